@@ -22,7 +22,8 @@ export interface RouteResponse {
 
 export const checkHealth = async () => {
   const res = await fetch('/health');
-  if (!res.ok) throw new Error('Offline');
+  // 503 while the engine warms up; the body still carries its status
+  if (!res.ok && res.status !== 503) throw new Error('Offline');
   return await res.json();
 };
 
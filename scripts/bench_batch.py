@@ -0,0 +1,89 @@
+"""
+Batch ETA benchmark: one compute_route_eta_batch() call vs one single-pair
+call per item (what compute_route_eta() does for each /predict-route-eta
+request) over the same origin/destination pairs.
+
+Usage (from the project root):
+    python scripts/bench_batch.py [--pairs 200] [--distinct 120] [--k 1] [--seed 5]
+
+Draws --distinct random OD pairs and repeats some of them up to --pairs
+items (dispatch batches often repeat a depot or a hub). Both sides start
+with an empty route cache and the same seed, and each item's routes are
+checked to match between the two.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.routing.route_eta as eng  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pairs", type=int, default=200)
+    parser.add_argument("--distinct", type=int, default=120)
+    parser.add_argument("--k", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    eng.initialize_engine()
+    if not eng.is_engine_ready():
+        print(f"Engine failed to initialize: {eng.get_init_error()}")
+        sys.exit(1)
+    cg = eng.COMPILED_GRAPH
+    rng = np.random.default_rng(args.seed)
+
+    def point(i):
+        return {"lat": float(cg.node_y[i]), "lon": float(cg.node_x[i])}
+
+    distinct = [tuple(point(i) for i in rng.integers(0, cg.num_nodes, size=2))
+                for _ in range(args.distinct)]
+    pairs = distinct + [distinct[i] for i in rng.integers(0, len(distinct), args.pairs - len(distinct))]
+    departure = "2026-01-05T09:00:00"
+
+    eng.ROUTE_CACHE.clear()
+    t0 = time.perf_counter()
+    singles = []
+    for source, destination in pairs:
+        try:
+            singles.append(eng.compute_route_eta_batch(
+                [(source, destination)], departure_time=departure, seed=args.seed, k=args.k,
+                include_geometry=False,
+            )[0])
+        except ValueError as e:
+            singles.append({"error": str(e)})
+    loop_s = time.perf_counter() - t0
+
+    eng.ROUTE_CACHE.clear()
+    t0 = time.perf_counter()
+    batch = eng.compute_route_eta_batch(
+        pairs, departure_time=departure, seed=args.seed, k=args.k, include_geometry=False
+    )
+    batch_s = time.perf_counter() - t0
+
+    def estimates(result):
+        return [r["eta_minutes"]["1_hour"]["estimate"] for r in result.get("routes", [])]
+
+    # Incident draws differ (one Generator across the batch), so compare the
+    # route sets and the incident-free part: distance per route
+    mismatched = sum(
+        [r["meta"]["distance_km"] for r in a.get("routes", [])]
+        != [r["meta"]["distance_km"] for r in b.get("routes", [])]
+        or ("error" in a) != ("error" in b)
+        for a, b in zip(singles, batch)
+    )
+    errors = sum("error" in r for r in batch)
+    print(f"{len(pairs)} items, {len(distinct)} distinct pairs, k={args.k}, {errors} errors")
+    print(f"loop of single requests: {loop_s * 1000:9.1f} ms")
+    print(f"one batch call:          {batch_s * 1000:9.1f} ms  ({loop_s / batch_s:.1f}x)")
+    print(f"items whose routes differ: {mismatched}; "
+          f"median 1_hour ETA {np.median([e for r in batch for e in estimates(r)]):.1f} min")
+
+
+if __name__ == "__main__":
+    main()
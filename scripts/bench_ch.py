@@ -0,0 +1,87 @@
+"""
+Contraction-hierarchy benchmark.
+
+Usage (from the project root):
+    python -m src.cli build-ch          # once, offline
+    python scripts/bench_ch.py [--queries 200] [--seed 11]
+
+Reports the CH's preprocessing time (from its manifest), shortcut count and
+index size, then p50/p99 query latency and median settled nodes for
+Dijkstra, bidirectional A* and the CH over random OD pairs. Every CH path
+is unpacked and its length checked against Dijkstra.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.routing.compiled_graph import bidirectional_astar, shortest_path  # noqa: E402
+from src.routing.contraction import CH_DIR, load_ch  # noqa: E402
+from src.routing.graph_snapshot import SNAPSHOT_DIR, load_snapshot  # noqa: E402
+
+
+def path_length(cg, path):
+    return float(cg.lengths[cg.path_edges(path)].astype(np.float64).sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    cg = load_snapshot(SNAPSHOT_DIR)
+    ch = load_ch(cg.snapshot_id)
+    if ch is None:
+        print("No contraction hierarchy for this snapshot; run `python -m src.cli build-ch` first.")
+        sys.exit(1)
+    with open(os.path.join(CH_DIR, "manifest.json")) as f:
+        manifest = json.load(f)
+
+    print(f"graph:          {cg.num_nodes} nodes, {cg.num_edges} edges, {cg.nbytes() / 1e6:.1f} MB")
+    print(f"preprocessing:  {manifest.get('build_seconds')} s")
+    print(f"shortcuts:      {ch.num_shortcuts} ({ch.num_shortcuts / cg.num_edges:.2f} per edge)")
+    print(f"index size:     {ch.nbytes() / 1e6:.1f} MB")
+    print()
+
+    rng = np.random.default_rng(args.seed)
+    pairs = [tuple(int(x) for x in rng.integers(0, cg.num_nodes, size=2)) for _ in range(args.queries)]
+    cg.reverse(), cg.planar()
+
+    searches = (
+        ("dijkstra", lambda s, t, st: shortest_path(cg, s, t, stats=st)),
+        ("astar", lambda s, t, st: bidirectional_astar(cg, s, t, stats=st)),
+        ("ch", lambda s, t, st: ch.query(s, t, stats=st)),
+    )
+    reference = {}
+    print(f"{'search':9s} {'settled':>9s} {'p50 ms':>9s} {'p99 ms':>9s}  mismatches")
+    for name, fn in searches:
+        settled, samples, mismatches = [], [], 0
+        for s, t in pairs:
+            stats = {}
+            t0 = time.perf_counter()
+            path = fn(s, t, stats)
+            samples.append(time.perf_counter() - t0)
+            settled.append(stats["settled"])
+            length = path_length(cg, path) if path else None
+            if name == "dijkstra":
+                reference[(s, t)] = length
+            else:
+                ref = reference[(s, t)]
+                if (ref is None) != (length is None) or (
+                        ref is not None and abs(ref - length) > 1e-3 * max(ref, 1.0)):
+                    mismatches += 1
+        print(
+            f"{name:9s} {int(np.median(settled)):9d} "
+            f"{np.percentile(samples, 50) * 1000:9.2f} "
+            f"{np.percentile(samples, 99) * 1000:9.2f}  {mismatches}"
+        )
+
+
+if __name__ == "__main__":
+    main()
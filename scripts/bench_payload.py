@@ -0,0 +1,115 @@
+"""
+Response payload benchmark for /predict-route-eta: size and serialisation
+time per geometry format, for long cross-city routes.
+
+Usage (from the project root):
+    python scripts/bench_payload.py [--pairs 10] [--repeat 20] [--zoom 12]
+
+For each of the --pairs longest origin/destination pairs sampled, the same
+seeded response is built with geometry_format json, polyline and delta,
+and as json and polyline simplified for a map at --zoom.
+Serialisation is timed the way FastAPI returns a plain dict
+(jsonable_encoder, then JSONResponse) and with FastJSONResponse, and each
+body is also measured gzipped at the API's level 6.
+"""
+import argparse
+import gzip
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+import src.routing.route_eta as eng  # noqa: E402
+from src.api.responses import FastJSONResponse, orjson  # noqa: E402
+from src.common.geometry import GEOMETRY_FORMATS, decode_delta, decode_polyline  # noqa: E402
+
+
+def timed_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return float(np.median(samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pairs", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--zoom", type=int, default=12)
+    args = parser.parse_args()
+
+    eng.initialize_engine()
+    if not eng.is_engine_ready():
+        print(f"Engine failed to initialize: {eng.get_init_error()}")
+        sys.exit(1)
+    cg = eng.COMPILED_GRAPH
+    rng = np.random.default_rng(args.seed)
+
+    # Long routes: of many random pairs, keep the ones furthest apart
+    cand = rng.integers(0, cg.num_nodes, size=(args.pairs * 20, 2))
+    span = np.hypot(cg.node_x[cand[:, 0]] - cg.node_x[cand[:, 1]],
+                    cg.node_y[cand[:, 0]] - cg.node_y[cand[:, 1]])
+    pairs = cand[np.argsort(span)[::-1][:args.pairs]]
+
+    def point(i):
+        return {"lat": float(cg.node_y[i]), "lon": float(cg.node_x[i])}
+
+    variants = {fmt: {"geometry_format": fmt} for fmt in GEOMETRY_FORMATS}
+    for fmt in ("json", "polyline"):
+        variants[f"{fmt} z{args.zoom}"] = {"geometry_format": fmt, "zoom": args.zoom}
+    totals = {name: np.zeros(5) for name in variants}
+    points, simplified_points = [], []
+    for a, b in pairs:
+        results = {
+            name: eng.compute_route_eta(point(a), point(b), seed=args.seed, **options)
+            for name, options in variants.items()
+        }
+        json_routes = results["json"]["routes"]
+        points.append(sum(len(r["meta"]["route_geometry"]) for r in json_routes))
+        simplified_points.append(
+            sum(len(r["meta"]["route_geometry"]) for r in results[f"json z{args.zoom}"]["routes"])
+        )
+        for name, result in results.items():
+            fmt = variants[name]["geometry_format"]
+            # Unsimplified geometry decodes to the dict points within the precision
+            checked = [] if "zoom" in variants[name] else result["routes"]
+            for plain, encoded in zip(json_routes, checked):
+                geometry = encoded["meta"]["route_geometry"]
+                decoded = {"json": lambda g: g, "polyline": decode_polyline,
+                           "delta": decode_delta}[fmt](geometry)
+                err = max(max(abs(p["lat"] - q["lat"]), abs(p["lon"] - q["lon"]))
+                          for p, q in zip(plain["meta"]["route_geometry"], decoded))
+                assert len(decoded) == len(plain["meta"]["route_geometry"]) and err <= 5e-6, (fmt, err)
+
+            baseline = JSONResponse(jsonable_encoder(result)).body
+            fast = FastJSONResponse(result).body
+            totals[name] += [
+                len(baseline),
+                len(gzip.compress(baseline, compresslevel=6)),
+                timed_ms(lambda: JSONResponse(jsonable_encoder(result)), args.repeat),
+                timed_ms(lambda: FastJSONResponse(result), args.repeat),
+                timed_ms(lambda: gzip.compress(fast, compresslevel=6), args.repeat),
+            ]
+
+    n = len(pairs)
+    print(f"{n} long routes ({np.mean(points):.0f} geometry points per response, "
+          f"{eng.K_ROUTES} routes each, {np.mean(simplified_points):.0f} at zoom {args.zoom}), "
+          f"serialiser: {'orjson' if orjson else 'json'}")
+    print(f"{'format':<12} {'bytes':>9} {'gzip':>9} {'dict+JSONResponse':>18} "
+          f"{'FastJSONResponse':>17} {'gzip time':>10}")
+    for name, (size, gz, slow_ms, fast_ms, gz_ms) in totals.items():
+        print(f"{name:<12} {size / n:9.0f} {gz / n:9.0f} {slow_ms / n:15.2f} ms "
+              f"{fast_ms / n:14.2f} ms {gz_ms / n:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
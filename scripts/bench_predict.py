@@ -0,0 +1,139 @@
+"""
+ETA inference benchmark: per-segment vs batched vs speed-field
+predict_route_etas(), plus Monte Carlo bands.
+
+Usage (from the project root):
+    python scripts/bench_predict.py [--routes 20] [--seed 3] [--samples 200]
+
+Takes routes between random OD pairs, simulates incidents once per route,
+then times the original per-segment loop (one-row DataFrame and predict()
+per segment per horizon, reproduced below as the reference) against the
+engine's batched predict_route_etas(). Both draw their noise from the same
+seed, so with model inference their outputs must be identical; any difference is
+reported. With CGEE_INFERENCE=lut the largest ETA deviation shows the
+lookup tables' interpolation error at route level. The speed-field mode
+(edge indices passed, clear segments read from the hourly field) is timed
+too; it adds the noise to predicted speeds, so it is not compared. "monte carlo"
+is the speed-field mode with --samples draws per route for the bands; the
+formula and Monte Carlo band widths are printed for comparison.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.routing.route_eta as eng  # noqa: E402
+from src.common.features import build_features  # noqa: E402
+
+
+def per_segment_speeds(segments, road_types, hour, is_peak, incident_data, rng):
+    """The pre-vectorisation inner loop: returns {horizon: eta_minutes}."""
+    etas = {}
+    for horizon, model in eng.MODELS.items():
+        eta_minutes = 0.0
+        cfg = eng.HORIZON_CONFIG[horizon]
+        for idx, seg_len in enumerate(segments):
+            road_type = road_types[idx]
+            off_peak_factor, peak_factor = eng.LOAD_FACTORS.get(road_type, (0.45, 0.68))
+            load_factor = peak_factor if is_peak else off_peak_factor
+            base_speed = eng.FREE_FLOW.get(road_type, 40) * (1.0 - load_factor)
+            base_speed += rng.normal(0, 2.5)
+            base_speed = max(base_speed, 5.0)
+
+            projected_hour = (hour + cfg["hour_offset"]) % 24
+            projected_peak = 1 if (7 <= projected_hour <= 10 or
+                                   17 <= projected_hour <= 21) else 0
+            severity = incident_data["segment_severities"][idx]
+            features = build_features(
+                speed_lag_1=base_speed * cfg["speed_decay"],
+                hour=projected_hour,
+                is_peak=projected_peak,
+                incident_flag=int(severity > 0),
+                incident_severity=float(severity),
+            )
+            raw_speed = float(model.predict(features)[0])
+            if severity > 0:
+                raw_speed = raw_speed * (1.0 - (severity * 0.6))
+            pred_speed = max(raw_speed, 5.0)
+            eta_minutes += (seg_len / pred_speed) * 60.0
+        etas[horizon] = round(eta_minutes, 2)
+    return etas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--routes", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    eng.initialize_engine()
+    if not eng.is_engine_ready():
+        print(f"Engine failed to initialize: {eng.get_init_error()}")
+        sys.exit(1)
+    cg = eng.COMPILED_GRAPH
+    rng = np.random.default_rng(args.seed)
+    hour, is_peak = 18, 1
+
+    cases = []
+    while len(cases) < args.routes:
+        s, t = (int(cg.node_ids[i]) for i in rng.integers(0, cg.num_nodes, size=2))
+        routes = eng.find_k_routes(s, t, k=1, hour=hour)
+        if not routes:
+            continue
+        geometry, segments, road_types, edges = eng.extract_route_info(routes[0], with_edges=True)
+        if segments:
+            incidents = eng.simulate_incidents(len(segments), road_types, hour, geometry)
+            cases.append((segments, road_types, incidents, edges))
+
+    timings = {"per-segment": [], "batched": [], "speed field": [], "monte carlo": []}
+    widths = {"formula": [], "monte carlo": []}
+    mismatches, max_dev = 0, 0.0
+    for i, (segments, road_types, incidents, edges) in enumerate(cases):
+        t0 = time.perf_counter()
+        reference = per_segment_speeds(segments, road_types, hour, is_peak, incidents,
+                                       np.random.default_rng(i))
+        timings["per-segment"].append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        etas, _ = eng.predict_route_etas(segments, road_types, hour, is_peak, incidents, seed=i)
+        timings["batched"].append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        formula, _ = eng.predict_route_etas(segments, road_types, hour, is_peak, incidents, edges)
+        timings["speed field"].append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        sampled, _ = eng.predict_route_etas(segments, road_types, hour, is_peak, incidents, edges,
+                                            samples=args.samples, seed=i)
+        timings["monte carlo"].append(time.perf_counter() - t0)
+        for name, band in (("formula", formula), ("monte carlo", sampled)):
+            widths[name].append(band["1_hour"]["upper_bound"] - band["1_hour"]["lower_bound"])
+
+        if any(etas[h]["estimate"] != reference[h] for h in reference):
+            mismatches += 1
+        max_dev = max(max_dev, *(
+            abs(etas[h]["estimate"] - reference[h]) / max(reference[h], 1e-9) for h in reference
+        ))
+
+    n_segments = [len(c[0]) for c in cases]
+    print(f"{len(cases)} routes, median {int(np.median(n_segments))} segments, "
+          f"{len(eng.MODELS)} horizons")
+    print(f"{'mode':12s} {'p50 ms':>9s} {'p99 ms':>9s}")
+    for name, samples in timings.items():
+        print(f"{name:12s} {np.percentile(samples, 50) * 1000:9.2f} "
+              f"{np.percentile(samples, 99) * 1000:9.2f}")
+    speedup = np.median(timings["per-segment"]) / np.median(timings["batched"])
+    print(f"speedup: {speedup:.0f}x, mismatched routes: {mismatches}/{len(cases)}, "
+          f"max ETA deviation {max_dev * 100:.2f}% (inference: {eng.INFERENCE_STATS.get('mode')})")
+    print(f"median 1_hour band width: formula {np.median(widths['formula']):.2f} min, "
+          f"monte carlo ({args.samples} samples, P{eng.MC_PERCENTILES[0]:g}-"
+          f"P{eng.MC_PERCENTILES[1]:g}) {np.median(widths['monte carlo']):.2f} min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Routing latency benchmark: compiled CSR backend vs NetworkX.
+
+Usage (from the project root):
+    python scripts/bench_routing.py [--runs 20] [--k 3]
+
+Runs find_k_routes for a set of Bengaluru OD pairs on both backends and
+prints p50/p99 latency per pair. Routes from both backends are compared
+so a regression in path quality shows up next to the timings. Both search
+on edge length (the NetworkX backend has no travel-time weights), so the
+engine is pinned to CGEE_ROUTE_WEIGHT=length for the run.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.routing.route_eta as eng  # noqa: E402
+from src.routing.graph_loader import load_graph  # noqa: E402
+
+OD_PAIRS = {
+    "Yelahanka -> Electronic City": ((13.1007, 77.5963), (12.8399, 77.6770)),
+    "Majestic -> Whitefield":       ((12.9767, 77.5713), (12.9698, 77.7500)),
+    "Hebbal -> Jayanagar":          ((13.0358, 77.5970), (12.9250, 77.5938)),
+    "MG Road -> Indiranagar":       ((12.9755, 77.6066), (12.9784, 77.6408)),
+}
+
+
+def percentile_ms(samples, q):
+    return float(np.percentile(samples, q)) * 1000.0
+
+
+def time_backend(fn, orig, dest, k, runs):
+    samples = []
+    routes = None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        routes = fn(orig, dest, k, 5.0)
+        samples.append(time.perf_counter() - t0)
+    return samples, routes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--k", type=int, default=3)
+    args = parser.parse_args()
+
+    eng.ROUTE_WEIGHT = "length"
+    eng.initialize_engine()
+    if not eng.is_engine_ready():
+        print(f"Engine failed to initialize: {eng.get_init_error()}")
+        sys.exit(1)
+    if eng.GRAPH is None:
+        # Engine came up from the binary snapshot; NetworkX needs the GraphML
+        eng.GRAPH = load_graph()
+    eng._build_weight_cache()
+
+    print(f"{'pair':32s} {'backend':9s} {'p50 ms':>9s} {'p99 ms':>9s}  routes")
+    for name, ((slat, slon), (dlat, dlon)) in OD_PAIRS.items():
+        orig, dest = eng.SPATIAL_INDEX.snap([slat, dlat], [slon, dlon]).tolist()
+
+        for backend, fn in (("compiled", eng._find_k_routes_compiled),
+                            ("networkx", eng._find_k_routes_networkx)):
+            samples, routes = time_backend(fn, orig, dest, args.k, args.runs)
+            print(
+                f"{name:32s} {backend:9s} "
+                f"{percentile_ms(samples, 50):9.1f} {percentile_ms(samples, 99):9.1f}"
+                f"  {len(routes)}"
+            )
+
+        first_c = eng._find_k_routes_compiled(orig, dest, 1, 5.0)
+        first_n = eng._find_k_routes_networkx(orig, dest, 1, 5.0)
+        if first_c and first_n and first_c[0] != first_n[0]:
+            print(f"{'':32s} note: primary routes differ (equal-length tie?)")
+
+
+if __name__ == "__main__":
+    main()
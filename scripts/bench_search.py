@@ -0,0 +1,96 @@
+"""
+Point-to-point search benchmark: Dijkstra vs bidirectional A*.
+
+Usage (from the project root):
+    python scripts/bench_search.py [--pairs 20] [--seed 7]
+
+Samples random OD pairs from the compiled graph in short (<3 km), medium
+(3-10 km) and cross-city (>15 km) straight-line bands and reports, per
+band, median settled-node counts and p50/p99 latency for both searches.
+Path lengths are cross-checked so an inadmissible heuristic shows up as
+a mismatch rather than a silent speedup.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.routing.route_eta as eng  # noqa: E402
+from src.routing.compiled_graph import bidirectional_astar, shortest_path  # noqa: E402
+
+BANDS = {
+    "short":      (0.0, 3_000.0),
+    "medium":     (3_000.0, 10_000.0),
+    "cross-city": (15_000.0, float("inf")),
+}
+
+
+def sample_pairs(cg, lo, hi, n, rng):
+    xs, ys = (np.asarray(a) for a in cg.planar())
+    pairs = []
+    attempts = 0
+    while len(pairs) < n and attempts < n * 500:
+        attempts += 1
+        s, t = rng.integers(0, cg.num_nodes, size=2)
+        d = np.hypot(xs[s] - xs[t], ys[s] - ys[t])
+        if lo <= d < hi:
+            pairs.append((int(s), int(t)))
+    return pairs
+
+
+def path_length(cg, path):
+    return float(cg.lengths[cg.path_edges(path)].astype(np.float64).sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pairs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    eng.initialize_engine()
+    if not eng.is_engine_ready():
+        print(f"Engine failed to initialize: {eng.get_init_error()}")
+        sys.exit(1)
+    cg = eng.COMPILED_GRAPH
+    cg.reverse(), cg.planar()  # build lazily-derived arrays outside the timings
+    rng = np.random.default_rng(args.seed)
+
+    print(f"{'band':11s} {'search':9s} {'settled':>9s} {'p50 ms':>9s} {'p99 ms':>9s}")
+    for band, (lo, hi) in BANDS.items():
+        pairs = sample_pairs(cg, lo, hi, args.pairs, rng)
+        if not pairs:
+            print(f"{band:11s} (no pairs in this band)")
+            continue
+
+        results = {}
+        for name, fn in (("dijkstra", shortest_path), ("astar", bidirectional_astar)):
+            settled, samples, lengths = [], [], []
+            for s, t in pairs:
+                stats = {}
+                t0 = time.perf_counter()
+                path = fn(cg, s, t, stats=stats)
+                samples.append(time.perf_counter() - t0)
+                settled.append(stats["settled"])
+                lengths.append(path_length(cg, path) if path else None)
+            results[name] = lengths
+            print(
+                f"{band:11s} {name:9s} {int(np.median(settled)):9d} "
+                f"{np.percentile(samples, 50) * 1000:9.2f} "
+                f"{np.percentile(samples, 99) * 1000:9.2f}"
+            )
+
+        mismatches = sum(
+            1 for a, b in zip(results["dijkstra"], results["astar"])
+            if (a is None) != (b is None) or (a is not None and abs(a - b) > 1e-3 * max(a, 1.0))
+        )
+        if mismatches:
+            print(f"{'':11s} WARNING: {mismatches}/{len(pairs)} path lengths differ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Compute backend for CPU-bound route prediction.
+
+Requests are admitted into a bounded pool instead of Starlette's shared
+thread pool:
+
+    "process"  a ProcessPoolExecutor whose workers each initialise the
+               engine once. The graph is the memory-mapped snapshot, so
+               workers share its pages. Each still builds its own models,
+               speed field, spatial index and the graph's derived
+               planar/reverse arrays, and runs its own interpreter;
+               predictions run outside the API process's GIL, so /health
+               and history reads are never queued behind them.
+    "thread"   a ThreadPoolExecutor over this process's engine (no extra
+               memory, but predictions share the GIL with the API).
+
+At most `workers` calls run and `queue_limit` wait; beyond that run()
+raises PoolSaturated at once so the endpoint can answer 429 rather than
+let latency grow without bound. Each call reports the time it waited for
+a worker separately from the time it computed.
+
+run(..., coalesce_key=...) lets identical requests share one call: while
+a call with that key is in flight, later ones await its result without
+taking a slot. This works for both backends (the engine's own
+single-flight only sees calls within one process).
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+import numpy as np
+
+from src.common.metrics import record_stages, stage_collector
+
+logger = logging.getLogger("cgee.compute")
+
+COMPUTE_BACKEND = os.environ.get("CGEE_COMPUTE_BACKEND", "thread")
+COMPUTE_WORKERS = int(os.environ.get("CGEE_COMPUTE_WORKERS", str(min(4, os.cpu_count() or 1))))
+COMPUTE_QUEUE = int(os.environ.get("CGEE_COMPUTE_QUEUE", "16"))   # waiting beyond the workers
+WARMUP_TIMEOUT_S = float(os.environ.get("CGEE_WARMUP_TIMEOUT_S", "600"))
+_TIMING_WINDOW = 1000   # recent calls kept for the wait/compute percentiles
+
+
+class PoolSaturated(Exception):
+    """Every worker is busy and the queue is full."""
+
+
+class PoolUnavailable(Exception):
+    """The pool is shut down or its workers died."""
+
+
+def _init_worker(model_version):
+    """Process-pool initializer: load the engine (and model version) once."""
+    import src.routing.route_eta as eng
+
+    logging.basicConfig(level=logging.INFO,
+                        format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+    eng.initialize_engine()
+    if model_version and eng.is_engine_ready() and eng.MODEL_INFO.get("version") != model_version:
+        eng.reload_models(model_version)
+
+
+def _worker_version():
+    import src.routing.route_eta as eng
+    return eng.MODEL_INFO.get("version") if eng.is_engine_ready() else None
+
+
+def _worker_ready():
+    """(pid, engine ready); holds the worker briefly so a round spreads over the pool."""
+    import src.routing.route_eta as eng
+    time.sleep(0.05)
+    return os.getpid(), eng.is_engine_ready()
+
+
+def _timed_call(fn, args, kwargs):
+    """
+    Runs in the worker: (result, wall-clock start, compute seconds, stage
+    seconds). Stage timings come back to be recorded in the API process.
+    """
+    started = time.time()
+    t0 = time.perf_counter()
+    with stage_collector(record=False) as stages:
+        result = fn(*args, **kwargs)
+    return result, started, time.perf_counter() - t0, stages
+
+
+class ComputePool:
+    def __init__(self, backend=COMPUTE_BACKEND, workers=COMPUTE_WORKERS, queue_limit=COMPUTE_QUEUE):
+        if backend not in ("process", "thread"):
+            raise ValueError(f"Unknown compute backend {backend!r}")
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.queue_limit = max(0, queue_limit)
+        self._executor = None
+        self._model_version = None   # registry version the process workers load
+        self._inflight = 0       # only touched on the event loop thread
+        self._wait_ms = deque(maxlen=_TIMING_WINDOW)
+        self._compute_ms = deque(maxlen=_TIMING_WINDOW)
+        self._shared = {}        # coalesce_key -> asyncio.Task in flight
+        self._warm = {"state": "pending", "ready_workers": 0, "seconds": None}
+        self._counts = {"completed": 0, "failed": 0, "rejected": 0, "restarts": 0, "coalesced": 0}
+
+    def _new_executor(self, model_version=None):
+        if self.backend == "thread":
+            return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cgee-compute")
+        # spawn: the API process runs threads (engine init, speed field refresh)
+        # that must not be forked mid-operation
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_version,),
+        )
+
+    def start(self, model_version=None):
+        if self._executor is None:
+            self._model_version = model_version
+            self._executor = self._new_executor(model_version)
+            if self.backend == "process":
+                if int(os.environ.get("WEB_CONCURRENCY", "1")) > 1:
+                    logger.warning(
+                        "CGEE_COMPUTE_BACKEND=process with WEB_CONCURRENCY > 1: every uvicorn "
+                        "worker starts its own engine and compute pool; run a single worker"
+                    )
+                # Spawn the workers now so engine loading overlaps startup
+                # instead of delaying the first requests
+                for _ in range(self.workers):
+                    self._executor.submit(_worker_version)
+            logger.info(f"Compute pool started: {self.workers} {self.backend} workers, "
+                        f"queue limit {self.queue_limit}")
+
+    def restart(self, model_version=None):
+        """
+        Replace the process workers with fresh ones on `model_version` once
+        they are up; calls already running finish on the old workers.
+        Thread workers share this process's engine and need no restart.
+        """
+        if self.backend != "process":
+            return
+        executor = self._new_executor(model_version)
+        versions = [f.result() for f in [executor.submit(_worker_version) for _ in range(self.workers)]]
+        old, self._executor = self._executor, executor
+        self._model_version = model_version
+        self._counts["restarts"] += 1
+        logger.info(f"Compute pool restarted on model versions {sorted(set(map(str, versions)))}")
+        if old is not None:
+            old.shutdown(wait=False)
+
+    def warm_up(self):
+        """
+        Block until every process worker has loaded and warmed its engine.
+        Workers pick up calls only once their initializer has finished, so
+        calls are sent in rounds until all `workers` PIDs have answered ready.
+        Thread workers share this process's engine: nothing to wait for.
+        """
+        started = time.perf_counter()
+        if self.backend == "thread":
+            self._warm.update(state="ready", ready_workers=self.workers, seconds=0.0)
+            return True
+        self._warm["state"] = "running"
+        ready = set()
+        while len(ready) < self.workers and self._executor is not None:
+            if time.perf_counter() - started > WARMUP_TIMEOUT_S:
+                self._warm["state"] = "failed"
+                logger.error(f"Only {len(ready)}/{self.workers} compute workers ready "
+                             f"after {WARMUP_TIMEOUT_S:.0f}s")
+                return False
+            try:
+                calls = [self._executor.submit(_worker_ready) for _ in range(self.workers - len(ready))]
+                ready.update(pid for pid, engine_ready in (f.result() for f in calls) if engine_ready)
+            except BrokenProcessPool:
+                logger.error("Compute worker died while warming up; starting a new pool")
+                self._executor = self._new_executor(self._model_version)
+                ready.clear()
+            except RuntimeError:
+                break   # shut down meanwhile
+            self._warm["ready_workers"] = len(ready)
+        if len(ready) < self.workers:
+            return False
+        self._warm.update(state="ready", seconds=round(time.perf_counter() - started, 2))
+        logger.info(f"Compute workers warm in {self._warm['seconds']:.1f}s")
+        return True
+
+    def is_warm(self) -> bool:
+        return self._warm["state"] == "ready"
+
+    def shutdown(self):
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn, *args, coalesce_key=None, **kwargs):
+        """
+        Run fn(*args, **kwargs) on a worker. Returns (result, timing) with
+        timing = {"queue_wait_ms", "compute_ms", "stages_ms"}. Raises PoolSaturated when
+        full and PoolUnavailable when there are no usable workers. Calls
+        sharing a `coalesce_key` get the in-flight call's result or error.
+        """
+        if coalesce_key is None:
+            return await self._run(fn, args, kwargs)
+        task = self._shared.get(coalesce_key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(fn, args, kwargs))
+            self._shared[coalesce_key] = task
+            task.add_done_callback(partial(self._release, coalesce_key))
+        else:
+            self._counts["coalesced"] += 1
+        # shield: a caller that goes away must not cancel the others' call
+        return await asyncio.shield(task)
+
+    def _release(self, key, task):
+        if self._shared.get(key) is task:
+            del self._shared[key]
+        if not task.cancelled():
+            task.exception()   # retrieved, even if every caller went away
+
+    async def _run(self, fn, args, kwargs):
+        executor = self._executor
+        if executor is None:
+            raise PoolUnavailable("Compute pool is not running")
+        if self._inflight >= self.workers + self.queue_limit:
+            self._counts["rejected"] += 1
+            raise PoolSaturated(f"{self._inflight} requests in flight")
+
+        self._inflight += 1
+        submitted = time.time()
+        try:
+            result, started, compute_s, stages = await asyncio.get_running_loop().run_in_executor(
+                executor, partial(_timed_call, fn, args, kwargs)
+            )
+        except BrokenProcessPool:
+            self._counts["failed"] += 1
+            logger.error("Compute worker died; starting a new pool")
+            if self._executor is executor:
+                self._executor = self._new_executor(self._model_version)
+            raise PoolUnavailable("Compute worker died")
+        except Exception:
+            self._counts["failed"] += 1
+            raise
+        finally:
+            self._inflight -= 1
+
+        record_stages(stages)
+        timing = {
+            "queue_wait_ms": round(max(0.0, started - submitted) * 1000, 2),
+            "compute_ms": round(compute_s * 1000, 2),
+            "stages_ms": {name: round(seconds * 1000, 2) for name, seconds in stages.items()},
+        }
+        self._counts["completed"] += 1
+        self._wait_ms.append(timing["queue_wait_ms"])
+        self._compute_ms.append(timing["compute_ms"])
+        return result, timing
+
+    def worker_pids(self) -> list:
+        """PIDs of the process workers (for py-spy and the like); [] for threads."""
+        executor = self._executor
+        if self.backend != "process" or executor is None:
+            return []
+        return sorted(getattr(executor, "_processes", None) or {})
+
+    def retry_after_s(self) -> int:
+        """Seconds a rejected client should wait: one queue's worth of work."""
+        typical_ms = np.median(self._compute_ms) if self._compute_ms else 100.0
+        return max(1, int(np.ceil(typical_ms * (self._inflight / self.workers) / 1000)))
+
+    def stats(self) -> dict:
+        def pct(samples):
+            if not samples:
+                return None
+            p50, p95 = np.percentile(samples, [50, 95])
+            return {"p50": round(float(p50), 2), "p95": round(float(p95), 2)}
+
+        return {
+            "backend": self.backend,
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "running": self._executor is not None,
+            "warm_up": dict(self._warm),
+            "in_flight": self._inflight,
+            **self._counts,
+            "queue_wait_ms": pct(self._wait_ms),
+            "compute_ms": pct(self._compute_ms),
+        }
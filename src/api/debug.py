@@ -0,0 +1,202 @@
+"""
+On-demand diagnostics for a live API process: a sampling profiler and a
+memory report. Nothing here runs until an admin endpoint calls it.
+
+sample_stacks() wakes every 1/hz seconds for `seconds`, reads every
+thread's current frame with sys._current_frames() and counts the stacks
+of the threads it was asked for (by default the compute pool's
+"cgee-compute" threads). The profiled code is not instrumented or traced,
+so its cost is one stack walk per thread per tick, paid by the sampler
+thread. Output is collapsed stacks, one "frame;frame;...;leaf count" line
+per distinct stack, which flamegraph.pl, speedscope and inferno read
+directly.
+
+memory_report() sizes the engine's large objects and, given
+trace_seconds, runs tracemalloc for that long and lists the top
+allocation sites still alive at the end. Tracing slows every allocation,
+so it is switched off again before returning.
+"""
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+import numpy as np
+
+PROFILE_MAX_SECONDS = 60
+PROFILE_MAX_HZ = 1000
+COMPUTE_THREAD_PREFIX = "cgee-compute"
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_profile_lock = threading.Lock()   # one profile or memory trace at a time
+
+
+class DiagnosticsBusy(Exception):
+    """Another profile or memory trace is running."""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    path = code.co_filename
+    if path.startswith(_PROJECT_ROOT):
+        path = os.path.relpath(path, _PROJECT_ROOT)
+    else:
+        path = "/".join(path.split(os.sep)[-2:])
+    return f"{code.co_name} ({path}:{frame.f_lineno})"
+
+
+def _is_idle(frame) -> bool:
+    """A pool thread waiting for work, or any thread blocked in a threading wait."""
+    path, name = frame.f_code.co_filename, frame.f_code.co_name
+    return (path.endswith(os.path.join("concurrent", "futures", "thread.py")) and name == "_worker") or (
+        path.endswith("threading.py") and name in ("wait", "_wait_for_tstate_lock")
+    )
+
+
+def _collapsed(frame, thread_name) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    # root first; ";" separates frames in the collapsed format
+    return ";".join(reversed(labels))
+
+
+def sample_stacks(seconds, hz=100, threads="compute", idle=False):
+    """
+    (collapsed stack lines, stats) for `seconds` of sampling at `hz`.
+    `threads` is "compute" (the compute pool's threads) or "all" (every
+    thread but the sampler). Threads waiting for work are counted in
+    stats but left out of the stacks unless `idle`.
+    """
+    seconds = min(max(float(seconds), 0.1), PROFILE_MAX_SECONDS)
+    hz = min(max(int(hz), 1), PROFILE_MAX_HZ)
+    if not _profile_lock.acquire(blocking=False):
+        raise DiagnosticsBusy("A profile or memory trace is already running")
+    try:
+        me = threading.get_ident()
+        counts = Counter()
+        ticks = 0
+        busy_samples = idle_samples = 0
+        interval = 1.0 / hz
+        deadline = time.perf_counter() + seconds
+        next_tick = time.perf_counter()
+        while next_tick < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                name = names.get(ident, f"thread-{ident}")
+                if ident == me or (threads == "compute" and not name.startswith(COMPUTE_THREAD_PREFIX)):
+                    continue
+                waiting = _is_idle(frame)
+                idle_samples += waiting
+                busy_samples += not waiting
+                if waiting and not idle:
+                    continue
+                # Group pool threads under one root so their stacks merge
+                root = COMPUTE_THREAD_PREFIX if name.startswith(COMPUTE_THREAD_PREFIX) else name
+                counts[_collapsed(frame, root)] += 1
+            ticks += 1
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+    finally:
+        _profile_lock.release()
+
+    lines = [f"{stack} {count}" for stack, count in counts.most_common()]
+    return lines, {"seconds": seconds, "hz": hz, "ticks": ticks, "samples": busy_samples,
+                   "idle_samples": idle_samples, "stacks": len(counts)}
+
+
+def _nbytes(obj, seen=None, depth=0) -> int:
+    """
+    Approximate deep size: arrays by nbytes, objects with an nbytes()
+    method by that, xgboost models by their serialised booster, containers
+    and instances recursively (each object counted once).
+    """
+    seen = set() if seen is None else seen
+    if obj is None or id(obj) in seen or depth > 50:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if callable(getattr(obj, "nbytes", None)):
+        return int(obj.nbytes())
+    if hasattr(obj, "get_booster"):
+        return len(obj.get_booster().save_raw("ubj"))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_nbytes(k, seen, depth + 1) + _nbytes(v, seen, depth + 1) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_nbytes(item, seen, depth + 1) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += _nbytes(vars(obj), seen, depth + 1)
+    return size
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def memory_report(trace_seconds=0.0, top=20) -> dict:
+    """Sizes of the engine's large objects, plus top allocators over trace_seconds."""
+    import src.routing.route_eta as eng
+
+    def mb(n):
+        return None if n is None else round(n / 1e6, 2)
+
+    objects = {
+        "GRAPH": eng.GRAPH,
+        "COMPILED_GRAPH": eng.COMPILED_GRAPH,
+        "SPATIAL_INDEX": eng.SPATIAL_INDEX,
+        "CH_INDEX": eng.CH_INDEX,
+        "_WEIGHT_CACHE": eng._WEIGHT_CACHE,
+        "SPEED_FIELD": eng.SPEED_FIELD,
+        "SPEED_LUTS": eng.SPEED_LUTS,
+    }
+    sizes = {name: mb(_nbytes(obj)) for name, obj in objects.items() if obj is not None}
+    sizes["MODELS"] = {h: mb(_nbytes(m)) for h, m in (eng.MODELS or {}).items()}
+    report = {
+        "rss_mb": mb(_rss_bytes()),
+        "objects_mb": sizes,
+        "route_cache_entries": eng.ROUTE_CACHE.stats()["size"],
+        # memory-mapped graph arrays are shared page cache, not private RSS
+        "graph_mmap": isinstance(getattr(eng.COMPILED_GRAPH, "offsets", None), np.memmap),
+    }
+
+    if trace_seconds > 0:
+        trace_seconds = min(float(trace_seconds), PROFILE_MAX_SECONDS)
+        if tracemalloc.is_tracing():
+            raise DiagnosticsBusy("tracemalloc is already tracing in this process")
+        if not _profile_lock.acquire(blocking=False):
+            raise DiagnosticsBusy("A profile or memory trace is already running")
+        try:
+            tracemalloc.start()   # one frame per allocation: the cheapest setting
+            time.sleep(trace_seconds)
+            snapshot = tracemalloc.take_snapshot()
+            traced, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            _profile_lock.release()
+        stats = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ]).statistics("lineno")
+        report["tracemalloc"] = {
+            "seconds": trace_seconds,
+            "traced_mb": mb(traced),
+            "peak_mb": mb(peak),
+            "top": [
+                {"site": f"{s.traceback[0].filename}:{s.traceback[0].lineno}",
+                 "size_kb": round(s.size / 1e3, 1), "count": s.count}
+                for s in stats[:top]
+            ],
+        }
+    return report
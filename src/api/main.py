@@ -1,21 +1,38 @@
 import os
 import asyncio
+import hmac
 import time
 import logging
 from contextlib import asynccontextmanager
+from datetime import datetime
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, validator
+from typing import List, Optional
 
 from src.routing.route_eta import (
     initialize_engine,
     is_engine_ready,
     get_init_error,
     compute_route_eta,
+    compute_route_eta_batch,
     get_shortest_path,
+    model_status,
+    start_model_reload,
+    BATCH_MAX_ITEMS,
+    HORIZON_CONFIG,
+    K_ROUTES,
+    MC_MAX_SAMPLES,
 )
+from src.common.geometry import GEOMETRY_FORMATS, MAX_ZOOM
+from src.models.registry import list_versions, read_manifest
+from src.api.compute_pool import ComputePool, PoolSaturated, PoolUnavailable
+from src.api.debug import DiagnosticsBusy, memory_report, sample_stacks
+from src.api.responses import FastJSONResponse
+from src.common.metrics import METRICS_ENABLED, REQUEST_SECONDS, STAGE_SECONDS, render_metric
 from src.db.supabase_client import save_trip, get_history, get_favourites, delete_favourite
 import threading
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -28,17 +45,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger("cgee")
 
+# Route predictions run here (CGEE_COMPUTE_BACKEND / _WORKERS / _QUEUE),
+# not in Starlette's thread pool
+COMPUTE_POOL = ComputePool()
+
+
+def _warm_up():
+    initialize_engine()
+    if is_engine_ready():
+        COMPUTE_POOL.warm_up()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
-    Non-blocking startup: engine loads in a background thread.
+    Non-blocking startup: engine loads and warms up in a background thread.
     App accepts requests immediately; /predict-route-eta returns 503
-    until engine_ready = True.
+    until engine_ready = True, and /health until the compute workers are
+    warm as well.
     """
+    COMPUTE_POOL.start()
     loop = asyncio.get_event_loop()
     # Store the future so exceptions are not silently discarded
-    future = loop.run_in_executor(None, initialize_engine)
+    future = loop.run_in_executor(None, _warm_up)
 
     # Log any unhandled exception from the init thread
     def _on_init_done(fut):
@@ -49,6 +78,7 @@ async def lifespan(app: FastAPI):
 
     logger.info("[CGEE] Engine initialization started in background thread.")
     yield
+    COMPUTE_POOL.shutdown()
     get_shortest_path.cache_clear()
     logger.info("[CGEE] Shutdown complete.")
 
@@ -71,7 +101,14 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["GET", "POST", "DELETE"],
     allow_headers=["Content-Type", "X-Session-ID"],
+    expose_headers=["X-Queue-Wait-Ms", "X-Compute-Ms", "Server-Timing"],
 )
+# Compress responses for clients that accept gzip (route geometry shrinks
+# about 4x); level 6 is within 1% of level 9's size at half the CPU.
+# CGEE_GZIP_MIN_BYTES=0 turns it off
+GZIP_MIN_BYTES = int(os.environ.get("CGEE_GZIP_MIN_BYTES", "1024"))
+if GZIP_MIN_BYTES > 0:
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES, compresslevel=6)
 
 limiter = Limiter(key_func=get_remote_address)
 app.state.limiter = limiter
@@ -104,6 +141,102 @@ class Location(BaseModel):
 class RouteRequest(BaseModel):
     source: Location
     destination: Location
+    # Seeds the incident simulation so a response can be reproduced
+    seed: Optional[int] = None
+    # Monte Carlo draws per route for the ETA bands (0: margin formula;
+    # omitted: the server's CGEE_UNCERTAINTY default)
+    samples: Optional[int] = None
+    # route_geometry as {"lat","lon"} dicts ("json"), an encoded polyline
+    # ("polyline") or delta-encoded integers ("delta")
+    geometry_format: str = "json"
+    # Thin route_geometry for display: a tolerance in metres, or the map zoom
+    # the route is drawn at (one pixel); ETAs always use the full route
+    simplify_tolerance_m: Optional[float] = None
+    zoom: Optional[int] = None
+
+    @validator("samples")
+    def validate_samples(cls, v):
+        if v is not None and not (0 <= v <= MC_MAX_SAMPLES):
+            raise ValueError(f"samples must be between 0 and {MC_MAX_SAMPLES}.")
+        return v
+
+    @validator("geometry_format")
+    def validate_geometry_format(cls, v):
+        if v not in GEOMETRY_FORMATS:
+            raise ValueError(f"geometry_format must be one of {list(GEOMETRY_FORMATS)}.")
+        return v
+
+    @validator("simplify_tolerance_m")
+    def validate_simplify_tolerance(cls, v):
+        if v is not None and not (0 <= v <= 1000):
+            raise ValueError("simplify_tolerance_m must be between 0 and 1000.")
+        return v
+
+    @validator("zoom")
+    def validate_zoom(cls, v):
+        if v is not None and not (0 <= v <= MAX_ZOOM):
+            raise ValueError(f"zoom must be between 0 and {MAX_ZOOM}.")
+        return v
+
+class BatchRouteRequest(BaseModel):
+    items: List[RouteRequest]
+    # Options for the whole batch (an item's own seed, samples and geometry
+    # options are ignored)
+    k: int = K_ROUTES
+    horizons: Optional[List[str]] = None
+    include_geometry: bool = True
+    geometry_format: str = "json"
+    simplify_tolerance_m: Optional[float] = None
+    zoom: Optional[int] = None
+    departure_time: Optional[str] = None
+    seed: Optional[int] = None
+    samples: Optional[int] = 0
+
+    @validator("items")
+    def validate_items(cls, v):
+        if not (1 <= len(v) <= BATCH_MAX_ITEMS):
+            raise ValueError(f"A batch holds 1 to {BATCH_MAX_ITEMS} route requests.")
+        return v
+
+    @validator("k")
+    def validate_k(cls, v):
+        if not (1 <= v <= K_ROUTES):
+            raise ValueError(f"k must be between 1 and {K_ROUTES}.")
+        return v
+
+    @validator("horizons")
+    def validate_horizons(cls, v):
+        if v is not None and (not v or any(h not in HORIZON_CONFIG for h in v)):
+            raise ValueError(f"horizons must be a non-empty subset of {list(HORIZON_CONFIG)}.")
+        return v
+
+    @validator("geometry_format")
+    def validate_geometry_format(cls, v):
+        if v not in GEOMETRY_FORMATS:
+            raise ValueError(f"geometry_format must be one of {list(GEOMETRY_FORMATS)}.")
+        return v
+
+    @validator("simplify_tolerance_m")
+    def validate_simplify_tolerance(cls, v):
+        if v is not None and not (0 <= v <= 1000):
+            raise ValueError("simplify_tolerance_m must be between 0 and 1000.")
+        return v
+
+    @validator("zoom")
+    def validate_zoom(cls, v):
+        if v is not None and not (0 <= v <= MAX_ZOOM):
+            raise ValueError(f"zoom must be between 0 and {MAX_ZOOM}.")
+        return v
+
+    @validator("samples")
+    def validate_samples(cls, v):
+        if v is not None and not (0 <= v <= MC_MAX_SAMPLES):
+            raise ValueError(f"samples must be between 0 and {MC_MAX_SAMPLES}.")
+        return v
+
+class ModelReloadRequest(BaseModel):
+    # Registry version to load; the registry's active version when omitted
+    version: Optional[str] = None
 
 class SessionRequest(BaseModel):
     session_id: str
@@ -115,15 +248,29 @@ class DeleteFavRequest(BaseModel):
 
 # ----- Middleware: structured request logging -----
 
+# Requests inside the app right now (only touched on the event loop thread)
+IN_FLIGHT_REQUESTS = 0
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
+    global IN_FLIGHT_REQUESTS
     start = time.time()
-    response = await call_next(request)
-    ms = round((time.time() - start) * 1000, 1)
+    IN_FLIGHT_REQUESTS += 1
+    try:
+        response = await call_next(request)
+    finally:
+        IN_FLIGHT_REQUESTS -= 1
+    elapsed = time.time() - start
+    ms = round(elapsed * 1000, 1)
     logger.info(
         f"{request.method} {request.url.path} "
         f"→ {response.status_code} ({ms}ms)"
     )
+    if METRICS_ENABLED:
+        # Label by route template, not the raw path, to bound the series
+        route = request.scope.get("route")
+        REQUEST_SECONDS.observe(elapsed, getattr(route, "path", "unmatched"), response.status_code)
     return response
 
 
@@ -159,23 +306,196 @@ async def value_error_handler(request: Request, exc: ValueError):
 
 @app.get("/health")
 def health():
+    """
+    200 once the engine and the compute workers are warm, 503 with the
+    warm-up progress until then, so health checks keep traffic off a cold
+    instance.
+    """
     import src.routing.route_eta as eng
-    return {
-        "status": "ok" if is_engine_ready() else "initializing",
+    ready = is_engine_ready() and COMPUTE_POOL.is_warm()
+    body = {
+        "status": "ok" if ready else "initializing",
         "engine_ready": is_engine_ready(),
+        "warmup": eng.warmup_status(),
         "models": list(eng.MODELS.keys()) if hasattr(eng, 'MODELS') and eng.MODELS else [],
+        "model_version": eng.MODEL_INFO.get("version"),
+        "route_cache": eng.ROUTE_CACHE.stats(),
+        "inference": eng.INFERENCE_STATS,
+        "speed_field": eng.speed_field_stats(),
+        "compute": COMPUTE_POOL.stats(),
+        "coalescing": eng.COALESCER.stats(),
     }
+    return JSONResponse(body, status_code=200 if ready else 503)
+
+
+@app.get("/metrics")
+def metrics():
+    """Prometheus text exposition: stage and request histograms plus engine state."""
+    import src.routing.route_eta as eng
+    cache = eng.ROUTE_CACHE.stats()
+    path_cache = get_shortest_path.cache_info()
+    coalescing = eng.COALESCER.stats()
+    compute = COMPUTE_POOL.stats()
+    field = eng.SPEED_FIELD_STATS
+    lines = STAGE_SECONDS.render() + REQUEST_SECONDS.render()
+    lines += render_metric("cgee_engine_ready", "gauge", "1 once the engine has initialised",
+                           [({}, int(is_engine_ready()))])
+    lines += render_metric("cgee_engine_init_seconds", "gauge", "Duration of engine initialisation",
+                           [({}, eng.INIT_SECONDS)])
+    lines += render_metric("cgee_warmup_stage_seconds", "gauge", "Duration of each engine warm-up stage",
+                           [({"stage": name}, ms / 1000)
+                            for name, ms in eng.WARMUP_STATUS["stages_ms"].items()])
+    lines += render_metric("cgee_model_info", "gauge", "Active model registry version",
+                           [({"version": eng.MODEL_INFO.get("version")}, 1)] if eng.MODEL_INFO else [])
+    lines += render_metric("cgee_http_requests_in_flight", "gauge", "Requests being handled",
+                           [({}, IN_FLIGHT_REQUESTS)])
+    lines += render_metric("cgee_route_cache_lookups_total", "counter", "Route cache lookups by result",
+                           [({"result": "hit"}, cache["hits"]), ({"result": "miss"}, cache["misses"])])
+    lines += render_metric("cgee_route_cache_evictions_total", "counter", "Route cache LRU evictions",
+                           [({}, cache["evictions"])])
+    lines += render_metric("cgee_route_cache_entries", "gauge", "Route cache size", [({}, cache["size"])])
+    lines += render_metric("cgee_path_cache_lookups_total", "counter",
+                           "get_shortest_path cache lookups by result",
+                           [({"result": "hit"}, path_cache.hits), ({"result": "miss"}, path_cache.misses)])
+    lines += render_metric("cgee_coalesced_requests_total", "counter",
+                           "Requests that shared an identical in-flight computation",
+                           [({"level": "engine"}, coalescing["coalesced"]),
+                            ({"level": "api"}, compute["coalesced"])])
+    lines += render_metric("cgee_compute_in_flight", "gauge", "Calls running or queued in the compute pool",
+                           [({}, compute["in_flight"])])
+    lines += render_metric("cgee_compute_calls_total", "counter", "Compute pool calls by outcome",
+                           [({"outcome": k}, compute[k]) for k in ("completed", "failed", "rejected")])
+    lines += render_metric("cgee_speed_field_refreshes_total", "counter", "Speed field rebuilds by outcome",
+                           [({"outcome": "ok"}, field["refreshes"]), ({"outcome": "failed"}, field["failures"])])
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    import src.routing.route_eta as eng
+    return eng.ROUTE_CACHE.stats()
 
 
 @app.get("/cache/clear")
 def clear_cache():
+    import src.routing.route_eta as eng
     get_shortest_path.cache_clear()
+    eng.ROUTE_CACHE.clear()
     return {"cleared": True}
 
 
+# Admin endpoints are enabled by setting CGEE_ADMIN_TOKEN; callers send it
+# in the X-Admin-Token header.
+ADMIN_TOKEN = os.environ.get("CGEE_ADMIN_TOKEN")
+
+
+def _require_admin(request: Request):
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (set CGEE_ADMIN_TOKEN).")
+    # Constant-time; bytes, since compare_digest rejects non-ASCII str
+    token = request.headers.get("X-Admin-Token", "").encode()
+    if not hmac.compare_digest(token, ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token.")
+
+
+@app.get("/admin/models")
+def admin_models(request: Request):
+    _require_admin(request)
+    return {**model_status(), "versions": list_versions()}
+
+
+@app.post("/admin/models/reload", status_code=202)
+def admin_reload_models(request: Request, req: ModelReloadRequest = None):
+    """Load a registry version in the background and swap it in when warm."""
+    _require_admin(request)
+    if not is_engine_ready():
+        raise HTTPException(status_code=503, detail="Engine not ready")
+    version = req.version if req else None
+    if version is not None:
+        try:
+            read_manifest(version)
+        except FileNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+    # Process workers hold their own engine: move them over once it is live
+    on_success = (lambda info: COMPUTE_POOL.restart(info["version"])) \
+        if COMPUTE_POOL.backend == "process" else None
+    if not start_model_reload(version, on_success=on_success):
+        raise HTTPException(status_code=409, detail="A model reload is already in progress")
+    return {"reload": "started", "version": version, "status": model_status()}
+
+
+# ----- Debug endpoints (admin only; idle until called) -----
+
+@app.get("/debug/profile")
+async def debug_profile(request: Request, seconds: float = 10.0, hz: int = 100, threads: str = "compute",
+                        idle: bool = False):
+    """
+    Sample the stacks of the threads running route predictions for
+    `seconds` and return them as collapsed stacks (flamegraph.pl,
+    speedscope). threads=all samples every thread of the API process;
+    idle=true keeps the stacks of threads waiting for work.
+    """
+    _require_admin(request)
+    if threads not in ("compute", "all"):
+        raise HTTPException(status_code=422, detail='threads must be "compute" or "all".')
+    if threads == "compute" and COMPUTE_POOL.backend != "thread":
+        raise HTTPException(status_code=409, detail={
+            "error": "Route predictions run in worker processes, outside this process's threads.",
+            "hint": "Profile the workers with an external sampler such as py-spy, or use threads=all "
+                    "for the API process itself.",
+            "worker_pids": COMPUTE_POOL.worker_pids(),
+        })
+    try:
+        lines, stats = await asyncio.get_running_loop().run_in_executor(
+            None, sample_stacks, seconds, hz, threads, idle
+        )
+    except DiagnosticsBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return PlainTextResponse("\n".join(lines) + "\n", headers={
+        "X-Profile-Samples": str(stats["samples"]),
+        "X-Profile-Idle-Samples": str(stats["idle_samples"]),
+        "X-Profile-Ticks": str(stats["ticks"]),
+        "X-Profile-Hz": str(stats["hz"]),
+    })
+
+
+@app.get("/debug/memory")
+async def debug_memory(request: Request, trace_seconds: float = 0.0, top: int = 20):
+    """
+    Sizes of the graph, caches and models in this process; with
+    trace_seconds, also the top tracemalloc allocation sites over that window.
+    """
+    _require_admin(request)
+    try:
+        report = await asyncio.get_running_loop().run_in_executor(
+            None, memory_report, trace_seconds, min(max(top, 1), 100)
+        )
+    except DiagnosticsBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    report["compute_backend"] = COMPUTE_POOL.backend
+    return report
+
+
+# Add a Server-Timing header (browser dev tools show it per request) with
+# the queue wait, each engine stage and the total compute time
+SERVER_TIMING = os.environ.get("CGEE_SERVER_TIMING", "0") == "1"
+
+
+def _timing_headers(timing) -> dict:
+    headers = {
+        "X-Queue-Wait-Ms": str(timing["queue_wait_ms"]),
+        "X-Compute-Ms": str(timing["compute_ms"]),
+    }
+    if SERVER_TIMING:
+        entries = [("queue", timing["queue_wait_ms"]), *timing["stages_ms"].items(),
+                   ("compute", timing["compute_ms"])]
+        headers["Server-Timing"] = ", ".join(f"{name};dur={ms}" for name, ms in entries)
+    return headers
+
+
 @app.post("/predict-route-eta")
 @limiter.limit("30/minute")
-def predict_route_eta(request: Request, req: RouteRequest):
+async def predict_route_eta(request: Request, req: RouteRequest):
     if not is_engine_ready():
         err = get_init_error()
         raise HTTPException(
@@ -190,9 +510,23 @@ def predict_route_eta(request: Request, req: RouteRequest):
             },
         )
     try:
-        result = compute_route_eta(
-            source=req.source.dict(),
-            destination=req.destination.dict(),
+        source, destination = req.source.dict(), req.destination.dict()
+        # Identical requests in the same departure hour share one computation
+        coalesce_key = (
+            source["lat"], source["lon"], destination["lat"], destination["lon"],
+            req.seed, req.samples, req.geometry_format, req.simplify_tolerance_m, req.zoom,
+            datetime.now().hour,
+        )
+        result, timing = await COMPUTE_POOL.run(
+            compute_route_eta,
+            source=source,
+            destination=destination,
+            seed=req.seed,
+            samples=req.samples,
+            geometry_format=req.geometry_format,
+            simplify_tolerance_m=req.simplify_tolerance_m,
+            zoom=req.zoom,
+            coalesce_key=coalesce_key,
         )
         session_id = request.headers.get("X-Session-ID", "demo")
         threading.Thread(
@@ -200,7 +534,17 @@ def predict_route_eta(request: Request, req: RouteRequest):
             args=(session_id, req.source.dict(), req.destination.dict(), result),
             daemon=True
         ).start()
-        return result
+        return FastJSONResponse(result, headers=_timing_headers(timing))
+    except PoolSaturated:
+        raise HTTPException(
+            status_code=429,
+            detail="Server busy: too many route predictions in flight. Retry shortly.",
+            headers={"Retry-After": str(COMPUTE_POOL.retry_after_s())},
+        )
+    except PoolUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except ValueError as e:
@@ -212,6 +556,47 @@ def predict_route_eta(request: Request, req: RouteRequest):
             detail={"error": "ETA computation failed", "detail": str(e)},
         )
 
+@app.post("/predict-route-eta/batch")
+@limiter.limit("10/minute")
+async def predict_route_eta_batch(request: Request, req: BatchRouteRequest):
+    """
+    ETAs for many origin/destination pairs in one call. Results come back
+    in request order; an item that cannot be routed carries "error".
+    """
+    if not is_engine_ready():
+        raise HTTPException(status_code=503, detail={"error": "Engine not ready", "init_error": get_init_error()})
+    try:
+        results, timing = await COMPUTE_POOL.run(
+            compute_route_eta_batch,
+            pairs=[(item.source.dict(), item.destination.dict()) for item in req.items],
+            departure_time=req.departure_time,
+            seed=req.seed,
+            samples=req.samples,
+            k=req.k,
+            horizons=req.horizons,
+            include_geometry=req.include_geometry,
+            geometry_format=req.geometry_format,
+            simplify_tolerance_m=req.simplify_tolerance_m,
+            zoom=req.zoom,
+        )
+    except PoolSaturated:
+        raise HTTPException(
+            status_code=429,
+            detail="Server busy: too many route predictions in flight. Retry shortly.",
+            headers={"Retry-After": str(COMPUTE_POOL.retry_after_s())},
+        )
+    except PoolUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return FastJSONResponse({
+        "results": results,
+        "count": len(results),
+        "errors": sum(1 for r in results if "error" in r),
+    }, headers=_timing_headers(timing))
+
 @app.post("/trips/save")
 def save_trip_endpoint(req: RouteRequest, session_id: str = "demo"):
     """Called by frontend after a successful prediction to store history."""
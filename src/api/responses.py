@@ -0,0 +1,30 @@
+"""
+JSON response class for the route endpoints.
+
+Route responses are large nested dicts of plain floats, ints and strings.
+Returning them as a Response skips FastAPI's jsonable_encoder walk over
+every geometry point; orjson then serialises the dict several times faster
+than the json module. Without orjson installed the same compact JSON is
+written with json.dumps.
+"""
+import json
+
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:   # optional: only a speed-up
+    orjson = None
+
+
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -0,0 +1,148 @@
+"""
+CGEE command-line tools.
+
+Usage (from the project root):
+    python -m src.cli build-snapshot [--graphml PATH] [--out DIR]
+    python -m src.cli build-ch [--snapshot DIR] [--out DIR]
+    python -m src.cli export-models [--models DIR] [--verify CSV | --no-verify]
+    python -m src.cli publish-models [--models DIR] [--version NAME] [--activate]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+
+def build_snapshot(args):
+    import osmnx as ox
+    from src.routing.compiled_graph import compile_graph
+    from src.routing.graph_snapshot import save_snapshot
+
+    started = time.perf_counter()
+    print(f"Parsing {args.graphml}...")
+    G = ox.load_graphml(args.graphml)
+    print(f"Compiling {len(G.nodes)} nodes, {len(G.edges)} edges...")
+    cg = compile_graph(G)
+    save_snapshot(cg, args.out, source=args.graphml)
+    print(
+        f"Snapshot written to {args.out}: {cg.num_nodes} nodes, "
+        f"{cg.num_edges} edges, {cg.nbytes() / 1e6:.1f} MB "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+
+
+def build_ch(args):
+    from src.routing.contraction import build_ch as contract, save_ch
+    from src.routing.graph_snapshot import load_snapshot
+
+    cg = load_snapshot(args.snapshot, mmap=False)
+    print(f"Contracting {cg.num_nodes} nodes, {cg.num_edges} edges...")
+    started = time.perf_counter()
+    ch = contract(cg)
+    elapsed = time.perf_counter() - started
+    save_ch(ch, cg.snapshot_id, args.out, build_seconds=round(elapsed, 1))
+    print(
+        f"Contraction hierarchy written to {args.out}: {ch.num_shortcuts} shortcuts, "
+        f"{ch.nbytes() / 1e6:.1f} MB in {elapsed:.1f}s"
+    )
+
+
+def export_models(args):
+    import joblib
+    import numpy as np
+    import pandas as pd
+    from src.models.multi_horizon_xgb import DATA_PATH, FEATURE_COLS, TARGETS
+    from src.models.tree_ensemble import export_model
+
+    X = None
+    verify_path = args.verify or str(DATA_PATH)
+    if args.no_verify:
+        pass
+    elif os.path.exists(verify_path):
+        X = pd.read_csv(verify_path).dropna(subset=FEATURE_COLS)[FEATURE_COLS].to_numpy(np.float32)
+        print(f"Verifying against {len(X)} rows of {verify_path}")
+    elif args.verify:
+        print(f"{verify_path} not found")
+        return 1
+    else:
+        print(f"{verify_path} not found; exporting without verification")
+
+    for horizon in TARGETS:
+        pkl_path = os.path.join(args.models, f"xgb_{horizon}.pkl")
+        npz_path = os.path.join(args.models, f"xgb_{horizon}.npz")
+        model = joblib.load(pkl_path)
+        ensemble = export_model(model)
+        if ensemble.feature_names and ensemble.feature_names != FEATURE_COLS:
+            print(f"{pkl_path}: features {ensemble.feature_names} do not match FEATURE_COLS")
+            return 1
+        if X is not None:
+            mismatched = int((model.predict(X) != ensemble.predict(X)).sum())
+            if mismatched:
+                print(f"{pkl_path}: {mismatched}/{len(X)} predictions differ; not exported")
+                return 1
+        ensemble.save(npz_path)
+        print(
+            f"{npz_path}: {ensemble.num_trees} trees, depth {ensemble.max_depth}, "
+            f"{os.path.getsize(npz_path) / 1e3:.0f} kB"
+            + (", bit-identical to xgboost" if X is not None else "")
+        )
+    return 0
+
+
+def publish_models(args):
+    from src.models.registry import REGISTRY_DIR, load_version, publish_version
+
+    version = publish_version(args.models, version=args.version, activate=args.activate)
+    _, manifest = load_version(version)   # re-read: checksums and feature columns
+    for horizon, entry in manifest["horizons"].items():
+        print(f"{horizon}: {entry['file']} sha256 {entry['sha256'][:12]} metrics {entry['metrics']}")
+    print(
+        f"Published {REGISTRY_DIR}/{version}"
+        + (" and made it current" if args.activate else
+           f" (activate with --activate, or POST /admin/models/reload {{\"version\": \"{version}\"}})")
+    )
+    return 0
+
+
+def main(argv=None):
+    from src.routing.graph_loader import GRAPH_PATH
+    from src.routing.graph_snapshot import SNAPSHOT_DIR
+    from src.routing.contraction import CH_DIR
+    from src.models.multi_horizon_xgb import MODEL_DIR
+
+    parser = argparse.ArgumentParser(prog="cgee", description="CGEE command-line tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build-snapshot", help="Convert the GraphML road graph into a binary snapshot")
+    p.add_argument("--graphml", default=GRAPH_PATH)
+    p.add_argument("--out", default=SNAPSHOT_DIR)
+    p.set_defaults(func=build_snapshot)
+
+    p = sub.add_parser("build-ch", help="Build a contraction hierarchy for the graph snapshot")
+    p.add_argument("--snapshot", default=SNAPSHOT_DIR)
+    p.add_argument("--out", default=CH_DIR)
+    p.set_defaults(func=build_ch)
+
+    p = sub.add_parser("export-models", help="Export the XGBoost horizon models for the native evaluator")
+    p.add_argument("--models", default=str(MODEL_DIR))
+    p.add_argument("--verify", default=None,
+                   help="CSV whose FEATURE_COLS rows both evaluators must score identically "
+                        "(default: the training dataset, when present)")
+    p.add_argument("--no-verify", action="store_true")
+    p.set_defaults(func=export_models)
+
+    p = sub.add_parser("publish-models", help="Publish the horizon models as a new registry version")
+    p.add_argument("--models", default=str(MODEL_DIR))
+    p.add_argument("--version", default=None, help="Version name (default: a timestamp)")
+    p.add_argument("--activate", action="store_true",
+                   help="Point the registry's CURRENT at the new version")
+    p.set_defaults(func=publish_models)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
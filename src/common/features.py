@@ -3,6 +3,57 @@
 import numpy as np
 import pandas as pd
 
+# 🔒 LOCKED FEATURE CONTRACT (TRAINING == INFERENCE)
+# Defined here, not in the training module, so serving code gets it without
+# importing multi_horizon_xgb (which creates MODEL_DIR and loads joblib).
+FEATURE_COLS = [
+    "speed_lag_1",
+    "hour",
+    "hour_sin",
+    "hour_cos",
+    "is_peak",
+    "incident_flag",
+    "incident_severity"
+]
+
+# hour takes 24 values, so its cyclical encoding is a table lookup
+_HOURS = np.arange(24)
+HOUR_SIN = np.sin(2 * np.pi * _HOURS / 24)
+HOUR_COS = np.cos(2 * np.pi * _HOURS / 24)
+
+_COL = {name: i for i, name in enumerate(FEATURE_COLS)}
+
+
+def build_features_batch(
+    speed_lag_1,
+    hour,
+    is_peak,
+    incident_flag,
+    incident_severity
+) -> np.ndarray:
+    """
+    Build the ML feature matrix for many rows at once: a C-contiguous
+    float32 array with columns in the locked FEATURE_COLS order. Arguments
+    are arrays (or scalars, broadcast to the common length). float32 is
+    what XGBoost converts its input to, so predictions are unchanged.
+    """
+    speed_lag_1, hour, is_peak, incident_flag, incident_severity = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(speed_lag_1, dtype=np.float64)),
+        np.atleast_1d(np.asarray(hour, dtype=np.int64)),
+        np.atleast_1d(is_peak),
+        np.atleast_1d(incident_flag),
+        np.atleast_1d(np.asarray(incident_severity, dtype=np.float64)),
+    )
+    X = np.empty((len(hour), len(FEATURE_COLS)), dtype=np.float32)
+    X[:, _COL["speed_lag_1"]] = speed_lag_1
+    X[:, _COL["hour"]] = hour
+    X[:, _COL["hour_sin"]] = HOUR_SIN[hour]
+    X[:, _COL["hour_cos"]] = HOUR_COS[hour]
+    X[:, _COL["is_peak"]] = is_peak
+    X[:, _COL["incident_flag"]] = incident_flag
+    X[:, _COL["incident_severity"]] = incident_severity
+    return X
+
 
 def build_features(
     speed_lag_1: float,
@@ -13,13 +64,9 @@ def build_features(
 ):
     """
     Build ML feature vector in EXACT order used during training
+    (one-row wrapper over build_features_batch)
     """
-    return pd.DataFrame([{
-        "speed_lag_1": speed_lag_1,
-        "hour": hour,
-        "hour_sin": np.sin(2 * np.pi * hour / 24),
-        "hour_cos": np.cos(2 * np.pi * hour / 24),
-        "is_peak": is_peak,
-        "incident_flag": incident_flag,
-        "incident_severity": incident_severity
-    }])
+    return pd.DataFrame(
+        build_features_batch(speed_lag_1, hour, is_peak, incident_flag, incident_severity),
+        columns=FEATURE_COLS,
+    )
@@ -0,0 +1,117 @@
+# src/common/geometry.py
+
+import numpy as np
+
+GEOMETRY_FORMATS = ("json", "polyline", "delta")
+GEOMETRY_PRECISION = 5   # decimal places kept: 1e-5 degrees is about 1.1 m
+EARTH_RADIUS_M = 6371000.0
+_M_PER_DEG = EARTH_RADIUS_M * np.pi / 180
+_MERCATOR_M_PER_PX = 156543.03392   # web-map metres per pixel at zoom 0 on the equator
+MAX_ZOOM = 22
+
+
+def _scaled_deltas(points, precision) -> np.ndarray:
+    """[lat0, lon0, dlat1, dlon1, ...] as integers in units of 10^-precision degrees."""
+    coords = np.array([(p["lat"], p["lon"]) for p in points], dtype=np.float64).reshape(-1, 2)
+    scaled = np.round(coords * 10 ** precision).astype(np.int64)
+    return np.diff(scaled, axis=0, prepend=np.zeros((1, 2), np.int64)).ravel()
+
+
+def encode_polyline(points, precision=GEOMETRY_PRECISION) -> str:
+    """
+    Google encoded polyline of [{"lat", "lon"}, ...]: decodes with the
+    standard clients (e.g. @mapbox/polyline, Leaflet plugins) at the same
+    precision.
+    """
+    chars = []
+    for value in _scaled_deltas(points, precision).tolist():
+        value = ~(value << 1) if value < 0 else value << 1
+        while value >= 0x20:
+            chars.append(chr((0x20 | (value & 0x1F)) + 63))
+            value >>= 5
+        chars.append(chr(value + 63))
+    return "".join(chars)
+
+
+def decode_polyline(encoded, precision=GEOMETRY_PRECISION) -> list:
+    values, value, shift = [], 0, 0
+    for ch in encoded:
+        b = ord(ch) - 63
+        value |= (b & 0x1F) << shift
+        shift += 5
+        if b < 0x20:
+            values.append(~(value >> 1) if value & 1 else value >> 1)
+            value, shift = 0, 0
+    return _undelta(values, precision)
+
+
+def encode_delta(points, precision=GEOMETRY_PRECISION) -> list:
+    """
+    Flat integer list [lat0, lon0, dlat1, dlon1, ...] in units of
+    10^-precision degrees; a running sum restores the coordinates.
+    """
+    return _scaled_deltas(points, precision).tolist()
+
+
+def decode_delta(values, precision=GEOMETRY_PRECISION) -> list:
+    return _undelta(values, precision)
+
+
+def _undelta(values, precision) -> list:
+    coords = np.cumsum(np.asarray(values, dtype=np.int64).reshape(-1, 2), axis=0) / 10 ** precision
+    return [{"lat": lat, "lon": lon} for lat, lon in coords.tolist()]
+
+
+def encode_geometry(points, geometry_format):
+    """route_geometry in `geometry_format` (one of GEOMETRY_FORMATS)."""
+    if geometry_format == "polyline":
+        return encode_polyline(points)
+    if geometry_format == "delta":
+        return encode_delta(points)
+    if geometry_format == "json":
+        return points
+    raise ValueError(f"Unknown geometry format {geometry_format!r}; use one of {GEOMETRY_FORMATS}")
+
+
+def zoom_tolerance_m(zoom, lat) -> float:
+    """Ground size of one pixel on a 256-px-tile web map at `zoom` and `lat`."""
+    return _MERCATOR_M_PER_PX * np.cos(np.radians(lat)) / 2 ** zoom
+
+
+def simplify_indices(points, tolerance_m, keep=()) -> np.ndarray:
+    """
+    Indices of [{"lat", "lon"}, ...] kept by Douglas-Peucker at
+    `tolerance_m` metres, in order. The first and last points and every
+    index in `keep` always survive: the line is split at them and each
+    piece simplified on its own. Distances are to the chord segment in a
+    local equirectangular projection, one numpy pass per chord.
+    """
+    n = len(points)
+    if n <= 2 or not tolerance_m or tolerance_m <= 0:
+        return np.arange(n)
+    coords = np.array([(p["lat"], p["lon"]) for p in points], dtype=np.float64)
+    y = coords[:, 0] * _M_PER_DEG
+    x = coords[:, 1] * _M_PER_DEG * np.cos(np.radians(coords[:, 0].mean()))
+    tol2 = float(tolerance_m) ** 2
+
+    kept = np.zeros(n, dtype=bool)
+    kept[[0, n - 1]] = True
+    kept[[k for k in keep if 0 <= k < n]] = True
+    anchors = np.flatnonzero(kept)
+    stack = [(i, j) for i, j in zip(anchors[:-1].tolist(), anchors[1:].tolist()) if j - i > 1]
+    while stack:
+        i, j = stack.pop()
+        dx, dy = x[j] - x[i], y[j] - y[i]
+        px, py = x[i + 1:j] - x[i], y[i + 1:j] - y[i]
+        chord2 = dx * dx + dy * dy
+        t = np.clip((px * dx + py * dy) / chord2, 0.0, 1.0) if chord2 > 0 else 0.0
+        d2 = (px - t * dx) ** 2 + (py - t * dy) ** 2
+        k = int(np.argmax(d2))
+        if d2[k] > tol2:
+            m = i + 1 + k
+            kept[m] = True
+            if m - i > 1:
+                stack.append((i, m))
+            if j - m > 1:
+                stack.append((m, j))
+    return np.flatnonzero(kept)
@@ -0,0 +1,145 @@
+# src/common/metrics.py
+"""
+In-process latency histograms, rendered in the Prometheus text format.
+
+Engine code times its hot-path stages with `with stage("snap"): ...`. The
+timings of one call are summed per stage in a thread-local collector and
+observed into STAGE_SECONDS once, when the outermost stage_collector()
+exits, so the histograms count per-request stage time. Compute workers
+collect with record=False and hand the dict back with their result; the
+API process records it, so /metrics sees the same numbers with the
+thread and the process backend.
+
+Observing is a bisect and three additions under a lock (about a
+microsecond); CGEE_METRICS=0 turns stage timing off entirely.
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+METRICS_ENABLED = os.environ.get("CGEE_METRICS", "1") == "1"
+# Seconds; the le="+Inf" bucket is implied
+LATENCY_BUCKETS_S = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                     0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names, values) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class Histogram:
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS_S):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}   # label values -> [count per bucket..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, seconds, *label_values):
+        i = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[i] += 1
+            series[-1] += seconds
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {key: list(values) for key, values in self._series.items()}
+        for label_values, values in sorted(series.items()):
+            cumulative = 0
+            for le, count in zip(self.buckets + ("+Inf",), values[:-1]):
+                cumulative += count
+                labels = _format_labels(self.labels + ("le",), label_values + (le,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {values[-1]:.6f}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def render_metric(name, kind, help_text, samples) -> list:
+    """Lines for a gauge or counter; samples are (labels dict, value) pairs."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        if value is None:
+            continue
+        rendered = _format_labels(tuple(labels), tuple(labels.values()))
+        lines.append(f"{name}{rendered} {float(value):g}")
+    return lines
+
+
+STAGE_SECONDS = Histogram(
+    "cgee_stage_seconds", "Time per request spent in each compute_route_eta stage", ("stage",)
+)
+REQUEST_SECONDS = Histogram(
+    "cgee_http_request_seconds", "HTTP request latency by route and status", ("path", "status")
+)
+
+# ---------------------------------------------------
+# Stage timing
+# ---------------------------------------------------
+_local = threading.local()
+
+
+class stage:
+    """Context manager adding the block's wall time to stage `name`."""
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record_stage(self.name, time.perf_counter() - self.started)
+
+
+def record_stage(name, seconds):
+    if not METRICS_ENABLED:
+        return
+    stages = getattr(_local, "stages", None)
+    if stages is None:
+        STAGE_SECONDS.observe(seconds, name)
+    else:
+        stages[name] = stages.get(name, 0.0) + seconds
+
+
+def record_stages(stages):
+    for name, seconds in stages.items():
+        STAGE_SECONDS.observe(seconds, name)
+
+
+@contextmanager
+def stage_collector(record=True):
+    """
+    Sum this thread's stage timings into the yielded dict. Nested
+    collectors share the outermost one; on exit it is observed into
+    STAGE_SECONDS unless `record` is False (the caller ships it elsewhere).
+    """
+    outer = getattr(_local, "stages", None)
+    if outer is not None:
+        yield outer
+        return
+    _local.stages = stages = {}
+    try:
+        yield stages
+    finally:
+        _local.stages = None
+        if record:
+            record_stages(stages)
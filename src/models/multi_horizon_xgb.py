@@ -1,32 +1,28 @@
 import pandas as pd
 import numpy as np
 import joblib
+import json
+import logging
 import os
-from xgboost import XGBRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 from pathlib import Path
 import joblib
 
+# 🔒 LOCKED FEATURE CONTRACT (TRAINING == INFERENCE), shared with serving
+from src.common.features import FEATURE_COLS
+
+# xgboost / sklearn are imported inside train_xgb_for_horizon(): serving
+# only needs FEATURE_COLS and load_models(), and with exported .npz models
+# never imports either.
+
 # ============================================================
 # CONFIG
 # ============================================================
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_PATH = PROJECT_ROOT / "data" / "processed" / "training_dataset.csv"
-MODEL_DIR = PROJECT_ROOT / "models"
+MODEL_DIR = Path(os.environ.get("CGEE_MODEL_DIR", PROJECT_ROOT / "models"))
 MODEL_DIR.mkdir(exist_ok=True)
 
-# 🔒 LOCKED FEATURE CONTRACT (TRAINING == INFERENCE)
-FEATURE_COLS = [
-    "speed_lag_1",
-    "hour",
-    "hour_sin",
-    "hour_cos",
-    "is_peak",
-    "incident_flag",
-    "incident_severity"
-]
-
 TARGETS = {
     "1_hour": "y_1h",
     "2_hour": "y_2h",
@@ -38,6 +34,9 @@ TARGETS = {
 # ============================================================
 
 def train_xgb_for_horizon(df, horizon_name, target_col):
+    from xgboost import XGBRegressor
+    from sklearn.metrics import mean_absolute_error, mean_squared_error
+
     print(f"\nTraining XGBoost for horizon: {horizon_name}")
 
     # Drop rows with missing required data
@@ -98,6 +97,10 @@ def main():
 
         results[horizon] = {"MAE": mae, "RMSE": rmse}
 
+    # Picked up by `python -m src.cli publish-models` for the registry manifest
+    with open(MODEL_DIR / "metrics.json", "w") as f:
+        json.dump({h: {k: round(float(v), 4) for k, v in m.items()} for h, m in results.items()}, f, indent=2)
+
     print("\n==== XGBOOST MULTI-HORIZON RESULTS (HOURLY) ====")
     for h, m in results.items():
         print(f"{h}: MAE={m['MAE']:.2f}, RMSE={m['RMSE']:.2f}")
@@ -107,16 +110,37 @@ if __name__ == "__main__":
     main()
 
 
+logger = logging.getLogger("cgee.models")
+
+# "native": load each horizon from its exported xgb_{horizon}.npz
+# (python -m src.cli export-models) and score with the NumPy tree evaluator;
+# "xgboost": always load the joblib pickle.
+MODEL_BACKEND = os.environ.get("CGEE_MODEL_BACKEND", "native")
+
+
 def load_models():
     """
-    Load trained multi-horizon XGBoost models from disk.
+    Load trained multi-horizon models from MODEL_DIR (the unversioned
+    layout; see src/models/registry.py for versions). Either kind exposes
+    predict(X) over FEATURE_COLS columns. An exported model older than its
+    pickle is ignored (with a warning) so a retrain is never shadowed.
     """
-    base_path = os.path.join("models")
-
-    models = {
-        "1_hour": joblib.load(os.path.join(base_path, "xgb_1_hour.pkl")),
-        "2_hour": joblib.load(os.path.join(base_path, "xgb_2_hour.pkl")),
-        "4_hour": joblib.load(os.path.join(base_path, "xgb_4_hour.pkl")),
-    }
+    base_path = MODEL_DIR
+
+    models = {}
+    for horizon in TARGETS:
+        pkl_path = os.path.join(base_path, f"xgb_{horizon}.pkl")
+        npz_path = os.path.join(base_path, f"xgb_{horizon}.npz")
+        if MODEL_BACKEND == "native" and os.path.exists(npz_path):
+            if os.path.exists(pkl_path) and os.path.getmtime(pkl_path) > os.path.getmtime(npz_path):
+                logger.warning(
+                    f"{npz_path} is older than {pkl_path}; loading the pickle. "
+                    f"Re-run `python -m src.cli export-models`."
+                )
+            else:
+                from src.models.tree_ensemble import TreeEnsemble
+                models[horizon] = TreeEnsemble.load(npz_path)
+                continue
+        models[horizon] = joblib.load(pkl_path)
 
     return models
@@ -0,0 +1,180 @@
+"""
+Versioned model registry.
+
+Each published model set lives in its own directory under REGISTRY_DIR:
+
+    models/registry/
+        20261018-141500/
+            manifest.json
+            xgb_1_hour.npz   (exported TreeEnsembles; joblib .pkl also accepted)
+            xgb_2_hour.npz
+            xgb_4_hour.npz
+        CURRENT             name of the active version
+
+manifest.json records the feature columns the models were trained on, the
+training metrics, and a SHA-256 per artifact; load_version() refuses a
+version whose features or checksums do not match. Without a CURRENT file
+the newest version is active, and without any version the flat
+models/xgb_{horizon}.* files are loaded as before ("unversioned").
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import joblib
+
+from src.models.multi_horizon_xgb import FEATURE_COLS, MODEL_DIR, TARGETS, load_models
+
+logger = logging.getLogger("cgee.models")
+
+REGISTRY_DIR = Path(os.environ.get("CGEE_MODEL_REGISTRY", MODEL_DIR / "registry"))
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+UNVERSIONED = "unversioned"
+
+
+def _sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_atomic(path, text):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def list_versions(registry_dir=REGISTRY_DIR) -> list:
+    """Published versions, oldest first."""
+    if not os.path.isdir(registry_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(registry_dir)
+        if os.path.isfile(os.path.join(registry_dir, name, MANIFEST_FILE))
+    )
+
+
+def active_version(registry_dir=REGISTRY_DIR):
+    """The version named in CURRENT, else the newest one, else None."""
+    versions = list_versions(registry_dir)
+    current = os.path.join(registry_dir, CURRENT_FILE)
+    if os.path.exists(current):
+        with open(current) as f:
+            name = f.read().strip()
+        if name in versions:
+            return name
+        logger.warning(f"{current} names unknown version {name!r}; using the newest")
+    return versions[-1] if versions else None
+
+
+def read_manifest(version, registry_dir=REGISTRY_DIR) -> dict:
+    path = os.path.join(registry_dir, version, MANIFEST_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Model version {version!r} not found in {registry_dir}")
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_version(version, registry_dir=REGISTRY_DIR):
+    """(models, manifest) for a published version, after validating it."""
+    manifest = read_manifest(version, registry_dir)
+    if manifest.get("feature_cols") != FEATURE_COLS:
+        raise ValueError(
+            f"Model version {version!r} was trained on {manifest.get('feature_cols')}, "
+            f"not FEATURE_COLS {FEATURE_COLS}"
+        )
+    missing = set(TARGETS) - set(manifest.get("horizons", {}))
+    if missing:
+        raise ValueError(f"Model version {version!r} has no model for {sorted(missing)}")
+
+    models = {}
+    for horizon in TARGETS:
+        entry = manifest["horizons"][horizon]
+        path = os.path.join(registry_dir, version, entry["file"])
+        if _sha256(path) != entry["sha256"]:
+            raise ValueError(f"{path}: checksum does not match the manifest")
+        if path.endswith(".npz"):
+            from src.models.tree_ensemble import TreeEnsemble
+            models[horizon] = TreeEnsemble.load(path)
+        else:
+            models[horizon] = joblib.load(path)
+    return models, manifest
+
+
+def load_active_models(registry_dir=REGISTRY_DIR):
+    """(models, info) for the active version, or the flat models/ files."""
+    version = active_version(registry_dir)
+    if version is None:
+        return load_models(), {"version": UNVERSIONED}
+    models, manifest = load_version(version, registry_dir)
+    return models, {
+        "version": version,
+        "created_at": manifest.get("created_at"),
+        "metrics": {h: e.get("metrics") for h, e in manifest["horizons"].items()},
+    }
+
+
+def publish_version(source_dir=MODEL_DIR, version=None, metrics=None, activate=False,
+                    registry_dir=REGISTRY_DIR) -> str:
+    """
+    Copy the horizon models in `source_dir` (the exported .npz when it is
+    not older than the pickle) into a new version directory with its
+    manifest. `metrics` is {horizon: {...}}, by default source_dir's
+    metrics.json as written by training. Returns the version name.
+    """
+    version = version or datetime.now().strftime("%Y%m%d-%H%M%S")
+    final_dir = os.path.join(registry_dir, version)
+    if os.path.exists(final_dir):
+        raise ValueError(f"Model version {version!r} already exists")
+    if metrics is None:
+        metrics_path = os.path.join(source_dir, "metrics.json")
+        metrics = {}
+        if os.path.exists(metrics_path):
+            with open(metrics_path) as f:
+                metrics = json.load(f)
+
+    # Build under a temporary name and rename, so a watcher never sees a
+    # half-written version
+    tmp_dir = os.path.join(registry_dir, f".{version}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    horizons = {}
+    for horizon in TARGETS:
+        pkl_path = os.path.join(source_dir, f"xgb_{horizon}.pkl")
+        npz_path = os.path.join(source_dir, f"xgb_{horizon}.npz")
+        src = npz_path if os.path.exists(npz_path) and (
+            not os.path.exists(pkl_path) or os.path.getmtime(npz_path) >= os.path.getmtime(pkl_path)
+        ) else pkl_path
+        dst = os.path.join(tmp_dir, os.path.basename(src))
+        shutil.copyfile(src, dst)
+        horizons[horizon] = {
+            "file": os.path.basename(src),
+            "sha256": _sha256(dst),
+            "metrics": metrics.get(horizon),
+        }
+    manifest = {
+        "version": version,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "feature_cols": FEATURE_COLS,
+        "horizons": horizons,
+    }
+    _write_atomic(os.path.join(tmp_dir, MANIFEST_FILE), json.dumps(manifest, indent=2))
+    os.replace(tmp_dir, final_dir)
+
+    if activate:
+        activate_version(version, registry_dir)
+    return version
+
+
+def activate_version(version, registry_dir=REGISTRY_DIR):
+    """Point CURRENT at `version` (atomically)."""
+    read_manifest(version, registry_dir)
+    _write_atomic(os.path.join(registry_dir, CURRENT_FILE), version + "\n")
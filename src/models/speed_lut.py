@@ -0,0 +1,123 @@
+"""
+Lookup-table inference for the horizon speed models.
+
+At inference time the seven model features are a function of three inputs:
+hour (which also fixes hour_sin, hour_cos and is_peak), speed_lag_1 and
+incident severity (incident_flag is severity > 0). SpeedLUT evaluates a
+model once on a uniform grid over those inputs: 24 hours × speed steps ×
+severity steps for incident rows, plus 24 × speed steps for incident-free
+rows. Queries are then answered by linear interpolation along speed and
+severity, i.e. a handful of array gathers per batch with no model call.
+Inputs outside the grid are clamped to its edge.
+
+The models are piecewise constant in each feature, so interpolation is
+only exact away from split thresholds. build_speed_lut() measures the
+error against the true model on random points and reports it.
+"""
+import numpy as np
+
+from src.common.features import build_features_batch
+
+SPEED_RANGE = (0.0, 120.0)       # speed_lag_1, km/h
+SEVERITY_RANGE = (0.0, 0.9)      # simulate_incidents caps severity at 0.90
+PEAK_HOURS = [h for h in range(24) if 7 <= h <= 10 or 17 <= h <= 21]
+_BUILD_CHUNK_ROWS = 50_000
+
+
+def lut_nbytes(speed_step, severity_step) -> int:
+    """Memory a SpeedLUT at this resolution needs, in bytes."""
+    n_speed = int(round((SPEED_RANGE[1] - SPEED_RANGE[0]) / speed_step)) + 1
+    n_sev = int(round((SEVERITY_RANGE[1] - SEVERITY_RANGE[0]) / severity_step)) + 1
+    return 4 * 24 * n_speed * (n_sev + 1)
+
+
+def _predict_chunked(model, hour, speed, severity):
+    hour = np.asarray(hour)
+    out = np.empty(len(hour), dtype=np.float32)
+    for lo in range(0, len(hour), _BUILD_CHUNK_ROWS):
+        hi = lo + _BUILD_CHUNK_ROWS
+        out[lo:hi] = model.predict(build_features_batch(
+            speed_lag_1=speed[lo:hi],
+            hour=hour[lo:hi],
+            is_peak=np.isin(hour[lo:hi], PEAK_HOURS),
+            incident_flag=severity[lo:hi] > 0,
+            incident_severity=severity[lo:hi],
+        ))
+    return out
+
+
+class SpeedLUT:
+    def __init__(self, speeds, severities, table_clear, table_incident):
+        self.speeds = speeds                  # float64 [S] grid along speed_lag_1
+        self.severities = severities          # float64 [V] grid along severity
+        self.table_clear = table_clear        # float32 [24, S]     incident_flag = 0
+        self.table_incident = table_incident  # float32 [24, S, V]  incident_flag = 1
+        self.max_abs_error = None
+        self.mean_abs_error = None
+
+    def _axis(self, grid, x):
+        """Lower grid index and interpolation weight for each x (clamped)."""
+        step = grid[1] - grid[0]
+        pos = (np.clip(x, grid[0], grid[-1]) - grid[0]) / step
+        i = np.minimum(pos.astype(np.intp), len(grid) - 2)
+        return i, pos - i
+
+    def predict(self, hour, speed_lag_1, severity) -> np.ndarray:
+        """Predicted speeds for arrays (or scalars) of the three inputs."""
+        hour, speed, severity = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(hour, dtype=np.intp)),
+            np.atleast_1d(np.asarray(speed_lag_1, dtype=np.float64)),
+            np.atleast_1d(np.asarray(severity, dtype=np.float64)),
+        )
+        i, ws = self._axis(self.speeds, speed)
+        clear = self.table_clear[hour, i] * (1 - ws) + self.table_clear[hour, i + 1] * ws
+
+        incident = severity > 0
+        if not incident.any():
+            return clear
+        j, wv = self._axis(self.severities, severity)
+        t = self.table_incident
+        lo = t[hour, i, j] * (1 - wv) + t[hour, i, j + 1] * wv
+        hi = t[hour, i + 1, j] * (1 - wv) + t[hour, i + 1, j + 1] * wv
+        return np.where(incident, lo * (1 - ws) + hi * ws, clear)
+
+    def nbytes(self) -> int:
+        return self.table_clear.nbytes + self.table_incident.nbytes
+
+
+def build_speed_lut(model, speed_step=0.5, severity_step=0.02, error_samples=2000, seed=0):
+    """
+    Evaluate `model` on the grid and measure interpolation error on
+    `error_samples` random (speed, severity) points per hour and incident
+    state. Returns a SpeedLUT with max_abs_error / mean_abs_error set.
+    """
+    speeds = np.linspace(*SPEED_RANGE, int(round((SPEED_RANGE[1] - SPEED_RANGE[0]) / speed_step)) + 1)
+    severities = np.linspace(
+        *SEVERITY_RANGE, int(round((SEVERITY_RANGE[1] - SEVERITY_RANGE[0]) / severity_step)) + 1
+    )
+    S, V = len(speeds), len(severities)
+
+    hours = np.repeat(np.arange(24), S)
+    table_clear = _predict_chunked(
+        model, hours, np.tile(speeds, 24), np.zeros(24 * S)
+    ).reshape(24, S)
+
+    hours = np.repeat(np.arange(24), S * V)
+    sp = np.tile(np.repeat(speeds, V), 24)
+    sv = np.tile(severities, 24 * S)
+    # Severity 0 with incident_flag 1 never occurs at inference; score the
+    # first column at the flag's boundary instead of the flag-0 point
+    sv_eval = np.where(sv > 0, sv, np.nextafter(np.float32(0), np.float32(1)))
+    table_incident = _predict_chunked(model, hours, sp, sv_eval).reshape(24, S, V)
+
+    lut = SpeedLUT(speeds, severities, table_clear, table_incident)
+
+    rng = np.random.default_rng(seed)
+    n = 24 * error_samples
+    hour = np.repeat(np.arange(24), error_samples)
+    speed = rng.uniform(*SPEED_RANGE, n)
+    severity = np.where(rng.random(n) < 0.5, 0.0, rng.uniform(*SEVERITY_RANGE, n))
+    err = np.abs(lut.predict(hour, speed, severity) - _predict_chunked(model, hour, speed, severity))
+    lut.max_abs_error = float(err.max())
+    lut.mean_abs_error = float(err.mean())
+    return lut
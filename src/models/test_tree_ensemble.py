@@ -0,0 +1,57 @@
+# src/models/test_tree_ensemble.py
+"""TreeEnsemble scores exactly like the xgboost model it was exported from."""
+import numpy as np
+import pytest
+
+from src.common.features import build_features_batch
+from src.models.tree_ensemble import DEDUPE_MIN_ROWS, TreeEnsemble, export_model
+
+xgb = pytest.importorskip("xgboost")
+
+
+def feature_rows(n, seed):
+    rng = np.random.default_rng(seed)
+    hour = rng.integers(0, 24, size=n)
+    severity = np.where(rng.random(n) < 0.3, rng.uniform(0.1, 0.9, size=n), 0.0)
+    X = build_features_batch(
+        speed_lag_1=rng.uniform(5.0, 90.0, size=n),
+        hour=hour,
+        is_peak=(7 <= hour) & (hour <= 10) | (17 <= hour) & (hour <= 21),
+        incident_flag=severity > 0,
+        incident_severity=severity,
+    )
+    y = X[:, 0] * (1.0 - 0.5 * X[:, 6]) + 3.0 * X[:, 2] + rng.normal(0, 2.0, size=n)
+    return X, y
+
+
+# max_depth 4 is scored by bitmasks (<= 16 leaves), 6 by the node walk
+@pytest.fixture(scope="module", params=[4, 6])
+def model(request):
+    X, y = feature_rows(2000, seed=0)
+    return xgb.XGBRegressor(n_estimators=60, max_depth=request.param, learning_rate=0.1,
+                            n_jobs=1).fit(X, y)
+
+
+def test_predictions_bit_identical(model):
+    X, _ = feature_rows(300, seed=1)
+    np.testing.assert_array_equal(export_model(model).predict(X), model.predict(X))
+
+
+def test_missing_values_follow_default_directions(model):
+    X, _ = feature_rows(300, seed=2)
+    X[::7, 0] = np.nan
+    X[::11, 6] = np.nan
+    np.testing.assert_array_equal(export_model(model).predict(X), model.predict(X))
+
+
+def test_deduplicated_large_batch(model):
+    X, _ = feature_rows(200, seed=3)
+    X = np.repeat(X, DEDUPE_MIN_ROWS // 200 + 1, axis=0)
+    np.testing.assert_array_equal(export_model(model).predict(X), model.predict(X))
+
+
+def test_save_load_roundtrip(model, tmp_path):
+    X, _ = feature_rows(300, seed=4)
+    path = tmp_path / "model.npz"
+    export_model(model).save(path)
+    np.testing.assert_array_equal(TreeEnsemble.load(path).predict(X), model.predict(X))
@@ -0,0 +1,295 @@
+"""
+Native evaluator for the XGBoost horizon models.
+
+export_model() flattens a trained XGBRegressor into plain arrays (split
+feature, threshold, left/right child, default direction for missing values,
+leaf value), one row per node across all trees, and TreeEnsemble scores
+batches of rows in NumPy with no DMatrix, thread dispatch or xgboost import.
+
+Scoring uses the QuickScorer bitmask scheme. Each tree's leaves are numbered
+left to right; a split node that evaluates false (x >= threshold, go right)
+rules out the leaves of its left subtree. Per feature, the split thresholds
+are sorted, and a table holds, for every rank of x among them, the AND of
+the masks of all nodes that rank makes false, for every tree. A row's
+exit leaf in a tree is then the lowest set bit of the AND of one table row
+per feature: seven row gathers instead of a per-node walk. Leaf values are
+accumulated in float32 in tree order starting from base_score, the way
+XGBoost's CPU predictor does, so results are bit-identical to
+model.predict(). Large batches are first reduced to their distinct rank
+vectors (rows that rank identically against every threshold share all
+their exit leaves), which makes sampled workloads with repeated or
+near-repeated rows cheap. Rows with missing values (and trees with more than 16
+leaves) take the plain node walk, which honours default directions.
+
+Only the model kinds this project trains are supported: gbtree boosters
+with numerical splits, a single target and reg:squarederror.
+"""
+import json
+
+import numpy as np
+
+MAX_BITMASK_LEAVES = 16
+DEDUPE_MIN_ROWS = 4096     # batches this large are checked for repeated rows
+_CHUNK_ROWS = 2048
+_MAX_KEY_SPACE = 1 << 62   # rank vectors must pack into one int64 key
+
+# Lowest set bit of every uint16: the leftmost leaf still reachable
+_LOWEST_BIT = np.zeros(1 << MAX_BITMASK_LEAVES, dtype=np.uint8)
+for _b in range(MAX_BITMASK_LEAVES - 1, -1, -1):
+    _LOWEST_BIT[(np.arange(1 << MAX_BITMASK_LEAVES) >> _b) & 1 == 1] = _b
+del _b
+
+
+class TreeEnsemble:
+    def __init__(self, feature, threshold, left, right, default_left, value,
+                 roots, base_score, max_depth, feature_names):
+        self.feature = feature              # int32   [nodes]  split feature (0 at leaves)
+        self.threshold = threshold          # float32 [nodes]  go left if x < threshold
+        self.left = left                    # int32   [nodes]  leaves point at themselves
+        self.right = right                  # int32   [nodes]
+        self.default_left = default_left    # bool    [nodes]  direction for NaN
+        self.value = value                  # float32 [nodes]  leaf value (0 at splits)
+        self.roots = roots                  # int32   [trees]
+        self.base_score = np.float32(base_score)
+        self.max_depth = int(max_depth)
+        self.feature_names = list(feature_names)
+        self._bitmasks = None   # built on first predict()
+
+    @property
+    def num_trees(self) -> int:
+        return len(self.roots)
+
+    def predict(self, X) -> np.ndarray:
+        """Score rows of X (columns in feature_names order). Returns float32 [n]."""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[None, :]
+        if self._bitmasks is None:
+            self._bitmasks = self._build_bitmasks()
+        if self._bitmasks is False:
+            return self._predict_walk(X)
+
+        missing = np.isnan(X).any(axis=1)
+        if not missing.any():
+            return self._predict_bitmask(X)
+        out = np.empty(X.shape[0], dtype=np.float32)
+        out[~missing] = self._predict_bitmask(X[~missing])
+        out[missing] = self._predict_walk(X[missing])
+        return out
+
+    def _accumulate(self, leaf_values_t) -> np.ndarray:
+        """
+        base_score + sum of a (trees + 1, n) array whose row 0 is reserved
+        for the base. Reducing over axis 0 of a C-contiguous array adds one
+        row at a time, i.e. the trees in order, in float32.
+        """
+        leaf_values_t[0] = self.base_score
+        if leaf_values_t.shape[1] == 1:
+            # A single column reduces as one contiguous vector, i.e. pairwise;
+            # cumsum keeps the sequential order
+            return np.cumsum(leaf_values_t[:, 0], dtype=np.float32)[-1:]
+        return np.add.reduce(leaf_values_t, axis=0, dtype=np.float32)
+
+    def _predict_bitmask(self, X) -> np.ndarray:
+        thresholds, tables, _, _, key_space = self._bitmasks
+        n = X.shape[0]
+        ranks = [
+            None if table is None else np.searchsorted(sorted_thr, X[:, j], side="right")
+            for j, (sorted_thr, table) in enumerate(zip(thresholds, tables))
+        ]
+        if n >= DEDUPE_MIN_ROWS and key_space <= _MAX_KEY_SPACE:
+            # Rows with the same rank for every feature reach the same leaves;
+            # score each distinct rank vector once and scatter the results
+            key = np.zeros(n, dtype=np.int64)
+            for rank, table in zip(ranks, tables):
+                if rank is not None:
+                    key = key * len(table) + rank
+            _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+            if len(first) < n // 2:
+                ranks = [None if rank is None else rank[first] for rank in ranks]
+                return self._score_ranks(ranks, len(first))[inverse.ravel()]
+        return self._score_ranks(ranks, n)
+
+    def _score_ranks(self, ranks, n) -> np.ndarray:
+        """Scores for n rows given each feature's threshold rank per row."""
+        _, tables, leaf_values, leaf_offsets, _ = self._bitmasks
+        # Features constant across the batch (hour and its encodings, within
+        # one request) contribute a single table row
+        shared, varying = None, []
+        for rank, table in zip(ranks, tables):
+            if rank is None:
+                continue
+            if rank.min() == rank.max():
+                row = table[rank[0]]
+                shared = row if shared is None else shared & row
+            else:
+                varying.append((rank, table))
+
+        scores = np.empty(n, dtype=np.float32)
+        # Row chunks keep the (rows, trees) intermediates cache-sized
+        for lo in range(0, n, _CHUNK_ROWS):
+            hi = min(lo + _CHUNK_ROWS, n)
+            mask = None
+            for rank, table in varying:
+                if mask is None:
+                    mask = np.take(table, rank[lo:hi], axis=0)
+                else:
+                    mask &= np.take(table, rank[lo:hi], axis=0)
+            if shared is not None:
+                mask = np.broadcast_to(shared, (hi - lo, self.num_trees)) if mask is None else mask & shared
+
+            out = np.empty((self.num_trees + 1, hi - lo), dtype=np.float32)
+            if mask is None:  # no splits at all: every tree is a single leaf
+                leaf = np.zeros((self.num_trees, hi - lo), dtype=np.intp)
+            else:
+                leaf = np.take(_LOWEST_BIT, mask.T).astype(np.intp)
+            leaf += leaf_offsets
+            np.take(leaf_values, leaf, out=out[1:])
+            scores[lo:hi] = self._accumulate(out)
+        return scores
+
+    def _predict_walk(self, X) -> np.ndarray:
+        n = X.shape[0]
+        rows = np.arange(n)[None, :]
+        node = np.broadcast_to(self.roots[:, None], (self.num_trees, n))
+        for _ in range(self.max_depth):
+            x = X[rows, self.feature[node]]
+            go_left = np.where(np.isnan(x), self.default_left[node], x < self.threshold[node])
+            node = np.where(go_left, self.left[node], self.right[node])
+        out = np.empty((self.num_trees + 1, n), dtype=np.float32)
+        out[1:] = self.value[node]
+        return self._accumulate(out)
+
+    def _build_bitmasks(self):
+        """Per-feature (sorted thresholds, rank -> tree masks) tables, or False."""
+        full = (1 << MAX_BITMASK_LEAVES) - 1
+        leaf_values = np.zeros((self.num_trees, MAX_BITMASK_LEAVES), dtype=np.float32)
+        node_tree, node_mask = {}, {}
+
+        for t, root in enumerate(self.roots.tolist()):
+            # Iterative in-order walk: number leaves left to right and give
+            # each split the mask clearing its left subtree's leaves
+            next_leaf, stack, first_leaf = 0, [(root, False)], {}
+            while stack:
+                node, expanded = stack.pop()
+                if self.left[node] == node:
+                    if next_leaf >= MAX_BITMASK_LEAVES:
+                        return False
+                    leaf_values[t, next_leaf] = self.value[node]
+                    first_leaf[node] = (next_leaf, next_leaf + 1)
+                    next_leaf += 1
+                elif not expanded:
+                    stack.append((node, True))
+                    stack.append((int(self.right[node]), False))
+                    stack.append((int(self.left[node]), False))
+                else:
+                    lo, mid = first_leaf[int(self.left[node])]
+                    _, hi = first_leaf[int(self.right[node])]
+                    first_leaf[node] = (lo, hi)
+                    node_tree[node] = t
+                    node_mask[node] = full & ~(((1 << (mid - lo)) - 1) << lo)
+
+        splits = np.fromiter(node_tree, dtype=np.int64, count=len(node_tree))
+        thresholds, tables = [], []
+        for j in range(len(self.feature_names) or int(self.feature.max()) + 1):
+            nodes = splits[self.feature[splits] == j]
+            sorted_thr = np.unique(self.threshold[nodes])
+            if len(nodes) == 0:
+                thresholds.append(sorted_thr)
+                tables.append(None)
+                continue
+            # x ranks past a threshold exactly when x >= it (node false)
+            table = np.full((len(sorted_thr) + 1, self.num_trees), full, dtype=np.uint16)
+            ranks = np.searchsorted(sorted_thr, self.threshold[nodes]) + 1
+            for node, rank in zip(nodes.tolist(), ranks.tolist()):
+                table[rank, node_tree[node]] &= node_mask[node]
+            thresholds.append(sorted_thr)
+            tables.append(np.bitwise_and.accumulate(table, axis=0))
+
+        leaf_offsets = (np.arange(self.num_trees, dtype=np.intp) * MAX_BITMASK_LEAVES)[:, None]
+        key_space = 1
+        for table in tables:
+            if table is not None:
+                key_space *= len(table)   # Python int: no overflow
+        return thresholds, tables, leaf_values.ravel(), leaf_offsets, key_space
+
+    def save(self, path):
+        np.savez(
+            path,
+            feature=self.feature, threshold=self.threshold,
+            left=self.left, right=self.right, default_left=self.default_left,
+            value=self.value, roots=self.roots,
+            base_score=np.float32(self.base_score),
+            max_depth=np.int32(self.max_depth),
+            feature_names=np.array(self.feature_names),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as z:
+            return cls(
+                z["feature"], z["threshold"], z["left"], z["right"],
+                z["default_left"], z["value"], z["roots"],
+                z["base_score"].item(), z["max_depth"].item(),
+                z["feature_names"].tolist(),
+            )
+
+    def nbytes(self) -> int:
+        arrays = [self.feature, self.threshold, self.left, self.right,
+                  self.default_left, self.value, self.roots]
+        if self._bitmasks:
+            thresholds, tables, leaf_values, _, _ = self._bitmasks
+            arrays += thresholds + [t for t in tables if t is not None] + [leaf_values]
+        return sum(a.nbytes for a in arrays)
+
+
+def export_model(model) -> TreeEnsemble:
+    """Flatten an XGBRegressor (or Booster) into a TreeEnsemble."""
+    booster = model.get_booster() if hasattr(model, "get_booster") else model
+    learner = json.loads(booster.save_raw(raw_format="json"))["learner"]
+
+    objective = learner["objective"]["name"]
+    booster_name = learner["gradient_booster"]["name"]
+    if booster_name != "gbtree" or objective != "reg:squarederror":
+        raise ValueError(f"Unsupported model: {booster_name} / {objective}")
+    if int(learner["learner_model_param"].get("num_target", "1")) != 1:
+        raise ValueError("Multi-target models are not supported")
+
+    feature, threshold, left, right, default_left, value, roots = ([] for _ in range(7))
+    max_depth = 0
+    for tree in learner["gradient_booster"]["model"]["trees"]:
+        if any(tree["split_type"]):
+            raise ValueError("Categorical splits are not supported")
+        offset = len(feature)
+        roots.append(offset)
+        lc, rc = tree["left_children"], tree["right_children"]
+        depth = [0] * len(lc)
+        for i in range(len(lc)):
+            if lc[i] == -1:
+                feature.append(0)
+                threshold.append(0.0)
+                left.append(offset + i)
+                right.append(offset + i)
+                value.append(tree["split_conditions"][i])
+                max_depth = max(max_depth, depth[i])
+            else:
+                feature.append(tree["split_indices"][i])
+                threshold.append(tree["split_conditions"][i])
+                left.append(offset + lc[i])
+                right.append(offset + rc[i])
+                value.append(0.0)
+                depth[lc[i]] = depth[rc[i]] = depth[i] + 1
+            default_left.append(bool(tree["default_left"][i]))
+
+    return TreeEnsemble(
+        feature=np.asarray(feature, dtype=np.int32),
+        threshold=np.asarray(threshold, dtype=np.float32),
+        left=np.asarray(left, dtype=np.int32),
+        right=np.asarray(right, dtype=np.int32),
+        default_left=np.asarray(default_left, dtype=bool),
+        value=np.asarray(value, dtype=np.float32),
+        roots=np.asarray(roots, dtype=np.int32),
+        base_score=np.float32(float(learner["learner_model_param"]["base_score"])),
+        max_depth=max_depth,
+        feature_names=learner.get("feature_names") or [],
+    )
@@ -0,0 +1,117 @@
+"""
+Alternative routes by the plateau ("choice routing") method.
+
+One forward shortest-path tree from the origin and one backward tree from
+the destination are grown to `max_stretch` × the optimal cost (pruned to
+the ellipse of nodes that can still lie on such a route). An edge
+u → v lying on both trees belongs to a plateau; each maximal chain of
+such edges defines a via-route (forward tree path to the plateau, then the
+backward tree path to the destination) that is locally optimal along the
+whole plateau. Candidates are ranked by plateau length and admitted
+greedily subject to the stretch and overlap limits, so k routes cost two
+bounded searches instead of k full ones.
+"""
+import numpy as np
+
+from src.routing.compiled_graph import CompiledGraph, shortest_path_tree
+
+MAX_STRETCH = 1.3        # alternates at most 30% costlier than the optimum
+MAX_OVERLAP = 0.75       # share of an alternate's length reused from any chosen route
+MIN_PLATEAU_SHARE = 0.05  # ignore plateaus shorter than 5% of the optimum (trivial detours)
+
+
+def route_cost(cg: CompiledGraph, path, weights=None) -> float:
+    w = cg.lengths if weights is None else weights
+    return float(np.asarray(w)[cg.path_edges(path)].astype(np.float64).sum())
+
+
+def admissible(cg: CompiledGraph, candidate, chosen, optimum, weights=None,
+               max_stretch=MAX_STRETCH, max_overlap=MAX_OVERLAP):
+    """
+    True if `candidate` (compact path) is new, within `max_stretch` of
+    `optimum` cost, and shares at most `max_overlap` of its length with each
+    already chosen route.
+    """
+    if len(set(candidate)) < len(candidate):
+        return False  # via-route loops back on itself
+    if route_cost(cg, candidate, weights) > optimum * max_stretch + 1e-6:
+        return False
+    edges = cg.path_edges(candidate)
+    lengths = np.asarray(cg.lengths)
+    total = float(lengths[edges].astype(np.float64).sum()) or 1.0
+    for other in chosen:
+        if other == candidate:
+            return False
+        shared = np.intersect1d(edges, cg.path_edges(other), assume_unique=False)
+        if float(lengths[shared].astype(np.float64).sum()) / total > max_overlap:
+            return False
+    return True
+
+
+def plateau_routes(cg: CompiledGraph, source: int, target: int, k: int, weights=None,
+                   max_stretch=MAX_STRETCH, max_overlap=MAX_OVERLAP, heuristic_scale=1.0):
+    """
+    Up to k routes between compact indices: the optimum first, then plateau
+    alternates passing the limits. Both trees are pruned to the ellipse of
+    nodes that could lie on a route within `max_stretch` (`heuristic_scale`
+    as for bidirectional_astar). Returns (routes, optimum_cost); routes is
+    empty if the target is unreachable.
+    """
+    dist_f, pred_f = shortest_path_tree(
+        cg, source, weights, target=target, stretch=max_stretch,
+        goal=target, heuristic_scale=heuristic_scale,
+    )
+    if target not in dist_f:
+        return [], None
+    optimum = dist_f[target]
+    limit = optimum * max_stretch
+    dist_r, pred_r = shortest_path_tree(
+        cg, target, weights, reverse=True, max_dist=limit,
+        goal=source, heuristic_scale=heuristic_scale,
+    )
+
+    def via_route(v):
+        head = []
+        u = v
+        while u != -1:
+            head.append(u)
+            u = pred_f[u]
+        head.reverse()
+        u = pred_r[v]
+        while u != -1:
+            head.append(u)
+            u = pred_r[u]
+        return head
+
+    # Plateau edges: u → v on both trees, within the stretch bound
+    nxt, has_prev = {}, set()
+    for v, df in dist_f.items():
+        dr = dist_r.get(v)
+        if dr is None or df + dr > limit:
+            continue
+        u = pred_f[v]
+        if u != -1 and pred_r.get(u) == v:
+            nxt[u] = v
+            has_prev.add(v)
+
+    plateaus = []
+    min_len = optimum * MIN_PLATEAU_SHARE
+    for start in nxt:
+        if start in has_prev:
+            continue
+        end = start
+        while end in nxt:
+            end = nxt[end]
+        length = dist_f[end] - dist_f[start]
+        if length >= min_len:
+            plateaus.append((length, start))
+    plateaus.sort(reverse=True)
+
+    routes = [via_route(target)]
+    for _, start in plateaus:
+        if len(routes) >= k:
+            break
+        candidate = via_route(start)
+        if admissible(cg, candidate, routes, optimum, weights, max_stretch, max_overlap):
+            routes.append(candidate)
+    return routes, optimum
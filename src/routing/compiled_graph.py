@@ -0,0 +1,378 @@
+"""
+Compiled (CSR) road graph for fast shortest-path queries.
+
+The osmnx MultiDiGraph is flattened once into contiguous NumPy arrays:
+
+    node_ids  int64   [N]    OSM node id per compact index (sorted ascending)
+    offsets   int64   [N+1]  CSR row pointers into the edge arrays
+    targets   int32   [E]    compact index of each edge's head node
+    lengths   float32 [E]    edge length in metres
+    node_x    float64 [N]    longitude
+    node_y    float64 [N]    latitude
+    road_type uint8   [E]    index into `road_type_names` (OSM highway tag)
+
+Parallel edges between the same (u, v) pair are collapsed to the shortest
+one, matching how NetworkX resolves `weight="length"` on a MultiDiGraph;
+that edge's highway tag is the one kept.
+Searches run a binary-heap Dijkstra directly over these arrays, reading them
+through memoryviews so scalar access stays cheap without copying.
+"""
+import heapq
+import math
+
+import numpy as np
+
+EARTH_RADIUS_M = 6_371_009.0
+# Shrinks the planar-distance heuristic so projection error can never make
+# it exceed the true great-circle edge lengths (keeps A* exact).
+HEURISTIC_SAFETY = 0.995
+
+
+class CompiledGraph:
+    def __init__(self, node_ids, offsets, targets, lengths,
+                 node_x, node_y, road_type, road_type_names):
+        self.node_ids = node_ids
+        self.offsets = offsets
+        self.targets = targets
+        self.lengths = lengths
+        self.node_x = node_x
+        self.node_y = node_y
+        self.road_type = road_type
+        self.road_type_names = list(road_type_names)
+        # Identifies the on-disk snapshot these arrays came from (None if
+        # compiled in-process), so derived indexes can check they match.
+        self.snapshot_id = None
+        # Zero-copy scalar views used by the search loops
+        self._offsets_mv = memoryview(offsets)
+        self._targets_mv = memoryview(targets)
+        self._lengths_mv = memoryview(lengths)
+        # Derived lazily, per process (cheap to rebuild, not worth snapshotting)
+        self._reverse = None
+        self._planar = None
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def index_of(self, node_id) -> int:
+        """Map an OSM node id to its compact index. Raises KeyError if absent."""
+        i = int(np.searchsorted(self.node_ids, node_id))
+        if i >= len(self.node_ids) or self.node_ids[i] != node_id:
+            raise KeyError(node_id)
+        return i
+
+    def ids_of(self, indices) -> list:
+        """Map a sequence of compact indices back to OSM node ids."""
+        return self.node_ids[np.asarray(indices, dtype=np.int64)].tolist()
+
+    def edge_index(self, u: int, v: int) -> int:
+        """Return the edge-array position of u → v (compact indices), or -1."""
+        offsets, targets = self._offsets_mv, self._targets_mv
+        for e in range(offsets[u], offsets[u + 1]):
+            if targets[e] == v:
+                return e
+        return -1
+
+    def path_edges(self, path) -> np.ndarray:
+        """Edge-array positions for consecutive pairs of a compact-index path."""
+        return np.array(
+            [self.edge_index(u, v) for u, v in zip(path[:-1], path[1:])],
+            dtype=np.int64,
+        )
+
+    def reverse(self):
+        """
+        In-edge adjacency as (rev_offsets, rev_sources, rev_edges) memoryviews:
+        for node v, positions rev_offsets[v]:rev_offsets[v+1] list each
+        predecessor u and the forward edge id of u → v, so reverse searches
+        can read the same weight arrays as forward ones.
+        """
+        if self._reverse is None:
+            src = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.offsets))
+            order = np.argsort(self.targets, kind="stable")
+            rev_offsets = np.zeros(self.num_nodes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.targets, minlength=self.num_nodes), out=rev_offsets[1:])
+            self._reverse = (
+                memoryview(rev_offsets),
+                memoryview(src[order]),
+                memoryview(order.astype(np.int64)),
+            )
+        return self._reverse
+
+    def planar(self):
+        """Node coordinates on a local equirectangular plane, in metres (memoryviews)."""
+        if self._planar is None:
+            cos_lat0 = math.cos(math.radians(float(np.mean(self.node_y))))
+            x = EARTH_RADIUS_M * np.radians(self.node_x) * cos_lat0
+            y = EARTH_RADIUS_M * np.radians(self.node_y)
+            self._planar = (memoryview(x), memoryview(y))
+        return self._planar
+
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (
+            self.node_ids, self.offsets, self.targets, self.lengths,
+            self.node_x, self.node_y, self.road_type,
+        ))
+
+
+def compile_graph(G) -> CompiledGraph:
+    """Flatten an osmnx MultiDiGraph into a CompiledGraph. O(E log E)."""
+    node_ids = np.fromiter(G.nodes, dtype=np.int64, count=len(G.nodes))
+    node_ids.sort()
+
+    num_edges = G.number_of_edges()
+    src = np.empty(num_edges, dtype=np.int64)
+    dst = np.empty(num_edges, dtype=np.int64)
+    lengths = np.empty(num_edges, dtype=np.float64)
+    road_type = np.empty(num_edges, dtype=np.int64)
+    road_type_codes = {}
+    for i, (u, v, data) in enumerate(G.edges(data=True)):
+        raw = data.get("length", 100)
+        highway = data.get("highway", "residential")
+        if isinstance(highway, list):
+            highway = highway[0]
+        src[i] = u
+        dst[i] = v
+        lengths[i] = float(raw[0] if isinstance(raw, list) else raw)
+        road_type[i] = road_type_codes.setdefault(highway, len(road_type_codes))
+
+    if len(road_type_codes) > 255:
+        raise ValueError(f"Too many distinct road types ({len(road_type_codes)}) for uint8 codes")
+
+    src = np.searchsorted(node_ids, src)
+    dst = np.searchsorted(node_ids, dst)
+
+    # Drop self-loops, then keep only the shortest of each parallel (u, v) set
+    keep = src != dst
+    src, dst, lengths, road_type = src[keep], dst[keep], lengths[keep], road_type[keep]
+    order = np.lexsort((lengths, dst, src))
+    src, dst, lengths, road_type = src[order], dst[order], lengths[order], road_type[order]
+    first = np.ones(len(src), dtype=bool)
+    first[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+    src, dst, lengths, road_type = src[first], dst[first], lengths[first], road_type[first]
+
+    offsets = np.zeros(len(node_ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=len(node_ids)), out=offsets[1:])
+
+    node_data = G.nodes
+    return CompiledGraph(
+        node_ids=node_ids,
+        offsets=offsets,
+        targets=dst.astype(np.int32),
+        lengths=lengths.astype(np.float32),
+        node_x=np.array([node_data[n]["x"] for n in node_ids.tolist()], dtype=np.float64),
+        node_y=np.array([node_data[n]["y"] for n in node_ids.tolist()], dtype=np.float64),
+        road_type=road_type.astype(np.uint8),
+        road_type_names=list(road_type_codes),
+    )
+
+
+def shortest_path(cg: CompiledGraph, source: int, target: int, weights=None, stats=None):
+    """
+    Binary-heap Dijkstra from `source` to `target` (compact indices).
+    `weights` is an optional float32 array aligned with the edge list;
+    defaults to edge lengths. Returns the node-index path, or None if
+    `target` is unreachable. If `stats` is a dict, the number of settled
+    nodes is stored under "settled".
+    """
+    offsets = cg._offsets_mv
+    targets = cg._targets_mv
+    w = cg._lengths_mv if weights is None else memoryview(weights)
+
+    inf = float("inf")
+    dist = {source: 0.0}
+    pred = {source: -1}
+    heap = [(0.0, source)]
+    pop, push = heapq.heappop, heapq.heappush
+    settled = 0
+
+    while heap:
+        d, u = pop(heap)
+        if d > dist[u]:
+            continue  # stale heap entry
+        settled += 1
+        if u == target:
+            if stats is not None:
+                stats["settled"] = settled
+            path = [u]
+            while pred[u] != -1:
+                u = pred[u]
+                path.append(u)
+            path.reverse()
+            return path
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            nd = d + w[e]
+            if nd < dist.get(v, inf):
+                dist[v] = nd
+                pred[v] = u
+                push(heap, (nd, v))
+
+    if stats is not None:
+        stats["settled"] = settled
+    return None
+
+
+def bidirectional_astar(cg: CompiledGraph, source: int, target: int, weights=None,
+                        heuristic_scale=1.0, stats=None):
+    """
+    Bidirectional A* between compact indices, using the symmetric
+    "average" potential p(v) = (h_t(v) - h_s(v)) / 2 so both searches see the
+    same non-negative reduced costs and the classic bidirectional stopping
+    rule applies (stop once top_f + top_r >= best path found).
+
+    h is the planar straight-line distance in metres times
+    `heuristic_scale`, which must keep it a lower bound on `weights`:
+    1.0 for length (or penalised length) weights, 1 / max speed for
+    travel-time weights. Same return value and `stats` contract as
+    shortest_path().
+    """
+    if source == target:
+        if stats is not None:
+            stats["settled"] = 1
+        return [source]
+
+    offsets, targets = cg._offsets_mv, cg._targets_mv
+    rev_offsets, rev_sources, rev_edges = cg.reverse()
+    xs, ys = cg.planar()
+    w = cg._lengths_mv if weights is None else memoryview(weights)
+
+    scale = 0.5 * heuristic_scale * HEURISTIC_SAFETY
+    sx, sy, tx, ty = xs[source], ys[source], xs[target], ys[target]
+    sqrt = math.sqrt
+    pot_cache = {}
+
+    def potential(v):
+        p = pot_cache.get(v)
+        if p is None:
+            x, y = xs[v], ys[v]
+            p = scale * (sqrt((x - tx) ** 2 + (y - ty) ** 2)
+                         - sqrt((x - sx) ** 2 + (y - sy) ** 2))
+            pot_cache[v] = p
+        return p
+
+    inf = float("inf")
+    g_f, g_r = {source: 0.0}, {target: 0.0}
+    pred_f, pred_r = {source: -1}, {target: -1}
+    heap_f = [(potential(source), source)]
+    heap_r = [(-potential(target), target)]
+    done_f, done_r = set(), set()
+    pop, push = heapq.heappop, heapq.heappush
+    best, meet = inf, -1
+    settled = 0
+
+    while heap_f and heap_r:
+        if heap_f[0][0] + heap_r[0][0] >= best:
+            break
+
+        if len(heap_f) <= len(heap_r):
+            _, u = pop(heap_f)
+            if u in done_f:
+                continue
+            done_f.add(u)
+            settled += 1
+            gu = g_f[u]
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                nd = gu + w[e]
+                if nd < g_f.get(v, inf):
+                    g_f[v] = nd
+                    pred_f[v] = u
+                    push(heap_f, (nd + potential(v), v))
+                    gr = g_r.get(v)
+                    if gr is not None and nd + gr < best:
+                        best, meet = nd + gr, v
+        else:
+            _, u = pop(heap_r)
+            if u in done_r:
+                continue
+            done_r.add(u)
+            settled += 1
+            gu = g_r[u]
+            for i in range(rev_offsets[u], rev_offsets[u + 1]):
+                v = rev_sources[i]
+                nd = gu + w[rev_edges[i]]
+                if nd < g_r.get(v, inf):
+                    g_r[v] = nd
+                    pred_r[v] = u
+                    push(heap_r, (nd - potential(v), v))
+                    gf = g_f.get(v)
+                    if gf is not None and nd + gf < best:
+                        best, meet = nd + gf, v
+
+    if stats is not None:
+        stats["settled"] = settled
+    if meet == -1:
+        return None
+
+    path = []
+    u = meet
+    while u != -1:
+        path.append(u)
+        u = pred_f[u]
+    path.reverse()
+    u = pred_r[meet]
+    while u != -1:
+        path.append(u)
+        u = pred_r[u]
+    return path
+
+
+
+def shortest_path_tree(cg: CompiledGraph, source: int, weights=None, reverse=False,
+                       target=None, stretch=None, max_dist=float("inf"),
+                       goal=None, heuristic_scale=1.0):
+    """
+    Dijkstra tree from `source` (over in-edges when `reverse`), settling
+    nodes up to `max_dist`. If `target` and `stretch` are given, the radius
+    is set to stretch × dist(target) once the target is settled. With a
+    `goal` node, nodes whose distance plus straight-line estimate to the
+    goal exceeds the radius are pruned; that bounds the tree to an ellipse
+    without losing any node that could lie on a path within the radius.
+    Returns (dist, pred) dicts for settled nodes; pred[source] is -1.
+    """
+    if reverse:
+        offsets, nbrs, edge_ids = cg.reverse()
+    else:
+        offsets, nbrs, edge_ids = cg._offsets_mv, cg._targets_mv, None
+    w = cg._lengths_mv if weights is None else memoryview(weights)
+
+    if goal is not None:
+        xs, ys = cg.planar()
+        gx, gy = xs[goal], ys[goal]
+        scale = heuristic_scale * HEURISTIC_SAFETY
+        sqrt = math.sqrt
+
+    inf = float("inf")
+    tentative = {source: 0.0}
+    parent = {source: -1}
+    dist, pred = {}, {}
+    heap = [(0.0, source)]
+    pop, push = heapq.heappop, heapq.heappush
+
+    while heap:
+        d, u = pop(heap)
+        if u in dist:
+            continue
+        if d > max_dist:
+            break
+        dist[u] = d
+        pred[u] = parent[u]
+        if u == target and stretch is not None:
+            max_dist = d * stretch
+        for i in range(offsets[u], offsets[u + 1]):
+            v = nbrs[i]
+            nd = d + w[edge_ids[i] if edge_ids is not None else i]
+            if nd < tentative.get(v, inf):
+                if goal is not None and max_dist < inf:
+                    if nd + scale * sqrt((xs[v] - gx) ** 2 + (ys[v] - gy) ** 2) > max_dist:
+                        continue
+                tentative[v] = nd
+                parent[v] = u
+                push(heap, (nd, v))
+
+    return dist, pred
@@ -0,0 +1,57 @@
+# src/routing/conftest.py
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.routing.compiled_graph import compile_graph
+
+# test_route_eta.py is a manual script against the full Bengaluru data
+collect_ignore = ["test_route_eta.py"]
+
+
+def make_road_graph(rows=20, cols=20, seed=0) -> nx.MultiDiGraph:
+    """
+    A jittered grid around central Bengaluru shaped like an osmnx graph:
+    x/y in degrees, edge `length` in metres (at least the straight-line
+    distance, so A*'s heuristic stays admissible), some one-way streets
+    and a few parallel edges.
+    """
+    rng = np.random.default_rng(seed)
+    G = nx.MultiDiGraph()
+    step = 0.002   # about 220 m
+    for r in range(rows):
+        for c in range(cols):
+            G.add_node(1000 + r * cols + c,
+                       x=77.59 + c * step + rng.uniform(-0.3, 0.3) * step,
+                       y=12.97 + r * step + rng.uniform(-0.3, 0.3) * step)
+
+    def metres(u, v):
+        a, b = G.nodes[u], G.nodes[v]
+        cos_lat = math.cos(math.radians((a["y"] + b["y"]) / 2))
+        return 6371000.0 * math.radians(math.hypot((a["x"] - b["x"]) * cos_lat, a["y"] - b["y"]))
+
+    highways = ["primary", "secondary", "residential"]
+    for r in range(rows):
+        for c in range(cols):
+            u = 1000 + r * cols + c
+            for dr, dc in ((0, 1), (1, 0)):
+                if r + dr >= rows or c + dc >= cols:
+                    continue
+                v = 1000 + (r + dr) * cols + c + dc
+                highway = highways[rng.integers(len(highways))]
+                length = metres(u, v) * rng.uniform(1.0, 1.6)
+                one_way = rng.random() < 0.15
+                G.add_edge(u, v, length=length, highway=highway)
+                if not one_way:
+                    G.add_edge(v, u, length=length * rng.uniform(1.0, 1.1), highway=highway)
+                if rng.random() < 0.05:
+                    G.add_edge(u, v, length=length * 1.3, highway="service")
+    return G
+
+
+@pytest.fixture(scope="session")
+def road_graph():
+    G = make_road_graph()
+    return G, compile_graph(G)
@@ -0,0 +1,373 @@
+"""
+Contraction hierarchy (CH) over the compiled road graph, by edge length.
+
+Preprocessing (`python -m src.cli build-ch`) contracts nodes one at a time
+in order of a lazily updated priority (edge quotient, original-edge
+quotient and hierarchy depth). Whenever a node v is contracted, the path u → v → w becomes a
+shortcut u → w unless a bounded witness search finds something no longer
+without v. The result is stored next to the graph snapshot as CSR arrays:
+
+    rank          int32   [N]   contraction order of each node
+    up_*          edges u → w with rank[w] > rank[u], grouped by u
+    down_*        edges u → v with rank[u] > rank[v], grouped by v
+    *_weights     float32 edge / shortcut length in metres
+    *_mid         int32   middle node of a shortcut, -1 for an original edge
+
+A query runs Dijkstra upward from both ends (forward over up_*, backward
+over down_*), so it touches only a few hundred nodes. Shortcuts are then
+unpacked back into original compact node indices.
+"""
+import heapq
+import json
+import logging
+import os
+import shutil
+import time
+
+import numpy as np
+
+from src.routing.compiled_graph import CompiledGraph
+
+logger = logging.getLogger("cgee.ch")
+
+CH_DIR = "data/processed/graph_ch"
+CH_VERSION = 1
+
+CH_ARRAYS = (
+    "rank",
+    "up_offsets", "up_targets", "up_weights", "up_mid",
+    "down_offsets", "down_sources", "down_weights", "down_mid",
+)
+
+# Witness searches give up after settling this many nodes; a missed witness
+# only costs a redundant shortcut, never a wrong answer.
+WITNESS_SETTLE_LIMIT = 60
+
+# Contraction stops once the remaining graph averages this many edges per
+# node. Those last nodes form an uncontracted "core" whose edges are stored
+# in both directions, so queries finish with a plain bidirectional search
+# there instead of preprocessing paying for an ever-denser clique.
+CORE_MAX_AVG_DEGREE = 16.0
+
+
+class ContractionHierarchy:
+    def __init__(self, rank, up_offsets, up_targets, up_weights, up_mid,
+                 down_offsets, down_sources, down_weights, down_mid):
+        self.rank = rank
+        self.up_offsets, self.up_targets = up_offsets, up_targets
+        self.up_weights, self.up_mid = up_weights, up_mid
+        self.down_offsets, self.down_sources = down_offsets, down_sources
+        self.down_weights, self.down_mid = down_weights, down_mid
+        self._mv = tuple(memoryview(a) for a in (
+            rank, up_offsets, up_targets, up_weights, up_mid,
+            down_offsets, down_sources, down_weights, down_mid,
+        ))
+
+    @property
+    def num_shortcuts(self) -> int:
+        return int((np.asarray(self.up_mid) >= 0).sum() + (np.asarray(self.down_mid) >= 0).sum())
+
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in CH_ARRAYS)
+
+    def _edge_mid(self, u, v):
+        rank, up_off, up_tgt, _, up_mid, dn_off, dn_src, _, dn_mid = self._mv
+        if rank[v] > rank[u]:
+            for e in range(up_off[u], up_off[u + 1]):
+                if up_tgt[e] == v:
+                    return up_mid[e]
+        else:
+            for e in range(dn_off[v], dn_off[v + 1]):
+                if dn_src[e] == u:
+                    return dn_mid[e]
+        raise KeyError((u, v))
+
+    def _unpack(self, path):
+        """Expand a path of CH edges into original compact node indices."""
+        out = [path[0]]
+        for a, b in zip(path[:-1], path[1:]):
+            stack = [(a, b)]
+            while stack:
+                u, v = stack.pop()
+                mid = self._edge_mid(u, v)
+                if mid < 0:
+                    out.append(v)
+                else:
+                    stack.append((mid, v))
+                    stack.append((u, mid))
+        return out
+
+    def query(self, source: int, target: int, stats=None):
+        """
+        Shortest path by length between compact indices. Same return value
+        and `stats` contract as compiled_graph.shortest_path().
+        """
+        if source == target:
+            if stats is not None:
+                stats["settled"] = 1
+            return [source]
+
+        _, up_off, up_tgt, up_w, _, dn_off, dn_src, dn_w, _ = self._mv
+        inf = float("inf")
+        dist = ({source: 0.0}, {target: 0.0})
+        pred = ({source: -1}, {target: -1})
+        heaps = ([(0.0, source)], [(0.0, target)])
+        adjacency = ((up_off, up_tgt, up_w), (dn_off, dn_src, dn_w))
+        pop, push = heapq.heappop, heapq.heappush
+        best, meet = inf, -1
+        settled = 0
+        side = 0
+
+        while heaps[0] or heaps[1]:
+            # Alternate directions; a direction is finished once its
+            # smallest key can no longer improve the best meeting point.
+            if not heaps[side] or heaps[side][0][0] >= best:
+                side ^= 1
+                if not heaps[side] or heaps[side][0][0] >= best:
+                    break
+            d, u = pop(heaps[side])
+            own, other = dist[side], dist[side ^ 1]
+            if d > own[u]:
+                continue
+            settled += 1
+            if u in other and d + other[u] < best:
+                best, meet = d + other[u], u
+            offsets, nbrs, weights = adjacency[side]
+            for e in range(offsets[u], offsets[u + 1]):
+                v = nbrs[e]
+                nd = d + weights[e]
+                if nd < own.get(v, inf):
+                    own[v] = nd
+                    pred[side][v] = u
+                    push(heaps[side], (nd, v))
+            side ^= 1
+
+        if stats is not None:
+            stats["settled"] = settled
+        if meet == -1:
+            return None
+
+        path = []
+        u = meet
+        while u != -1:
+            path.append(u)
+            u = pred[0][u]
+        path.reverse()
+        u = pred[1][meet]
+        while u != -1:
+            path.append(u)
+            u = pred[1][u]
+        return self._unpack(path)
+
+
+# ---------------------------------------------------
+# Preprocessing
+# ---------------------------------------------------
+def _witness_distances(out_adj, source, skip, max_dist):
+    """Bounded Dijkstra from `source` in the remaining graph, avoiding `skip`."""
+    inf = float("inf")
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    pop, push = heapq.heappop, heapq.heappush
+    settled = 0
+    while heap:
+        d, x = pop(heap)
+        if d > dist[x]:
+            continue
+        if d > max_dist:
+            break
+        settled += 1
+        if settled > WITNESS_SETTLE_LIMIT:
+            break
+        for y, w in out_adj[x].items():
+            if y == skip:
+                continue
+            nd = d + w
+            if nd < dist.get(y, inf):
+                dist[y] = nd
+                push(heap, (nd, y))
+    return dist
+
+
+def _needed_shortcuts(out_adj, in_adj, hops, v):
+    """Shortcuts (u, w, weight, hops) required if v were contracted now."""
+    outs = out_adj[v]
+    if not outs:
+        return []
+    max_out = max(outs.values())
+    shortcuts = []
+    inf = float("inf")
+    for u, w_uv in in_adj[v].items():
+        dist = _witness_distances(out_adj, u, v, w_uv + max_out)
+        h_uv = hops.get((u, v), 1)
+        for w, w_vw in outs.items():
+            if w == u:
+                continue
+            via = w_uv + w_vw
+            if dist.get(w, inf) > via:
+                shortcuts.append((u, w, via, h_uv + hops.get((v, w), 1)))
+    return shortcuts
+
+
+def build_ch(cg: CompiledGraph, progress_every: int = 10000,
+             core_max_avg_degree: float = CORE_MAX_AVG_DEGREE) -> ContractionHierarchy:
+    """Contract the nodes of `cg` up to the core cut-off. Pure Python; minutes for a city graph."""
+    n = cg.num_nodes
+    offsets = cg.offsets.tolist()
+    targets = cg.targets.tolist()
+    lengths = cg.lengths.astype(np.float64).tolist()
+
+    out_adj = [dict() for _ in range(n)]
+    in_adj = [dict() for _ in range(n)]
+    for u in range(n):
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            out_adj[u][v] = lengths[e]
+            in_adj[v][u] = lengths[e]
+    mid = {}   # (u, w) -> middle node, for shortcut edges only
+    hops = {}  # (u, w) -> original edges a shortcut stands for (default 1)
+    level = [0] * n
+
+    def priority(v, shortcuts):
+        # Edge quotient, original-edge quotient and hierarchy depth: keeps
+        # the remaining core sparse and the hierarchy shallow, so the last
+        # contractions don't degenerate into a dense clique.
+        removed = len(in_adj[v]) + len(out_adj[v])
+        removed_hops = (sum(hops.get((u, v), 1) for u in in_adj[v])
+                        + sum(hops.get((v, w), 1) for w in out_adj[v]))
+        added_hops = sum(sc[3] for sc in shortcuts)
+        return (2.0 * len(shortcuts) / max(removed, 1)
+                + added_hops / max(removed_hops, 1)
+                + level[v])
+
+    heap = [(priority(v, _needed_shortcuts(out_adj, in_adj, hops, v)), v) for v in range(n)]
+    heapq.heapify(heap)
+
+    rank = np.empty(n, dtype=np.int32)
+    up, down = [], []  # (owner, other, weight, mid)
+    order = 0
+    remaining_edges = len(targets)
+    while heap:
+        if remaining_edges > core_max_avg_degree * len(heap):
+            break
+        _, v = heapq.heappop(heap)
+        shortcuts = _needed_shortcuts(out_adj, in_adj, hops, v)
+        p = priority(v, shortcuts)
+        if heap and p > heap[0][0]:
+            heapq.heappush(heap, (p, v))  # lazy update: stale priority
+            continue
+
+        rank[v] = order
+        order += 1
+        if progress_every and order % progress_every == 0:
+            logger.info(f"Contracted {order}/{n} nodes")
+
+        remaining_edges -= len(out_adj[v]) + len(in_adj[v])
+        for w, weight in out_adj[v].items():
+            up.append((v, w, weight, mid.get((v, w), -1)))
+            del in_adj[w][v]
+            level[w] = max(level[w], level[v] + 1)
+        for u, weight in in_adj[v].items():
+            down.append((v, u, weight, mid.get((u, v), -1)))
+            del out_adj[u][v]
+            level[u] = max(level[u], level[v] + 1)
+        out_adj[v].clear()
+        in_adj[v].clear()
+
+        for u, w, weight, sc_hops in shortcuts:
+            if weight < out_adj[u].get(w, float("inf")):
+                if w not in out_adj[u]:
+                    remaining_edges += 1
+                out_adj[u][w] = weight
+                in_adj[w][u] = weight
+                mid[(u, w)] = v
+                hops[(u, w)] = sc_hops
+
+    # Uncontracted core: ranked above everything else, each edge stored both
+    # as an up-edge of its tail and a down-edge of its head.
+    core = sorted(v for _, v in heap)
+    if core:
+        logger.info(f"Leaving a core of {len(core)} nodes, {remaining_edges} edges uncontracted")
+    for v in core:
+        rank[v] = order
+        order += 1
+    for u in core:
+        for w, weight in out_adj[u].items():
+            m = mid.get((u, w), -1)
+            up.append((u, w, weight, m))
+            down.append((w, u, weight, m))
+
+    def to_csr(edges):
+        edges.sort(key=lambda e: e[0])
+        owners = np.array([e[0] for e in edges], dtype=np.int64)
+        offs = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(owners, minlength=n), out=offs[1:])
+        return (
+            offs,
+            np.array([e[1] for e in edges], dtype=np.int32),
+            np.array([e[2] for e in edges], dtype=np.float32),
+            np.array([e[3] for e in edges], dtype=np.int32),
+        )
+
+    up_offsets, up_targets, up_weights, up_mid = to_csr(up)
+    down_offsets, down_sources, down_weights, down_mid = to_csr(down)
+    return ContractionHierarchy(
+        rank, up_offsets, up_targets, up_weights, up_mid,
+        down_offsets, down_sources, down_weights, down_mid,
+    )
+
+
+# ---------------------------------------------------
+# Persistence
+# ---------------------------------------------------
+def save_ch(ch: ContractionHierarchy, snapshot_id: str, path: str = CH_DIR,
+            build_seconds: float = None):
+    """Write `ch` next to the graph snapshot it was built from (atomic rename)."""
+    tmp = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    for name in CH_ARRAYS:
+        np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(getattr(ch, name)))
+    manifest = {
+        "version": CH_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "snapshot_id": snapshot_id,
+        "num_nodes": len(ch.rank),
+        "num_up_edges": len(ch.up_targets),
+        "num_down_edges": len(ch.down_sources),
+        "num_shortcuts": ch.num_shortcuts,
+        "build_seconds": build_seconds,
+    }
+    with open(os.path.join(tmp, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    old = f"{path}.old-{os.getpid()}"
+    if os.path.exists(path):
+        os.rename(path, old)
+    os.rename(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+    logger.info(f"Contraction hierarchy written to {path} ({ch.nbytes() / 1e6:.1f} MB)")
+
+
+def load_ch(snapshot_id: str, path: str = CH_DIR, mmap: bool = True):
+    """
+    Load the CH built for the graph snapshot `snapshot_id`, memory-mapped.
+    Returns None if there is none, or if it was built from another snapshot.
+    """
+    manifest_path = os.path.join(path, "manifest.json")
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if (manifest.get("version") != CH_VERSION
+            or snapshot_id is None or manifest.get("snapshot_id") != snapshot_id):
+        logger.warning(
+            f"Ignoring contraction hierarchy at {path}: built for a different graph "
+            f"snapshot. Rebuild it with `python -m src.cli build-ch`."
+        )
+        return None
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None)
+        for name in CH_ARRAYS
+    }
+    return ContractionHierarchy(**arrays)
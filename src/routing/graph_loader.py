@@ -1,9 +1,21 @@
 import os
-import osmnx as ox
+from contextlib import contextmanager
+
+from src.routing.compiled_graph import compile_graph
+from src.routing.graph_snapshot import SNAPSHOT_DIR, load_snapshot, save_snapshot
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines: single-process, no locking needed
+    fcntl = None
 
 GRAPH_PATH = "data/raw/osm/bengaluru.graphml"
 
 def load_graph():
+    # Imported lazily: osmnx pulls in geopandas/shapely/pyproj, which workers
+    # attaching to the binary snapshot never need.
+    import osmnx as ox
+
     if os.path.exists(GRAPH_PATH):
         print("Loading cached OSM graph...")
         return ox.load_graphml(GRAPH_PATH)
@@ -18,3 +30,55 @@ def load_graph():
     os.makedirs(os.path.dirname(GRAPH_PATH), exist_ok=True)
     ox.save_graphml(G, GRAPH_PATH)
     return G
+
+
+@contextmanager
+def _snapshot_lock(path):
+    """Exclusive inter-process lock so only one worker builds the snapshot."""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_compiled_graph(require_networkx=False):
+    """
+    Return (G, compiled). Normally G is None and `compiled` is the binary
+    snapshot, memory-mapped read-only: every uvicorn worker maps the same
+    files, so the graph's pages are shared through the OS page cache rather
+    than copied per process. If no usable snapshot exists, the first worker
+    to take the lock builds it from GraphML while the others wait, then all
+    of them map it.
+
+    With `require_networkx` (the networkx backend) the GraphML is parsed and
+    compiled in-process instead.
+    """
+    if require_networkx:
+        G = load_graph()
+        return G, compile_graph(G)
+
+    with _snapshot_lock(SNAPSHOT_DIR):
+        try:
+            print("Loading graph snapshot...")
+            return None, load_snapshot(SNAPSHOT_DIR)
+        except FileNotFoundError:
+            print("No graph snapshot found; building one from GraphML...")
+        except ValueError as e:
+            print(f"Rebuilding unusable graph snapshot: {e}")
+
+        G = load_graph()
+        compiled = compile_graph(G)
+        try:
+            save_snapshot(compiled, SNAPSHOT_DIR, source=GRAPH_PATH)
+        except OSError as e:
+            # Read-only data dir: serve from the in-process copy this time
+            print(f"Could not write graph snapshot ({e}); using in-memory graph.")
+            return None, compiled
+        del G, compiled
+        return None, load_snapshot(SNAPSHOT_DIR)
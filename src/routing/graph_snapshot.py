@@ -0,0 +1,107 @@
+"""
+Versioned binary snapshot of the compiled road graph.
+
+`build-snapshot` converts the GraphML once into a directory of plain .npy
+arrays plus a JSON manifest. Loading memory-maps the arrays, so startup
+skips XML parsing and attribute coercion entirely and pages are only read
+from disk as routing touches them.
+
+Layout (SNAPSHOT_DIR):
+    manifest.json   format version, counts, road-type names, source info
+    <array>.npy     one file per CompiledGraph array (see SNAPSHOT_ARRAYS)
+"""
+import json
+import logging
+import os
+import shutil
+import time
+
+import numpy as np
+
+from src.routing.compiled_graph import CompiledGraph
+
+logger = logging.getLogger("cgee.snapshot")
+
+SNAPSHOT_DIR = "data/processed/graph_snapshot"
+SNAPSHOT_VERSION = 1
+
+SNAPSHOT_ARRAYS = (
+    "node_ids", "node_x", "node_y",
+    "offsets", "targets", "lengths", "road_type",
+)
+
+
+def snapshot_exists(path: str = SNAPSHOT_DIR) -> bool:
+    return os.path.exists(os.path.join(path, "manifest.json"))
+
+
+def save_snapshot(cg: CompiledGraph, path: str = SNAPSHOT_DIR, source: str = None):
+    """
+    Write `cg` to `path`. Arrays go to a sibling temp directory first and are
+    swapped in with a rename, so a reader never sees a half-written snapshot.
+    """
+    tmp = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+
+    for name in SNAPSHOT_ARRAYS:
+        np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(getattr(cg, name)))
+
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "num_nodes": cg.num_nodes,
+        "num_edges": cg.num_edges,
+        "road_type_names": cg.road_type_names,
+    }
+    if source and os.path.exists(source):
+        stat = os.stat(source)
+        manifest["source"] = {"path": source, "size": stat.st_size, "mtime": stat.st_mtime}
+    with open(os.path.join(tmp, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    old = f"{path}.old-{os.getpid()}"
+    if os.path.exists(path):
+        os.rename(path, old)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    os.rename(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+    logger.info(f"Graph snapshot written to {path} ({cg.nbytes() / 1e6:.1f} MB)")
+
+
+def load_snapshot(path: str = SNAPSHOT_DIR, mmap: bool = True) -> CompiledGraph:
+    """
+    Load a snapshot written by save_snapshot(). Arrays are memory-mapped
+    read-only unless `mmap` is False. Raises FileNotFoundError if absent and
+    ValueError on a format-version mismatch.
+    """
+    manifest_path = os.path.join(path, "manifest.json")
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError(manifest_path)
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Graph snapshot at {path} is version {manifest.get('version')}, "
+            f"expected {SNAPSHOT_VERSION}. Rebuild it with `python -m src.cli build-snapshot`."
+        )
+
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None)
+        for name in SNAPSHOT_ARRAYS
+    }
+    cg = CompiledGraph(road_type_names=manifest["road_type_names"], **arrays)
+    cg.snapshot_id = manifest["created_at"]
+
+    if cg.num_nodes != manifest["num_nodes"] or cg.num_edges != manifest["num_edges"]:
+        raise ValueError(f"Graph snapshot at {path} does not match its manifest.")
+
+    source = manifest.get("source")
+    if source and os.path.exists(source["path"]):
+        if os.stat(source["path"]).st_mtime > source["mtime"]:
+            logger.warning(
+                f"{source['path']} is newer than the graph snapshot; "
+                f"run `python -m src.cli build-snapshot` to refresh it."
+            )
+    return cg
@@ -0,0 +1,77 @@
+"""
+Route result cache for compute_route_eta().
+
+Keyed on (orig node, dest node, departure hour bucket, k), i.e. everything
+that decides which routes come back once both endpoints are snapped; the
+search algorithm does not, as every mode returns optimal routes. Values are the node paths plus the extracted geometry, segment
+lengths and road types per route, so a hit skips the k-route search and
+extraction. Incident simulation and ETA prediction still run per request.
+
+Bounded by entry count with LRU eviction, and entries expire after a TTL.
+All operations take one lock; the critical sections are dict operations.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+ROUTE_CACHE_SIZE = int(os.environ.get("CGEE_ROUTE_CACHE_SIZE", "2048"))
+ROUTE_CACHE_TTL_S = float(os.environ.get("CGEE_ROUTE_CACHE_TTL", "900"))
+
+
+class RouteCache:
+    def __init__(self, maxsize: int = ROUTE_CACHE_SIZE, ttl: float = ROUTE_CACHE_TTL_S):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()   # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Cached value for `key`, or None on a miss or expired entry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_s": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -1,64 +1,228 @@
-import osmnx as ox
+import os
 import networkx as nx
 import numpy as np
 import threading
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 from functools import lru_cache
 
-from src.common.features import build_features
-from src.models.multi_horizon_xgb import load_models
-from src.routing.graph_loader import load_graph
+from src.common.features import build_features_batch
+from src.common.metrics import stage, stage_collector
+from src.common.geometry import (
+    GEOMETRY_FORMATS, GEOMETRY_PRECISION, MAX_ZOOM, encode_geometry, simplify_indices, zoom_tolerance_m,
+)
+from src.models.registry import active_version, load_active_models, load_version
+from src.models.speed_lut import build_speed_lut, lut_nbytes
+from src.routing.graph_loader import load_compiled_graph
+from src.routing.compiled_graph import bidirectional_astar, shortest_path
+from src.routing.contraction import load_ch
+from src.routing.alternatives import (
+    MAX_OVERLAP, MAX_STRETCH, admissible, plateau_routes, route_cost,
+)
+from src.routing.route_cache import RouteCache
+from src.routing.single_flight import SingleFlight
+from src.routing.spatial_index import SpatialIndex
 
 logger = logging.getLogger("cgee.engine")
 
 # ---------------------------------------------------
 # Global Cache
 # ---------------------------------------------------
-GRAPH = None
+GRAPH = None            # NetworkX graph; only loaded for the networkx backend
+COMPILED_GRAPH = None   # CSR arrays, from the binary snapshot when present
+SPATIAL_INDEX = None    # KD-tree / edge grid for snapping coordinates
+CH_INDEX = None         # contraction hierarchy, when one was built for the snapshot
 MODELS = None
-_engine_ready = False
+MODEL_INFO = {}         # active registry version, its creation time and metrics
+SPEED_FIELD = None      # per-edge speeds / travel times for the current hour bucket
+ROUTE_CACHE = RouteCache()  # (orig, dest, hour, k) -> extracted routes
+SPEED_LUTS = None       # horizon -> SpeedLUT, in "lut" inference mode
+INFERENCE_STATS = {}    # inference mode and LUT error/memory, for /health
+INIT_SECONDS = None     # wall time of the last successful initialize_engine()
+_engine_loaded = False  # engine objects in place; the warm-up probes may run
+_engine_ready = False   # warm-up finished; serving traffic
 _engine_lock = threading.Lock()
 _init_error = None
+# "compiled" routes on the CSR arrays; "networkx" keeps the original
+# nx.shortest_path implementation for comparison and fallback.
+GRAPH_BACKEND = os.environ.get("CGEE_GRAPH_BACKEND", "compiled")
+
+# Default point-to-point search on the compiled backend: "dijkstra" or
+# "astar" (bidirectional A*). Overridable per call.
+ROUTE_ALGORITHM = os.environ.get("CGEE_ROUTE_ALGORITHM", "dijkstra")
+ROUTE_ALGORITHMS = ("dijkstra", "astar")
+
+# Answer unpenalised length queries (the fastest-route leg) from the
+# contraction hierarchy when `python -m src.cli build-ch` has been run.
+# Only loaded with ROUTE_WEIGHT "length": travel-time searches never use it.
+USE_CH = os.environ.get("CGEE_USE_CH", "1") == "1"
+
+# Alternate routes: "plateau" (shared forward/backward trees) or "penalty"
+# (iterative edge penalties). Both honour the stretch/overlap limits.
+ALT_ROUTE_METHOD = os.environ.get("CGEE_ALT_ROUTES", "plateau")
+ALT_MAX_STRETCH = float(os.environ.get("CGEE_ALT_MAX_STRETCH", MAX_STRETCH))
+ALT_MAX_OVERLAP = float(os.environ.get("CGEE_ALT_MAX_OVERLAP", MAX_OVERLAP))
+
+# Edge weight for route search on the compiled backend: "time" (predicted
+# travel time for the departure hour, see SPEED_FIELD) or "length".
+ROUTE_WEIGHT = os.environ.get("CGEE_ROUTE_WEIGHT", "time")
+# Horizon whose predicted speeds the search runs on; results are still
+# ETA'd and sorted on every horizon afterwards.
+ROUTE_HORIZON = os.environ.get("CGEE_ROUTE_HORIZON", "1_hour")
+
+# Read clear-road segment speeds from the hourly SPEED_FIELD instead of
+# scoring every segment per request (only incident segments are rescored).
+USE_SPEED_FIELD = os.environ.get("CGEE_SPEED_FIELD", "1") == "1"
+
+# Segment speed inference: "model" scores the horizon models directly;
+# "lut" interpolates in per-horizon lookup tables built at startup (see
+# src/models/speed_lut.py), within a memory budget.
+INFERENCE_MODE = os.environ.get("CGEE_INFERENCE", "model")
+LUT_SPEED_STEP = float(os.environ.get("CGEE_LUT_SPEED_STEP", "0.5"))         # km/h
+LUT_SEVERITY_STEP = float(os.environ.get("CGEE_LUT_SEVERITY_STEP", "0.02"))
+LUT_MAX_MB = float(os.environ.get("CGEE_LUT_MAX_MB", "64"))                  # all horizons
+
+# ETA bands: "formula" (margin from distance and incident severity) or
+# "montecarlo" (empirical percentiles of MC_SAMPLES simulated incident and
+# speed-noise draws per route). A request can set its own sample count.
+UNCERTAINTY_MODE = os.environ.get("CGEE_UNCERTAINTY", "formula")
+MC_SAMPLES = int(os.environ.get("CGEE_MC_SAMPLES", "200"))
+MC_MAX_SAMPLES = int(os.environ.get("CGEE_MC_MAX_SAMPLES", "1000"))
+MC_PERCENTILES = (10.0, 90.0)   # lower_bound, upper_bound
+
+# Poll the model registry's CURRENT pointer every MODEL_WATCH_S seconds and
+# hot-reload when it changes (0: reload only through reload_models()).
+MODEL_WATCH_S = float(os.environ.get("CGEE_MODEL_WATCH_S", "0"))
+
 # ---------------------------------------------------
 # Initialize Engine
 # ---------------------------------------------------
 def initialize_engine():
-    global GRAPH, MODELS, _engine_ready, _init_error
+    global GRAPH, COMPILED_GRAPH, SPATIAL_INDEX, CH_INDEX, MODELS
+    global SPEED_LUTS, INFERENCE_STATS, MODEL_INFO
+    global _engine_loaded, _engine_ready, _init_error, INIT_SECONDS
     with _engine_lock:
         if _engine_ready:
             return
+        WARMUP_STATUS.update(state="running", stage=None, completed=0, stages_ms={}, probes=None,
+                             error=None, started_at=time.time(), finished_at=None)
         try:
-            logger.info("Loading road graph...")
-            GRAPH = load_graph()
-            logger.info(f"Graph loaded: {len(GRAPH.nodes)} nodes, {len(GRAPH.edges)} edges")
-            logger.info("Loading XGBoost models...")
-            MODELS = load_models()
-            logger.info(f"Models loaded: {list(MODELS.keys())}")
+            started = time.perf_counter()
+            with _warmup_stage("graph"):
+                logger.info("Loading road graph...")
+                GRAPH, COMPILED_GRAPH = load_compiled_graph(
+                    require_networkx=(GRAPH_BACKEND == "networkx")
+                )
+                logger.info(
+                    f"Graph loaded: {COMPILED_GRAPH.num_nodes} nodes, "
+                    f"{COMPILED_GRAPH.num_edges} edges "
+                    f"({COMPILED_GRAPH.nbytes() / 1e6:.1f} MB compiled)"
+                )
+            with _warmup_stage("indexes"):
+                SPATIAL_INDEX = SpatialIndex(COMPILED_GRAPH)
+                logger.info(f"Spatial index built ({SPATIAL_INDEX.nbytes() / 1e6:.1f} MB)")
+                if USE_CH and GRAPH_BACKEND == "compiled":
+                    if ROUTE_WEIGHT == "length":
+                        CH_INDEX = load_ch(COMPILED_GRAPH.snapshot_id)
+                        if CH_INDEX is not None:
+                            logger.info(f"Contraction hierarchy loaded ({CH_INDEX.nbytes() / 1e6:.1f} MB)")
+                    else:
+                        # The hierarchy is exact only for length weights
+                        logger.info(f"Contraction hierarchy not loaded: routes search on "
+                                    f"CGEE_ROUTE_WEIGHT={ROUTE_WEIGHT}")
+                # Edge weight cache (only the NetworkX backend reads it)
+                if GRAPH_BACKEND == "networkx":
+                    _build_weight_cache()
+            with _warmup_stage("models"):
+                logger.info("Loading XGBoost models...")
+                models, info = load_active_models()
+                warm_up_models(models)
+                MODELS, MODEL_INFO = models, info
+                logger.info(f"Models loaded: {list(MODELS.keys())} (version {MODEL_INFO['version']})")
+                SPEED_LUTS, INFERENCE_STATS = _build_speed_luts(MODELS) if INFERENCE_MODE == "lut" else (
+                    None, {"mode": "model"}
+                )
+            with _warmup_stage("speed_field"):
+                if GRAPH_BACKEND == "compiled" and (ROUTE_WEIGHT == "time" or USE_SPEED_FIELD):
+                    refresh_speed_field()
+                    logger.info(
+                        f"Speed field built for hour {SPEED_FIELD.hour} "
+                        f"in {SPEED_FIELD_STATS['last_refresh_ms']:.0f} ms"
+                    )
+                    _start_speed_field_refresh()
+            _engine_loaded = True
+            with _warmup_stage("probe"):
+                WARMUP_STATUS["probes"] = _run_warmup_probes()
+            if MODEL_WATCH_S > 0:
+                _start_model_watch()
             _engine_ready = True
             _init_error = None
-            logger.info("Engine fully ready.")
-            # Pre-build edge weight cache immediately after graph load
-            _build_weight_cache()
+            INIT_SECONDS = time.perf_counter() - started
+            WARMUP_STATUS.update(state="ready", stage=None, finished_at=time.time())
+            logger.info(f"Engine fully ready in {INIT_SECONDS:.1f}s: {WARMUP_STATUS['stages_ms']} ms")
         except FileNotFoundError as e:
             _init_error = (
                 f"Missing required file: {e}. "
                 f"Ensure bengaluru.graphml is at data/raw/osm/ "
+                f"(or a snapshot is at data/processed/graph_snapshot/) "
                 f"and xgb_1_hour.pkl, xgb_2_hour.pkl, xgb_4_hour.pkl "
                 f"are at models/"
             )
             logger.error(f"[CGEE INIT FAILED] {_init_error}")
-            # Reset so the next call to initialize_engine() retries
-            GRAPH = None
-            MODELS = None
-            _engine_ready = False
+            _reset_engine()
 
         except Exception as e:
             _init_error = f"Engine initialization error: {type(e).__name__}: {e}"
             logger.error(f"[CGEE INIT FAILED] {_init_error}", exc_info=True)
-            GRAPH = None
-            MODELS = None
-            _engine_ready = False
+            _reset_engine()
+
+
+def _reset_engine():
+    """Drop a partial initialisation so the next initialize_engine() retries."""
+    global GRAPH, COMPILED_GRAPH, SPATIAL_INDEX, CH_INDEX, MODELS, SPEED_FIELD, SPEED_LUTS
+    global _engine_loaded, _engine_ready
+    GRAPH = None
+    COMPILED_GRAPH = None
+    SPATIAL_INDEX = None
+    CH_INDEX = None
+    MODELS = None
+    SPEED_FIELD = None
+    SPEED_LUTS = None
+    _other_hour_fields.clear()
+    _engine_loaded = False
+    _engine_ready = False
+    WARMUP_STATUS.update(state="failed", error=_init_error, finished_at=time.time())
+
+
+def _build_speed_luts(models):
+    """Per-horizon SpeedLUTs and their stats, or (None, stats) if over budget."""
+    needed_mb = len(models) * lut_nbytes(LUT_SPEED_STEP, LUT_SEVERITY_STEP) / 1e6
+    if needed_mb > LUT_MAX_MB:
+        logger.warning(
+            f"Speed LUTs at step {LUT_SPEED_STEP} km/h / {LUT_SEVERITY_STEP} severity "
+            f"need {needed_mb:.1f} MB > CGEE_LUT_MAX_MB={LUT_MAX_MB}; using model inference"
+        )
+        return None, {"mode": "model", "lut_rejected_mb": round(needed_mb, 1)}
+
+    started = time.perf_counter()
+    luts, stats = {}, {}
+    for horizon, model in models.items():
+        lut = build_speed_lut(model, LUT_SPEED_STEP, LUT_SEVERITY_STEP)
+        luts[horizon] = lut
+        stats[horizon] = {
+            "max_abs_error_kmh": round(lut.max_abs_error, 3),
+            "mean_abs_error_kmh": round(lut.mean_abs_error, 4),
+            "mb": round(lut.nbytes() / 1e6, 2),
+        }
+    logger.info(f"Speed LUTs built in {time.perf_counter() - started:.1f}s: {stats}")
+    return luts, {
+        "mode": "lut",
+        "speed_step_kmh": LUT_SPEED_STEP,
+        "severity_step": LUT_SEVERITY_STEP,
+        "horizons": stats,
+    }
 
 
 def is_engine_ready() -> bool:
@@ -68,14 +232,113 @@ def is_engine_ready() -> bool:
 def get_init_error():
     return _init_error
 
+
+# ---------------------------------------------------
+# Staged Warm-up
+# ---------------------------------------------------
+# initialize_engine() runs these stages in order and only declares the
+# engine ready after the last one, so /health can keep load balancers off
+# an instance until the first real request would be as fast as the rest.
+# The probe stage sends representative Bengaluru trips through the whole
+# pipeline (snap, k-route search on the current speed field, incident
+# simulation, model scoring, geometry assembly).
+WARMUP_STAGES = ("graph", "indexes", "models", "speed_field", "probe")
+WARMUP_OD_PAIRS = [
+    # (name, source, destination): central, IT corridors and cross-city trips
+    ("Majestic -> MG Road", (12.9767, 77.5713), (12.9756, 77.6050)),
+    ("Koramangala -> Whitefield", (12.9352, 77.6245), (12.9868, 77.7298)),
+    ("Hebbal -> Silk Board", (13.0358, 77.5970), (12.9177, 77.6238)),
+    ("Yeshwanthpur -> Indiranagar", (13.0280, 77.5400), (12.9784, 77.6408)),
+    ("Jayanagar -> Marathahalli", (12.9250, 77.5938), (12.9569, 77.7011)),
+    ("Banashankari -> Hebbal", (12.9255, 77.5468), (13.0358, 77.5970)),
+]
+WARMUP_PROBES = int(os.environ.get("CGEE_WARMUP_PROBES", str(len(WARMUP_OD_PAIRS))))
+WARMUP_STATUS = {"state": "pending", "stage": None, "completed": 0, "stages_ms": {}, "probes": None,
+                 "error": None, "started_at": None, "finished_at": None}
+
+
+class _warmup_stage:
+    """Marks `name` as the running warm-up stage and records its duration."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        WARMUP_STATUS["stage"] = self.name
+        self.started = time.perf_counter()
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            WARMUP_STATUS["stages_ms"][self.name] = round((time.perf_counter() - self.started) * 1000, 1)
+            WARMUP_STATUS["completed"] += 1
+
+
+def _run_warmup_probes() -> dict:
+    """
+    Route the first WARMUP_PROBES OD pairs end to end. A trip that fails
+    (e.g. a landmark outside a trimmed development graph) is logged and
+    skipped; if every trip fails the engine is not usable and this raises.
+    Stage timings are kept out of the request histograms.
+    """
+    pairs = WARMUP_OD_PAIRS[:max(0, WARMUP_PROBES)]
+    timings, failed = [], []
+    with stage_collector(record=False):
+        for name, (src_lat, src_lon), (dst_lat, dst_lon) in pairs:
+            started = time.perf_counter()
+            try:
+                compute_route_eta({"lat": src_lat, "lon": src_lon}, {"lat": dst_lat, "lon": dst_lon}, seed=0)
+            except Exception as e:
+                logger.warning(f"Warm-up probe {name!r} failed: {type(e).__name__}: {e}")
+                failed.append(name)
+                continue
+            timings.append((time.perf_counter() - started) * 1000)
+    if pairs and not timings:
+        raise RuntimeError(f"All {len(pairs)} warm-up probes failed")
+    return {
+        "pairs": len(pairs),
+        "failed": failed,
+        "ms": {"first": round(timings[0], 1), "max": round(max(timings), 1),
+               "median": round(float(np.median(timings)), 1)} if timings else None,
+    }
+
+
+def warmup_status() -> dict:
+    status = dict(WARMUP_STATUS, stages_ms=dict(WARMUP_STATUS["stages_ms"]))
+    status["progress"] = round(status["completed"] / len(WARMUP_STAGES), 2)
+    return status
+
 # ---------------------------------------------------
 # Cached Shortest Path Lookup
 # ---------------------------------------------------
 @lru_cache(maxsize=256)
-def get_shortest_path(orig, dest):
-    if not _engine_ready:
+def get_shortest_path(orig, dest, algorithm=None):
+    if not _engine_loaded:
         raise RuntimeError("Engine not ready. Call initialize_engine() first.")
-    return ox.shortest_path(GRAPH, orig, dest, weight="length")
+    if GRAPH_BACKEND == "networkx":
+        try:
+            return nx.shortest_path(GRAPH, orig, dest, weight="length")
+        except nx.NetworkXNoPath:
+            return None
+    cg = COMPILED_GRAPH
+    path = _search(cg, cg.index_of(orig), cg.index_of(dest), None, algorithm)
+    return cg.ids_of(path) if path else None
+
+
+def _search(cg, src, dst, weights, algorithm=None, stats=None, heuristic_scale=1.0):
+    """
+    Run a point-to-point search on compact indices. Plain length queries go
+    to the contraction hierarchy when one is loaded (it is exact for
+    them); anything else uses the selected algorithm. `heuristic_scale`
+    is passed to A* and must match the units of `weights`.
+    """
+    if weights is None and CH_INDEX is not None:
+        return CH_INDEX.query(src, dst, stats=stats)
+    algorithm = algorithm or ROUTE_ALGORITHM
+    if algorithm == "astar":
+        return bidirectional_astar(cg, src, dst, weights, heuristic_scale, stats=stats)
+    if algorithm == "dijkstra":
+        return shortest_path(cg, src, dst, weights, stats=stats)
+    raise ValueError(f"Unknown routing algorithm {algorithm!r}; expected one of {ROUTE_ALGORITHMS}")
 
 # ---------------------------------------------------
 # Road Type → Free-Flow Speed Mapping
@@ -91,6 +354,7 @@ FREE_FLOW = {
 }
 
 ROUTE_LABELS = ["Fastest Route", "Alternate Route", "Scenic Route"]
+K_ROUTES = len(ROUTE_LABELS)
 ROUTE_COLORS = ["#00BFFF", "#FF6B2B", "#00E676"]
 
 # ---------------------------------------------------
@@ -150,7 +414,324 @@ LOAD_FACTORS = {
 
 
 # ---------------------------------------------------
-# K-Shortest Paths via Edge Penalty Method (OPTIMISED)
+# Whole-Graph Speed Field (time-dependent edge weights)
+# ---------------------------------------------------
+# For an hour bucket, each road type gets the incident-free model speed
+# predict_route_etas() starts from (free-flow × load factor, horizon
+# modulation, XGBoost), and every edge gets its road type's speed: one
+# float32 array per horizon aligned with the edge list, plus the matching
+# travel-time weights (length / speed, in seconds) that route search runs
+# on. Requests read segment speeds from the field and only rescore their
+# incident segments.
+#
+# The current bucket is rebuilt at every hour boundary by a background
+# thread into freshly allocated arrays, then published with a single
+# assignment. A field is never written once published, so a refresh or a
+# model reload never blocks or tears a read; requests still holding the
+# old field finish on it and it is freed after them. Other departure hours
+# are built on demand and the most recent OTHER_HOUR_FIELDS are kept.
+SPEED_FLOOR_KMH = 5.0
+OTHER_HOUR_FIELDS = 4
+_speed_field_thread = None
+_other_hour_fields = OrderedDict()   # hour -> SpeedField, least recently used first
+_field_lock = threading.Lock()   # serialises field builds (hourly refresh, other hours, model reload)
+SPEED_FIELD_STATS = {"refreshes": 0, "failures": 0, "last_refresh_ms": None}
+
+
+class SpeedField:
+    def __init__(self, hour, speeds, weights, road_type_speeds_kmh):
+        self.hour = hour
+        self.speeds = speeds                    # horizon -> float32 [E] km/h
+        self.weights = weights                  # horizon -> float32 [E] seconds
+        self.road_type_speeds = road_type_speeds_kmh  # horizon -> float64 [road types]
+        self.built_at = time.time()
+        self.models = None                      # the MODELS dict it was built from
+
+    def heuristic_scale(self, horizon) -> float:
+        """1 / fastest speed in m/s: keeps planar metres a lower bound on seconds."""
+        return 3.6 / float(self.road_type_speeds[horizon].max())
+
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (*self.speeds.values(), *self.weights.values()))
+
+
+def road_type_speeds(road_types, hour, horizon, model, luts=None) -> np.ndarray:
+    """Incident-free predicted speed (km/h) for each road type at `hour`."""
+    cfg = HORIZON_CONFIG[horizon]
+    is_peak = int(7 <= hour <= 10 or 17 <= hour <= 21)
+    projected_hour = (hour + cfg["hour_offset"]) % 24
+    projected_peak = 1 if (7 <= projected_hour <= 10 or
+                           17 <= projected_hour <= 21) else 0
+
+    base_speed = np.empty(len(road_types), dtype=np.float64)
+    for i, road_type in enumerate(road_types):
+        off_peak_factor, peak_factor = LOAD_FACTORS.get(road_type, (0.45, 0.68))
+        load_factor = peak_factor if is_peak else off_peak_factor
+        base_speed[i] = max(FREE_FLOW.get(road_type, 40) * (1.0 - load_factor), 5.0)
+    speeds = _score_speeds(
+        horizon, model, projected_hour, projected_peak,
+        base_speed * cfg["speed_decay"], np.zeros(len(road_types)), luts,
+    )
+    return np.maximum(speeds, SPEED_FLOOR_KMH)
+
+
+def build_speed_field(hour, models=None, luts=None) -> SpeedField:
+    """
+    A new speed field for `hour`. Built from the live MODELS / SPEED_LUTS
+    unless a model set is passed.
+    """
+    if models is None:
+        models, luts = MODELS, SPEED_LUTS
+    cg = COMPILED_GRAPH
+    lengths = np.asarray(cg.lengths, dtype=np.float32)
+    codes = np.asarray(cg.road_type)
+    field = SpeedField(hour, {}, {}, {})
+    for horizon, model in models.items():
+        speeds = road_type_speeds(cg.road_type_names, hour, horizon, model, luts)
+        field.speeds[horizon] = speeds.astype(np.float32)[codes]
+        field.weights[horizon] = lengths * (3.6 / speeds).astype(np.float32)[codes]
+        field.road_type_speeds[horizon] = speeds
+    field.models = models
+    return field
+
+
+def get_speed_field(hour):
+    """Speed field for `hour`; the background bucket when it matches."""
+    current = SPEED_FIELD
+    if current is not None and current.hour == hour:
+        return current
+    with _field_lock:
+        field = _other_hour_fields.get(hour)
+        if field is None:
+            field = _other_hour_fields[hour] = build_speed_field(hour)
+            while len(_other_hour_fields) > OTHER_HOUR_FIELDS:
+                _other_hour_fields.popitem(last=False)
+        else:
+            _other_hour_fields.move_to_end(hour)
+        return field
+
+
+def refresh_speed_field(hour=None):
+    """Build a new field for `hour` (default: now) and publish it."""
+    with _field_lock:
+        started = time.perf_counter()
+        field = build_speed_field(datetime.now().hour if hour is None else hour)
+        _publish_speed_field(field)
+    SPEED_FIELD_STATS["refreshes"] += 1
+    SPEED_FIELD_STATS["last_refresh_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return field
+
+
+def _publish_speed_field(field):
+    """Make `field` the live one; hold _field_lock."""
+    global SPEED_FIELD
+    SPEED_FIELD = field
+    _other_hour_fields.pop(field.hour, None)
+
+
+def speed_field_stats() -> dict:
+    field = SPEED_FIELD
+    if field is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "hour": field.hour,
+        "built_at": datetime.fromtimestamp(field.built_at).isoformat(timespec="seconds"),
+        "edges": len(next(iter(field.speeds.values()))),
+        "other_hours": list(_other_hour_fields),
+        "mb": round((field.nbytes() + sum(f.nbytes() for f in _other_hour_fields.values())) / 1e6, 2),
+        **SPEED_FIELD_STATS,
+    }
+
+
+def _refresh_speed_field_loop():
+    while True:
+        now = datetime.now()
+        next_hour = 3600 - (now.minute * 60 + now.second + now.microsecond / 1e6)
+        time.sleep(next_hour + 1.0)
+        if not _engine_ready:
+            continue
+        try:
+            field = refresh_speed_field()
+            logger.info(
+                f"Speed field rebuilt for hour {field.hour} "
+                f"in {SPEED_FIELD_STATS['last_refresh_ms']:.0f} ms"
+            )
+        except Exception:
+            SPEED_FIELD_STATS["failures"] += 1
+            logger.error("Speed field rebuild failed; keeping previous bucket", exc_info=True)
+
+
+def _start_speed_field_refresh():
+    global _speed_field_thread
+    if _speed_field_thread is None:
+        _speed_field_thread = threading.Thread(
+            target=_refresh_speed_field_loop, name="cgee-speed-field", daemon=True
+        )
+        _speed_field_thread.start()
+
+
+# ---------------------------------------------------
+# Model Hot Reload
+# ---------------------------------------------------
+# A new registry version is loaded, validated and warmed off the request
+# path, together with everything derived from the models (lookup tables,
+# the current speed field). The live set is then replaced by reference
+# assignment and the route cache, whose routes were searched on the old
+# speeds, is cleared. Requests already running finish on the objects they
+# hold.
+_reload_lock = threading.Lock()
+_reload_thread = None
+_model_watch_thread = None
+RELOAD_STATUS = {"state": "idle", "version": None, "error": None,
+                 "started_at": None, "finished_at": None, "reloads": 0}
+
+
+def _probe_batch() -> np.ndarray:
+    """Feature rows covering every hour, a speed sweep and incident states."""
+    hour, speed, severity = np.meshgrid(
+        np.arange(24), np.arange(5.0, 105.0, 5.0), [0.0, 0.3, 0.6], indexing="ij"
+    )
+    hour, speed, severity = hour.ravel(), speed.ravel(), severity.ravel()
+    return build_features_batch(
+        speed_lag_1=speed,
+        hour=hour,
+        is_peak=(7 <= hour) & (hour <= 10) | (17 <= hour) & (hour <= 21),
+        incident_flag=severity > 0,
+        incident_severity=severity,
+    )
+
+
+def warm_up_models(models) -> dict:
+    """
+    Score the probe batch with every horizon model (building any lazy
+    evaluator state) and check the outputs are usable. Returns the mean
+    absolute difference from the live models per horizon, in km/h.
+    """
+    X = _probe_batch()
+    delta = {}
+    for horizon, model in models.items():
+        pred = np.asarray(model.predict(X), dtype=np.float64)
+        model.predict(X[:1])
+        if not np.all(np.isfinite(pred)):
+            raise ValueError(f"{horizon} model returned non-finite speeds on the probe batch")
+        if MODELS is not None and horizon in MODELS:
+            live = np.asarray(MODELS[horizon].predict(X), dtype=np.float64)
+            delta[horizon] = round(float(np.abs(pred - live).mean()), 3)
+    return delta
+
+
+def reload_models(version=None) -> dict:
+    """
+    Load registry `version` (the active one when None), warm it and swap it
+    in. Blocking; raises RuntimeError if another reload is running and
+    leaves the live models untouched if loading or warm-up fails.
+    """
+    global MODELS, MODEL_INFO, SPEED_LUTS, INFERENCE_STATS
+    if not _reload_lock.acquire(blocking=False):
+        raise RuntimeError("A model reload is already in progress")
+    try:
+        started = time.perf_counter()
+        RELOAD_STATUS.update(state="loading", version=version, error=None,
+                             started_at=datetime.now().isoformat(timespec="seconds"),
+                             finished_at=None)
+        if version is None:
+            models, info = load_active_models()
+        else:
+            models, manifest = load_version(version)
+            info = {
+                "version": version,
+                "created_at": manifest.get("created_at"),
+                "metrics": {h: e.get("metrics") for h, e in manifest["horizons"].items()},
+            }
+        RELOAD_STATUS.update(state="warming", version=info["version"])
+        info["probe_delta_kmh"] = warm_up_models(models)
+        luts, inference_stats = _build_speed_luts(models) if INFERENCE_MODE == "lut" else (
+            None, {"mode": "model"}
+        )
+
+        with _field_lock:
+            field = None
+            if SPEED_FIELD is not None:
+                field = build_speed_field(SPEED_FIELD.hour, models=models, luts=luts)
+            MODELS, SPEED_LUTS, INFERENCE_STATS, MODEL_INFO = models, luts, inference_stats, info
+            if field is not None:
+                _publish_speed_field(field)
+            _other_hour_fields.clear()
+        ROUTE_CACHE.clear()
+
+        info["loaded_in_s"] = round(time.perf_counter() - started, 2)
+        RELOAD_STATUS.update(state="idle", finished_at=datetime.now().isoformat(timespec="seconds"))
+        RELOAD_STATUS["reloads"] += 1
+        logger.info(f"Models reloaded: version {info['version']} in {info['loaded_in_s']}s "
+                    f"(probe delta {info['probe_delta_kmh']} km/h)")
+        return info
+    except Exception as e:
+        RELOAD_STATUS.update(state="failed", error=f"{type(e).__name__}: {e}",
+                             finished_at=datetime.now().isoformat(timespec="seconds"))
+        logger.error(f"Model reload failed; keeping version {MODEL_INFO.get('version')}",
+                     exc_info=True)
+        raise
+    finally:
+        _reload_lock.release()
+
+
+def start_model_reload(version=None, on_success=None) -> bool:
+    """
+    Run reload_models() in a background thread, then on_success(info) if
+    given (e.g. to move compute workers over). False if one is running.
+    """
+    global _reload_thread
+    if _reload_lock.locked():
+        return False
+
+    def _run():
+        try:
+            info = reload_models(version)
+        except Exception:
+            return   # recorded in RELOAD_STATUS
+        if on_success is not None:
+            try:
+                on_success(info)
+            except Exception:
+                logger.error("Post-reload step failed", exc_info=True)
+
+    _reload_thread = threading.Thread(target=_run, name="cgee-model-reload", daemon=True)
+    _reload_thread.start()
+    return True
+
+
+def model_status() -> dict:
+    return {"active": MODEL_INFO, "reload": RELOAD_STATUS}
+
+
+def _model_watch_loop():
+    while True:
+        time.sleep(MODEL_WATCH_S)
+        if not _engine_ready or _reload_lock.locked():
+            continue
+        try:
+            version = active_version()
+            if RELOAD_STATUS["state"] == "failed" and RELOAD_STATUS["version"] == version:
+                continue   # do not retry a broken version until CURRENT moves
+            if version is not None and version != MODEL_INFO.get("version"):
+                logger.info(f"Model registry now points at {version}; reloading")
+                reload_models(version)
+        except Exception:
+            pass   # logged and recorded by reload_models(); retried next poll
+
+
+def _start_model_watch():
+    global _model_watch_thread
+    if _model_watch_thread is None:
+        _model_watch_thread = threading.Thread(
+            target=_model_watch_loop, name="cgee-model-watch", daemon=True
+        )
+        _model_watch_thread.start()
+
+
+# ---------------------------------------------------
+# K Routes: plateau alternates + edge-penalty fallback
 # ---------------------------------------------------
 # Pre-built weight cache — avoids Python callback overhead on 392K+ edges.
 _WEIGHT_CACHE: dict = {}
@@ -171,15 +752,107 @@ def _build_weight_cache():
     logger.info(f"Weight cache built: {len(_WEIGHT_CACHE)} edges")
 
 
-def find_k_routes(orig, dest, k=1, penalty=5.0):
+def find_k_routes(orig, dest, k=1, penalty=5.0, algorithm=None, hour=None):
     """
-    Generate up to k distinct routes using iterative edge penalty.
-    Uses a pre-built numeric weight dict instead of a Python callback,
-    eliminating per-edge Python overhead on every Dijkstra call.
+    Generate up to k distinct routes: the optimum plus alternates.
+    Dispatches on GRAPH_BACKEND; takes and returns OSM node ids either way.
+    `algorithm` ("dijkstra" / "astar") selects the compiled-backend
+    point-to-point search and defaults to ROUTE_ALGORITHM. With k > 1 and
+    the plateau method it is not used for the optimum (see
+    _find_k_routes_compiled). With ROUTE_WEIGHT "time", routes are
+    optimal in predicted travel time for departure `hour` (default: now).
     """
-    if not _engine_ready:
+    if not _engine_loaded:
         raise RuntimeError("Engine not initialized. Call initialize_engine() first.")
 
+    if GRAPH_BACKEND == "networkx":
+        return _find_k_routes_networkx(orig, dest, k, penalty)
+    return _find_k_routes_compiled(orig, dest, k, penalty, algorithm, hour)
+
+
+def _find_k_routes_compiled(orig, dest, k, penalty, algorithm=None, hour=None):
+    """
+    The optimum plus up to k-1 alternates on the CSR arrays. Alternates come
+    from the plateau method (two bounded tree searches shared by all
+    candidates); if it yields too few, penalised searches fill the rest.
+    Every alternate must pass the ALT_MAX_STRETCH / ALT_MAX_OVERLAP limits.
+
+    The plateau method takes the optimum from its forward tree, which it
+    has to grow anyway, so `algorithm` and the contraction hierarchy are
+    not used then. They serve k <= 1, ALT_ROUTE_METHOD "penalty" and the
+    penalised fill searches.
+    """
+    cg = COMPILED_GRAPH
+    try:
+        src, dst = cg.index_of(orig), cg.index_of(dest)
+    except KeyError:
+        return []
+
+    # None means edge length (and lets the CH answer the optimum)
+    weights, scale = None, 1.0
+    if ROUTE_WEIGHT == "time":
+        field = get_speed_field(datetime.now().hour if hour is None else hour)
+        weights, scale = field.weights[ROUTE_HORIZON], field.heuristic_scale(ROUTE_HORIZON)
+
+    if k <= 1:
+        path = _search(cg, src, dst, weights, algorithm, heuristic_scale=scale)
+        return [cg.ids_of(path)] if path else []
+
+    if ALT_ROUTE_METHOD == "plateau":
+        routes, optimum = plateau_routes(
+            cg, src, dst, k, weights, max_stretch=ALT_MAX_STRETCH,
+            max_overlap=ALT_MAX_OVERLAP, heuristic_scale=scale,
+        )
+        if not routes:
+            return []
+    else:
+        path = _search(cg, src, dst, weights, algorithm, heuristic_scale=scale)
+        if not path:
+            return []
+        routes, optimum = [path], route_cost(cg, path, weights)
+
+    if len(routes) < k:
+        _penalty_fill(cg, src, dst, routes, k, penalty, optimum, algorithm, weights, scale)
+    if len(routes) < k:
+        logger.info(
+            f"Found {len(routes)} of {k} routes within stretch {ALT_MAX_STRETCH} "
+            f"and overlap {ALT_MAX_OVERLAP} limits"
+        )
+
+    return [cg.ids_of(path) for path in routes]
+
+
+def _penalty_fill(cg, src, dst, routes, k, penalty, optimum, algorithm=None,
+                  weights=None, heuristic_scale=1.0):
+    """
+    Append penalised-search routes to `routes` until there are k. Penalty
+    multipliers live in a float32 array aligned with the edge list, so each
+    search is one vectorised multiply instead of a Python weight closure. A
+    duplicate or over-limit result is penalised and retried, not a stop.
+    """
+    base = cg.lengths if weights is None else weights
+    penalties = np.ones(cg.num_edges, dtype=np.float32)
+    for path in routes:
+        penalties[cg.path_edges(path)] *= penalty
+
+    for _ in range(2 * k):
+        if len(routes) >= k:
+            break
+        # Penalties only ever raise weights, so the A* heuristic stays admissible
+        path = _search(cg, src, dst, base * penalties, algorithm, heuristic_scale=heuristic_scale)
+        if not path:
+            break
+        if admissible(cg, path, routes, optimum, weights,
+                      max_stretch=ALT_MAX_STRETCH, max_overlap=ALT_MAX_OVERLAP):
+            routes.append(path)
+        penalties[cg.path_edges(path)] *= penalty
+
+
+def _find_k_routes_networkx(orig, dest, k, penalty):
+    """
+    Uses a pre-built numeric weight dict instead of a Python callback,
+    eliminating per-edge Python overhead on every Dijkstra call.
+    """
     # Build weight cache on first call (once per server lifetime)
     global _WEIGHT_CACHE_VALID
     if not _WEIGHT_CACHE_VALID:
@@ -231,95 +904,89 @@ def find_k_routes(orig, dest, k=1, penalty=5.0):
 # ---------------------------------------------------
 # Extract route info from a node list
 # ---------------------------------------------------
-def extract_route_info(route_nodes):
-    route_geometry = []
-    for node in route_nodes:
-        route_geometry.append({
-            "lat": GRAPH.nodes[node]["y"],
-            "lon": GRAPH.nodes[node]["x"]
-        })
-
-    segments = []
-    road_types = []
-
-    for u, v in zip(route_nodes[:-1], route_nodes[1:]):
-        edge_dict = GRAPH.get_edge_data(u, v)
-        if not edge_dict:
-            continue
-
-        edge_data = list(edge_dict.values())[0]
-        length_km = edge_data.get("length", 0) / 1000.0
-        segments.append(length_km)
-
-        road_type = edge_data.get("highway", "residential")
-        if isinstance(road_type, list):
-            road_type = road_type[0]
-        road_types.append(road_type)
-
+def extract_route_info(route_nodes, with_edges=False):
+    """
+    (route_geometry, segments, road_types) for a node path; with_edges
+    appends the compiled-graph edge index of each segment.
+    """
+    cg = COMPILED_GRAPH
+    idx = np.searchsorted(cg.node_ids, np.asarray(route_nodes, dtype=np.int64))
+    route_geometry = [
+        {"lat": lat, "lon": lon}
+        for lat, lon in zip(cg.node_y[idx].tolist(), cg.node_x[idx].tolist())
+    ]
+
+    edges = cg.path_edges(idx.tolist())
+    # Consecutive nodes with no connecting edge contribute no segment
+    edges = edges[edges >= 0]
+    segments = (cg.lengths[edges].astype(np.float64) / 1000.0).tolist()
+    names = cg.road_type_names
+    road_types = [names[code] for code in cg.road_type[edges].tolist()]
+
+    if with_edges:
+        return route_geometry, segments, road_types, edges
     return route_geometry, segments, road_types
 
 
 # ---------------------------------------------------
 # Per-Segment Probabilistic Incident Model (BUG FIX 2)
 # ---------------------------------------------------
-def simulate_incidents(num_segments, road_types, hour, route_geometry):
+def incident_probabilities(road_types, hour) -> np.ndarray:
+    """Vectorised get_incident_probability() over a route's road types."""
+    base = np.array([BASE_INCIDENT_PROB.get(rt, 0.07) for rt in road_types], dtype=np.float64)
+    if 7 <= hour <= 10 or 17 <= hour <= 21:
+        return np.minimum(base * 2.5, 0.35)     # peak multiplier
+    elif 23 <= hour or hour <= 5:
+        return base * 0.4                       # night suppressor
+    return base
+
+
+def _draw_incidents(rng, p, shape):
     """
-    Generate per-segment incident data using probabilistic model
-    aligned with traffic_generator.py training distribution.
-    Each segment is evaluated independently based on road type and time.
-    Severity sampled from Beta(2,5) — mean ~0.28, right-skewed (mostly mild).
+    Incident flags and propagated severities for segments with incident
+    probabilities `p`, along the last axis of `shape` (a route, or a
+    samples x segments matrix of independent draws of it).
     """
-    incident_flags = []
-    raw_severities = []
-
     # Phase 1: Independent per-segment incident determination
-    for idx in range(num_segments):
-        road_type = road_types[idx] if idx < len(road_types) else "residential"
-        p = get_incident_probability(road_type, hour)
-        has_incident = 1 if np.random.rand() < p else 0
-        incident_flags.append(has_incident)
-
-        if has_incident:
-            # Beta(2,5) — mean ~0.28, right-skewed (mostly mild incidents)
-            severity = float(np.random.beta(2, 5))
-        else:
-            severity = 0.0
-        raw_severities.append(severity)
+    incident_flags = rng.random(shape) < p
+    # Beta(2,5) — mean ~0.28, right-skewed (mostly mild incidents)
+    raw_severities = np.where(incident_flags, rng.beta(2, 5, size=shape), 0.0)
 
     # Phase 2: Spatial propagation (adds severity from neighboring incidents)
-    segment_severities = []
-    incident_indices = set()
-    total_severity = 0.0
-    count = 0
-
-    for idx in range(num_segments):
-        severity = raw_severities[idx]
-
-        # Spatial propagation from neighbors
-        if idx > 0 and incident_flags[idx - 1] == 1:
-            severity += 0.15
-        if idx < num_segments - 1 and incident_flags[idx + 1] == 1:
-            severity += 0.15
+    severities = raw_severities.copy()
+    severities[..., 1:] += 0.15 * incident_flags[..., :-1]
+    severities[..., :-1] += 0.15 * incident_flags[..., 1:]
+    return incident_flags, np.minimum(severities, 0.90)
 
-        severity = min(severity, 0.90)
 
-        if incident_flags[idx] == 1:
-            incident_indices.add(idx)
-            total_severity += severity
-            count += 1
+def simulate_incidents(num_segments, road_types, hour, route_geometry, seed=None):
+    """
+    Generate per-segment incident data using probabilistic model
+    aligned with traffic_generator.py training distribution.
+    Each segment is evaluated independently based on road type and time.
+    Severity sampled from Beta(2,5) — mean ~0.28, right-skewed (mostly mild).
 
-        segment_severities.append(severity)
+    All variates come from one numpy Generator in two vectorised draws;
+    `seed` may be an int (reproducible), a Generator (to share a stream
+    across routes) or None (fresh entropy).
+    """
+    rng = np.random.default_rng(seed)
+    road_types = list(road_types[:num_segments]) + ["residential"] * (num_segments - len(road_types))
+    incident_flags, severities = _draw_incidents(
+        rng, incident_probabilities(road_types, hour), num_segments
+    )
 
-    avg_severity = total_severity / count if count > 0 else 0.0
+    incident_idx = np.flatnonzero(incident_flags)
+    count = len(incident_idx)
+    avg_severity = float(severities[incident_idx].mean()) if count > 0 else 0.0
 
-    incident_coords = []
-    for idx in incident_indices:
-        if idx < len(route_geometry):
-            incident_coords.append(route_geometry[idx])
+    incident_coords = [
+        route_geometry[idx] for idx in incident_idx.tolist() if idx < len(route_geometry)
+    ]
 
     return {
-        "segment_severities": segment_severities,
-        "incident_indices": incident_indices,
+        "segment_severities": severities.tolist(),
+        "incident_indices": set(incident_idx.tolist()),
         "incident_count": count,
         "avg_severity": avg_severity,
         "incident_coordinates": incident_coords,
@@ -330,97 +997,215 @@ def simulate_incidents(num_segments, road_types, hour, route_geometry):
 # Predict ETAs for a single route
 # (BUG FIX 1 + BUG FIX 3 + Patent Contextual Adjustment)
 # ---------------------------------------------------
-def predict_route_etas(segments, road_types, hour, is_peak, incident_data):
-    etas = {}
-    confidence_scores = {}
-    total_distance = sum(segments)
-    num_segments = len(segments)
-
-    for horizon, model in MODELS.items():
-        eta_minutes = 0.0
+def _score_speeds(horizon, model, projected_hour, projected_peak, speed_lag_1, severities,
+                  luts=None):
+    """
+    Raw predicted speeds (km/h) for a batch of rows; the LUT in "lut" mode
+    (`luts` overrides SPEED_LUTS when scoring a model set not yet live).
+    """
+    luts = SPEED_LUTS if luts is None else luts
+    if luts is not None:
+        return luts[horizon].predict(projected_hour, speed_lag_1, severities)
+    features = build_features_batch(
+        speed_lag_1=speed_lag_1,
+        hour=projected_hour,
+        is_peak=projected_peak,
+        incident_flag=severities > 0,
+        incident_severity=severities,
+    )
+    return np.asarray(model.predict(features), dtype=np.float64)
+
+
+def monte_carlo_etas(segments, road_types, hour, nominal_speed, samples, rng,
+                     horizons=None) -> dict:
+    """
+    {horizon: float64 [samples]} route ETAs (minutes) over independent
+    draws of the incident simulation and the per-segment speed noise.
+    Each horizon scores its samples x segments matrix in one batched
+    call; a draw is then reduced exactly like the point estimate.
+    """
+    seg_km = np.asarray(segments, dtype=np.float64)
+    shape = (samples, len(seg_km))
+    _, severities = _draw_incidents(rng, incident_probabilities(road_types, hour), shape)
+    contextual_factor = np.where(severities > 0, 1.0 - (severities * 0.6), 1.0)
+
+    eta_samples = {}
+    for horizon in horizons or MODELS:
+        model = MODELS[horizon]
         cfg = HORIZON_CONFIG[horizon]
+        projected_hour = (hour + cfg["hour_offset"]) % 24
+        projected_peak = 1 if (7 <= projected_hour <= 10 or
+                               17 <= projected_hour <= 21) else 0
+        base_speed = np.maximum(nominal_speed + rng.normal(0, 2.5, size=shape), 5.0)
+        raw_speed = _score_speeds(
+            horizon, model, projected_hour, projected_peak,
+            (base_speed * cfg["speed_decay"]).ravel(), severities.ravel(),
+        ).reshape(shape)
+        pred_speed = np.maximum(raw_speed * contextual_factor, 5.0)
+        eta_samples[horizon] = ((seg_km / pred_speed) * 60.0).sum(axis=1)
+    return eta_samples
+
+
+def predict_route_etas(segments, road_types, hour, is_peak, incident_data, edges=None,
+                       samples=0, seed=None):
+    """
+    Multi-horizon ETA for one route.
+
+    Every segment gets one N(0, 2.5) km/h noise draw per horizon, from
+    `seed` (an int, a Generator to share a stream, or None). Without
+    the speed field, every segment is scored with a single predict() per
+    horizon. The arithmetic and the noise draws are the same as scoring
+    segment by segment.
+
+    With the speed field enabled and the route's edge indices given,
+    clear-road speeds are read from the hourly SPEED_FIELD, which predicts
+    at the nominal speed, and the noise is added to the predicted speed.
+    Only incident segments are scored, with the noise on the model input
+    as above. Results therefore match the per-segment path only with
+    CGEE_SPEED_FIELD=0.
+
+    With `samples` > 0 the estimate is the median and the bands are the
+    MC_PERCENTILES of that many monte_carlo_etas() draws from the same
+    stream, instead of the single simulated ETA and the distance/severity
+    margin formula.
+    """
+    return predict_etas_batch(
+        [(segments, road_types, incident_data, edges)], hour, is_peak, samples, seed
+    )[0]
 
-        for idx, seg_len in enumerate(segments):
-            road_type = road_types[idx]
-            free_flow_speed = FREE_FLOW.get(road_type, 40)
 
-            # --- BUG FIX 3: Road-type-aware load factors ---
-            off_peak_factor, peak_factor = LOAD_FACTORS.get(
-                road_type, (0.45, 0.68)
-            )
-            load_factor = peak_factor if is_peak else off_peak_factor
-            base_speed = free_flow_speed * (1.0 - load_factor)
-            # Per-segment stochastic noise (realistic variation)
-            base_speed += np.random.normal(0, 2.5)
-            base_speed = max(base_speed, 5.0)
-
-            # --- BUG FIX 1: Horizon-specific feature modulation ---
-            projected_hour = (hour + cfg["hour_offset"]) % 24
-            projected_peak = 1 if (7 <= projected_hour <= 10 or
-                                   17 <= projected_hour <= 21) else 0
-            adjusted_speed_lag = base_speed * cfg["speed_decay"]
-
-            severity = incident_data["segment_severities"][idx]
+def predict_etas_batch(routes, hour, is_peak, samples=0, seed=None, horizons=None):
+    """
+    predict_route_etas() for many routes at once: `routes` is a list of
+    (segments, road_types, incident_data, edges) and the result a list of
+    (etas, confidence_scores). The segments of all routes are concatenated
+    and scored in one batched pass per horizon (`horizons`, default all).
+    """
+    horizons = list(horizons or MODELS)
+    rng = np.random.default_rng(seed)
+    lengths = [len(segments) for segments, _, _, _ in routes]
+    bounds = np.concatenate([[0], np.cumsum(lengths)]).tolist()
+
+    seg_km = np.concatenate([np.asarray(r[0], dtype=np.float64) for r in routes])
+    severities = np.concatenate([
+        np.asarray(incident_data["segment_severities"][:n], dtype=np.float64)
+        for (_, _, incident_data, _), n in zip(routes, lengths)
+    ])
+    road_types = [rt for _, route_road_types, _, _ in routes for rt in route_road_types]
+    use_field = (USE_SPEED_FIELD and SPEED_FIELD is not None
+                 and all(edges is not None for _, _, _, edges in routes))
+    field = get_speed_field(hour) if use_field else None
+    if field is not None:
+        edges = np.concatenate([np.asarray(r[3], dtype=np.intp) for r in routes])
+
+    # --- BUG FIX 3: Road-type-aware load factors ---
+    free_flow_speed = np.array([FREE_FLOW.get(rt, 40) for rt in road_types], dtype=np.float64)
+    load_factor = np.array(
+        [LOAD_FACTORS.get(rt, (0.45, 0.68))[1 if is_peak else 0] for rt in road_types],
+        dtype=np.float64,
+    )
+    nominal_speed = free_flow_speed * (1.0 - load_factor)
+
+    # --- Patent Module 4: Contextual Adjustment Mechanism ---
+    # Post-prediction speed modulation based on incident severity.
+    # This makes the Contextual Adjustment a visible, auditable step
+    # faithful to the patent's architectural claim.
+    has_incident = severities > 0
+    contextual_factor = np.where(has_incident, 1.0 - (severities * 0.6), 1.0)
+
+    # Per-segment travel minutes, horizon -> float64 [all segments]
+    segment_minutes = {}
+    for horizon in horizons:
+        model = MODELS[horizon]
+        cfg = HORIZON_CONFIG[horizon]
 
-            features = build_features(
-                speed_lag_1=adjusted_speed_lag,
-                hour=projected_hour,
-                is_peak=projected_peak,
-                incident_flag=int(severity > 0),
-                incident_severity=float(severity)
+        # --- BUG FIX 1: Horizon-specific feature modulation ---
+        projected_hour = (hour + cfg["hour_offset"]) % 24
+        projected_peak = 1 if (7 <= projected_hour <= 10 or
+                               17 <= projected_hour <= 21) else 0
+
+        # Per-segment stochastic noise (realistic variation)
+        noise = rng.normal(0, 2.5, size=len(seg_km))
+        if field is not None:
+            # Clear segments: the field's prediction at the nominal speed,
+            # with the noise added to the predicted speed instead
+            raw_speed = np.maximum(field.speeds[horizon][edges] + noise, 5.0)
+            if has_incident.any():
+                base_speed = np.maximum(nominal_speed[has_incident] + noise[has_incident], 5.0)
+                raw_speed[has_incident] = _score_speeds(
+                    horizon, model, projected_hour, projected_peak,
+                    base_speed * cfg["speed_decay"], severities[has_incident],
+                )
+        else:
+            base_speed = np.maximum(nominal_speed + noise, 5.0)
+            adjusted_speed_lag = base_speed * cfg["speed_decay"]
+            raw_speed = _score_speeds(
+                horizon, model, projected_hour, projected_peak, adjusted_speed_lag, severities
             )
+        pred_speed = np.maximum(raw_speed * contextual_factor, 5.0)
 
-            raw_speed = float(model.predict(features)[0])
-
-            # --- Patent Module 4: Contextual Adjustment Mechanism ---
-            # Post-prediction speed modulation based on incident severity.
-            # This makes the Contextual Adjustment a visible, auditable step
-            # faithful to the patent's architectural claim.
-            if severity > 0:
-                contextual_factor = 1.0 - (severity * 0.6)
-                adjusted_speed = raw_speed * contextual_factor
-            else:
-                adjusted_speed = raw_speed
-
-            pred_speed = max(adjusted_speed, 5.0)
-
-            # Patent formula: ETA_segment = (distance_km / speed_kmh) * 60
-            segment_eta = (seg_len / pred_speed) * 60.0
-            eta_minutes += segment_eta
+        # Patent formula: ETA_segment = (distance_km / speed_kmh) * 60
+        segment_minutes[horizon] = (seg_km / pred_speed) * 60.0
 
-        # Uncertainty bands
-        distance_factor = total_distance * 0.03
-        incident_factor = (
-            incident_data["avg_severity"] * 8
-            if incident_data["incident_count"] > 0 else 0
+    results = []
+    for (segments, route_road_types, incident_data, _), lo, hi in zip(routes, bounds, bounds[1:]):
+        etas = {}
+        confidence_scores = {}
+        total_distance = sum(segments)
+        num_segments = hi - lo
+        eta_samples = (
+            monte_carlo_etas(segments, route_road_types, hour, nominal_speed[lo:hi], samples,
+                             rng, horizons)
+            if samples > 0 else None
         )
-        horizon_factor = {"1_hour": 1.0, "2_hour": 1.15, "4_hour": 1.35}[horizon]
-        margin = (distance_factor + incident_factor) * horizon_factor
 
-        etas[horizon] = {
-            "estimate": round(eta_minutes, 2),
-            "lower_bound": round(max(0, eta_minutes - margin), 2),
-            "upper_bound": round(eta_minutes + margin, 2),
-        }
+        for horizon in horizons:
+            # (summed in segment order, as the per-segment loop did)
+            eta_minutes = sum(segment_minutes[horizon][lo:hi].tolist())
+
+            # Uncertainty bands
+            if eta_samples is not None:
+                # Estimate and band come from the same draws: the median and
+                # the MC_PERCENTILES
+                eta_minutes, lower, upper = np.percentile(
+                    eta_samples[horizon], (50.0, *MC_PERCENTILES)
+                ).tolist()
+            else:
+                distance_factor = total_distance * 0.03
+                incident_factor = (
+                    incident_data["avg_severity"] * 8
+                    if incident_data["incident_count"] > 0 else 0
+                )
+                horizon_factor = {"1_hour": 1.0, "2_hour": 1.15, "4_hour": 1.35}[horizon]
+                margin = (distance_factor + incident_factor) * horizon_factor
+                lower, upper = max(0, eta_minutes - margin), eta_minutes + margin
+
+            etas[horizon] = {
+                "estimate": round(eta_minutes, 2),
+                "lower_bound": round(lower, 2),
+                "upper_bound": round(upper, 2),
+            }
 
-        # Confidence score
-        confidence = 0.95 - (incident_data["avg_severity"] * 0.4)
-        confidence -= {"1_hour": 0, "2_hour": 0.05, "4_hour": 0.12}[horizon]
-        confidence -= min(0.1, num_segments * 0.0005)
-        confidence = max(0.5, min(confidence, 0.98))
-        confidence_scores[horizon] = round(confidence, 2)
+            # Confidence score
+            confidence = 0.95 - (incident_data["avg_severity"] * 0.4)
+            confidence -= {"1_hour": 0, "2_hour": 0.05, "4_hour": 0.12}[horizon]
+            confidence -= min(0.1, num_segments * 0.0005)
+            confidence = max(0.5, min(confidence, 0.98))
+            confidence_scores[horizon] = round(confidence, 2)
 
-    return etas, confidence_scores
+        results.append((etas, confidence_scores))
+    return results
 
 
 # ---------------------------------------------------
 # MAIN: Multi-Route ETA Computation
 # ---------------------------------------------------
-def compute_route_eta(source: dict, destination: dict, departure_time=None):
-    if not _engine_ready:
-        err = _init_error or "Engine not yet initialized."
-        raise RuntimeError(err)
+BATCH_MAX_ITEMS = int(os.environ.get("CGEE_BATCH_MAX", "500"))
+COALESCER = SingleFlight()   # identical concurrent compute_route_eta() calls
+
 
+def _departure(departure_time):
+    """(hour, is_peak) for an ISO departure time, or now."""
     # Parse departure time
     try:
         if departure_time:
@@ -431,80 +1216,269 @@ def compute_route_eta(source: dict, destination: dict, departure_time=None):
         now = datetime.now()
 
     hour = now.hour
-    is_peak = int(7 <= hour <= 10 or 17 <= hour <= 21)
+    return hour, int(7 <= hour <= 10 or 17 <= hour <= 21)
 
-    # Find nearest graph nodes
-    orig = ox.distance.nearest_nodes(GRAPH, source["lon"], source["lat"])
-    dest = ox.distance.nearest_nodes(GRAPH, destination["lon"], destination["lat"])
 
-    # Generate routes (k=3 to provide alternate and scenic routes)
-    all_routes = find_k_routes(orig, dest, k=3)
+def _extract_routes(orig, dest, hour, k, algorithm=None):
+    """
+    [(route_nodes, geometry, segments, road_types, edges)] for k routes,
+    or the extracted routes of an identical earlier request.
+    """
+    # Not keyed on the algorithm: every search mode returns optimal routes
+    cache_key = (orig, dest, hour, k)
+    extracted = ROUTE_CACHE.get(cache_key)
+    if extracted is None:
+        with stage("route_search"):
+            all_routes = find_k_routes(orig, dest, k=k, algorithm=algorithm, hour=hour)
+
+        if not all_routes:
+            raise ValueError("No path found between selected locations.")
+
+        with stage("extract"):
+            extracted = [
+                (route_nodes, *extract_route_info(route_nodes, with_edges=True))
+                for route_nodes in all_routes
+            ]
+        ROUTE_CACHE.put(cache_key, extracted)
+    return extracted
+
+
+def _stitch_geometry(route_geometry, src_coord, dst_coord):
+    # --- FIX: Stitch actual source/dest pin coordinates into geometry ---
+    # The graph path starts/ends at the *nearest node*, which can be
+    # dozens of metres away from the user's selected pin.  Prepending the
+    # real source and appending the real destination closes the visual gap
+    # on the map without altering any ETA or distance computation.
+    if route_geometry:
+        first = route_geometry[0]
+        last  = route_geometry[-1]
+        # Only stitch if the actual coord differs measurably from the node
+        if abs(first["lat"] - src_coord["lat"]) > 1e-5 or abs(first["lon"] - src_coord["lon"]) > 1e-5:
+            route_geometry = [src_coord] + route_geometry
+        if abs(last["lat"] - dst_coord["lat"]) > 1e-5 or abs(last["lon"] - dst_coord["lon"]) > 1e-5:
+            route_geometry = route_geometry + [dst_coord]
+    return route_geometry
+
+
+def compute_route_eta(source: dict, destination: dict, departure_time=None, algorithm=None,
+                      seed=None, samples=None, geometry_format="json", simplify_tolerance_m=None,
+                      zoom=None):
+    """
+    `seed` makes the result reproducible: all routes of the request draw
+    their incidents and speed noise from one Generator seeded with it. `samples` sets the
+    Monte Carlo draws per route for the ETA bands (0 for the margin
+    formula; None for the UNCERTAINTY_MODE default), up to MC_MAX_SAMPLES.
+    `geometry_format` is one of GEOMETRY_FORMATS: "json" lists {"lat",
+    "lon"} per node, "polyline" and "delta" encode each route_geometry
+    compactly (src/common/geometry.py). `simplify_tolerance_m`, or a map
+    `zoom` (one pixel's ground size), thins the returned geometry with
+    Douglas-Peucker; the pins and incident points are always kept and the
+    ETAs are computed on the full route either way.
+
+    Concurrent calls that snap to the same nodes with the same hour and
+    options share one computation (COALESCER); each caller still gets its
+    own pin coordinates stitched into the geometry.
+    """
+    _check_engine()
+    _check_geometry_options(geometry_format, simplify_tolerance_m, zoom)
+    hour, is_peak = _departure(departure_time)
+    samples = _resolve_samples(samples)
+    with stage_collector():
+        with stage("snap"):
+            node_pair = tuple(SPATIAL_INDEX.snap(
+                [source["lat"], destination["lat"]], [source["lon"], destination["lon"]]
+            ).tolist())
+
+        key = (*node_pair, hour, seed, samples)
+        by_pair, errors = COALESCER.do(key, lambda: _predict_node_pairs(
+            [node_pair], hour, is_peak, algorithm, seed, samples, K_ROUTES, list(MODELS)
+        ))
+        with stage("assemble"):
+            result = _assemble_result(
+                source, destination, node_pair, by_pair, errors, True,
+                geometry_format=geometry_format, simplify_tolerance_m=simplify_tolerance_m, zoom=zoom,
+            )
+    if "error" in result:
+        raise ValueError(result["error"])
+    return result
 
-    if not all_routes:
-        raise ValueError("No path found between selected locations.")
 
-    # Process each route
-    results = []
-    # Actual user-selected coordinates (may differ from nearest graph node)
-    src_coord = {"lat": source["lat"], "lon": source["lon"]}
-    dst_coord = {"lat": destination["lat"], "lon": destination["lon"]}
-
-    for i, route_nodes in enumerate(all_routes):
-        route_geometry, segments, road_types = extract_route_info(route_nodes)
+def compute_route_eta_batch(pairs, departure_time=None, algorithm=None, seed=None, samples=None,
+                            k=K_ROUTES, horizons=None, include_geometry=True, geometry_format="json",
+                            simplify_tolerance_m=None, zoom=None):
+    """
+    compute_route_eta() for a list of (source, destination) pairs. Returns
+    one dict per pair, in order: {"routes": [...]} or {"error": message}.
+
+    All endpoints are snapped in one query, identical snapped node pairs
+    share a single route search, incident simulation and result, and the
+    segments of every route are scored together (predict_etas_batch).
+    `k` routes per pair (1..K_ROUTES), `horizons` a subset of the models
+    (routes are ranked on the first), `include_geometry` False drops the
+    route and incident coordinates from the response. `geometry_format`,
+    `simplify_tolerance_m` and `zoom` as for compute_route_eta().
+    """
+    _check_engine()
+    _check_geometry_options(geometry_format, simplify_tolerance_m, zoom)
+    if len(pairs) > BATCH_MAX_ITEMS:
+        raise ValueError(f"At most {BATCH_MAX_ITEMS} route requests per batch.")
+    horizons = list(horizons or MODELS)
+    unknown = [h for h in horizons if h not in MODELS]
+    if unknown:
+        raise ValueError(f"Unknown horizons {unknown}; available: {list(MODELS)}")
+    k = min(max(int(k), 1), K_ROUTES)
+
+    hour, is_peak = _departure(departure_time)
+    samples = _resolve_samples(samples)
+
+    with stage_collector():
+        # Find nearest graph nodes (every endpoint in one vectorised query)
+        with stage("snap"):
+            nodes = list(map(tuple, SPATIAL_INDEX.snap(
+                [p[key]["lat"] for p in pairs for key in (0, 1)],
+                [p[key]["lon"] for p in pairs for key in (0, 1)],
+            ).reshape(-1, 2).tolist()))
+
+        by_pair, errors = _predict_node_pairs(
+            list(dict.fromkeys(nodes)), hour, is_peak, algorithm, seed, samples, k, horizons
+        )
+        with stage("assemble"):
+            return [
+                _assemble_result(
+                    source, destination, pair, by_pair, errors, include_geometry,
+                    geometry_format=geometry_format, simplify_tolerance_m=simplify_tolerance_m,
+                    zoom=zoom,
+                )
+                for (source, destination), pair in zip(pairs, nodes)
+            ]
+
+
+def _check_engine():
+    if not _engine_loaded:
+        err = _init_error or "Engine not yet initialized."
+        raise RuntimeError(err)
 
-        if len(segments) == 0:
-            continue
 
-        # --- FIX: Stitch actual source/dest pin coordinates into geometry ---
-        # The graph path starts/ends at the *nearest node*, which can be
-        # dozens of metres away from the user's selected pin.  Prepending the
-        # real source and appending the real destination closes the visual gap
-        # on the map without altering any ETA or distance computation.
-        if route_geometry:
-            first = route_geometry[0]
-            last  = route_geometry[-1]
-            # Only stitch if the actual coord differs measurably from the node
-            if abs(first["lat"] - src_coord["lat"]) > 1e-5 or abs(first["lon"] - src_coord["lon"]) > 1e-5:
-                route_geometry = [src_coord] + route_geometry
-            if abs(last["lat"] - dst_coord["lat"]) > 1e-5 or abs(last["lon"] - dst_coord["lon"]) > 1e-5:
-                route_geometry = route_geometry + [dst_coord]
+def _check_geometry_options(geometry_format, simplify_tolerance_m, zoom):
+    if geometry_format not in GEOMETRY_FORMATS:
+        raise ValueError(f"geometry_format must be one of {list(GEOMETRY_FORMATS)}")
+    if simplify_tolerance_m is not None and simplify_tolerance_m < 0:
+        raise ValueError("simplify_tolerance_m must not be negative")
+    if zoom is not None and not (0 <= zoom <= MAX_ZOOM):
+        raise ValueError(f"zoom must be between 0 and {MAX_ZOOM}")
 
-        total_distance = sum(segments)
 
-        # Per-segment probabilistic incident simulation (BUG FIX 2)
-        incident_data = simulate_incidents(
-            len(segments), road_types, hour, route_geometry
-        )
+def _resolve_samples(samples) -> int:
+    if samples is None:
+        samples = MC_SAMPLES if UNCERTAINTY_MODE == "montecarlo" else 0
+    return min(max(int(samples), 0), MC_MAX_SAMPLES)
 
-        # Multi-horizon ETA prediction
-        etas, confidence_scores = predict_route_etas(
-            segments, road_types, hour, is_peak, incident_data
-        )
 
-        results.append({
+def _predict_node_pairs(node_pairs, hour, is_peak, algorithm, seed, samples, k, horizons):
+    """
+    Routes and ETAs for distinct snapped (orig, dest) pairs, before any
+    request's pin coordinates are applied. Returns (by_pair, errors):
+    by_pair[pair] is [(geometry, incident_data, scored route)] ranked on
+    the first horizon, errors[pair] the message for a pair with no route.
+    """
+    # Generate routes (k=3 to provide alternate and scenic routes) once per
+    # distinct node pair
+    extracted, errors = {}, {}
+    for orig, dest in node_pairs:
+        try:
+            extracted[orig, dest] = [
+                route for route in _extract_routes(orig, dest, hour, k, algorithm)
+                if len(route[2]) > 0
+            ]
+            if not extracted[orig, dest]:
+                raise ValueError("Route contains zero segments — graph edge extraction failed.")
+        except ValueError as e:
+            errors[orig, dest] = str(e)
+            extracted.pop((orig, dest), None)
+
+    # Per-segment probabilistic incident simulation (BUG FIX 2), then
+    # multi-horizon ETA prediction for all routes in one batch
+    rng = np.random.default_rng(seed)
+    flat = []
+    with stage("incidents"):
+        for pair, routes in extracted.items():
+            for route_nodes, route_geometry, segments, road_types, edges in routes:
+                incident_data = simulate_incidents(
+                    len(segments), road_types, hour, route_geometry, seed=rng
+                )
+                flat.append((pair, route_geometry, segments, road_types, edges, incident_data))
+    with stage("predict"):
+        scored = predict_etas_batch(
+            [(segments, road_types, incident_data, edges)
+             for _, _, segments, road_types, edges, incident_data in flat],
+            hour, is_peak, samples, rng, horizons,
+        ) if flat else []
+
+    uncertainty = (
+        {"method": "montecarlo", "samples": samples, "estimate": "median",
+         "percentiles": list(MC_PERCENTILES)}
+        if samples > 0 else {"method": "formula"}
+    )
+    by_pair = {pair: [] for pair in extracted}
+    for (pair, route_geometry, segments, _, _, incident_data), (etas, confidence_scores) in zip(flat, scored):
+        by_pair[pair].append((route_geometry, incident_data, {
             "eta_minutes": etas,
             "confidence": confidence_scores,
             "meta": {
-                "distance_km": round(total_distance, 2),
+                "distance_km": round(sum(segments), 2),
                 "segments": len(segments),
                 "incident": incident_data["incident_count"] > 0,
                 "incident_segments": incident_data["incident_count"],
                 "avg_incident_severity": round(incident_data["avg_severity"], 2),
-                "route_geometry": route_geometry,
-                "incident_coordinates": incident_data["incident_coordinates"],
+                "uncertainty": uncertainty,
             }
-        })
-
-    if not results:
-        raise ValueError("Route contains zero segments — graph edge extraction failed.")
-
-    # Sort results by the 1_hour ETA estimate, ascending
-    results.sort(key=lambda x: x["eta_minutes"]["1_hour"]["estimate"])
+        }))
+    for routes in by_pair.values():
+        # Sort results by the first horizon's ETA estimate, ascending
+        routes.sort(key=lambda x: x[2]["eta_minutes"][horizons[0]]["estimate"])
+    return by_pair, errors
+
+
+def _assemble_result(source, destination, pair, by_pair, errors, include_geometry,
+                     geometry_format="json", simplify_tolerance_m=None, zoom=None):
+    """One request's response from _predict_node_pairs() output (not modified)."""
+    if pair in errors:
+        return {"error": errors[pair]}
+    # Actual user-selected coordinates (may differ from nearest graph node)
+    src_coord = {"lat": source["lat"], "lon": source["lon"]}
+    dst_coord = {"lat": destination["lat"], "lon": destination["lon"]}
+    tolerance_m = simplify_tolerance_m
+    if tolerance_m is None and zoom is not None:
+        tolerance_m = zoom_tolerance_m(zoom, (source["lat"] + destination["lat"]) / 2)
 
-    # Assign labels, colors, and IDs sequentially after sorting
-    for i, r in enumerate(results):
+    routes = []
+    for i, (route_geometry, incident_data, scored_route) in enumerate(by_pair[pair]):
+        r = {**scored_route, "meta": dict(scored_route["meta"])}
+        if include_geometry:
+            route_geometry = _stitch_geometry(route_geometry, src_coord, dst_coord)
+            incident_points = [
+                idx for idx in sorted(incident_data["incident_indices"]) if idx < len(route_geometry)
+            ]
+            shown = route_geometry
+            if tolerance_m:
+                # The stitched pins are the ends, so they are kept too
+                kept = simplify_indices(route_geometry, tolerance_m, keep=incident_points)
+                shown = [route_geometry[idx] for idx in kept.tolist()]
+            r["meta"]["route_geometry"] = encode_geometry(shown, geometry_format)
+            r["meta"]["incident_coordinates"] = [route_geometry[idx] for idx in incident_points]
+            if tolerance_m:
+                r["meta"]["geometry_simplification"] = {
+                    "tolerance_m": round(float(tolerance_m), 2),
+                    "points": len(shown),
+                    "full_points": len(route_geometry),
+                }
+            if geometry_format != "json":
+                r["meta"]["geometry_encoding"] = {
+                    "format": geometry_format, "precision": GEOMETRY_PRECISION
+                }
+        # Assign labels, colors, and IDs sequentially after sorting
         r["route_id"] = i + 1
         r["label"] = ROUTE_LABELS[i] if i < len(ROUTE_LABELS) else f"Route {i+1}"
         r["color"] = ROUTE_COLORS[i] if i < len(ROUTE_COLORS) else "#6B7280"
-
-    return {"routes": results}
+        routes.append(r)
+    return {"routes": routes}
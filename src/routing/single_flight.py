@@ -0,0 +1,95 @@
+"""
+Single-flight coalescing for compute_route_eta().
+
+When many clients ask for the same snapped (orig, dest, hour bucket,
+options) at once, the first call computes and the others block on it and
+share its result, instead of each running the k-route search, incident
+simulation and model scoring. Nothing is kept after the call completes:
+this only merges calls that overlap in time (the RouteCache covers
+repeats).
+
+A failure in the computing call is raised in every waiter. A waiter gives
+up after `timeout` seconds with TimeoutError; the computation itself
+carries on and still completes for the caller that started it.
+"""
+import os
+import threading
+import time
+
+from src.common.metrics import record_stage
+
+COALESCE_WAIT_S = float(os.environ.get("CGEE_COALESCE_WAIT_S", "30"))
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self, timeout: float = COALESCE_WAIT_S):
+        self.timeout = timeout
+        self._calls = {}   # key -> _Call in flight
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.timeouts = 0
+
+    def do(self, key, fn):
+        """fn() once for all concurrent calls with the same key."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            started = time.perf_counter()
+            finished = call.done.wait(self.timeout)
+            record_stage("coalesced_wait", time.perf_counter() - started)
+            if not finished:
+                with self._lock:
+                    self.timeouts += 1
+                raise TimeoutError(
+                    f"Timed out after {self.timeout:g}s waiting for an identical route request"
+                )
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.failures += 1
+            raise
+        finally:
+            # Unregister before waking the waiters, so a call arriving now
+            # starts a fresh computation rather than reading this one
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "waiting": sum(c.waiters for c in self._calls.values()),
+                "computed": self.leaders,
+                "coalesced": self.coalesced,
+                "failures": self.failures,
+                "timeouts": self.timeouts,
+            }
@@ -0,0 +1,141 @@
+"""
+Spatial index for snapping coordinates onto the compiled road graph.
+
+Built once in initialize_engine() from the CompiledGraph's node coordinates,
+projected onto a local equirectangular plane in metres (accurate to well
+under 0.1% across Bengaluru). Nodes go into a KD-tree for vectorised
+nearest-node queries; edges go into a uniform grid of CELL_SIZE_M cells for
+nearest-edge queries. Edges are treated as straight segments between their
+end nodes, since the snapshot does not carry curved edge geometry.
+"""
+import numpy as np
+from scipy.spatial import cKDTree
+
+from src.routing.compiled_graph import CompiledGraph
+
+EARTH_RADIUS_M = 6_371_009.0
+CELL_SIZE_M = 250.0
+
+
+class SpatialIndex:
+    def __init__(self, cg: CompiledGraph, cell_size_m: float = CELL_SIZE_M):
+        self.cg = cg
+        self.cell_size = cell_size_m
+        self._cos_lat0 = float(np.cos(np.radians(np.mean(cg.node_y))))
+
+        self.xy = np.column_stack(self.project(cg.node_y, cg.node_x))
+        self.tree = cKDTree(self.xy)
+        self._build_edge_grid()
+
+    def project(self, lats, lons):
+        """(lat, lon) in degrees → local planar (x, y) in metres."""
+        lats = np.radians(np.asarray(lats, dtype=np.float64))
+        lons = np.radians(np.asarray(lons, dtype=np.float64))
+        return EARTH_RADIUS_M * lons * self._cos_lat0, EARTH_RADIUS_M * lats
+
+    # ---------------------------------------------------
+    # Nearest node
+    # ---------------------------------------------------
+    def snap_indices(self, lats, lons):
+        """Vectorised nearest-node query. Returns (compact indices, distances in m)."""
+        x, y = self.project(np.atleast_1d(lats), np.atleast_1d(lons))
+        dist, idx = self.tree.query(np.column_stack((x, y)))
+        return idx.astype(np.int64), dist
+
+    def snap(self, lats, lons) -> np.ndarray:
+        """Vectorised nearest-node query. Returns OSM node ids (int64 array)."""
+        idx, _ = self.snap_indices(lats, lons)
+        return self.cg.node_ids[idx]
+
+    # ---------------------------------------------------
+    # Nearest edge
+    # ---------------------------------------------------
+    def _build_edge_grid(self):
+        cg = self.cg
+        src = np.repeat(np.arange(cg.num_nodes, dtype=np.int64), np.diff(cg.offsets))
+        dst = np.asarray(cg.targets, dtype=np.int64)
+        self._edge_src, self._edge_dst = src, dst
+
+        self._origin = self.xy.min(axis=0)
+        cells = np.floor((self.xy - self._origin) / self.cell_size).astype(np.int64)
+        self._grid_shape = tuple(cells.max(axis=0) + 1)
+        nx_, ny_ = self._grid_shape
+
+        # Each edge is registered in every cell its bounding box overlaps
+        cx0 = np.minimum(cells[src, 0], cells[dst, 0])
+        cx1 = np.maximum(cells[src, 0], cells[dst, 0])
+        cy0 = np.minimum(cells[src, 1], cells[dst, 1])
+        cy1 = np.maximum(cells[src, 1], cells[dst, 1])
+        w, h = cx1 - cx0 + 1, cy1 - cy0 + 1
+        counts = w * h
+
+        edge_ids = np.repeat(np.arange(len(src), dtype=np.int64), counts)
+        starts = np.cumsum(counts) - counts
+        k = np.arange(len(edge_ids), dtype=np.int64) - np.repeat(starts, counts)
+        rep_w = np.repeat(w, counts)
+        cell_x = np.repeat(cx0, counts) + k % rep_w
+        cell_y = np.repeat(cy0, counts) + k // rep_w
+        cell_ids = cell_x * ny_ + cell_y
+
+        order = np.argsort(cell_ids, kind="stable")
+        self._cell_edges = edge_ids[order]
+        self._cell_offsets = np.zeros(nx_ * ny_ + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cell_ids, minlength=nx_ * ny_), out=self._cell_offsets[1:])
+
+    def _edges_in_block(self, cx, cy, r):
+        nx_, ny_ = self._grid_shape
+        xs = np.arange(max(cx - r, 0), min(cx + r, nx_ - 1) + 1)
+        ys = np.arange(max(cy - r, 0), min(cy + r, ny_ - 1) + 1)
+        if len(xs) == 0 or len(ys) == 0:
+            return np.empty(0, dtype=np.int64)
+        ids = (xs[:, None] * ny_ + ys[None, :]).ravel()
+        lo, hi = self._cell_offsets[ids], self._cell_offsets[ids + 1]
+        if not (hi > lo).any():
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(
+            [self._cell_edges[a:b] for a, b in zip(lo.tolist(), hi.tolist()) if b > a]
+        ))
+
+    def _nearest_edge_xy(self, px, py):
+        cx, cy = np.floor((np.array([px, py]) - self._origin) / self.cell_size).astype(np.int64)
+        max_r = max(self._grid_shape) + abs(int(cx)) + abs(int(cy))
+        r = 0
+        while r <= max_r:
+            cand = self._edges_in_block(int(cx), int(cy), r)
+            if len(cand):
+                a = self.xy[self._edge_src[cand]]
+                b = self.xy[self._edge_dst[cand]]
+                ab = b - a
+                denom = (ab ** 2).sum(axis=1)
+                t = np.where(denom > 0,
+                             ((px - a[:, 0]) * ab[:, 0] + (py - a[:, 1]) * ab[:, 1])
+                             / np.where(denom > 0, denom, 1.0), 0.0)
+                t = np.clip(t, 0.0, 1.0)
+                d = np.hypot(a[:, 0] + t * ab[:, 0] - px, a[:, 1] + t * ab[:, 1] - py)
+                best = int(np.argmin(d))
+                # Edges outside the searched block are at least r cells away
+                if d[best] <= r * self.cell_size:
+                    return int(cand[best]), float(t[best]), float(d[best])
+            r += 1
+        return -1, 0.0, float("inf")
+
+    def snap_edges(self, lats, lons):
+        """
+        Nearest directed edge for each point. Returns (u_ids, v_ids,
+        fractions, distances_m) where `fractions` is the projected position
+        along u → v in [0, 1].
+        """
+        xs, ys = self.project(np.atleast_1d(lats), np.atleast_1d(lons))
+        n = len(xs)
+        edges = np.empty(n, dtype=np.int64)
+        fractions = np.empty(n, dtype=np.float64)
+        dists = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            edges[i], fractions[i], dists[i] = self._nearest_edge_xy(xs[i], ys[i])
+        node_ids = self.cg.node_ids
+        return (node_ids[self._edge_src[edges]], node_ids[self._edge_dst[edges]],
+                fractions, dists)
+
+    def nbytes(self) -> int:
+        return (self.xy.nbytes + self._edge_src.nbytes + self._edge_dst.nbytes
+                + self._cell_edges.nbytes + self._cell_offsets.nbytes)
@@ -0,0 +1,44 @@
+# src/routing/test_alternatives.py
+"""Plateau alternates respect the stretch and overlap limits."""
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.routing.alternatives import plateau_routes, route_cost
+
+
+def overlap(cg, route, other):
+    lengths = np.asarray(cg.lengths, dtype=np.float64)
+    edges = cg.path_edges(route)
+    shared = np.intersect1d(edges, cg.path_edges(other))
+    return lengths[shared].sum() / lengths[edges].sum()
+
+
+@pytest.mark.parametrize("max_stretch,max_overlap", [(1.3, 0.75), (1.1, 0.4)])
+def test_plateau_routes_within_limits(road_graph, max_stretch, max_overlap):
+    G, cg = road_graph
+    rng = np.random.default_rng(4)
+    alternates = 0
+    for s, t in rng.integers(0, cg.num_nodes, size=(40, 2)).tolist():
+        if s == t:
+            continue
+        routes, optimum = plateau_routes(cg, s, t, 3, max_stretch=max_stretch, max_overlap=max_overlap)
+        try:
+            expected = nx.shortest_path_length(G, cg.node_ids[s].item(), cg.node_ids[t].item(),
+                                               weight="length")
+        except nx.NetworkXNoPath:
+            assert routes == [] and optimum is None
+            continue
+        assert optimum == pytest.approx(expected, rel=1e-5)
+        assert route_cost(cg, routes[0]) == pytest.approx(optimum, rel=1e-5)
+        assert len(routes) <= 3
+        for i, route in enumerate(routes):
+            assert route[0] == s and route[-1] == t
+            assert len(set(route)) == len(route)
+            assert route_cost(cg, route) <= optimum * max_stretch + 1e-3
+            for other in routes[:i]:
+                assert route != other
+                assert overlap(cg, route, other) <= max_overlap + 1e-9
+        alternates += len(routes) - 1
+    # the limits were exercised, not vacuously met by single routes
+    assert alternates > 0
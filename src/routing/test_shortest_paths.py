@@ -0,0 +1,75 @@
+# src/routing/test_shortest_paths.py
+"""Compiled Dijkstra, bidirectional A* and the contraction hierarchy agree with NetworkX."""
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.routing.compiled_graph import bidirectional_astar, shortest_path
+from src.routing.contraction import build_ch
+
+PAIRS = 60
+
+
+def path_cost(cg, path, weights=None):
+    w = cg.lengths if weights is None else weights
+    return float(np.asarray(w, dtype=np.float64)[cg.path_edges(path)].sum())
+
+
+def random_pairs(cg, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, cg.num_nodes, size=(PAIRS, 2)).tolist()
+
+
+def reference(G, cg, s, t, weight="length"):
+    try:
+        return nx.shortest_path_length(G, cg.node_ids[s].item(), cg.node_ids[t].item(), weight=weight)
+    except nx.NetworkXNoPath:
+        return None
+
+
+@pytest.fixture(scope="module")
+def ch(road_graph):
+    return build_ch(road_graph[1], progress_every=0)
+
+
+@pytest.mark.parametrize("search", ["dijkstra", "astar", "ch"])
+def test_length_costs_match_networkx(road_graph, ch, search):
+    G, cg = road_graph
+    for s, t in random_pairs(cg):
+        if search == "dijkstra":
+            path = shortest_path(cg, s, t)
+        elif search == "astar":
+            path = bidirectional_astar(cg, s, t)
+        else:
+            path = ch.query(s, t)
+        expected = reference(G, cg, s, t)
+        if expected is None:
+            assert path is None
+            continue
+        assert path[0] == s and path[-1] == t
+        # lengths are stored as float32 in the compiled graph
+        assert path_cost(cg, path) == pytest.approx(expected, rel=1e-5)
+
+
+def test_travel_time_weights_match_networkx(road_graph):
+    _, cg = road_graph
+    rng = np.random.default_rng(2)
+    speeds = rng.uniform(3.0, 20.0, size=cg.num_edges)   # m/s
+    weights = (cg.lengths / speeds).astype(np.float32)
+
+    ref = nx.DiGraph()
+    for u in range(cg.num_nodes):
+        for e in range(cg.offsets[u], cg.offsets[u + 1]):
+            ref.add_edge(u, int(cg.targets[e]), time=float(weights[e]))
+
+    for s, t in random_pairs(cg, seed=3):
+        try:
+            expected = nx.shortest_path_length(ref, s, t, weight="time")
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
+            expected = None
+        for path in (shortest_path(cg, s, t, weights),
+                     bidirectional_astar(cg, s, t, weights, heuristic_scale=1 / 20.0)):
+            if expected is None:
+                assert path is None
+            else:
+                assert path_cost(cg, path, weights) == pytest.approx(expected, rel=1e-5)
@@ -0,0 +1,128 @@
+# src/routing/test_single_flight.py
+"""SingleFlight coalescing and RouteCache LRU/TTL behaviour."""
+import threading
+import time
+
+import pytest
+
+from src.routing import route_cache
+from src.routing.route_cache import RouteCache
+from src.routing.single_flight import SingleFlight
+
+
+def run_concurrently(flight, key, fn, callers):
+    """Start `callers` threads on flight.do(key, fn); returns (threads, outcomes)."""
+    outcomes = [None] * callers
+
+    def call(i):
+        try:
+            outcomes[i] = ("ok", flight.do(key, fn))
+        except Exception as e:
+            outcomes[i] = ("error", e)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for t in threads:
+        t.start()
+    return threads, outcomes
+
+
+def wait_for_waiters(flight, waiting, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while flight.stats()["waiting"] < waiting:
+        assert time.monotonic() < deadline, "callers never coalesced"
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_computation():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return {"routes": len(calls)}
+
+    threads, outcomes = run_concurrently(flight, ("a", "b", 8), compute, 8)
+    wait_for_waiters(flight, 7)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(outcome == ("ok", {"routes": 1}) for outcome in outcomes)
+    stats = flight.stats()
+    assert (stats["computed"], stats["coalesced"], stats["in_flight"]) == (1, 7, 0)
+
+    # Nothing is kept once the call completes
+    assert flight.do(("a", "b", 8), compute) == {"routes": 2}
+    assert len(calls) == 2
+
+
+def test_error_reaches_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def compute():
+        release.wait(5)
+        raise ValueError("no route")
+
+    threads, outcomes = run_concurrently(flight, "key", compute, 4)
+    wait_for_waiters(flight, 3)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert all(kind == "error" and isinstance(e, ValueError) for kind, e in outcomes)
+    assert flight.stats()["failures"] == 1
+
+
+def test_waiter_times_out_while_the_call_completes():
+    flight = SingleFlight(timeout=0.05)
+    release = threading.Event()
+    leader, outcomes = run_concurrently(flight, "key", lambda: release.wait(5) and "done", 1)
+    while flight.stats()["in_flight"] == 0:
+        time.sleep(0.001)
+
+    with pytest.raises(TimeoutError):
+        flight.do("key", lambda: "not called")
+    release.set()
+    leader[0].join()
+    assert outcomes == [("ok", "done")]
+    assert flight.stats()["timeouts"] == 1
+
+
+def test_distinct_keys_do_not_coalesce():
+    flight = SingleFlight()
+    assert [flight.do(k, lambda k=k: k * 2) for k in range(3)] == [0, 2, 4]
+    assert flight.stats()["coalesced"] == 0
+
+
+def test_route_cache_lru_eviction():
+    cache = RouteCache(maxsize=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1   # "b" is now least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    stats = cache.stats()
+    assert (stats["size"], stats["evictions"], stats["hits"], stats["misses"]) == (2, 1, 3, 1)
+
+
+def test_route_cache_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(route_cache.time, "monotonic", lambda: now[0])
+    cache = RouteCache(maxsize=8, ttl=10)
+    cache.put("a", 1)
+    now[0] += 9.9
+    assert cache.get("a") == 1
+    now[0] += 0.2
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_route_cache_disabled():
+    cache = RouteCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
@@ -46,4 +46,4 @@ Predicted via contextual graph ML (patent pending)`;navigator.clipboard.writeTex
  * (c) 2010-2023 Vladimir Agafonkin, (c) 2010-2011 CloudMade
  */(function(e,n){(function(i,o){o(n)})(Tm,function(i){var o="1.9.4";function a(t){var r,s,l,c;for(s=1,l=arguments.length;s<l;s++){c=arguments[s];for(r in c)t[r]=c[r]}return t}var u=Object.create||function(){function t(){}return function(r){return t.prototype=r,new t}}();function f(t,r){var s=Array.prototype.slice;if(t.bind)return t.bind.apply(t,s.call(arguments,1));var l=s.call(arguments,2);return function(){return t.apply(r,l.length?l.concat(s.call(arguments)):arguments)}}var d=0;function p(t){return"_leaflet_id"in t||(t._leaflet_id=++d),t._leaflet_id}function g(t,r,s){var l,c,h,v;return v=function(){l=!1,c&&(h.apply(s,c),c=!1)},h=function(){l?c=arguments:(t.apply(s,arguments),setTimeout(v,r),l=!0)},h}function k(t,r,s){var l=r[1],c=r[0],h=l-c;return t===l&&s?t:((t-c)%h+h)%h+c}function P(){return!1}function S(t,r){if(r===!1)return t;var s=Math.pow(10,r===void 0?6:r);return Math.round(t*s)/s}function E(t){return t.trim?t.trim():t.replace(/^\s+|\s+$/g,"")}function O(t){return E(t).split(/\s+/)}function T(t,r){Object.prototype.hasOwnProperty.call(t,"options")||(t.options=t.options?u(t.options):{});for(var s in r)t.options[s]=r[s];return t.options}function q(t,r,s){var l=[];for(var c in t)l.push(encodeURIComponent(s?c.toUpperCase():c)+"="+encodeURIComponent(t[c]));return(!r||r.indexOf("?")===-1?"?":"&")+l.join("&")}var x=/\{ *([\w_ -]+) *\}/g;function _(t,r){return t.replace(x,function(s,l){var c=r[l];if(c===void 0)throw new Error("No value provided for variable "+s);return typeof c=="function"&&(c=c(r)),c})}var y=Array.isArray||function(t){return Object.prototype.toString.call(t)==="[object Array]"};function N(t,r){for(var s=0;s<t.length;s++)if(t[s]===r)return s;return-1}var R="data:image/gif;base64,R0lGODlhAQABAAD/ACwAAAAAAQABAAACADs=";function B(t){return window["webkit"+t]||window["moz"+t]||window["ms"+t]}var D=0;function Z(t){var r=+new Date,s=Math.max(0,16-(r-D));return D=r+s,window.setTimeout(t,s)}var ue=window.requestAnimationFrame||B("RequestAnimationFrame")||Z,Y=window.cancelAnimationFrame||B("CancelAnimationFrame")||B("CancelRequestAnimationFrame")||function(t){window.clearTimeout(t)};function se(t,r,s){if(s&&ue===Z)t.call(r);else return ue.call(window,f(t,r))}function Ce(t){t&&Y.call(window,t)}var _n={__proto__:null,extend:a,create:u,bind:f,get lastId(){return d},stamp:p,throttle:g,wrapNum:k,falseFn:P,formatNum:S,trim:E,splitWords:O,setOptions:T,getParamString:q,template:_,isArray:y,indexOf:N,emptyImageUrl:R,requestFn:ue,cancelFn:Y,requestAnimFrame:se,cancelAnimFrame:Ce};function it(){}it.extend=function(t){var r=function(){T(this),this.initialize&&this.initialize.apply(this,arguments),this.callInitHooks()},s=r.__super__=this.prototype,l=u(s);l.constructor=r,r.prototype=l;for(var c in this)Object.prototype.hasOwnProperty.call(this,c)&&c!=="prototype"&&c!=="__super__"&&(r[c]=this[c]);return t.statics&&a(r,t.statics),t.includes&&(hs(t.includes),a.apply(null,[l].concat(t.includes))),a(l,t),delete l.statics,delete l.includes,l.options&&(l.options=s.options?u(s.options):{},a(l.options,t.options)),l._initHooks=[],l.callInitHooks=function(){if(!this._initHooksCalled){s.callInitHooks&&s.callInitHooks.call(this),this._initHooksCalled=!0;for(var h=0,v=l._initHooks.length;h<v;h++)l._initHooks[h].call(this)}},r},it.include=function(t){var r=this.prototype.options;return a(this.prototype,t),t.options&&(this.prototype.options=r,this.mergeOptions(t.options)),this},it.mergeOptions=function(t){return a(this.prototype.options,t),this},it.addInitHook=function(t){var r=Array.prototype.slice.call(arguments,1),s=typeof t=="function"?t:function(){this[t].apply(this,r)};return this.prototype._initHooks=this.prototype._initHooks||[],this.prototype._initHooks.push(s),this};function hs(t){if(!(typeof L>"u"||!L||!L.Mixin)){t=y(t)?t:[t];for(var r=0;r<t.length;r++)t[r]===L.Mixin.Events&&console.warn("Deprecated include of L.Mixin.Events: this property will be removed in future releases, please inherit from L.Evented instead.",new Error().stack)}}var Ne={on:function(t,r,s){if(typeof t=="object")for(var l in t)this._on(l,t[l],r);else{t=O(t);for(var c=0,h=t.length;c<h;c++)this._on(t[c],r,s)}return this},off:function(t,r,s){if(!arguments.length)delete this._events;else if(typeof t=="object")for(var l in t)this._off(l,t[l],r);else{t=O(t);for(var c=arguments.length===1,h=0,v=t.length;h<v;h++)c?this._off(t[h]):this._off(t[h],r,s)}return this},_on:function(t,r,s,l){if(typeof r!="function"){console.warn("wrong listener type: "+typeof r);return}if(this._listens(t,r,s)===!1){s===this&&(s=void 0);var c={fn:r,ctx:s};l&&(c.once=!0),this._events=this._events||{},this._events[t]=this._events[t]||[],this._events[t].push(c)}},_off:function(t,r,s){var l,c,h;if(this._events&&(l=this._events[t],!!l)){if(arguments.length===1){if(this._firingCount)for(c=0,h=l.length;c<h;c++)l[c].fn=P;delete this._events[t];return}if(typeof r!="function"){console.warn("wrong listener type: "+typeof r);return}var v=this._listens(t,r,s);if(v!==!1){var w=l[v];this._firingCount&&(w.fn=P,this._events[t]=l=l.slice()),l.splice(v,1)}}},fire:function(t,r,s){if(!this.listens(t,s))return this;var l=a({},r,{type:t,target:this,sourceTarget:r&&r.sourceTarget||this});if(this._events){var c=this._events[t];if(c){this._firingCount=this._firingCount+1||1;for(var h=0,v=c.length;h<v;h++){var w=c[h],C=w.fn;w.once&&this.off(t,C,w.ctx),C.call(w.ctx||this,l)}this._firingCount--}}return s&&this._propagateEvent(l),this},listens:function(t,r,s,l){typeof t!="string"&&console.warn('"string" type argument expected');var c=r;typeof r!="function"&&(l=!!r,c=void 0,s=void 0);var h=this._events&&this._events[t];if(h&&h.length&&this._listens(t,c,s)!==!1)return!0;if(l){for(var v in this._eventParents)if(this._eventParents[v].listens(t,r,s,l))return!0}return!1},_listens:function(t,r,s){if(!this._events)return!1;var l=this._events[t]||[];if(!r)return!!l.length;s===this&&(s=void 0);for(var c=0,h=l.length;c<h;c++)if(l[c].fn===r&&l[c].ctx===s)return c;return!1},once:function(t,r,s){if(typeof t=="object")for(var l in t)this._on(l,t[l],r,!0);else{t=O(t);for(var c=0,h=t.length;c<h;c++)this._on(t[c],r,s,!0)}return this},addEventParent:function(t){return this._eventParents=this._eventParents||{},this._eventParents[p(t)]=t,this},removeEventParent:function(t){return this._eventParents&&delete this._eventParents[p(t)],this},_propagateEvent:function(t){for(var r in this._eventParents)this._eventParents[r].fire(t.type,a({layer:t.target,propagatedFrom:t.target},t),!0)}};Ne.addEventListener=Ne.on,Ne.removeEventListener=Ne.clearAllEventListeners=Ne.off,Ne.addOneTimeEventListener=Ne.once,Ne.fireEvent=Ne.fire,Ne.hasEventListeners=Ne.listens;var Mt=it.extend(Ne);function z(t,r,s){this.x=s?Math.round(t):t,this.y=s?Math.round(r):r}var V=Math.trunc||function(t){return t>0?Math.floor(t):Math.ceil(t)};z.prototype={clone:function(){return new z(this.x,this.y)},add:function(t){return this.clone()._add(j(t))},_add:function(t){return this.x+=t.x,this.y+=t.y,this},subtract:function(t){return this.clone()._subtract(j(t))},_subtract:function(t){return this.x-=t.x,this.y-=t.y,this},divideBy:function(t){return this.clone()._divideBy(t)},_divideBy:function(t){return this.x/=t,this.y/=t,this},multiplyBy:function(t){return this.clone()._multiplyBy(t)},_multiplyBy:function(t){return this.x*=t,this.y*=t,this},scaleBy:function(t){return new z(this.x*t.x,this.y*t.y)},unscaleBy:function(t){return new z(this.x/t.x,this.y/t.y)},round:function(){return this.clone()._round()},_round:function(){return this.x=Math.round(this.x),this.y=Math.round(this.y),this},floor:function(){return this.clone()._floor()},_floor:function(){return this.x=Math.floor(this.x),this.y=Math.floor(this.y),this},ceil:function(){return this.clone()._ceil()},_ceil:function(){return this.x=Math.ceil(this.x),this.y=Math.ceil(this.y),this},trunc:function(){return this.clone()._trunc()},_trunc:function(){return this.x=V(this.x),this.y=V(this.y),this},distanceTo:function(t){t=j(t);var r=t.x-this.x,s=t.y-this.y;return Math.sqrt(r*r+s*s)},equals:function(t){return t=j(t),t.x===this.x&&t.y===this.y},contains:function(t){return t=j(t),Math.abs(t.x)<=Math.abs(this.x)&&Math.abs(t.y)<=Math.abs(this.y)},toString:function(){return"Point("+S(this.x)+", "+S(this.y)+")"}};function j(t,r,s){return t instanceof z?t:y(t)?new z(t[0],t[1]):t==null?t:typeof t=="object"&&"x"in t&&"y"in t?new z(t.x,t.y):new z(t,r,s)}function U(t,r){if(t)for(var s=r?[t,r]:t,l=0,c=s.length;l<c;l++)this.extend(s[l])}U.prototype={extend:function(t){var r,s;if(!t)return this;if(t instanceof z||typeof t[0]=="number"||"x"in t)r=s=j(t);else if(t=ee(t),r=t.min,s=t.max,!r||!s)return this;return!this.min&&!this.max?(this.min=r.clone(),this.max=s.clone()):(this.min.x=Math.min(r.x,this.min.x),this.max.x=Math.max(s.x,this.max.x),this.min.y=Math.min(r.y,this.min.y),this.max.y=Math.max(s.y,this.max.y)),this},getCenter:function(t){return j((this.min.x+this.max.x)/2,(this.min.y+this.max.y)/2,t)},getBottomLeft:function(){return j(this.min.x,this.max.y)},getTopRight:function(){return j(this.max.x,this.min.y)},getTopLeft:function(){return this.min},getBottomRight:function(){return this.max},getSize:function(){return this.max.subtract(this.min)},contains:function(t){var r,s;return typeof t[0]=="number"||t instanceof z?t=j(t):t=ee(t),t instanceof U?(r=t.min,s=t.max):r=s=t,r.x>=this.min.x&&s.x<=this.max.x&&r.y>=this.min.y&&s.y<=this.max.y},intersects:function(t){t=ee(t);var r=this.min,s=this.max,l=t.min,c=t.max,h=c.x>=r.x&&l.x<=s.x,v=c.y>=r.y&&l.y<=s.y;return h&&v},overlaps:function(t){t=ee(t);var r=this.min,s=this.max,l=t.min,c=t.max,h=c.x>r.x&&l.x<s.x,v=c.y>r.y&&l.y<s.y;return h&&v},isValid:function(){return!!(this.min&&this.max)},pad:function(t){var r=this.min,s=this.max,l=Math.abs(r.x-s.x)*t,c=Math.abs(r.y-s.y)*t;return ee(j(r.x-l,r.y-c),j(s.x+l,s.y+c))},equals:function(t){return t?(t=ee(t),this.min.equals(t.getTopLeft())&&this.max.equals(t.getBottomRight())):!1}};function ee(t,r){return!t||t instanceof U?t:new U(t,r)}function Pe(t,r){if(t)for(var s=r?[t,r]:t,l=0,c=s.length;l<c;l++)this.extend(s[l])}Pe.prototype={extend:function(t){var r=this._southWest,s=this._northEast,l,c;if(t instanceof ne)l=t,c=t;else if(t instanceof Pe){if(l=t._southWest,c=t._northEast,!l||!c)return this}else return t?this.extend(G(t)||oe(t)):this;return!r&&!s?(this._southWest=new ne(l.lat,l.lng),this._northEast=new ne(c.lat,c.lng)):(r.lat=Math.min(l.lat,r.lat),r.lng=Math.min(l.lng,r.lng),s.lat=Math.max(c.lat,s.lat),s.lng=Math.max(c.lng,s.lng)),this},pad:function(t){var r=this._southWest,s=this._northEast,l=Math.abs(r.lat-s.lat)*t,c=Math.abs(r.lng-s.lng)*t;return new Pe(new ne(r.lat-l,r.lng-c),new ne(s.lat+l,s.lng+c))},getCenter:function(){return new ne((this._southWest.lat+this._northEast.lat)/2,(this._southWest.lng+this._northEast.lng)/2)},getSouthWest:function(){return this._southWest},getNorthEast:function(){return this._northEast},getNorthWest:function(){return new ne(this.getNorth(),this.getWest())},getSouthEast:function(){return new ne(this.getSouth(),this.getEast())},getWest:function(){return this._southWest.lng},getSouth:function(){return this._southWest.lat},getEast:function(){return this._northEast.lng},getNorth:function(){return this._northEast.lat},contains:function(t){typeof t[0]=="number"||t instanceof ne||"lat"in t?t=G(t):t=oe(t);var r=this._southWest,s=this._northEast,l,c;return t instanceof Pe?(l=t.getSouthWest(),c=t.getNorthEast()):l=c=t,l.lat>=r.lat&&c.lat<=s.lat&&l.lng>=r.lng&&c.lng<=s.lng},intersects:function(t){t=oe(t);var r=this._southWest,s=this._northEast,l=t.getSouthWest(),c=t.getNorthEast(),h=c.lat>=r.lat&&l.lat<=s.lat,v=c.lng>=r.lng&&l.lng<=s.lng;return h&&v},overlaps:function(t){t=oe(t);var r=this._southWest,s=this._northEast,l=t.getSouthWest(),c=t.getNorthEast(),h=c.lat>r.lat&&l.lat<s.lat,v=c.lng>r.lng&&l.lng<s.lng;return h&&v},toBBoxString:function(){return[this.getWest(),this.getSouth(),this.getEast(),this.getNorth()].join(",")},equals:function(t,r){return t?(t=oe(t),this._southWest.equals(t.getSouthWest(),r)&&this._northEast.equals(t.getNorthEast(),r)):!1},isValid:function(){return!!(this._southWest&&this._northEast)}};function oe(t,r){return t instanceof Pe?t:new Pe(t,r)}function ne(t,r,s){if(isNaN(t)||isNaN(r))throw new Error("Invalid LatLng object: ("+t+", "+r+")");this.lat=+t,this.lng=+r,s!==void 0&&(this.alt=+s)}ne.prototype={equals:function(t,r){if(!t)return!1;t=G(t);var s=Math.max(Math.abs(this.lat-t.lat),Math.abs(this.lng-t.lng));return s<=(r===void 0?1e-9:r)},toString:function(t){return"LatLng("+S(this.lat,t)+", "+S(this.lng,t)+")"},distanceTo:function(t){return Gt.distance(this,G(t))},wrap:function(){return Gt.wrapLatLng(this)},toBounds:function(t){var r=180*t/40075017,s=r/Math.cos(Math.PI/180*this.lat);return oe([this.lat-r,this.lng-s],[this.lat+r,this.lng+s])},clone:function(){return new ne(this.lat,this.lng,this.alt)}};function G(t,r,s){return t instanceof ne?t:y(t)&&typeof t[0]!="object"?t.length===3?new ne(t[0],t[1],t[2]):t.length===2?new ne(t[0],t[1]):null:t==null?t:typeof t=="object"&&"lat"in t?new ne(t.lat,"lng"in t?t.lng:t.lon,t.alt):r===void 0?null:new ne(t,r,s)}var Ue={latLngToPoint:function(t,r){var s=this.projection.project(t),l=this.scale(r);return this.transformation._transform(s,l)},pointToLatLng:function(t,r){var s=this.scale(r),l=this.transformation.untransform(t,s);return this.projection.unproject(l)},project:function(t){return this.projection.project(t)},unproject:function(t){return this.projection.unproject(t)},scale:function(t){return 256*Math.pow(2,t)},zoom:function(t){return Math.log(t/256)/Math.LN2},getProjectedBounds:function(t){if(this.infinite)return null;var r=this.projection.bounds,s=this.scale(t),l=this.transformation.transform(r.min,s),c=this.transformation.transform(r.max,s);return new U(l,c)},infinite:!1,wrapLatLng:function(t){var r=this.wrapLng?k(t.lng,this.wrapLng,!0):t.lng,s=this.wrapLat?k(t.lat,this.wrapLat,!0):t.lat,l=t.alt;return new ne(s,r,l)},wrapLatLngBounds:function(t){var r=t.getCenter(),s=this.wrapLatLng(r),l=r.lat-s.lat,c=r.lng-s.lng;if(l===0&&c===0)return t;var h=t.getSouthWest(),v=t.getNorthEast(),w=new ne(h.lat-l,h.lng-c),C=new ne(v.lat-l,v.lng-c);return new Pe(w,C)}},Gt=a({},Ue,{wrapLng:[-180,180],R:6371e3,distance:function(t,r){var s=Math.PI/180,l=t.lat*s,c=r.lat*s,h=Math.sin((r.lat-t.lat)*s/2),v=Math.sin((r.lng-t.lng)*s/2),w=h*h+Math.cos(l)*Math.cos(c)*v*v,C=2*Math.atan2(Math.sqrt(w),Math.sqrt(1-w));return this.R*C}}),fu=6378137,ds={R:fu,MAX_LATITUDE:85.0511287798,project:function(t){var r=Math.PI/180,s=this.MAX_LATITUDE,l=Math.max(Math.min(s,t.lat),-s),c=Math.sin(l*r);return new z(this.R*t.lng*r,this.R*Math.log((1+c)/(1-c))/2)},unproject:function(t){var r=180/Math.PI;return new ne((2*Math.atan(Math.exp(t.y/this.R))-Math.PI/2)*r,t.x*r/this.R)},bounds:function(){var t=fu*Math.PI;return new U([-t,-t],[t,t])}()};function ps(t,r,s,l){if(y(t)){this._a=t[0],this._b=t[1],this._c=t[2],this._d=t[3];return}this._a=t,this._b=r,this._c=s,this._d=l}ps.prototype={transform:function(t,r){return this._transform(t.clone(),r)},_transform:function(t,r){return r=r||1,t.x=r*(this._a*t.x+this._b),t.y=r*(this._c*t.y+this._d),t},untransform:function(t,r){return r=r||1,new z((t.x/r-this._b)/this._a,(t.y/r-this._d)/this._c)}};function wi(t,r,s,l){return new ps(t,r,s,l)}var ms=a({},Gt,{code:"EPSG:3857",projection:ds,transformation:function(){var t=.5/(Math.PI*ds.R);return wi(t,.5,-t,.5)}()}),rp=a({},ms,{code:"EPSG:900913"});function hu(t){return document.createElementNS("http://www.w3.org/2000/svg",t)}function du(t,r){var s="",l,c,h,v,w,C;for(l=0,h=t.length;l<h;l++){for(w=t[l],c=0,v=w.length;c<v;c++)C=w[c],s+=(c?"L":"M")+C.x+" "+C.y;s+=r?F.svg?"z":"x":""}return s||"M0 0"}var _s=document.documentElement.style,Lr="ActiveXObject"in window,op=Lr&&!document.addEventListener,pu="msLaunchUri"in navigator&&!("documentMode"in document),vs=kt("webkit"),mu=kt("android"),_u=kt("android 2")||kt("android 3"),sp=parseInt(/WebKit\/([0-9]+)|$/.exec(navigator.userAgent)[1],10),ap=mu&&kt("Google")&&sp<537&&!("AudioNode"in window),gs=!!window.opera,vu=!pu&&kt("chrome"),gu=kt("gecko")&&!vs&&!gs&&!Lr,lp=!vu&&kt("safari"),yu=kt("phantom"),xu="OTransition"in _s,up=navigator.platform.indexOf("Win")===0,wu=Lr&&"transition"in _s,ys="WebKitCSSMatrix"in window&&"m11"in new window.WebKitCSSMatrix&&!_u,ku="MozPerspective"in _s,cp=!window.L_DISABLE_3D&&(wu||ys||ku)&&!xu&&!yu,ki=typeof orientation<"u"||kt("mobile"),fp=ki&&vs,hp=ki&&ys,Pu=!window.PointerEvent&&window.MSPointerEvent,Su=!!(window.PointerEvent||Pu),Lu="ontouchstart"in window||!!window.TouchEvent,dp=!window.L_NO_TOUCH&&(Lu||Su),pp=ki&&gs,mp=ki&&gu,_p=(window.devicePixelRatio||window.screen.deviceXDPI/window.screen.logicalXDPI)>1,vp=function(){var t=!1;try{var r=Object.defineProperty({},"passive",{get:function(){t=!0}});window.addEventListener("testPassiveEventSupport",P,r),window.removeEventListener("testPassiveEventSupport",P,r)}catch{}return t}(),gp=function(){return!!document.createElement("canvas").getContext}(),xs=!!(document.createElementNS&&hu("svg").createSVGRect),yp=!!xs&&function(){var t=document.createElement("div");return t.innerHTML="<svg/>",(t.firstChild&&t.firstChild.namespaceURI)==="http://www.w3.org/2000/svg"}(),xp=!xs&&function(){try{var t=document.createElement("div");t.innerHTML='<v:shape adj="1"/>';var r=t.firstChild;return r.style.behavior="url(#default#VML)",r&&typeof r.adj=="object"}catch{return!1}}(),wp=navigator.platform.indexOf("Mac")===0,kp=navigator.platform.indexOf("Linux")===0;function kt(t){return navigator.userAgent.toLowerCase().indexOf(t)>=0}var F={ie:Lr,ielt9:op,edge:pu,webkit:vs,android:mu,android23:_u,androidStock:ap,opera:gs,chrome:vu,gecko:gu,safari:lp,phantom:yu,opera12:xu,win:up,ie3d:wu,webkit3d:ys,gecko3d:ku,any3d:cp,mobile:ki,mobileWebkit:fp,mobileWebkit3d:hp,msPointer:Pu,pointer:Su,touch:dp,touchNative:Lu,mobileOpera:pp,mobileGecko:mp,retina:_p,passiveEvents:vp,canvas:gp,svg:xs,vml:xp,inlineSvg:yp,mac:wp,linux:kp},Cu=F.msPointer?"MSPointerDown":"pointerdown",Eu=F.msPointer?"MSPointerMove":"pointermove",Tu=F.msPointer?"MSPointerUp":"pointerup",zu=F.msPointer?"MSPointerCancel":"pointercancel",ws={touchstart:Cu,touchmove:Eu,touchend:Tu,touchcancel:zu},Nu={touchstart:Tp,touchmove:Cr,touchend:Cr,touchcancel:Cr},An={},Mu=!1;function Pp(t,r,s){return r==="touchstart"&&Ep(),Nu[r]?(s=Nu[r].bind(this,s),t.addEventListener(ws[r],s,!1),s):(console.warn("wrong event specified:",r),P)}function Sp(t,r,s){if(!ws[r]){console.warn("wrong event specified:",r);return}t.removeEventListener(ws[r],s,!1)}function Lp(t){An[t.pointerId]=t}function Cp(t){An[t.pointerId]&&(An[t.pointerId]=t)}function Ou(t){delete An[t.pointerId]}function Ep(){Mu||(document.addEventListener(Cu,Lp,!0),document.addEventListener(Eu,Cp,!0),document.addEventListener(Tu,Ou,!0),document.addEventListener(zu,Ou,!0),Mu=!0)}function Cr(t,r){if(r.pointerType!==(r.MSPOINTER_TYPE_MOUSE||"mouse")){r.touches=[];for(var s in An)r.touches.push(An[s]);r.changedTouches=[r],t(r)}}function Tp(t,r){r.MSPOINTER_TYPE_TOUCH&&r.pointerType===r.MSPOINTER_TYPE_TOUCH&&Me(r),Cr(t,r)}function zp(t){var r={},s,l;for(l in t)s=t[l],r[l]=s&&s.bind?s.bind(t):s;return t=r,r.type="dblclick",r.detail=2,r.isTrusted=!1,r._simulated=!0,r}var Np=200;function Mp(t,r){t.addEventListener("dblclick",r);var s=0,l;function c(h){if(h.detail!==1){l=h.detail;return}if(!(h.pointerType==="mouse"||h.sourceCapabilities&&!h.sourceCapabilities.firesTouchEvents)){var v=bu(h);if(!(v.some(function(C){return C instanceof HTMLLabelElement&&C.attributes.for})&&!v.some(function(C){return C instanceof HTMLInputElement||C instanceof HTMLSelectElement}))){var w=Date.now();w-s<=Np?(l++,l===2&&r(zp(h))):l=1,s=w}}}return t.addEventListener("click",c),{dblclick:r,simDblclick:c}}function Op(t,r){t.removeEventListener("dblclick",r.dblclick),t.removeEventListener("click",r.simDblclick)}var ks=zr(["transform","webkitTransform","OTransform","MozTransform","msTransform"]),Pi=zr(["webkitTransition","transition","OTransition","MozTransition","msTransition"]),Iu=Pi==="webkitTransition"||Pi==="OTransition"?Pi+"End":"transitionend";function ju(t){return typeof t=="string"?document.getElementById(t):t}function Si(t,r){var s=t.style[r]||t.currentStyle&&t.currentStyle[r];if((!s||s==="auto")&&document.defaultView){var l=document.defaultView.getComputedStyle(t,null);s=l?l[r]:null}return s==="auto"?null:s}function ie(t,r,s){var l=document.createElement(t);return l.className=r||"",s&&s.appendChild(l),l}function de(t){var r=t.parentNode;r&&r.removeChild(t)}function Er(t){for(;t.firstChild;)t.removeChild(t.firstChild)}function bn(t){var r=t.parentNode;r&&r.lastChild!==t&&r.appendChild(t)}function Bn(t){var r=t.parentNode;r&&r.firstChild!==t&&r.insertBefore(t,r.firstChild)}function Ps(t,r){if(t.classList!==void 0)return t.classList.contains(r);var s=Tr(t);return s.length>0&&new RegExp("(^|\\s)"+r+"(\\s|$)").test(s)}function Q(t,r){if(t.classList!==void 0)for(var s=O(r),l=0,c=s.length;l<c;l++)t.classList.add(s[l]);else if(!Ps(t,r)){var h=Tr(t);Ss(t,(h?h+" ":"")+r)}}function ge(t,r){t.classList!==void 0?t.classList.remove(r):Ss(t,E((" "+Tr(t)+" ").replace(" "+r+" "," ")))}function Ss(t,r){t.className.baseVal===void 0?t.className=r:t.className.baseVal=r}function Tr(t){return t.correspondingElement&&(t=t.correspondingElement),t.className.baseVal===void 0?t.className:t.className.baseVal}function rt(t,r){"opacity"in t.style?t.style.opacity=r:"filter"in t.style&&Ip(t,r)}function Ip(t,r){var s=!1,l="DXImageTransform.Microsoft.Alpha";try{s=t.filters.item(l)}catch{if(r===1)return}r=Math.round(r*100),s?(s.Enabled=r!==100,s.Opacity=r):t.style.filter+=" progid:"+l+"(opacity="+r+")"}function zr(t){for(var r=document.documentElement.style,s=0;s<t.length;s++)if(t[s]in r)return t[s];return!1}function vn(t,r,s){var l=r||new z(0,0);t.style[ks]=(F.ie3d?"translate("+l.x+"px,"+l.y+"px)":"translate3d("+l.x+"px,"+l.y+"px,0)")+(s?" scale("+s+")":"")}function xe(t,r){t._leaflet_pos=r,F.any3d?vn(t,r):(t.style.left=r.x+"px",t.style.top=r.y+"px")}function gn(t){return t._leaflet_pos||new z(0,0)}var Li,Ci,Ls;if("onselectstart"in document)Li=function(){K(window,"selectstart",Me)},Ci=function(){ae(window,"selectstart",Me)};else{var Ei=zr(["userSelect","WebkitUserSelect","OUserSelect","MozUserSelect","msUserSelect"]);Li=function(){if(Ei){var t=document.documentElement.style;Ls=t[Ei],t[Ei]="none"}},Ci=function(){Ei&&(document.documentElement.style[Ei]=Ls,Ls=void 0)}}function Cs(){K(window,"dragstart",Me)}function Es(){ae(window,"dragstart",Me)}var Nr,Ts;function zs(t){for(;t.tabIndex===-1;)t=t.parentNode;t.style&&(Mr(),Nr=t,Ts=t.style.outlineStyle,t.style.outlineStyle="none",K(window,"keydown",Mr))}function Mr(){Nr&&(Nr.style.outlineStyle=Ts,Nr=void 0,Ts=void 0,ae(window,"keydown",Mr))}function Ru(t){do t=t.parentNode;while((!t.offsetWidth||!t.offsetHeight)&&t!==document.body);return t}function Ns(t){var r=t.getBoundingClientRect();return{x:r.width/t.offsetWidth||1,y:r.height/t.offsetHeight||1,boundingClientRect:r}}var jp={__proto__:null,TRANSFORM:ks,TRANSITION:Pi,TRANSITION_END:Iu,get:ju,getStyle:Si,create:ie,remove:de,empty:Er,toFront:bn,toBack:Bn,hasClass:Ps,addClass:Q,removeClass:ge,setClass:Ss,getClass:Tr,setOpacity:rt,testProp:zr,setTransform:vn,setPosition:xe,getPosition:gn,get disableTextSelection(){return Li},get enableTextSelection(){return Ci},disableImageDrag:Cs,enableImageDrag:Es,preventOutline:zs,restoreOutline:Mr,getSizedParentNode:Ru,getScale:Ns};function K(t,r,s,l){if(r&&typeof r=="object")for(var c in r)Os(t,c,r[c],s);else{r=O(r);for(var h=0,v=r.length;h<v;h++)Os(t,r[h],s,l)}return this}var Pt="_leaflet_events";function ae(t,r,s,l){if(arguments.length===1)Au(t),delete t[Pt];else if(r&&typeof r=="object")for(var c in r)Is(t,c,r[c],s);else if(r=O(r),arguments.length===2)Au(t,function(w){return N(r,w)!==-1});else for(var h=0,v=r.length;h<v;h++)Is(t,r[h],s,l);return this}function Au(t,r){for(var s in t[Pt]){var l=s.split(/\d/)[0];(!r||r(l))&&Is(t,l,null,null,s)}}var Ms={mouseenter:"mouseover",mouseleave:"mouseout",wheel:!("onwheel"in window)&&"mousewheel"};function Os(t,r,s,l){var c=r+p(s)+(l?"_"+p(l):"");if(t[Pt]&&t[Pt][c])return this;var h=function(w){return s.call(l||t,w||window.event)},v=h;!F.touchNative&&F.pointer&&r.indexOf("touch")===0?h=Pp(t,r,h):F.touch&&r==="dblclick"?h=Mp(t,h):"addEventListener"in t?r==="touchstart"||r==="touchmove"||r==="wheel"||r==="mousewheel"?t.addEventListener(Ms[r]||r,h,F.passiveEvents?{passive:!1}:!1):r==="mouseenter"||r==="mouseleave"?(h=function(w){w=w||window.event,Rs(t,w)&&v(w)},t.addEventListener(Ms[r],h,!1)):t.addEventListener(r,v,!1):t.attachEvent("on"+r,h),t[Pt]=t[Pt]||{},t[Pt][c]=h}function Is(t,r,s,l,c){c=c||r+p(s)+(l?"_"+p(l):"");var h=t[Pt]&&t[Pt][c];if(!h)return this;!F.touchNative&&F.pointer&&r.indexOf("touch")===0?Sp(t,r,h):F.touch&&r==="dblclick"?Op(t,h):"removeEventListener"in t?t.removeEventListener(Ms[r]||r,h,!1):t.detachEvent("on"+r,h),t[Pt][c]=null}function yn(t){return t.stopPropagation?t.stopPropagation():t.originalEvent?t.originalEvent._stopped=!0:t.cancelBubble=!0,this}function js(t){return Os(t,"wheel",yn),this}function Ti(t){return K(t,"mousedown touchstart dblclick contextmenu",yn),t._leaflet_disable_click=!0,this}function Me(t){return t.preventDefault?t.preventDefault():t.returnValue=!1,this}function xn(t){return Me(t),yn(t),this}function bu(t){if(t.composedPath)return t.composedPath();for(var r=[],s=t.target;s;)r.push(s),s=s.parentNode;return r}function Bu(t,r){if(!r)return new z(t.clientX,t.clientY);var s=Ns(r),l=s.boundingClientRect;return new z((t.clientX-l.left)/s.x-r.clientLeft,(t.clientY-l.top)/s.y-r.clientTop)}var Rp=F.linux&&F.chrome?window.devicePixelRatio:F.mac?window.devicePixelRatio*3:window.devicePixelRatio>0?2*window.devicePixelRatio:1;function Du(t){return F.edge?t.wheelDeltaY/2:t.deltaY&&t.deltaMode===0?-t.deltaY/Rp:t.deltaY&&t.deltaMode===1?-t.deltaY*20:t.deltaY&&t.deltaMode===2?-t.deltaY*60:t.deltaX||t.deltaZ?0:t.wheelDelta?(t.wheelDeltaY||t.wheelDelta)/2:t.detail&&Math.abs(t.detail)<32765?-t.detail*20:t.detail?t.detail/-32765*60:0}function Rs(t,r){var s=r.relatedTarget;if(!s)return!0;try{for(;s&&s!==t;)s=s.parentNode}catch{return!1}return s!==t}var Ap={__proto__:null,on:K,off:ae,stopPropagation:yn,disableScrollPropagation:js,disableClickPropagation:Ti,preventDefault:Me,stop:xn,getPropagationPath:bu,getMousePosition:Bu,getWheelDelta:Du,isExternalTarget:Rs,addListener:K,removeListener:ae},Zu=Mt.extend({run:function(t,r,s,l){this.stop(),this._el=t,this._inProgress=!0,this._duration=s||.25,this._easeOutPower=1/Math.max(l||.5,.2),this._startPos=gn(t),this._offset=r.subtract(this._startPos),this._startTime=+new Date,this.fire("start"),this._animate()},stop:function(){this._inProgress&&(this._step(!0),this._complete())},_animate:function(){this._animId=se(this._animate,this),this._step()},_step:function(t){var r=+new Date-this._startTime,s=this._duration*1e3;r<s?this._runFrame(this._easeOut(r/s),t):(this._runFrame(1),this._complete())},_runFrame:function(t,r){var s=this._startPos.add(this._offset.multiplyBy(t));r&&s._round(),xe(this._el,s),this.fire("step")},_complete:function(){Ce(this._animId),this._inProgress=!1,this.fire("end")},_easeOut:function(t){return 1-Math.pow(1-t,this._easeOutPower)}}),J=Mt.extend({options:{crs:ms,center:void 0,zoom:void 0,minZoom:void 0,maxZoom:void 0,layers:[],maxBounds:void 0,renderer:void 0,zoomAnimation:!0,zoomAnimationThreshold:4,fadeAnimation:!0,markerZoomAnimation:!0,transform3DLimit:8388608,zoomSnap:1,zoomDelta:1,trackResize:!0},initialize:function(t,r){r=T(this,r),this._handlers=[],this._layers={},this._zoomBoundLayers={},this._sizeChanged=!0,this._initContainer(t),this._initLayout(),this._onResize=f(this._onResize,this),this._initEvents(),r.maxBounds&&this.setMaxBounds(r.maxBounds),r.zoom!==void 0&&(this._zoom=this._limitZoom(r.zoom)),r.center&&r.zoom!==void 0&&this.setView(G(r.center),r.zoom,{reset:!0}),this.callInitHooks(),this._zoomAnimated=Pi&&F.any3d&&!F.mobileOpera&&this.options.zoomAnimation,this._zoomAnimated&&(this._createAnimProxy(),K(this._proxy,Iu,this._catchTransitionEnd,this)),this._addLayers(this.options.layers)},setView:function(t,r,s){if(r=r===void 0?this._zoom:this._limitZoom(r),t=this._limitCenter(G(t),r,this.options.maxBounds),s=s||{},this._stop(),this._loaded&&!s.reset&&s!==!0){s.animate!==void 0&&(s.zoom=a({animate:s.animate},s.zoom),s.pan=a({animate:s.animate,duration:s.duration},s.pan));var l=this._zoom!==r?this._tryAnimatedZoom&&this._tryAnimatedZoom(t,r,s.zoom):this._tryAnimatedPan(t,s.pan);if(l)return clearTimeout(this._sizeTimer),this}return this._resetView(t,r,s.pan&&s.pan.noMoveStart),this},setZoom:function(t,r){return this._loaded?this.setView(this.getCenter(),t,{zoom:r}):(this._zoom=t,this)},zoomIn:function(t,r){return t=t||(F.any3d?this.options.zoomDelta:1),this.setZoom(this._zoom+t,r)},zoomOut:function(t,r){return t=t||(F.any3d?this.options.zoomDelta:1),this.setZoom(this._zoom-t,r)},setZoomAround:function(t,r,s){var l=this.getZoomScale(r),c=this.getSize().divideBy(2),h=t instanceof z?t:this.latLngToContainerPoint(t),v=h.subtract(c).multiplyBy(1-1/l),w=this.containerPointToLatLng(c.add(v));return this.setView(w,r,{zoom:s})},_getBoundsCenterZoom:function(t,r){r=r||{},t=t.getBounds?t.getBounds():oe(t);var s=j(r.paddingTopLeft||r.padding||[0,0]),l=j(r.paddingBottomRight||r.padding||[0,0]),c=this.getBoundsZoom(t,!1,s.add(l));if(c=typeof r.maxZoom=="number"?Math.min(r.maxZoom,c):c,c===1/0)return{center:t.getCenter(),zoom:c};var h=l.subtract(s).divideBy(2),v=this.project(t.getSouthWest(),c),w=this.project(t.getNorthEast(),c),C=this.unproject(v.add(w).divideBy(2).add(h),c);return{center:C,zoom:c}},fitBounds:function(t,r){if(t=oe(t),!t.isValid())throw new Error("Bounds are not valid.");var s=this._getBoundsCenterZoom(t,r);return this.setView(s.center,s.zoom,r)},fitWorld:function(t){return this.fitBounds([[-90,-180],[90,180]],t)},panTo:function(t,r){return this.setView(t,this._zoom,{pan:r})},panBy:function(t,r){if(t=j(t).round(),r=r||{},!t.x&&!t.y)return this.fire("moveend");if(r.animate!==!0&&!this.getSize().contains(t))return this._resetView(this.unproject(this.project(this.getCenter()).add(t)),this.getZoom()),this;if(this._panAnim||(this._panAnim=new Zu,this._panAnim.on({step:this._onPanTransitionStep,end:this._onPanTransitionEnd},this)),r.noMoveStart||this.fire("movestart"),r.animate!==!1){Q(this._mapPane,"leaflet-pan-anim");var s=this._getMapPanePos().subtract(t).round();this._panAnim.run(this._mapPane,s,r.duration||.25,r.easeLinearity)}else this._rawPanBy(t),this.fire("move").fire("moveend");return this},flyTo:function(t,r,s){if(s=s||{},s.animate===!1||!F.any3d)return this.setView(t,r,s);this._stop();var l=this.project(this.getCenter()),c=this.project(t),h=this.getSize(),v=this._zoom;t=G(t),r=r===void 0?v:r;var w=Math.max(h.x,h.y),C=w*this.getZoomScale(v,r),M=c.distanceTo(l)||1,A=1.42,W=A*A;function X(we){var Wr=we?-1:1,Sm=we?C:w,Lm=C*C-w*w+Wr*W*W*M*M,Cm=2*Sm*W*M,Gs=Lm/Cm,xc=Math.sqrt(Gs*Gs+1)-Gs,Em=xc<1e-9?-18:Math.log(xc);return Em}function De(we){return(Math.exp(we)-Math.exp(-we))/2}function Ee(we){return(Math.exp(we)+Math.exp(-we))/2}function st(we){return De(we)/Ee(we)}var Ve=X(0);function Un(we){return w*(Ee(Ve)/Ee(Ve+A*we))}function xm(we){return w*(Ee(Ve)*st(Ve+A*we)-De(Ve))/W}function wm(we){return 1-Math.pow(1-we,1.5)}var km=Date.now(),gc=(X(1)-Ve)/A,Pm=s.duration?1e3*s.duration:1e3*gc*.8;function yc(){var we=(Date.now()-km)/Pm,Wr=wm(we)*gc;we<=1?(this._flyToFrame=se(yc,this),this._move(this.unproject(l.add(c.subtract(l).multiplyBy(xm(Wr)/M)),v),this.getScaleZoom(w/Un(Wr),v),{flyTo:!0})):this._move(t,r)._moveEnd(!0)}return this._moveStart(!0,s.noMoveStart),yc.call(this),this},flyToBounds:function(t,r){var s=this._getBoundsCenterZoom(t,r);return this.flyTo(s.center,s.zoom,r)},setMaxBounds:function(t){return t=oe(t),this.listens("moveend",this._panInsideMaxBounds)&&this.off("moveend",this._panInsideMaxBounds),t.isValid()?(this.options.maxBounds=t,this._loaded&&this._panInsideMaxBounds(),this.on("moveend",this._panInsideMaxBounds)):(this.options.maxBounds=null,this)},setMinZoom:function(t){var r=this.options.minZoom;return this.options.minZoom=t,this._loaded&&r!==t&&(this.fire("zoomlevelschange"),this.getZoom()<this.options.minZoom)?this.setZoom(t):this},setMaxZoom:function(t){var r=this.options.maxZoom;return this.options.maxZoom=t,this._loaded&&r!==t&&(this.fire("zoomlevelschange"),this.getZoom()>this.options.maxZoom)?this.setZoom(t):this},panInsideBounds:function(t,r){this._enforcingBounds=!0;var s=this.getCenter(),l=this._limitCenter(s,this._zoom,oe(t));return s.equals(l)||this.panTo(l,r),this._enforcingBounds=!1,this},panInside:function(t,r){r=r||{};var s=j(r.paddingTopLeft||r.padding||[0,0]),l=j(r.paddingBottomRight||r.padding||[0,0]),c=this.project(this.getCenter()),h=this.project(t),v=this.getPixelBounds(),w=ee([v.min.add(s),v.max.subtract(l)]),C=w.getSize();if(!w.contains(h)){this._enforcingBounds=!0;var M=h.subtract(w.getCenter()),A=w.extend(h).getSize().subtract(C);c.x+=M.x<0?-A.x:A.x,c.y+=M.y<0?-A.y:A.y,this.panTo(this.unproject(c),r),this._enforcingBounds=!1}return this},invalidateSize:function(t){if(!this._loaded)return this;t=a({animate:!1,pan:!0},t===!0?{animate:!0}:t);var r=this.getSize();this._sizeChanged=!0,this._lastCenter=null;var s=this.getSize(),l=r.divideBy(2).round(),c=s.divideBy(2).round(),h=l.subtract(c);return!h.x&&!h.y?this:(t.animate&&t.pan?this.panBy(h):(t.pan&&this._rawPanBy(h),this.fire("move"),t.debounceMoveend?(clearTimeout(this._sizeTimer),this._sizeTimer=setTimeout(f(this.fire,this,"moveend"),200)):this.fire("moveend")),this.fire("resize",{oldSize:r,newSize:s}))},stop:function(){return this.setZoom(this._limitZoom(this._zoom)),this.options.zoomSnap||this.fire("viewreset"),this._stop()},locate:function(t){if(t=this._locateOptions=a({timeout:1e4,watch:!1},t),!("geolocation"in navigator))return this._handleGeolocationError({code:0,message:"Geolocation not supported."}),this;var r=f(this._handleGeolocationResponse,this),s=f(this._handleGeolocationError,this);return t.watch?this._locationWatchId=navigator.geolocation.watchPosition(r,s,t):navigator.geolocation.getCurrentPosition(r,s,t),this},stopLocate:function(){return navigator.geolocation&&navigator.geolocation.clearWatch&&navigator.geolocation.clearWatch(this._locationWatchId),this._locateOptions&&(this._locateOptions.setView=!1),this},_handleGeolocationError:function(t){if(this._container._leaflet_id){var r=t.code,s=t.message||(r===1?"permission denied":r===2?"position unavailable":"timeout");this._locateOptions.setView&&!this._loaded&&this.fitWorld(),this.fire("locationerror",{code:r,message:"Geolocation error: "+s+"."})}},_handleGeolocationResponse:function(t){if(this._container._leaflet_id){var r=t.coords.latitude,s=t.coords.longitude,l=new ne(r,s),c=l.toBounds(t.coords.accuracy*2),h=this._locateOptions;if(h.setView){var v=this.getBoundsZoom(c);this.setView(l,h.maxZoom?Math.min(v,h.maxZoom):v)}var w={latlng:l,bounds:c,timestamp:t.timestamp};for(var C in t.coords)typeof t.coords[C]=="number"&&(w[C]=t.coords[C]);this.fire("locationfound",w)}},addHandler:function(t,r){if(!r)return this;var s=this[t]=new r(this);return this._handlers.push(s),this.options[t]&&s.enable(),this},remove:function(){if(this._initEvents(!0),this.options.maxBounds&&this.off("moveend",this._panInsideMaxBounds),this._containerId!==this._container._leaflet_id)throw new Error("Map container is being reused by another instance");try{delete this._container._leaflet_id,delete this._containerId}catch{this._container._leaflet_id=void 0,this._containerId=void 0}this._locationWatchId!==void 0&&this.stopLocate(),this._stop(),de(this._mapPane),this._clearControlPos&&this._clearControlPos(),this._resizeRequest&&(Ce(this._resizeRequest),this._resizeRequest=null),this._clearHandlers(),this._loaded&&this.fire("unload");var t;for(t in this._layers)this._layers[t].remove();for(t in this._panes)de(this._panes[t]);return this._layers=[],this._panes=[],delete this._mapPane,delete this._renderer,this},createPane:function(t,r){var s="leaflet-pane"+(t?" leaflet-"+t.replace("Pane","")+"-pane":""),l=ie("div",s,r||this._mapPane);return t&&(this._panes[t]=l),l},getCenter:function(){return this._checkIfLoaded(),this._lastCenter&&!this._moved()?this._lastCenter.clone():this.layerPointToLatLng(this._getCenterLayerPoint())},getZoom:function(){return this._zoom},getBounds:function(){var t=this.getPixelBounds(),r=this.unproject(t.getBottomLeft()),s=this.unproject(t.getTopRight());return new Pe(r,s)},getMinZoom:function(){return this.options.minZoom===void 0?this._layersMinZoom||0:this.options.minZoom},getMaxZoom:function(){return this.options.maxZoom===void 0?this._layersMaxZoom===void 0?1/0:this._layersMaxZoom:this.options.maxZoom},getBoundsZoom:function(t,r,s){t=oe(t),s=j(s||[0,0]);var l=this.getZoom()||0,c=this.getMinZoom(),h=this.getMaxZoom(),v=t.getNorthWest(),w=t.getSouthEast(),C=this.getSize().subtract(s),M=ee(this.project(w,l),this.project(v,l)).getSize(),A=F.any3d?this.options.zoomSnap:1,W=C.x/M.x,X=C.y/M.y,De=r?Math.max(W,X):Math.min(W,X);return l=this.getScaleZoom(De,l),A&&(l=Math.round(l/(A/100))*(A/100),l=r?Math.ceil(l/A)*A:Math.floor(l/A)*A),Math.max(c,Math.min(h,l))},getSize:function(){return(!this._size||this._sizeChanged)&&(this._size=new z(this._container.clientWidth||0,this._container.clientHeight||0),this._sizeChanged=!1),this._size.clone()},getPixelBounds:function(t,r){var s=this._getTopLeftPoint(t,r);return new U(s,s.add(this.getSize()))},getPixelOrigin:function(){return this._checkIfLoaded(),this._pixelOrigin},getPixelWorldBounds:function(t){return this.options.crs.getProjectedBounds(t===void 0?this.getZoom():t)},getPane:function(t){return typeof t=="string"?this._panes[t]:t},getPanes:function(){return this._panes},getContainer:function(){return this._container},getZoomScale:function(t,r){var s=this.options.crs;return r=r===void 0?this._zoom:r,s.scale(t)/s.scale(r)},getScaleZoom:function(t,r){var s=this.options.crs;r=r===void 0?this._zoom:r;var l=s.zoom(t*s.scale(r));return isNaN(l)?1/0:l},project:function(t,r){return r=r===void 0?this._zoom:r,this.options.crs.latLngToPoint(G(t),r)},unproject:function(t,r){return r=r===void 0?this._zoom:r,this.options.crs.pointToLatLng(j(t),r)},layerPointToLatLng:function(t){var r=j(t).add(this.getPixelOrigin());return this.unproject(r)},latLngToLayerPoint:function(t){var r=this.project(G(t))._round();return r._subtract(this.getPixelOrigin())},wrapLatLng:function(t){return this.options.crs.wrapLatLng(G(t))},wrapLatLngBounds:function(t){return this.options.crs.wrapLatLngBounds(oe(t))},distance:function(t,r){return this.options.crs.distance(G(t),G(r))},containerPointToLayerPoint:function(t){return j(t).subtract(this._getMapPanePos())},layerPointToContainerPoint:function(t){return j(t).add(this._getMapPanePos())},containerPointToLatLng:function(t){var r=this.containerPointToLayerPoint(j(t));return this.layerPointToLatLng(r)},latLngToContainerPoint:function(t){return this.layerPointToContainerPoint(this.latLngToLayerPoint(G(t)))},mouseEventToContainerPoint:function(t){return Bu(t,this._container)},mouseEventToLayerPoint:function(t){return this.containerPointToLayerPoint(this.mouseEventToContainerPoint(t))},mouseEventToLatLng:function(t){return this.layerPointToLatLng(this.mouseEventToLayerPoint(t))},_initContainer:function(t){var r=this._container=ju(t);if(r){if(r._leaflet_id)throw new Error("Map container is already initialized.")}else throw new Error("Map container not found.");K(r,"scroll",this._onScroll,this),this._containerId=p(r)},_initLayout:function(){var t=this._container;this._fadeAnimated=this.options.fadeAnimation&&F.any3d,Q(t,"leaflet-container"+(F.touch?" leaflet-touch":"")+(F.retina?" leaflet-retina":"")+(F.ielt9?" leaflet-oldie":"")+(F.safari?" leaflet-safari":"")+(this._fadeAnimated?" leaflet-fade-anim":""));var r=Si(t,"position");r!=="absolute"&&r!=="relative"&&r!=="fixed"&&r!=="sticky"&&(t.style.position="relative"),this._initPanes(),this._initControlPos&&this._initControlPos()},_initPanes:function(){var t=this._panes={};this._paneRenderers={},this._mapPane=this.createPane("mapPane",this._container),xe(this._mapPane,new z(0,0)),this.createPane("tilePane"),this.createPane("overlayPane"),this.createPane("shadowPane"),this.createPane("markerPane"),this.createPane("tooltipPane"),this.createPane("popupPane"),this.options.markerZoomAnimation||(Q(t.markerPane,"leaflet-zoom-hide"),Q(t.shadowPane,"leaflet-zoom-hide"))},_resetView:function(t,r,s){xe(this._mapPane,new z(0,0));var l=!this._loaded;this._loaded=!0,r=this._limitZoom(r),this.fire("viewprereset");var c=this._zoom!==r;this._moveStart(c,s)._move(t,r)._moveEnd(c),this.fire("viewreset"),l&&this.fire("load")},_moveStart:function(t,r){return t&&this.fire("zoomstart"),r||this.fire("movestart"),this},_move:function(t,r,s,l){r===void 0&&(r=this._zoom);var c=this._zoom!==r;return this._zoom=r,this._lastCenter=t,this._pixelOrigin=this._getNewPixelOrigin(t),l?s&&s.pinch&&this.fire("zoom",s):((c||s&&s.pinch)&&this.fire("zoom",s),this.fire("move",s)),this},_moveEnd:function(t){return t&&this.fire("zoomend"),this.fire("moveend")},_stop:function(){return Ce(this._flyToFrame),this._panAnim&&this._panAnim.stop(),this},_rawPanBy:function(t){xe(this._mapPane,this._getMapPanePos().subtract(t))},_getZoomSpan:function(){return this.getMaxZoom()-this.getMinZoom()},_panInsideMaxBounds:function(){this._enforcingBounds||this.panInsideBounds(this.options.maxBounds)},_checkIfLoaded:function(){if(!this._loaded)throw new Error("Set map center and zoom first.")},_initEvents:function(t){this._targets={},this._targets[p(this._container)]=this;var r=t?ae:K;r(this._container,"click dblclick mousedown mouseup mouseover mouseout mousemove contextmenu keypress keydown keyup",this._handleDOMEvent,this),this.options.trackResize&&r(window,"resize",this._onResize,this),F.any3d&&this.options.transform3DLimit&&(t?this.off:this.on).call(this,"moveend",this._onMoveEnd)},_onResize:function(){Ce(this._resizeRequest),this._resizeRequest=se(function(){this.invalidateSize({debounceMoveend:!0})},this)},_onScroll:function(){this._container.scrollTop=0,this._container.scrollLeft=0},_onMoveEnd:function(){var t=this._getMapPanePos();Math.max(Math.abs(t.x),Math.abs(t.y))>=this.options.transform3DLimit&&this._resetView(this.getCenter(),this.getZoom())},_findEventTargets:function(t,r){for(var s=[],l,c=r==="mouseout"||r==="mouseover",h=t.target||t.srcElement,v=!1;h;){if(l=this._targets[p(h)],l&&(r==="click"||r==="preclick")&&this._draggableMoved(l)){v=!0;break}if(l&&l.listens(r,!0)&&(c&&!Rs(h,t)||(s.push(l),c))||h===this._container)break;h=h.parentNode}return!s.length&&!v&&!c&&this.listens(r,!0)&&(s=[this]),s},_isClickDisabled:function(t){for(;t&&t!==this._container;){if(t._leaflet_disable_click)return!0;t=t.parentNode}},_handleDOMEvent:function(t){var r=t.target||t.srcElement;if(!(!this._loaded||r._leaflet_disable_events||t.type==="click"&&this._isClickDisabled(r))){var s=t.type;s==="mousedown"&&zs(r),this._fireDOMEvent(t,s)}},_mouseEvents:["click","dblclick","mouseover","mouseout","contextmenu"],_fireDOMEvent:function(t,r,s){if(t.type==="click"){var l=a({},t);l.type="preclick",this._fireDOMEvent(l,l.type,s)}var c=this._findEventTargets(t,r);if(s){for(var h=[],v=0;v<s.length;v++)s[v].listens(r,!0)&&h.push(s[v]);c=h.concat(c)}if(c.length){r==="contextmenu"&&Me(t);var w=c[0],C={originalEvent:t};if(t.type!=="keypress"&&t.type!=="keydown"&&t.type!=="keyup"){var M=w.getLatLng&&(!w._radius||w._radius<=10);C.containerPoint=M?this.latLngToContainerPoint(w.getLatLng()):this.mouseEventToContainerPoint(t),C.layerPoint=this.containerPointToLayerPoint(C.containerPoint),C.latlng=M?w.getLatLng():this.layerPointToLatLng(C.layerPoint)}for(v=0;v<c.length;v++)if(c[v].fire(r,C,!0),C.originalEvent._stopped||c[v].options.bubblingMouseEvents===!1&&N(this._mouseEvents,r)!==-1)return}},_draggableMoved:function(t){return t=t.dragging&&t.dragging.enabled()?t:this,t.dragging&&t.dragging.moved()||this.boxZoom&&this.boxZoom.moved()},_clearHandlers:function(){for(var t=0,r=this._handlers.length;t<r;t++)this._handlers[t].disable()},whenReady:function(t,r){return this._loaded?t.call(r||this,{target:this}):this.on("load",t,r),this},_getMapPanePos:function(){return gn(this._mapPane)||new z(0,0)},_moved:function(){var t=this._getMapPanePos();return t&&!t.equals([0,0])},_getTopLeftPoint:function(t,r){var s=t&&r!==void 0?this._getNewPixelOrigin(t,r):this.getPixelOrigin();return s.subtract(this._getMapPanePos())},_getNewPixelOrigin:function(t,r){var s=this.getSize()._divideBy(2);return this.project(t,r)._subtract(s)._add(this._getMapPanePos())._round()},_latLngToNewLayerPoint:function(t,r,s){var l=this._getNewPixelOrigin(s,r);return this.project(t,r)._subtract(l)},_latLngBoundsToNewLayerBounds:function(t,r,s){var l=this._getNewPixelOrigin(s,r);return ee([this.project(t.getSouthWest(),r)._subtract(l),this.project(t.getNorthWest(),r)._subtract(l),this.project(t.getSouthEast(),r)._subtract(l),this.project(t.getNorthEast(),r)._subtract(l)])},_getCenterLayerPoint:function(){return this.containerPointToLayerPoint(this.getSize()._divideBy(2))},_getCenterOffset:function(t){return this.latLngToLayerPoint(t).subtract(this._getCenterLayerPoint())},_limitCenter:function(t,r,s){if(!s)return t;var l=this.project(t,r),c=this.getSize().divideBy(2),h=new U(l.subtract(c),l.add(c)),v=this._getBoundsOffset(h,s,r);return Math.abs(v.x)<=1&&Math.abs(v.y)<=1?t:this.unproject(l.add(v),r)},_limitOffset:function(t,r){if(!r)return t;var s=this.getPixelBounds(),l=new U(s.min.add(t),s.max.add(t));return t.add(this._getBoundsOffset(l,r))},_getBoundsOffset:function(t,r,s){var l=ee(this.project(r.getNorthEast(),s),this.project(r.getSouthWest(),s)),c=l.min.subtract(t.min),h=l.max.subtract(t.max),v=this._rebound(c.x,-h.x),w=this._rebound(c.y,-h.y);return new z(v,w)},_rebound:function(t,r){return t+r>0?Math.round(t-r)/2:Math.max(0,Math.ceil(t))-Math.max(0,Math.floor(r))},_limitZoom:function(t){var r=this.getMinZoom(),s=this.getMaxZoom(),l=F.any3d?this.options.zoomSnap:1;return l&&(t=Math.round(t/l)*l),Math.max(r,Math.min(s,t))},_onPanTransitionStep:function(){this.fire("move")},_onPanTransitionEnd:function(){ge(this._mapPane,"leaflet-pan-anim"),this.fire("moveend")},_tryAnimatedPan:function(t,r){var s=this._getCenterOffset(t)._trunc();return(r&&r.animate)!==!0&&!this.getSize().contains(s)?!1:(this.panBy(s,r),!0)},_createAnimProxy:function(){var t=this._proxy=ie("div","leaflet-proxy leaflet-zoom-animated");this._panes.mapPane.appendChild(t),this.on("zoomanim",function(r){var s=ks,l=this._proxy.style[s];vn(this._proxy,this.project(r.center,r.zoom),this.getZoomScale(r.zoom,1)),l===this._proxy.style[s]&&this._animatingZoom&&this._onZoomTransitionEnd()},this),this.on("load moveend",this._animMoveEnd,this),this._on("unload",this._destroyAnimProxy,this)},_destroyAnimProxy:function(){de(this._proxy),this.off("load moveend",this._animMoveEnd,this),delete this._proxy},_animMoveEnd:function(){var t=this.getCenter(),r=this.getZoom();vn(this._proxy,this.project(t,r),this.getZoomScale(r,1))},_catchTransitionEnd:function(t){this._animatingZoom&&t.propertyName.indexOf("transform")>=0&&this._onZoomTransitionEnd()},_nothingToAnimate:function(){return!this._container.getElementsByClassName("leaflet-zoom-animated").length},_tryAnimatedZoom:function(t,r,s){if(this._animatingZoom)return!0;if(s=s||{},!this._zoomAnimated||s.animate===!1||this._nothingToAnimate()||Math.abs(r-this._zoom)>this.options.zoomAnimationThreshold)return!1;var l=this.getZoomScale(r),c=this._getCenterOffset(t)._divideBy(1-1/l);return s.animate!==!0&&!this.getSize().contains(c)?!1:(se(function(){this._moveStart(!0,s.noMoveStart||!1)._animateZoom(t,r,!0)},this),!0)},_animateZoom:function(t,r,s,l){this._mapPane&&(s&&(this._animatingZoom=!0,this._animateToCenter=t,this._animateToZoom=r,Q(this._mapPane,"leaflet-zoom-anim")),this.fire("zoomanim",{center:t,zoom:r,noUpdate:l}),this._tempFireZoomEvent||(this._tempFireZoomEvent=this._zoom!==this._animateToZoom),this._move(this._animateToCenter,this._animateToZoom,void 0,!0),setTimeout(f(this._onZoomTransitionEnd,this),250))},_onZoomTransitionEnd:function(){this._animatingZoom&&(this._mapPane&&ge(this._mapPane,"leaflet-zoom-anim"),this._animatingZoom=!1,this._move(this._animateToCenter,this._animateToZoom,void 0,!0),this._tempFireZoomEvent&&this.fire("zoom"),delete this._tempFireZoomEvent,this.fire("move"),this._moveEnd(!0))}});function bp(t,r){return new J(t,r)}var dt=it.extend({options:{position:"topright"},initialize:function(t){T(this,t)},getPosition:function(){return this.options.position},setPosition:function(t){var r=this._map;return r&&r.removeControl(this),this.options.position=t,r&&r.addControl(this),this},getContainer:function(){return this._container},addTo:function(t){this.remove(),this._map=t;var r=this._container=this.onAdd(t),s=this.getPosition(),l=t._controlCorners[s];return Q(r,"leaflet-control"),s.indexOf("bottom")!==-1?l.insertBefore(r,l.firstChild):l.appendChild(r),this._map.on("unload",this.remove,this),this},remove:function(){return this._map?(de(this._container),this.onRemove&&this.onRemove(this._map),this._map.off("unload",this.remove,this),this._map=null,this):this},_refocusOnMap:function(t){this._map&&t&&t.screenX>0&&t.screenY>0&&this._map.getContainer().focus()}}),zi=function(t){return new dt(t)};J.include({addControl:function(t){return t.addTo(this),this},removeControl:function(t){return t.remove(),this},_initControlPos:function(){var t=this._controlCorners={},r="leaflet-",s=this._controlContainer=ie("div",r+"control-container",this._container);function l(c,h){var v=r+c+" "+r+h;t[c+h]=ie("div",v,s)}l("top","left"),l("top","right"),l("bottom","left"),l("bottom","right")},_clearControlPos:function(){for(var t in this._controlCorners)de(this._controlCorners[t]);de(this._controlContainer),delete this._controlCorners,delete this._controlContainer}});var Fu=dt.extend({options:{collapsed:!0,position:"topright",autoZIndex:!0,hideSingleBase:!1,sortLayers:!1,sortFunction:function(t,r,s,l){return s<l?-1:l<s?1:0}},initialize:function(t,r,s){T(this,s),this._layerControlInputs=[],this._layers=[],this._lastZIndex=0,this._handlingClick=!1,this._preventClick=!1;for(var l in t)this._addLayer(t[l],l);for(l in r)this._addLayer(r[l],l,!0)},onAdd:function(t){this._initLayout(),this._update(),this._map=t,t.on("zoomend",this._checkDisabledLayers,this);for(var r=0;r<this._layers.length;r++)this._layers[r].layer.on("add remove",this._onLayerChange,this);return this._container},addTo:function(t){return dt.prototype.addTo.call(this,t),this._expandIfNotCollapsed()},onRemove:function(){this._map.off("zoomend",this._checkDisabledLayers,this);for(var t=0;t<this._layers.length;t++)this._layers[t].layer.off("add remove",this._onLayerChange,this)},addBaseLayer:function(t,r){return this._addLayer(t,r),this._map?this._update():this},addOverlay:function(t,r){return this._addLayer(t,r,!0),this._map?this._update():this},removeLayer:function(t){t.off("add remove",this._onLayerChange,this);var r=this._getLayer(p(t));return r&&this._layers.splice(this._layers.indexOf(r),1),this._map?this._update():this},expand:function(){Q(this._container,"leaflet-control-layers-expanded"),this._section.style.height=null;var t=this._map.getSize().y-(this._container.offsetTop+50);return t<this._section.clientHeight?(Q(this._section,"leaflet-control-layers-scrollbar"),this._section.style.height=t+"px"):ge(this._section,"leaflet-control-layers-scrollbar"),this._checkDisabledLayers(),this},collapse:function(){return ge(this._container,"leaflet-control-layers-expanded"),this},_initLayout:function(){var t="leaflet-control-layers",r=this._container=ie("div",t),s=this.options.collapsed;r.setAttribute("aria-haspopup",!0),Ti(r),js(r);var l=this._section=ie("section",t+"-list");s&&(this._map.on("click",this.collapse,this),K(r,{mouseenter:this._expandSafely,mouseleave:this.collapse},this));var c=this._layersLink=ie("a",t+"-toggle",r);c.href="#",c.title="Layers",c.setAttribute("role","button"),K(c,{keydown:function(h){h.keyCode===13&&this._expandSafely()},click:function(h){Me(h),this._expandSafely()}},this),s||this.expand(),this._baseLayersList=ie("div",t+"-base",l),this._separator=ie("div",t+"-separator",l),this._overlaysList=ie("div",t+"-overlays",l),r.appendChild(l)},_getLayer:function(t){for(var r=0;r<this._layers.length;r++)if(this._layers[r]&&p(this._layers[r].layer)===t)return this._layers[r]},_addLayer:function(t,r,s){this._map&&t.on("add remove",this._onLayerChange,this),this._layers.push({layer:t,name:r,overlay:s}),this.options.sortLayers&&this._layers.sort(f(function(l,c){return this.options.sortFunction(l.layer,c.layer,l.name,c.name)},this)),this.options.autoZIndex&&t.setZIndex&&(this._lastZIndex++,t.setZIndex(this._lastZIndex)),this._expandIfNotCollapsed()},_update:function(){if(!this._container)return this;Er(this._baseLayersList),Er(this._overlaysList),this._layerControlInputs=[];var t,r,s,l,c=0;for(s=0;s<this._layers.length;s++)l=this._layers[s],this._addItem(l),r=r||l.overlay,t=t||!l.overlay,c+=l.overlay?0:1;return this.options.hideSingleBase&&(t=t&&c>1,this._baseLayersList.style.display=t?"":"none"),this._separator.style.display=r&&t?"":"none",this},_onLayerChange:function(t){this._handlingClick||this._update();var r=this._getLayer(p(t.target)),s=r.overlay?t.type==="add"?"overlayadd":"overlayremove":t.type==="add"?"baselayerchange":null;s&&this._map.fire(s,r)},_createRadioElement:function(t,r){var s='<input type="radio" class="leaflet-control-layers-selector" name="'+t+'"'+(r?' checked="checked"':"")+"/>",l=document.createElement("div");return l.innerHTML=s,l.firstChild},_addItem:function(t){var r=document.createElement("label"),s=this._map.hasLayer(t.layer),l;t.overlay?(l=document.createElement("input"),l.type="checkbox",l.className="leaflet-control-layers-selector",l.defaultChecked=s):l=this._createRadioElement("leaflet-base-layers_"+p(this),s),this._layerControlInputs.push(l),l.layerId=p(t.layer),K(l,"click",this._onInputClick,this);var c=document.createElement("span");c.innerHTML=" "+t.name;var h=document.createElement("span");r.appendChild(h),h.appendChild(l),h.appendChild(c);var v=t.overlay?this._overlaysList:this._baseLayersList;return v.appendChild(r),this._checkDisabledLayers(),r},_onInputClick:function(){if(!this._preventClick){var t=this._layerControlInputs,r,s,l=[],c=[];this._handlingClick=!0;for(var h=t.length-1;h>=0;h--)r=t[h],s=this._getLayer(r.layerId).layer,r.checked?l.push(s):r.checked||c.push(s);for(h=0;h<c.length;h++)this._map.hasLayer(c[h])&&this._map.removeLayer(c[h]);for(h=0;h<l.length;h++)this._map.hasLayer(l[h])||this._map.addLayer(l[h]);this._handlingClick=!1,this._refocusOnMap()}},_checkDisabledLayers:function(){for(var t=this._layerControlInputs,r,s,l=this._map.getZoom(),c=t.length-1;c>=0;c--)r=t[c],s=this._getLayer(r.layerId).layer,r.disabled=s.options.minZoom!==void 0&&l<s.options.minZoom||s.options.maxZoom!==void 0&&l>s.options.maxZoom},_expandIfNotCollapsed:function(){return this._map&&!this.options.collapsed&&this.expand(),this},_expandSafely:function(){var t=this._section;this._preventClick=!0,K(t,"click",Me),this.expand();var r=this;setTimeout(function(){ae(t,"click",Me),r._preventClick=!1})}}),Bp=function(t,r,s){return new Fu(t,r,s)},As=dt.extend({options:{position:"topleft",zoomInText:'<span aria-hidden="true">+</span>',zoomInTitle:"Zoom in",zoomOutText:'<span aria-hidden="true">&#x2212;</span>',zoomOutTitle:"Zoom out"},onAdd:function(t){var r="leaflet-control-zoom",s=ie("div",r+" leaflet-bar"),l=this.options;return this._zoomInButton=this._createButton(l.zoomInText,l.zoomInTitle,r+"-in",s,this._zoomIn),this._zoomOutButton=this._createButton(l.zoomOutText,l.zoomOutTitle,r+"-out",s,this._zoomOut),this._updateDisabled(),t.on("zoomend zoomlevelschange",this._updateDisabled,this),s},onRemove:function(t){t.off("zoomend zoomlevelschange",this._updateDisabled,this)},disable:function(){return this._disabled=!0,this._updateDisabled(),this},enable:function(){return this._disabled=!1,this._updateDisabled(),this},_zoomIn:function(t){!this._disabled&&this._map._zoom<this._map.getMaxZoom()&&this._map.zoomIn(this._map.options.zoomDelta*(t.shiftKey?3:1))},_zoomOut:function(t){!this._disabled&&this._map._zoom>this._map.getMinZoom()&&this._map.zoomOut(this._map.options.zoomDelta*(t.shiftKey?3:1))},_createButton:function(t,r,s,l,c){var h=ie("a",s,l);return h.innerHTML=t,h.href="#",h.title=r,h.setAttribute("role","button"),h.setAttribute("aria-label",r),Ti(h),K(h,"click",xn),K(h,"click",c,this),K(h,"click",this._refocusOnMap,this),h},_updateDisabled:function(){var t=this._map,r="leaflet-disabled";ge(this._zoomInButton,r),ge(this._zoomOutButton,r),this._zoomInButton.setAttribute("aria-disabled","false"),this._zoomOutButton.setAttribute("aria-disabled","false"),(this._disabled||t._zoom===t.getMinZoom())&&(Q(this._zoomOutButton,r),this._zoomOutButton.setAttribute("aria-disabled","true")),(this._disabled||t._zoom===t.getMaxZoom())&&(Q(this._zoomInButton,r),this._zoomInButton.setAttribute("aria-disabled","true"))}});J.mergeOptions({zoomControl:!0}),J.addInitHook(function(){this.options.zoomControl&&(this.zoomControl=new As,this.addControl(this.zoomControl))});var Dp=function(t){return new As(t)},Hu=dt.extend({options:{position:"bottomleft",maxWidth:100,metric:!0,imperial:!0},onAdd:function(t){var r="leaflet-control-scale",s=ie("div",r),l=this.options;return this._addScales(l,r+"-line",s),t.on(l.updateWhenIdle?"moveend":"move",this._update,this),t.whenReady(this._update,this),s},onRemove:function(t){t.off(this.options.updateWhenIdle?"moveend":"move",this._update,this)},_addScales:function(t,r,s){t.metric&&(this._mScale=ie("div",r,s)),t.imperial&&(this._iScale=ie("div",r,s))},_update:function(){var t=this._map,r=t.getSize().y/2,s=t.distance(t.containerPointToLatLng([0,r]),t.containerPointToLatLng([this.options.maxWidth,r]));this._updateScales(s)},_updateScales:function(t){this.options.metric&&t&&this._updateMetric(t),this.options.imperial&&t&&this._updateImperial(t)},_updateMetric:function(t){var r=this._getRoundNum(t),s=r<1e3?r+" m":r/1e3+" km";this._updateScale(this._mScale,s,r/t)},_updateImperial:function(t){var r=t*3.2808399,s,l,c;r>5280?(s=r/5280,l=this._getRoundNum(s),this._updateScale(this._iScale,l+" mi",l/s)):(c=this._getRoundNum(r),this._updateScale(this._iScale,c+" ft",c/r))},_updateScale:function(t,r,s){t.style.width=Math.round(this.options.maxWidth*s)+"px",t.innerHTML=r},_getRoundNum:function(t){var r=Math.pow(10,(Math.floor(t)+"").length-1),s=t/r;return s=s>=10?10:s>=5?5:s>=3?3:s>=2?2:1,r*s}}),Zp=function(t){return new Hu(t)},Fp='<svg aria-hidden="true" xmlns="http://www.w3.org/2000/svg" width="12" height="8" viewBox="0 0 12 8" class="leaflet-attribution-flag"><path fill="#4C7BE1" d="M0 0h12v4H0z"/><path fill="#FFD500" d="M0 4h12v3H0z"/><path fill="#E0BC00" d="M0 7h12v1H0z"/></svg>',bs=dt.extend({options:{position:"bottomright",prefix:'<a href="https://leafletjs.com" title="A JavaScript library for interactive maps">'+(F.inlineSvg?Fp+" ":"")+"Leaflet</a>"},initialize:function(t){T(this,t),this._attributions={}},onAdd:function(t){t.attributionControl=this,this._container=ie("div","leaflet-control-attribution"),Ti(this._container);for(var r in t._layers)t._layers[r].getAttribution&&this.addAttribution(t._layers[r].getAttribution());return this._update(),t.on("layeradd",this._addAttribution,this),this._container},onRemove:function(t){t.off("layeradd",this._addAttribution,this)},_addAttribution:function(t){t.layer.getAttribution&&(this.addAttribution(t.layer.getAttribution()),t.layer.once("remove",function(){this.removeAttribution(t.layer.getAttribution())},this))},setPrefix:function(t){return this.options.prefix=t,this._update(),this},addAttribution:function(t){return t?(this._attributions[t]||(this._attributions[t]=0),this._attributions[t]++,this._update(),this):this},removeAttribution:function(t){return t?(this._attributions[t]&&(this._attributions[t]--,this._update()),this):this},_update:function(){if(this._map){var t=[];for(var r in this._attributions)this._attributions[r]&&t.push(r);var s=[];this.options.prefix&&s.push(this.options.prefix),t.length&&s.push(t.join(", ")),this._container.innerHTML=s.join(' <span aria-hidden="true">|</span> ')}}});J.mergeOptions({attributionControl:!0}),J.addInitHook(function(){this.options.attributionControl&&new bs().addTo(this)});var Hp=function(t){return new bs(t)};dt.Layers=Fu,dt.Zoom=As,dt.Scale=Hu,dt.Attribution=bs,zi.layers=Bp,zi.zoom=Dp,zi.scale=Zp,zi.attribution=Hp;var St=it.extend({initialize:function(t){this._map=t},enable:function(){return this._enabled?this:(this._enabled=!0,this.addHooks(),this)},disable:function(){return this._enabled?(this._enabled=!1,this.removeHooks(),this):this},enabled:function(){return!!this._enabled}});St.addTo=function(t,r){return t.addHandler(r,this),this};var Wp={Events:Ne},Wu=F.touch?"touchstart mousedown":"mousedown",Kt=Mt.extend({options:{clickTolerance:3},initialize:function(t,r,s,l){T(this,l),this._element=t,this._dragStartTarget=r||t,this._preventOutline=s},enable:function(){this._enabled||(K(this._dragStartTarget,Wu,this._onDown,this),this._enabled=!0)},disable:function(){this._enabled&&(Kt._dragging===this&&this.finishDrag(!0),ae(this._dragStartTarget,Wu,this._onDown,this),this._enabled=!1,this._moved=!1)},_onDown:function(t){if(this._enabled&&(this._moved=!1,!Ps(this._element,"leaflet-zoom-anim"))){if(t.touches&&t.touches.length!==1){Kt._dragging===this&&this.finishDrag();return}if(!(Kt._dragging||t.shiftKey||t.which!==1&&t.button!==1&&!t.touches)&&(Kt._dragging=this,this._preventOutline&&zs(this._element),Cs(),Li(),!this._moving)){this.fire("down");var r=t.touches?t.touches[0]:t,s=Ru(this._element);this._startPoint=new z(r.clientX,r.clientY),this._startPos=gn(this._element),this._parentScale=Ns(s);var l=t.type==="mousedown";K(document,l?"mousemove":"touchmove",this._onMove,this),K(document,l?"mouseup":"touchend touchcancel",this._onUp,this)}}},_onMove:function(t){if(this._enabled){if(t.touches&&t.touches.length>1){this._moved=!0;return}var r=t.touches&&t.touches.length===1?t.touches[0]:t,s=new z(r.clientX,r.clientY)._subtract(this._startPoint);!s.x&&!s.y||Math.abs(s.x)+Math.abs(s.y)<this.options.clickTolerance||(s.x/=this._parentScale.x,s.y/=this._parentScale.y,Me(t),this._moved||(this.fire("dragstart"),this._moved=!0,Q(document.body,"leaflet-dragging"),this._lastTarget=t.target||t.srcElement,window.SVGElementInstance&&this._lastTarget instanceof window.SVGElementInstance&&(this._lastTarget=this._lastTarget.correspondingUseElement),Q(this._lastTarget,"leaflet-drag-target")),this._newPos=this._startPos.add(s),this._moving=!0,this._lastEvent=t,this._updatePosition())}},_updatePosition:function(){var t={originalEvent:this._lastEvent};this.fire("predrag",t),xe(this._element,this._newPos),this.fire("drag",t)},_onUp:function(){this._enabled&&this.finishDrag()},finishDrag:function(t){ge(document.body,"leaflet-dragging"),this._lastTarget&&(ge(this._lastTarget,"leaflet-drag-target"),this._lastTarget=null),ae(document,"mousemove touchmove",this._onMove,this),ae(document,"mouseup touchend touchcancel",this._onUp,this),Es(),Ci();var r=this._moved&&this._moving;this._moving=!1,Kt._dragging=!1,r&&this.fire("dragend",{noInertia:t,distance:this._newPos.distanceTo(this._startPos)})}});function Uu(t,r,s){var l,c=[1,4,2,8],h,v,w,C,M,A,W,X;for(h=0,A=t.length;h<A;h++)t[h]._code=wn(t[h],r);for(w=0;w<4;w++){for(W=c[w],l=[],h=0,A=t.length,v=A-1;h<A;v=h++)C=t[h],M=t[v],C._code&W?M._code&W||(X=Or(M,C,W,r,s),X._code=wn(X,r),l.push(X)):(M._code&W&&(X=Or(M,C,W,r,s),X._code=wn(X,r),l.push(X)),l.push(C));t=l}return t}function Vu(t,r){var s,l,c,h,v,w,C,M,A;if(!t||t.length===0)throw new Error("latlngs not passed");ot(t)||(console.warn("latlngs are not flat! Only the first ring will be used"),t=t[0]);var W=G([0,0]),X=oe(t),De=X.getNorthWest().distanceTo(X.getSouthWest())*X.getNorthEast().distanceTo(X.getNorthWest());De<1700&&(W=Bs(t));var Ee=t.length,st=[];for(s=0;s<Ee;s++){var Ve=G(t[s]);st.push(r.project(G([Ve.lat-W.lat,Ve.lng-W.lng])))}for(w=C=M=0,s=0,l=Ee-1;s<Ee;l=s++)c=st[s],h=st[l],v=c.y*h.x-h.y*c.x,C+=(c.x+h.x)*v,M+=(c.y+h.y)*v,w+=v*3;w===0?A=st[0]:A=[C/w,M/w];var Un=r.unproject(j(A));return G([Un.lat+W.lat,Un.lng+W.lng])}function Bs(t){for(var r=0,s=0,l=0,c=0;c<t.length;c++){var h=G(t[c]);r+=h.lat,s+=h.lng,l++}return G([r/l,s/l])}var Up={__proto__:null,clipPolygon:Uu,polygonCenter:Vu,centroid:Bs};function Gu(t,r){if(!r||!t.length)return t.slice();var s=r*r;return t=Kp(t,s),t=Gp(t,s),t}function Ku(t,r,s){return Math.sqrt(Ni(t,r,s,!0))}function Vp(t,r,s){return Ni(t,r,s)}function Gp(t,r){var s=t.length,l=typeof Uint8Array<"u"?Uint8Array:Array,c=new l(s);c[0]=c[s-1]=1,Ds(t,c,r,0,s-1);var h,v=[];for(h=0;h<s;h++)c[h]&&v.push(t[h]);return v}function Ds(t,r,s,l,c){var h=0,v,w,C;for(w=l+1;w<=c-1;w++)C=Ni(t[w],t[l],t[c],!0),C>h&&(v=w,h=C);h>s&&(r[v]=1,Ds(t,r,s,l,v),Ds(t,r,s,v,c))}function Kp(t,r){for(var s=[t[0]],l=1,c=0,h=t.length;l<h;l++)Qp(t[l],t[c])>r&&(s.push(t[l]),c=l);return c<h-1&&s.push(t[h-1]),s}var Qu;function Yu(t,r,s,l,c){var h=l?Qu:wn(t,s),v=wn(r,s),w,C,M;for(Qu=v;;){if(!(h|v))return[t,r];if(h&v)return!1;w=h||v,C=Or(t,r,w,s,c),M=wn(C,s),w===h?(t=C,h=M):(r=C,v=M)}}function Or(t,r,s,l,c){var h=r.x-t.x,v=r.y-t.y,w=l.min,C=l.max,M,A;return s&8?(M=t.x+h*(C.y-t.y)/v,A=C.y):s&4?(M=t.x+h*(w.y-t.y)/v,A=w.y):s&2?(M=C.x,A=t.y+v*(C.x-t.x)/h):s&1&&(M=w.x,A=t.y+v*(w.x-t.x)/h),new z(M,A,c)}function wn(t,r){var s=0;return t.x<r.min.x?s|=1:t.x>r.max.x&&(s|=2),t.y<r.min.y?s|=4:t.y>r.max.y&&(s|=8),s}function Qp(t,r){var s=r.x-t.x,l=r.y-t.y;return s*s+l*l}function Ni(t,r,s,l){var c=r.x,h=r.y,v=s.x-c,w=s.y-h,C=v*v+w*w,M;return C>0&&(M=((t.x-c)*v+(t.y-h)*w)/C,M>1?(c=s.x,h=s.y):M>0&&(c+=v*M,h+=w*M)),v=t.x-c,w=t.y-h,l?v*v+w*w:new z(c,h)}function ot(t){return!y(t[0])||typeof t[0][0]!="object"&&typeof t[0][0]<"u"}function Xu(t){return console.warn("Deprecated use of _flat, please use L.LineUtil.isFlat instead."),ot(t)}function $u(t,r){var s,l,c,h,v,w,C,M;if(!t||t.length===0)throw new Error("latlngs not passed");ot(t)||(console.warn("latlngs are not flat! Only the first ring will be used"),t=t[0]);var A=G([0,0]),W=oe(t),X=W.getNorthWest().distanceTo(W.getSouthWest())*W.getNorthEast().distanceTo(W.getNorthWest());X<1700&&(A=Bs(t));var De=t.length,Ee=[];for(s=0;s<De;s++){var st=G(t[s]);Ee.push(r.project(G([st.lat-A.lat,st.lng-A.lng])))}for(s=0,l=0;s<De-1;s++)l+=Ee[s].distanceTo(Ee[s+1])/2;if(l===0)M=Ee[0];else for(s=0,h=0;s<De-1;s++)if(v=Ee[s],w=Ee[s+1],c=v.distanceTo(w),h+=c,h>l){C=(h-l)/c,M=[w.x-C*(w.x-v.x),w.y-C*(w.y-v.y)];break}var Ve=r.unproject(j(M));return G([Ve.lat+A.lat,Ve.lng+A.lng])}var Yp={__proto__:null,simplify:Gu,pointToSegmentDistance:Ku,closestPointOnSegment:Vp,clipSegment:Yu,_getEdgeIntersection:Or,_getBitCode:wn,_sqClosestPointOnSegment:Ni,isFlat:ot,_flat:Xu,polylineCenter:$u},Zs={project:function(t){return new z(t.lng,t.lat)},unproject:function(t){return new ne(t.y,t.x)},bounds:new U([-180,-90],[180,90])},Fs={R:6378137,R_MINOR:6356752314245179e-9,bounds:new U([-2003750834279e-5,-1549657073972e-5],[2003750834279e-5,1876465623138e-5]),project:function(t){var r=Math.PI/180,s=this.R,l=t.lat*r,c=this.R_MINOR/s,h=Math.sqrt(1-c*c),v=h*Math.sin(l),w=Math.tan(Math.PI/4-l/2)/Math.pow((1-v)/(1+v),h/2);return l=-s*Math.log(Math.max(w,1e-10)),new z(t.lng*r*s,l)},unproject:function(t){for(var r=180/Math.PI,s=this.R,l=this.R_MINOR/s,c=Math.sqrt(1-l*l),h=Math.exp(-t.y/s),v=Math.PI/2-2*Math.atan(h),w=0,C=.1,M;w<15&&Math.abs(C)>1e-7;w++)M=c*Math.sin(v),M=Math.pow((1-M)/(1+M),c/2),C=Math.PI/2-2*Math.atan(h*M)-v,v+=C;return new ne(v*r,t.x*r/s)}},Xp={__proto__:null,LonLat:Zs,Mercator:Fs,SphericalMercator:ds},$p=a({},Gt,{code:"EPSG:3395",projection:Fs,transformation:function(){var t=.5/(Math.PI*Fs.R);return wi(t,.5,-t,.5)}()}),qu=a({},Gt,{code:"EPSG:4326",projection:Zs,transformation:wi(1/180,1,-1/180,.5)}),qp=a({},Ue,{projection:Zs,transformation:wi(1,0,-1,0),scale:function(t){return Math.pow(2,t)},zoom:function(t){return Math.log(t)/Math.LN2},distance:function(t,r){var s=r.lng-t.lng,l=r.lat-t.lat;return Math.sqrt(s*s+l*l)},infinite:!0});Ue.Earth=Gt,Ue.EPSG3395=$p,Ue.EPSG3857=ms,Ue.EPSG900913=rp,Ue.EPSG4326=qu,Ue.Simple=qp;var pt=Mt.extend({options:{pane:"overlayPane",attribution:null,bubblingMouseEvents:!0},addTo:function(t){return t.addLayer(this),this},remove:function(){return this.removeFrom(this._map||this._mapToAdd)},removeFrom:function(t){return t&&t.removeLayer(this),this},getPane:function(t){return this._map.getPane(t?this.options[t]||t:this.options.pane)},addInteractiveTarget:function(t){return this._map._targets[p(t)]=this,this},removeInteractiveTarget:function(t){return delete this._map._targets[p(t)],this},getAttribution:function(){return this.options.attribution},_layerAdd:function(t){var r=t.target;if(r.hasLayer(this)){if(this._map=r,this._zoomAnimated=r._zoomAnimated,this.getEvents){var s=this.getEvents();r.on(s,this),this.once("remove",function(){r.off(s,this)},this)}this.onAdd(r),this.fire("add"),r.fire("layeradd",{layer:this})}}});J.include({addLayer:function(t){if(!t._layerAdd)throw new Error("The provided object is not a Layer.");var r=p(t);return this._layers[r]?this:(this._layers[r]=t,t._mapToAdd=this,t.beforeAdd&&t.beforeAdd(this),this.whenReady(t._layerAdd,t),this)},removeLayer:function(t){var r=p(t);return this._layers[r]?(this._loaded&&t.onRemove(this),delete this._layers[r],this._loaded&&(this.fire("layerremove",{layer:t}),t.fire("remove")),t._map=t._mapToAdd=null,this):this},hasLayer:function(t){return p(t)in this._layers},eachLayer:function(t,r){for(var s in this._layers)t.call(r,this._layers[s]);return this},_addLayers:function(t){t=t?y(t)?t:[t]:[];for(var r=0,s=t.length;r<s;r++)this.addLayer(t[r])},_addZoomLimit:function(t){(!isNaN(t.options.maxZoom)||!isNaN(t.options.minZoom))&&(this._zoomBoundLayers[p(t)]=t,this._updateZoomLevels())},_removeZoomLimit:function(t){var r=p(t);this._zoomBoundLayers[r]&&(delete this._zoomBoundLayers[r],this._updateZoomLevels())},_updateZoomLevels:function(){var t=1/0,r=-1/0,s=this._getZoomSpan();for(var l in this._zoomBoundLayers){var c=this._zoomBoundLayers[l].options;t=c.minZoom===void 0?t:Math.min(t,c.minZoom),r=c.maxZoom===void 0?r:Math.max(r,c.maxZoom)}this._layersMaxZoom=r===-1/0?void 0:r,this._layersMinZoom=t===1/0?void 0:t,s!==this._getZoomSpan()&&this.fire("zoomlevelschange"),this.options.maxZoom===void 0&&this._layersMaxZoom&&this.getZoom()>this._layersMaxZoom&&this.setZoom(this._layersMaxZoom),this.options.minZoom===void 0&&this._layersMinZoom&&this.getZoom()<this._layersMinZoom&&this.setZoom(this._layersMinZoom)}});var Dn=pt.extend({initialize:function(t,r){T(this,r),this._layers={};var s,l;if(t)for(s=0,l=t.length;s<l;s++)this.addLayer(t[s])},addLayer:function(t){var r=this.getLayerId(t);return this._layers[r]=t,this._map&&this._map.addLayer(t),this},removeLayer:function(t){var r=t in this._layers?t:this.getLayerId(t);return this._map&&this._layers[r]&&this._map.removeLayer(this._layers[r]),delete this._layers[r],this},hasLayer:function(t){var r=typeof t=="number"?t:this.getLayerId(t);return r in this._layers},clearLayers:function(){return this.eachLayer(this.removeLayer,this)},invoke:function(t){var r=Array.prototype.slice.call(arguments,1),s,l;for(s in this._layers)l=this._layers[s],l[t]&&l[t].apply(l,r);return this},onAdd:function(t){this.eachLayer(t.addLayer,t)},onRemove:function(t){this.eachLayer(t.removeLayer,t)},eachLayer:function(t,r){for(var s in this._layers)t.call(r,this._layers[s]);return this},getLayer:function(t){return this._layers[t]},getLayers:function(){var t=[];return this.eachLayer(t.push,t),t},setZIndex:function(t){return this.invoke("setZIndex",t)},getLayerId:function(t){return p(t)}}),Jp=function(t,r){return new Dn(t,r)},Ot=Dn.extend({addLayer:function(t){return this.hasLayer(t)?this:(t.addEventParent(this),Dn.prototype.addLayer.call(this,t),this.fire("layeradd",{layer:t}))},removeLayer:function(t){return this.hasLayer(t)?(t in this._layers&&(t=this._layers[t]),t.removeEventParent(this),Dn.prototype.removeLayer.call(this,t),this.fire("layerremove",{layer:t})):this},setStyle:function(t){return this.invoke("setStyle",t)},bringToFront:function(){return this.invoke("bringToFront")},bringToBack:function(){return this.invoke("bringToBack")},getBounds:function(){var t=new Pe;for(var r in this._layers){var s=this._layers[r];t.extend(s.getBounds?s.getBounds():s.getLatLng())}return t}}),em=function(t,r){return new Ot(t,r)},Zn=it.extend({options:{popupAnchor:[0,0],tooltipAnchor:[0,0],crossOrigin:!1},initialize:function(t){T(this,t)},createIcon:function(t){return this._createIcon("icon",t)},createShadow:function(t){return this._createIcon("shadow",t)},_createIcon:function(t,r){var s=this._getIconUrl(t);if(!s){if(t==="icon")throw new Error("iconUrl not set in Icon options (see the docs).");return null}var l=this._createImg(s,r&&r.tagName==="IMG"?r:null);return this._setIconStyles(l,t),(this.options.crossOrigin||this.options.crossOrigin==="")&&(l.crossOrigin=this.options.crossOrigin===!0?"":this.options.crossOrigin),l},_setIconStyles:function(t,r){var s=this.options,l=s[r+"Size"];typeof l=="number"&&(l=[l,l]);var c=j(l),h=j(r==="shadow"&&s.shadowAnchor||s.iconAnchor||c&&c.divideBy(2,!0));t.className="leaflet-marker-"+r+" "+(s.className||""),h&&(t.style.marginLeft=-h.x+"px",t.style.marginTop=-h.y+"px"),c&&(t.style.width=c.x+"px",t.style.height=c.y+"px")},_createImg:function(t,r){return r=r||document.createElement("img"),r.src=t,r},_getIconUrl:function(t){return F.retina&&this.options[t+"RetinaUrl"]||this.options[t+"Url"]}});function tm(t){return new Zn(t)}var Mi=Zn.extend({options:{iconUrl:"marker-icon.png",iconRetinaUrl:"marker-icon-2x.png",shadowUrl:"marker-shadow.png",iconSize:[25,41],iconAnchor:[12,41],popupAnchor:[1,-34],tooltipAnchor:[16,-28],shadowSize:[41,41]},_getIconUrl:function(t){return typeof Mi.imagePath!="string"&&(Mi.imagePath=this._detectIconPath()),(this.options.imagePath||Mi.imagePath)+Zn.prototype._getIconUrl.call(this,t)},_stripUrl:function(t){var r=function(s,l,c){var h=l.exec(s);return h&&h[c]};return t=r(t,/^url\((['"])?(.+)\1\)$/,2),t&&r(t,/^(.*)marker-icon\.png$/,1)},_detectIconPath:function(){var t=ie("div","leaflet-default-icon-path",document.body),r=Si(t,"background-image")||Si(t,"backgroundImage");if(document.body.removeChild(t),r=this._stripUrl(r),r)return r;var s=document.querySelector('link[href$="leaflet.css"]');return s?s.href.substring(0,s.href.length-11-1):""}}),Ju=St.extend({initialize:function(t){this._marker=t},addHooks:function(){var t=this._marker._icon;this._draggable||(this._draggable=new Kt(t,t,!0)),this._draggable.on({dragstart:this._onDragStart,predrag:this._onPreDrag,drag:this._onDrag,dragend:this._onDragEnd},this).enable(),Q(t,"leaflet-marker-draggable")},removeHooks:function(){this._draggable.off({dragstart:this._onDragStart,predrag:this._onPreDrag,drag:this._onDrag,dragend:this._onDragEnd},this).disable(),this._marker._icon&&ge(this._marker._icon,"leaflet-marker-draggable")},moved:function(){return this._draggable&&this._draggable._moved},_adjustPan:function(t){var r=this._marker,s=r._map,l=this._marker.options.autoPanSpeed,c=this._marker.options.autoPanPadding,h=gn(r._icon),v=s.getPixelBounds(),w=s.getPixelOrigin(),C=ee(v.min._subtract(w).add(c),v.max._subtract(w).subtract(c));if(!C.contains(h)){var M=j((Math.max(C.max.x,h.x)-C.max.x)/(v.max.x-C.max.x)-(Math.min(C.min.x,h.x)-C.min.x)/(v.min.x-C.min.x),(Math.max(C.max.y,h.y)-C.max.y)/(v.max.y-C.max.y)-(Math.min(C.min.y,h.y)-C.min.y)/(v.min.y-C.min.y)).multiplyBy(l);s.panBy(M,{animate:!1}),this._draggable._newPos._add(M),this._draggable._startPos._add(M),xe(r._icon,this._draggable._newPos),this._onDrag(t),this._panRequest=se(this._adjustPan.bind(this,t))}},_onDragStart:function(){this._oldLatLng=this._marker.getLatLng(),this._marker.closePopup&&this._marker.closePopup(),this._marker.fire("movestart").fire("dragstart")},_onPreDrag:function(t){this._marker.options.autoPan&&(Ce(this._panRequest),this._panRequest=se(this._adjustPan.bind(this,t)))},_onDrag:function(t){var r=this._marker,s=r._shadow,l=gn(r._icon),c=r._map.layerPointToLatLng(l);s&&xe(s,l),r._latlng=c,t.latlng=c,t.oldLatLng=this._oldLatLng,r.fire("move",t).fire("drag",t)},_onDragEnd:function(t){Ce(this._panRequest),delete this._oldLatLng,this._marker.fire("moveend").fire("dragend",t)}}),Ir=pt.extend({options:{icon:new Mi,interactive:!0,keyboard:!0,title:"",alt:"Marker",zIndexOffset:0,opacity:1,riseOnHover:!1,riseOffset:250,pane:"markerPane",shadowPane:"shadowPane",bubblingMouseEvents:!1,autoPanOnFocus:!0,draggable:!1,autoPan:!1,autoPanPadding:[50,50],autoPanSpeed:10},initialize:function(t,r){T(this,r),this._latlng=G(t)},onAdd:function(t){this._zoomAnimated=this._zoomAnimated&&t.options.markerZoomAnimation,this._zoomAnimated&&t.on("zoomanim",this._animateZoom,this),this._initIcon(),this.update()},onRemove:function(t){this.dragging&&this.dragging.enabled()&&(this.options.draggable=!0,this.dragging.removeHooks()),delete this.dragging,this._zoomAnimated&&t.off("zoomanim",this._animateZoom,this),this._removeIcon(),this._removeShadow()},getEvents:function(){return{zoom:this.update,viewreset:this.update}},getLatLng:function(){return this._latlng},setLatLng:function(t){var r=this._latlng;return this._latlng=G(t),this.update(),this.fire("move",{oldLatLng:r,latlng:this._latlng})},setZIndexOffset:function(t){return this.options.zIndexOffset=t,this.update()},getIcon:function(){return this.options.icon},setIcon:function(t){return this.options.icon=t,this._map&&(this._initIcon(),this.update()),this._popup&&this.bindPopup(this._popup,this._popup.options),this},getElement:function(){return this._icon},update:function(){if(this._icon&&this._map){var t=this._map.latLngToLayerPoint(this._latlng).round();this._setPos(t)}return this},_initIcon:function(){var t=this.options,r="leaflet-zoom-"+(this._zoomAnimated?"animated":"hide"),s=t.icon.createIcon(this._icon),l=!1;s!==this._icon&&(this._icon&&this._removeIcon(),l=!0,t.title&&(s.title=t.title),s.tagName==="IMG"&&(s.alt=t.alt||"")),Q(s,r),t.keyboard&&(s.tabIndex="0",s.setAttribute("role","button")),this._icon=s,t.riseOnHover&&this.on({mouseover:this._bringToFront,mouseout:this._resetZIndex}),this.options.autoPanOnFocus&&K(s,"focus",this._panOnFocus,this);var c=t.icon.createShadow(this._shadow),h=!1;c!==this._shadow&&(this._removeShadow(),h=!0),c&&(Q(c,r),c.alt=""),this._shadow=c,t.opacity<1&&this._updateOpacity(),l&&this.getPane().appendChild(this._icon),this._initInteraction(),c&&h&&this.getPane(t.shadowPane).appendChild(this._shadow)},_removeIcon:function(){this.options.riseOnHover&&this.off({mouseover:this._bringToFront,mouseout:this._resetZIndex}),this.options.autoPanOnFocus&&ae(this._icon,"focus",this._panOnFocus,this),de(this._icon),this.removeInteractiveTarget(this._icon),this._icon=null},_removeShadow:function(){this._shadow&&de(this._shadow),this._shadow=null},_setPos:function(t){this._icon&&xe(this._icon,t),this._shadow&&xe(this._shadow,t),this._zIndex=t.y+this.options.zIndexOffset,this._resetZIndex()},_updateZIndex:function(t){this._icon&&(this._icon.style.zIndex=this._zIndex+t)},_animateZoom:function(t){var r=this._map._latLngToNewLayerPoint(this._latlng,t.zoom,t.center).round();this._setPos(r)},_initInteraction:function(){if(this.options.interactive&&(Q(this._icon,"leaflet-interactive"),this.addInteractiveTarget(this._icon),Ju)){var t=this.options.draggable;this.dragging&&(t=this.dragging.enabled(),this.dragging.disable()),this.dragging=new Ju(this),t&&this.dragging.enable()}},setOpacity:function(t){return this.options.opacity=t,this._map&&this._updateOpacity(),this},_updateOpacity:function(){var t=this.options.opacity;this._icon&&rt(this._icon,t),this._shadow&&rt(this._shadow,t)},_bringToFront:function(){this._updateZIndex(this.options.riseOffset)},_resetZIndex:function(){this._updateZIndex(0)},_panOnFocus:function(){var t=this._map;if(t){var r=this.options.icon.options,s=r.iconSize?j(r.iconSize):j(0,0),l=r.iconAnchor?j(r.iconAnchor):j(0,0);t.panInside(this._latlng,{paddingTopLeft:l,paddingBottomRight:s.subtract(l)})}},_getPopupAnchor:function(){return this.options.icon.options.popupAnchor},_getTooltipAnchor:function(){return this.options.icon.options.tooltipAnchor}});function nm(t,r){return new Ir(t,r)}var Qt=pt.extend({options:{stroke:!0,color:"#3388ff",weight:3,opacity:1,lineCap:"round",lineJoin:"round",dashArray:null,dashOffset:null,fill:!1,fillColor:null,fillOpacity:.2,fillRule:"evenodd",interactive:!0,bubblingMouseEvents:!0},beforeAdd:function(t){this._renderer=t.getRenderer(this)},onAdd:function(){this._renderer._initPath(this),this._reset(),this._renderer._addPath(this)},onRemove:function(){this._renderer._removePath(this)},redraw:function(){return this._map&&this._renderer._updatePath(this),this},setStyle:function(t){return T(this,t),this._renderer&&(this._renderer._updateStyle(this),this.options.stroke&&t&&Object.prototype.hasOwnProperty.call(t,"weight")&&this._updateBounds()),this},bringToFront:function(){return this._renderer&&this._renderer._bringToFront(this),this},bringToBack:function(){return this._renderer&&this._renderer._bringToBack(this),this},getElement:function(){return this._path},_reset:function(){this._project(),this._update()},_clickTolerance:function(){return(this.options.stroke?this.options.weight/2:0)+(this._renderer.options.tolerance||0)}}),jr=Qt.extend({options:{fill:!0,radius:10},initialize:function(t,r){T(this,r),this._latlng=G(t),this._radius=this.options.radius},setLatLng:function(t){var r=this._latlng;return this._latlng=G(t),this.redraw(),this.fire("move",{oldLatLng:r,latlng:this._latlng})},getLatLng:function(){return this._latlng},setRadius:function(t){return this.options.radius=this._radius=t,this.redraw()},getRadius:function(){return this._radius},setStyle:function(t){var r=t&&t.radius||this._radius;return Qt.prototype.setStyle.call(this,t),this.setRadius(r),this},_project:function(){this._point=this._map.latLngToLayerPoint(this._latlng),this._updateBounds()},_updateBounds:function(){var t=this._radius,r=this._radiusY||t,s=this._clickTolerance(),l=[t+s,r+s];this._pxBounds=new U(this._point.subtract(l),this._point.add(l))},_update:function(){this._map&&this._updatePath()},_updatePath:function(){this._renderer._updateCircle(this)},_empty:function(){return this._radius&&!this._renderer._bounds.intersects(this._pxBounds)},_containsPoint:function(t){return t.distanceTo(this._point)<=this._radius+this._clickTolerance()}});function im(t,r){return new jr(t,r)}var Hs=jr.extend({initialize:function(t,r,s){if(typeof r=="number"&&(r=a({},s,{radius:r})),T(this,r),this._latlng=G(t),isNaN(this.options.radius))throw new Error("Circle radius cannot be NaN");this._mRadius=this.options.radius},setRadius:function(t){return this._mRadius=t,this.redraw()},getRadius:function(){return this._mRadius},getBounds:function(){var t=[this._radius,this._radiusY||this._radius];return new Pe(this._map.layerPointToLatLng(this._point.subtract(t)),this._map.layerPointToLatLng(this._point.add(t)))},setStyle:Qt.prototype.setStyle,_project:function(){var t=this._latlng.lng,r=this._latlng.lat,s=this._map,l=s.options.crs;if(l.distance===Gt.distance){var c=Math.PI/180,h=this._mRadius/Gt.R/c,v=s.project([r+h,t]),w=s.project([r-h,t]),C=v.add(w).divideBy(2),M=s.unproject(C).lat,A=Math.acos((Math.cos(h*c)-Math.sin(r*c)*Math.sin(M*c))/(Math.cos(r*c)*Math.cos(M*c)))/c;(isNaN(A)||A===0)&&(A=h/Math.cos(Math.PI/180*r)),this._point=C.subtract(s.getPixelOrigin()),this._radius=isNaN(A)?0:C.x-s.project([M,t-A]).x,this._radiusY=C.y-v.y}else{var W=l.unproject(l.project(this._latlng).subtract([this._mRadius,0]));this._point=s.latLngToLayerPoint(this._latlng),this._radius=this._point.x-s.latLngToLayerPoint(W).x}this._updateBounds()}});function rm(t,r,s){return new Hs(t,r,s)}var It=Qt.extend({options:{smoothFactor:1,noClip:!1},initialize:function(t,r){T(this,r),this._setLatLngs(t)},getLatLngs:function(){return this._latlngs},setLatLngs:function(t){return this._setLatLngs(t),this.redraw()},isEmpty:function(){return!this._latlngs.length},closestLayerPoint:function(t){for(var r=1/0,s=null,l=Ni,c,h,v=0,w=this._parts.length;v<w;v++)for(var C=this._parts[v],M=1,A=C.length;M<A;M++){c=C[M-1],h=C[M];var W=l(t,c,h,!0);W<r&&(r=W,s=l(t,c,h))}return s&&(s.distance=Math.sqrt(r)),s},getCenter:function(){if(!this._map)throw new Error("Must add layer to map before using getCenter()");return $u(this._defaultShape(),this._map.options.crs)},getBounds:function(){return this._bounds},addLatLng:function(t,r){return r=r||this._defaultShape(),t=G(t),r.push(t),this._bounds.extend(t),this.redraw()},_setLatLngs:function(t){this._bounds=new Pe,this._latlngs=this._convertLatLngs(t)},_defaultShape:function(){return ot(this._latlngs)?this._latlngs:this._latlngs[0]},_convertLatLngs:function(t){for(var r=[],s=ot(t),l=0,c=t.length;l<c;l++)s?(r[l]=G(t[l]),this._bounds.extend(r[l])):r[l]=this._convertLatLngs(t[l]);return r},_project:function(){var t=new U;this._rings=[],this._projectLatlngs(this._latlngs,this._rings,t),this._bounds.isValid()&&t.isValid()&&(this._rawPxBounds=t,this._updateBounds())},_updateBounds:function(){var t=this._clickTolerance(),r=new z(t,t);this._rawPxBounds&&(this._pxBounds=new U([this._rawPxBounds.min.subtract(r),this._rawPxBounds.max.add(r)]))},_projectLatlngs:function(t,r,s){var l=t[0]instanceof ne,c=t.length,h,v;if(l){for(v=[],h=0;h<c;h++)v[h]=this._map.latLngToLayerPoint(t[h]),s.extend(v[h]);r.push(v)}else for(h=0;h<c;h++)this._projectLatlngs(t[h],r,s)},_clipPoints:function(){var t=this._renderer._bounds;if(this._parts=[],!(!this._pxBounds||!this._pxBounds.intersects(t))){if(this.options.noClip){this._parts=this._rings;return}var r=this._parts,s,l,c,h,v,w,C;for(s=0,c=0,h=this._rings.length;s<h;s++)for(C=this._rings[s],l=0,v=C.length;l<v-1;l++)w=Yu(C[l],C[l+1],t,l,!0),w&&(r[c]=r[c]||[],r[c].push(w[0]),(w[1]!==C[l+1]||l===v-2)&&(r[c].push(w[1]),c++))}},_simplifyPoints:function(){for(var t=this._parts,r=this.options.smoothFactor,s=0,l=t.length;s<l;s++)t[s]=Gu(t[s],r)},_update:function(){this._map&&(this._clipPoints(),this._simplifyPoints(),this._updatePath())},_updatePath:function(){this._renderer._updatePoly(this)},_containsPoint:function(t,r){var s,l,c,h,v,w,C=this._clickTolerance();if(!this._pxBounds||!this._pxBounds.contains(t))return!1;for(s=0,h=this._parts.length;s<h;s++)for(w=this._parts[s],l=0,v=w.length,c=v-1;l<v;c=l++)if(!(!r&&l===0)&&Ku(t,w[c],w[l])<=C)return!0;return!1}});function om(t,r){return new It(t,r)}It._flat=Xu;var Fn=It.extend({options:{fill:!0},isEmpty:function(){return!this._latlngs.length||!this._latlngs[0].length},getCenter:function(){if(!this._map)throw new Error("Must add layer to map before using getCenter()");return Vu(this._defaultShape(),this._map.options.crs)},_convertLatLngs:function(t){var r=It.prototype._convertLatLngs.call(this,t),s=r.length;return s>=2&&r[0]instanceof ne&&r[0].equals(r[s-1])&&r.pop(),r},_setLatLngs:function(t){It.prototype._setLatLngs.call(this,t),ot(this._latlngs)&&(this._latlngs=[this._latlngs])},_defaultShape:function(){return ot(this._latlngs[0])?this._latlngs[0]:this._latlngs[0][0]},_clipPoints:function(){var t=this._renderer._bounds,r=this.options.weight,s=new z(r,r);if(t=new U(t.min.subtract(s),t.max.add(s)),this._parts=[],!(!this._pxBounds||!this._pxBounds.intersects(t))){if(this.options.noClip){this._parts=this._rings;return}for(var l=0,c=this._rings.length,h;l<c;l++)h=Uu(this._rings[l],t,!0),h.length&&this._parts.push(h)}},_updatePath:function(){this._renderer._updatePoly(this,!0)},_containsPoint:function(t){var r=!1,s,l,c,h,v,w,C,M;if(!this._pxBounds||!this._pxBounds.contains(t))return!1;for(h=0,C=this._parts.length;h<C;h++)for(s=this._parts[h],v=0,M=s.length,w=M-1;v<M;w=v++)l=s[v],c=s[w],l.y>t.y!=c.y>t.y&&t.x<(c.x-l.x)*(t.y-l.y)/(c.y-l.y)+l.x&&(r=!r);return r||It.prototype._containsPoint.call(this,t,!0)}});function sm(t,r){return new Fn(t,r)}var jt=Ot.extend({initialize:function(t,r){T(this,r),this._layers={},t&&this.addData(t)},addData:function(t){var r=y(t)?t:t.features,s,l,c;if(r){for(s=0,l=r.length;s<l;s++)c=r[s],(c.geometries||c.geometry||c.features||c.coordinates)&&this.addData(c);return this}var h=this.options;if(h.filter&&!h.filter(t))return this;var v=Rr(t,h);return v?(v.feature=Br(t),v.defaultOptions=v.options,this.resetStyle(v),h.onEachFeature&&h.onEachFeature(t,v),this.addLayer(v)):this},resetStyle:function(t){return t===void 0?this.eachLayer(this.resetStyle,this):(t.options=a({},t.defaultOptions),this._setLayerStyle(t,this.options.style),this)},setStyle:function(t){return this.eachLayer(function(r){this._setLayerStyle(r,t)},this)},_setLayerStyle:function(t,r){t.setStyle&&(typeof r=="function"&&(r=r(t.feature)),t.setStyle(r))}});function Rr(t,r){var s=t.type==="Feature"?t.geometry:t,l=s?s.coordinates:null,c=[],h=r&&r.pointToLayer,v=r&&r.coordsToLatLng||Ws,w,C,M,A;if(!l&&!s)return null;switch(s.type){case"Point":return w=v(l),ec(h,t,w,r);case"MultiPoint":for(M=0,A=l.length;M<A;M++)w=v(l[M]),c.push(ec(h,t,w,r));return new Ot(c);case"LineString":case"MultiLineString":return C=Ar(l,s.type==="LineString"?0:1,v),new It(C,r);case"Polygon":case"MultiPolygon":return C=Ar(l,s.type==="Polygon"?1:2,v),new Fn(C,r);case"GeometryCollection":for(M=0,A=s.geometries.length;M<A;M++){var W=Rr({geometry:s.geometries[M],type:"Feature",properties:t.properties},r);W&&c.push(W)}return new Ot(c);case"FeatureCollection":for(M=0,A=s.features.length;M<A;M++){var X=Rr(s.features[M],r);X&&c.push(X)}return new Ot(c);default:throw new Error("Invalid GeoJSON object.")}}function ec(t,r,s,l){return t?t(r,s):new Ir(s,l&&l.markersInheritOptions&&l)}function Ws(t){return new ne(t[1],t[0],t[2])}function Ar(t,r,s){for(var l=[],c=0,h=t.length,v;c<h;c++)v=r?Ar(t[c],r-1,s):(s||Ws)(t[c]),l.push(v);return l}function Us(t,r){return t=G(t),t.alt!==void 0?[S(t.lng,r),S(t.lat,r),S(t.alt,r)]:[S(t.lng,r),S(t.lat,r)]}function br(t,r,s,l){for(var c=[],h=0,v=t.length;h<v;h++)c.push(r?br(t[h],ot(t[h])?0:r-1,s,l):Us(t[h],l));return!r&&s&&c.length>0&&c.push(c[0].slice()),c}function Hn(t,r){return t.feature?a({},t.feature,{geometry:r}):Br(r)}function Br(t){return t.type==="Feature"||t.type==="FeatureCollection"?t:{type:"Feature",properties:{},geometry:t}}var Vs={toGeoJSON:function(t){return Hn(this,{type:"Point",coordinates:Us(this.getLatLng(),t)})}};Ir.include(Vs),Hs.include(Vs),jr.include(Vs),It.include({toGeoJSON:function(t){var r=!ot(this._latlngs),s=br(this._latlngs,r?1:0,!1,t);return Hn(this,{type:(r?"Multi":"")+"LineString",coordinates:s})}}),Fn.include({toGeoJSON:function(t){var r=!ot(this._latlngs),s=r&&!ot(this._latlngs[0]),l=br(this._latlngs,s?2:r?1:0,!0,t);return r||(l=[l]),Hn(this,{type:(s?"Multi":"")+"Polygon",coordinates:l})}}),Dn.include({toMultiPoint:function(t){var r=[];return this.eachLayer(function(s){r.push(s.toGeoJSON(t).geometry.coordinates)}),Hn(this,{type:"MultiPoint",coordinates:r})},toGeoJSON:function(t){var r=this.feature&&this.feature.geometry&&this.feature.geometry.type;if(r==="MultiPoint")return this.toMultiPoint(t);var s=r==="GeometryCollection",l=[];return this.eachLayer(function(c){if(c.toGeoJSON){var h=c.toGeoJSON(t);if(s)l.push(h.geometry);else{var v=Br(h);v.type==="FeatureCollection"?l.push.apply(l,v.features):l.push(v)}}}),s?Hn(this,{geometries:l,type:"GeometryCollection"}):{type:"FeatureCollection",features:l}}});function tc(t,r){return new jt(t,r)}var am=tc,Dr=pt.extend({options:{opacity:1,alt:"",interactive:!1,crossOrigin:!1,errorOverlayUrl:"",zIndex:1,className:""},initialize:function(t,r,s){this._url=t,this._bounds=oe(r),T(this,s)},onAdd:function(){this._image||(this._initImage(),this.options.opacity<1&&this._updateOpacity()),this.options.interactive&&(Q(this._image,"leaflet-interactive"),this.addInteractiveTarget(this._image)),this.getPane().appendChild(this._image),this._reset()},onRemove:function(){de(this._image),this.options.interactive&&this.removeInteractiveTarget(this._image)},setOpacity:function(t){return this.options.opacity=t,this._image&&this._updateOpacity(),this},setStyle:function(t){return t.opacity&&this.setOpacity(t.opacity),this},bringToFront:function(){return this._map&&bn(this._image),this},bringToBack:function(){return this._map&&Bn(this._image),this},setUrl:function(t){return this._url=t,this._image&&(this._image.src=t),this},setBounds:function(t){return this._bounds=oe(t),this._map&&this._reset(),this},getEvents:function(){var t={zoom:this._reset,viewreset:this._reset};return this._zoomAnimated&&(t.zoomanim=this._animateZoom),t},setZIndex:function(t){return this.options.zIndex=t,this._updateZIndex(),this},getBounds:function(){return this._bounds},getElement:function(){return this._image},_initImage:function(){var t=this._url.tagName==="IMG",r=this._image=t?this._url:ie("img");if(Q(r,"leaflet-image-layer"),this._zoomAnimated&&Q(r,"leaflet-zoom-animated"),this.options.className&&Q(r,this.options.className),r.onselectstart=P,r.onmousemove=P,r.onload=f(this.fire,this,"load"),r.onerror=f(this._overlayOnError,this,"error"),(this.options.crossOrigin||this.options.crossOrigin==="")&&(r.crossOrigin=this.options.crossOrigin===!0?"":this.options.crossOrigin),this.options.zIndex&&this._updateZIndex(),t){this._url=r.src;return}r.src=this._url,r.alt=this.options.alt},_animateZoom:function(t){var r=this._map.getZoomScale(t.zoom),s=this._map._latLngBoundsToNewLayerBounds(this._bounds,t.zoom,t.center).min;vn(this._image,s,r)},_reset:function(){var t=this._image,r=new U(this._map.latLngToLayerPoint(this._bounds.getNorthWest()),this._map.latLngToLayerPoint(this._bounds.getSouthEast())),s=r.getSize();xe(t,r.min),t.style.width=s.x+"px",t.style.height=s.y+"px"},_updateOpacity:function(){rt(this._image,this.options.opacity)},_updateZIndex:function(){this._image&&this.options.zIndex!==void 0&&this.options.zIndex!==null&&(this._image.style.zIndex=this.options.zIndex)},_overlayOnError:function(){this.fire("error");var t=this.options.errorOverlayUrl;t&&this._url!==t&&(this._url=t,this._image.src=t)},getCenter:function(){return this._bounds.getCenter()}}),lm=function(t,r,s){return new Dr(t,r,s)},nc=Dr.extend({options:{autoplay:!0,loop:!0,keepAspectRatio:!0,muted:!1,playsInline:!0},_initImage:function(){var t=this._url.tagName==="VIDEO",r=this._image=t?this._url:ie("video");if(Q(r,"leaflet-image-layer"),this._zoomAnimated&&Q(r,"leaflet-zoom-animated"),this.options.className&&Q(r,this.options.className),r.onselectstart=P,r.onmousemove=P,r.onloadeddata=f(this.fire,this,"load"),t){for(var s=r.getElementsByTagName("source"),l=[],c=0;c<s.length;c++)l.push(s[c].src);this._url=s.length>0?l:[r.src];return}y(this._url)||(this._url=[this._url]),!this.options.keepAspectRatio&&Object.prototype.hasOwnProperty.call(r.style,"objectFit")&&(r.style.objectFit="fill"),r.autoplay=!!this.options.autoplay,r.loop=!!this.options.loop,r.muted=!!this.options.muted,r.playsInline=!!this.options.playsInline;for(var h=0;h<this._url.length;h++){var v=ie("source");v.src=this._url[h],r.appendChild(v)}}});function um(t,r,s){return new nc(t,r,s)}var ic=Dr.extend({_initImage:function(){var t=this._image=this._url;Q(t,"leaflet-image-layer"),this._zoomAnimated&&Q(t,"leaflet-zoom-animated"),this.options.className&&Q(t,this.options.className),t.onselectstart=P,t.onmousemove=P}});function cm(t,r,s){return new ic(t,r,s)}var Lt=pt.extend({options:{interactive:!1,offset:[0,0],className:"",pane:void 0,content:""},initialize:function(t,r){t&&(t instanceof ne||y(t))?(this._latlng=G(t),T(this,r)):(T(this,t),this._source=r),this.options.content&&(this._content=this.options.content)},openOn:function(t){return t=arguments.length?t:this._source._map,t.hasLayer(this)||t.addLayer(this),this},close:function(){return this._map&&this._map.removeLayer(this),this},toggle:function(t){return this._map?this.close():(arguments.length?this._source=t:t=this._source,this._prepareOpen(),this.openOn(t._map)),this},onAdd:function(t){this._zoomAnimated=t._zoomAnimated,this._container||this._initLayout(),t._fadeAnimated&&rt(this._container,0),clearTimeout(this._removeTimeout),this.getPane().appendChild(this._container),this.update(),t._fadeAnimated&&rt(this._container,1),this.bringToFront(),this.options.interactive&&(Q(this._container,"leaflet-interactive"),this.addInteractiveTarget(this._container))},onRemove:function(t){t._fadeAnimated?(rt(this._container,0),this._removeTimeout=setTimeout(f(de,void 0,this._container),200)):de(this._container),this.options.interactive&&(ge(this._container,"leaflet-interactive"),this.removeInteractiveTarget(this._container))},getLatLng:function(){return this._latlng},setLatLng:function(t){return this._latlng=G(t),this._map&&(this._updatePosition(),this._adjustPan()),this},getContent:function(){return this._content},setContent:function(t){return this._content=t,this.update(),this},getElement:function(){return this._container},update:function(){this._map&&(this._container.style.visibility="hidden",this._updateContent(),this._updateLayout(),this._updatePosition(),this._container.style.visibility="",this._adjustPan())},getEvents:function(){var t={zoom:this._updatePosition,viewreset:this._updatePosition};return this._zoomAnimated&&(t.zoomanim=this._animateZoom),t},isOpen:function(){return!!this._map&&this._map.hasLayer(this)},bringToFront:function(){return this._map&&bn(this._container),this},bringToBack:function(){return this._map&&Bn(this._container),this},_prepareOpen:function(t){var r=this._source;if(!r._map)return!1;if(r instanceof Ot){r=null;var s=this._source._layers;for(var l in s)if(s[l]._map){r=s[l];break}if(!r)return!1;this._source=r}if(!t)if(r.getCenter)t=r.getCenter();else if(r.getLatLng)t=r.getLatLng();else if(r.getBounds)t=r.getBounds().getCenter();else throw new Error("Unable to get source layer LatLng.");return this.setLatLng(t),this._map&&this.update(),!0},_updateContent:function(){if(this._content){var t=this._contentNode,r=typeof this._content=="function"?this._content(this._source||this):this._content;if(typeof r=="string")t.innerHTML=r;else{for(;t.hasChildNodes();)t.removeChild(t.firstChild);t.appendChild(r)}this.fire("contentupdate")}},_updatePosition:function(){if(this._map){var t=this._map.latLngToLayerPoint(this._latlng),r=j(this.options.offset),s=this._getAnchor();this._zoomAnimated?xe(this._container,t.add(s)):r=r.add(t).add(s);var l=this._containerBottom=-r.y,c=this._containerLeft=-Math.round(this._containerWidth/2)+r.x;this._container.style.bottom=l+"px",this._container.style.left=c+"px"}},_getAnchor:function(){return[0,0]}});J.include({_initOverlay:function(t,r,s,l){var c=r;return c instanceof t||(c=new t(l).setContent(r)),s&&c.setLatLng(s),c}}),pt.include({_initOverlay:function(t,r,s,l){var c=s;return c instanceof t?(T(c,l),c._source=this):(c=r&&!l?r:new t(l,this),c.setContent(s)),c}});var Zr=Lt.extend({options:{pane:"popupPane",offset:[0,7],maxWidth:300,minWidth:50,maxHeight:null,autoPan:!0,autoPanPaddingTopLeft:null,autoPanPaddingBottomRight:null,autoPanPadding:[5,5],keepInView:!1,closeButton:!0,autoClose:!0,closeOnEscapeKey:!0,className:""},openOn:function(t){return t=arguments.length?t:this._source._map,!t.hasLayer(this)&&t._popup&&t._popup.options.autoClose&&t.removeLayer(t._popup),t._popup=this,Lt.prototype.openOn.call(this,t)},onAdd:function(t){Lt.prototype.onAdd.call(this,t),t.fire("popupopen",{popup:this}),this._source&&(this._source.fire("popupopen",{popup:this},!0),this._source instanceof Qt||this._source.on("preclick",yn))},onRemove:function(t){Lt.prototype.onRemove.call(this,t),t.fire("popupclose",{popup:this}),this._source&&(this._source.fire("popupclose",{popup:this},!0),this._source instanceof Qt||this._source.off("preclick",yn))},getEvents:function(){var t=Lt.prototype.getEvents.call(this);return(this.options.closeOnClick!==void 0?this.options.closeOnClick:this._map.options.closePopupOnClick)&&(t.preclick=this.close),this.options.keepInView&&(t.moveend=this._adjustPan),t},_initLayout:function(){var t="leaflet-popup",r=this._container=ie("div",t+" "+(this.options.className||"")+" leaflet-zoom-animated"),s=this._wrapper=ie("div",t+"-content-wrapper",r);if(this._contentNode=ie("div",t+"-content",s),Ti(r),js(this._contentNode),K(r,"contextmenu",yn),this._tipContainer=ie("div",t+"-tip-container",r),this._tip=ie("div",t+"-tip",this._tipContainer),this.options.closeButton){var l=this._closeButton=ie("a",t+"-close-button",r);l.setAttribute("role","button"),l.setAttribute("aria-label","Close popup"),l.href="#close",l.innerHTML='<span aria-hidden="true">&#215;</span>',K(l,"click",function(c){Me(c),this.close()},this)}},_updateLayout:function(){var t=this._contentNode,r=t.style;r.width="",r.whiteSpace="nowrap";var s=t.offsetWidth;s=Math.min(s,this.options.maxWidth),s=Math.max(s,this.options.minWidth),r.width=s+1+"px",r.whiteSpace="",r.height="";var l=t.offsetHeight,c=this.options.maxHeight,h="leaflet-popup-scrolled";c&&l>c?(r.height=c+"px",Q(t,h)):ge(t,h),this._containerWidth=this._container.offsetWidth},_animateZoom:function(t){var r=this._map._latLngToNewLayerPoint(this._latlng,t.zoom,t.center),s=this._getAnchor();xe(this._container,r.add(s))},_adjustPan:function(){if(this.options.autoPan){if(this._map._panAnim&&this._map._panAnim.stop(),this._autopanning){this._autopanning=!1;return}var t=this._map,r=parseInt(Si(this._container,"marginBottom"),10)||0,s=this._container.offsetHeight+r,l=this._containerWidth,c=new z(this._containerLeft,-s-this._containerBottom);c._add(gn(this._container));var h=t.layerPointToContainerPoint(c),v=j(this.options.autoPanPadding),w=j(this.options.autoPanPaddingTopLeft||v),C=j(this.options.autoPanPaddingBottomRight||v),M=t.getSize(),A=0,W=0;h.x+l+C.x>M.x&&(A=h.x+l-M.x+C.x),h.x-A-w.x<0&&(A=h.x-w.x),h.y+s+C.y>M.y&&(W=h.y+s-M.y+C.y),h.y-W-w.y<0&&(W=h.y-w.y),(A||W)&&(this.options.keepInView&&(this._autopanning=!0),t.fire("autopanstart").panBy([A,W]))}},_getAnchor:function(){return j(this._source&&this._source._getPopupAnchor?this._source._getPopupAnchor():[0,0])}}),fm=function(t,r){return new Zr(t,r)};J.mergeOptions({closePopupOnClick:!0}),J.include({openPopup:function(t,r,s){return this._initOverlay(Zr,t,r,s).openOn(this),this},closePopup:function(t){return t=arguments.length?t:this._popup,t&&t.close(),this}}),pt.include({bindPopup:function(t,r){return this._popup=this._initOverlay(Zr,this._popup,t,r),this._popupHandlersAdded||(this.on({click:this._openPopup,keypress:this._onKeyPress,remove:this.closePopup,move:this._movePopup}),this._popupHandlersAdded=!0),this},unbindPopup:function(){return this._popup&&(this.off({click:this._openPopup,keypress:this._onKeyPress,remove:this.closePopup,move:this._movePopup}),this._popupHandlersAdded=!1,this._popup=null),this},openPopup:function(t){return this._popup&&(this instanceof Ot||(this._popup._source=this),this._popup._prepareOpen(t||this._latlng)&&this._popup.openOn(this._map)),this},closePopup:function(){return this._popup&&this._popup.close(),this},togglePopup:function(){return this._popup&&this._popup.toggle(this),this},isPopupOpen:function(){return this._popup?this._popup.isOpen():!1},setPopupContent:function(t){return this._popup&&this._popup.setContent(t),this},getPopup:function(){return this._popup},_openPopup:function(t){if(!(!this._popup||!this._map)){xn(t);var r=t.layer||t.target;if(this._popup._source===r&&!(r instanceof Qt)){this._map.hasLayer(this._popup)?this.closePopup():this.openPopup(t.latlng);return}this._popup._source=r,this.openPopup(t.latlng)}},_movePopup:function(t){this._popup.setLatLng(t.latlng)},_onKeyPress:function(t){t.originalEvent.keyCode===13&&this._openPopup(t)}});var Fr=Lt.extend({options:{pane:"tooltipPane",offset:[0,0],direction:"auto",permanent:!1,sticky:!1,opacity:.9},onAdd:function(t){Lt.prototype.onAdd.call(this,t),this.setOpacity(this.options.opacity),t.fire("tooltipopen",{tooltip:this}),this._source&&(this.addEventParent(this._source),this._source.fire("tooltipopen",{tooltip:this},!0))},onRemove:function(t){Lt.prototype.onRemove.call(this,t),t.fire("tooltipclose",{tooltip:this}),this._source&&(this.removeEventParent(this._source),this._source.fire("tooltipclose",{tooltip:this},!0))},getEvents:function(){var t=Lt.prototype.getEvents.call(this);return this.options.permanent||(t.preclick=this.close),t},_initLayout:function(){var t="leaflet-tooltip",r=t+" "+(this.options.className||"")+" leaflet-zoom-"+(this._zoomAnimated?"animated":"hide");this._contentNode=this._container=ie("div",r),this._container.setAttribute("role","tooltip"),this._container.setAttribute("id","leaflet-tooltip-"+p(this))},_updateLayout:function(){},_adjustPan:function(){},_setPosition:function(t){var r,s,l=this._map,c=this._container,h=l.latLngToContainerPoint(l.getCenter()),v=l.layerPointToContainerPoint(t),w=this.options.direction,C=c.offsetWidth,M=c.offsetHeight,A=j(this.options.offset),W=this._getAnchor();w==="top"?(r=C/2,s=M):w==="bottom"?(r=C/2,s=0):w==="center"?(r=C/2,s=M/2):w==="right"?(r=0,s=M/2):w==="left"?(r=C,s=M/2):v.x<h.x?(w="right",r=0,s=M/2):(w="left",r=C+(A.x+W.x)*2,s=M/2),t=t.subtract(j(r,s,!0)).add(A).add(W),ge(c,"leaflet-tooltip-right"),ge(c,"leaflet-tooltip-left"),ge(c,"leaflet-tooltip-top"),ge(c,"leaflet-tooltip-bottom"),Q(c,"leaflet-tooltip-"+w),xe(c,t)},_updatePosition:function(){var t=this._map.latLngToLayerPoint(this._latlng);this._setPosition(t)},setOpacity:function(t){this.options.opacity=t,this._container&&rt(this._container,t)},_animateZoom:function(t){var r=this._map._latLngToNewLayerPoint(this._latlng,t.zoom,t.center);this._setPosition(r)},_getAnchor:function(){return j(this._source&&this._source._getTooltipAnchor&&!this.options.sticky?this._source._getTooltipAnchor():[0,0])}}),hm=function(t,r){return new Fr(t,r)};J.include({openTooltip:function(t,r,s){return this._initOverlay(Fr,t,r,s).openOn(this),this},closeTooltip:function(t){return t.close(),this}}),pt.include({bindTooltip:function(t,r){return this._tooltip&&this.isTooltipOpen()&&this.unbindTooltip(),this._tooltip=this._initOverlay(Fr,this._tooltip,t,r),this._initTooltipInteractions(),this._tooltip.options.permanent&&this._map&&this._map.hasLayer(this)&&this.openTooltip(),this},unbindTooltip:function(){return this._tooltip&&(this._initTooltipInteractions(!0),this.closeTooltip(),this._tooltip=null),this},_initTooltipInteractions:function(t){if(!(!t&&this._tooltipHandlersAdded)){var r=t?"off":"on",s={remove:this.closeTooltip,move:this._moveTooltip};this._tooltip.options.permanent?s.add=this._openTooltip:(s.mouseover=this._openTooltip,s.mouseout=this.closeTooltip,s.click=this._openTooltip,this._map?this._addFocusListeners():s.add=this._addFocusListeners),this._tooltip.options.sticky&&(s.mousemove=this._moveTooltip),this[r](s),this._tooltipHandlersAdded=!t}},openTooltip:function(t){return this._tooltip&&(this instanceof Ot||(this._tooltip._source=this),this._tooltip._prepareOpen(t)&&(this._tooltip.openOn(this._map),this.getElement?this._setAriaDescribedByOnLayer(this):this.eachLayer&&this.eachLayer(this._setAriaDescribedByOnLayer,this))),this},closeTooltip:function(){if(this._tooltip)return this._tooltip.close()},toggleTooltip:function(){return this._tooltip&&this._tooltip.toggle(this),this},isTooltipOpen:function(){return this._tooltip.isOpen()},setTooltipContent:function(t){return this._tooltip&&this._tooltip.setContent(t),this},getTooltip:function(){return this._tooltip},_addFocusListeners:function(){this.getElement?this._addFocusListenersOnLayer(this):this.eachLayer&&this.eachLayer(this._addFocusListenersOnLayer,this)},_addFocusListenersOnLayer:function(t){var r=typeof t.getElement=="function"&&t.getElement();r&&(K(r,"focus",function(){this._tooltip._source=t,this.openTooltip()},this),K(r,"blur",this.closeTooltip,this))},_setAriaDescribedByOnLayer:function(t){var r=typeof t.getElement=="function"&&t.getElement();r&&r.setAttribute("aria-describedby",this._tooltip._container.id)},_openTooltip:function(t){if(!(!this._tooltip||!this._map)){if(this._map.dragging&&this._map.dragging.moving()&&!this._openOnceFlag){this._openOnceFlag=!0;var r=this;this._map.once("moveend",function(){r._openOnceFlag=!1,r._openTooltip(t)});return}this._tooltip._source=t.layer||t.target,this.openTooltip(this._tooltip.options.sticky?t.latlng:void 0)}},_moveTooltip:function(t){var r=t.latlng,s,l;this._tooltip.options.sticky&&t.originalEvent&&(s=this._map.mouseEventToContainerPoint(t.originalEvent),l=this._map.containerPointToLayerPoint(s),r=this._map.layerPointToLatLng(l)),this._tooltip.setLatLng(r)}});var rc=Zn.extend({options:{iconSize:[12,12],html:!1,bgPos:null,className:"leaflet-div-icon"},createIcon:function(t){var r=t&&t.tagName==="DIV"?t:document.createElement("div"),s=this.options;if(s.html instanceof Element?(Er(r),r.appendChild(s.html)):r.innerHTML=s.html!==!1?s.html:"",s.bgPos){var l=j(s.bgPos);r.style.backgroundPosition=-l.x+"px "+-l.y+"px"}return this._setIconStyles(r,"icon"),r},createShadow:function(){return null}});function dm(t){return new rc(t)}Zn.Default=Mi;var Oi=pt.extend({options:{tileSize:256,opacity:1,updateWhenIdle:F.mobile,updateWhenZooming:!0,updateInterval:200,zIndex:1,bounds:null,minZoom:0,maxZoom:void 0,maxNativeZoom:void 0,minNativeZoom:void 0,noWrap:!1,pane:"tilePane",className:"",keepBuffer:2},initialize:function(t){T(this,t)},onAdd:function(){this._initContainer(),this._levels={},this._tiles={},this._resetView()},beforeAdd:function(t){t._addZoomLimit(this)},onRemove:function(t){this._removeAllTiles(),de(this._container),t._removeZoomLimit(this),this._container=null,this._tileZoom=void 0},bringToFront:function(){return this._map&&(bn(this._container),this._setAutoZIndex(Math.max)),this},bringToBack:function(){return this._map&&(Bn(this._container),this._setAutoZIndex(Math.min)),this},getContainer:function(){return this._container},setOpacity:function(t){return this.options.opacity=t,this._updateOpacity(),this},setZIndex:function(t){return this.options.zIndex=t,this._updateZIndex(),this},isLoading:function(){return this._loading},redraw:function(){if(this._map){this._removeAllTiles();var t=this._clampZoom(this._map.getZoom());t!==this._tileZoom&&(this._tileZoom=t,this._updateLevels()),this._update()}return this},getEvents:function(){var t={viewprereset:this._invalidateAll,viewreset:this._resetView,zoom:this._resetView,moveend:this._onMoveEnd};return this.options.updateWhenIdle||(this._onMove||(this._onMove=g(this._onMoveEnd,this.options.updateInterval,this)),t.move=this._onMove),this._zoomAnimated&&(t.zoomanim=this._animateZoom),t},createTile:function(){return document.createElement("div")},getTileSize:function(){var t=this.options.tileSize;return t instanceof z?t:new z(t,t)},_updateZIndex:function(){this._container&&this.options.zIndex!==void 0&&this.options.zIndex!==null&&(this._container.style.zIndex=this.options.zIndex)},_setAutoZIndex:function(t){for(var r=this.getPane().children,s=-t(-1/0,1/0),l=0,c=r.length,h;l<c;l++)h=r[l].style.zIndex,r[l]!==this._container&&h&&(s=t(s,+h));isFinite(s)&&(this.options.zIndex=s+t(-1,1),this._updateZIndex())},_updateOpacity:function(){if(this._map&&!F.ielt9){rt(this._container,this.options.opacity);var t=+new Date,r=!1,s=!1;for(var l in this._tiles){var c=this._tiles[l];if(!(!c.current||!c.loaded)){var h=Math.min(1,(t-c.loaded)/200);rt(c.el,h),h<1?r=!0:(c.active?s=!0:this._onOpaqueTile(c),c.active=!0)}}s&&!this._noPrune&&this._pruneTiles(),r&&(Ce(this._fadeFrame),this._fadeFrame=se(this._updateOpacity,this))}},_onOpaqueTile:P,_initContainer:function(){this._container||(this._container=ie("div","leaflet-layer "+(this.options.className||"")),this._updateZIndex(),this.options.opacity<1&&this._updateOpacity(),this.getPane().appendChild(this._container))},_updateLevels:function(){var t=this._tileZoom,r=this.options.maxZoom;if(t!==void 0){for(var s in this._levels)s=Number(s),this._levels[s].el.children.length||s===t?(this._levels[s].el.style.zIndex=r-Math.abs(t-s),this._onUpdateLevel(s)):(de(this._levels[s].el),this._removeTilesAtZoom(s),this._onRemoveLevel(s),delete this._levels[s]);var l=this._levels[t],c=this._map;return l||(l=this._levels[t]={},l.el=ie("div","leaflet-tile-container leaflet-zoom-animated",this._container),l.el.style.zIndex=r,l.origin=c.project(c.unproject(c.getPixelOrigin()),t).round(),l.zoom=t,this._setZoomTransform(l,c.getCenter(),c.getZoom()),P(l.el.offsetWidth),this._onCreateLevel(l)),this._level=l,l}},_onUpdateLevel:P,_onRemoveLevel:P,_onCreateLevel:P,_pruneTiles:function(){if(this._map){var t,r,s=this._map.getZoom();if(s>this.options.maxZoom||s<this.options.minZoom){this._removeAllTiles();return}for(t in this._tiles)r=this._tiles[t],r.retain=r.current;for(t in this._tiles)if(r=this._tiles[t],r.current&&!r.active){var l=r.coords;this._retainParent(l.x,l.y,l.z,l.z-5)||this._retainChildren(l.x,l.y,l.z,l.z+2)}for(t in this._tiles)this._tiles[t].retain||this._removeTile(t)}},_removeTilesAtZoom:function(t){for(var r in this._tiles)this._tiles[r].coords.z===t&&this._removeTile(r)},_removeAllTiles:function(){for(var t in this._tiles)this._removeTile(t)},_invalidateAll:function(){for(var t in this._levels)de(this._levels[t].el),this._onRemoveLevel(Number(t)),delete this._levels[t];this._removeAllTiles(),this._tileZoom=void 0},_retainParent:function(t,r,s,l){var c=Math.floor(t/2),h=Math.floor(r/2),v=s-1,w=new z(+c,+h);w.z=+v;var C=this._tileCoordsToKey(w),M=this._tiles[C];return M&&M.active?(M.retain=!0,!0):(M&&M.loaded&&(M.retain=!0),v>l?this._retainParent(c,h,v,l):!1)},_retainChildren:function(t,r,s,l){for(var c=2*t;c<2*t+2;c++)for(var h=2*r;h<2*r+2;h++){var v=new z(c,h);v.z=s+1;var w=this._tileCoordsToKey(v),C=this._tiles[w];if(C&&C.active){C.retain=!0;continue}else C&&C.loaded&&(C.retain=!0);s+1<l&&this._retainChildren(c,h,s+1,l)}},_resetView:function(t){var r=t&&(t.pinch||t.flyTo);this._setView(this._map.getCenter(),this._map.getZoom(),r,r)},_animateZoom:function(t){this._setView(t.center,t.zoom,!0,t.noUpdate)},_clampZoom:function(t){var r=this.options;return r.minNativeZoom!==void 0&&t<r.minNativeZoom?r.minNativeZoom:r.maxNativeZoom!==void 0&&r.maxNativeZoom<t?r.maxNativeZoom:t},_setView:function(t,r,s,l){var c=Math.round(r);this.options.maxZoom!==void 0&&c>this.options.maxZoom||this.options.minZoom!==void 0&&c<this.options.minZoom?c=void 0:c=this._clampZoom(c);var h=this.options.updateWhenZooming&&c!==this._tileZoom;(!l||h)&&(this._tileZoom=c,this._abortLoading&&this._abortLoading(),this._updateLevels(),this._resetGrid(),c!==void 0&&this._update(t),s||this._pruneTiles(),this._noPrune=!!s),this._setZoomTransforms(t,r)},_setZoomTransforms:function(t,r){for(var s in this._levels)this._setZoomTransform(this._levels[s],t,r)},_setZoomTransform:function(t,r,s){var l=this._map.getZoomScale(s,t.zoom),c=t.origin.multiplyBy(l).subtract(this._map._getNewPixelOrigin(r,s)).round();F.any3d?vn(t.el,c,l):xe(t.el,c)},_resetGrid:function(){var t=this._map,r=t.options.crs,s=this._tileSize=this.getTileSize(),l=this._tileZoom,c=this._map.getPixelWorldBounds(this._tileZoom);c&&(this._globalTileRange=this._pxBoundsToTileRange(c)),this._wrapX=r.wrapLng&&!this.options.noWrap&&[Math.floor(t.project([0,r.wrapLng[0]],l).x/s.x),Math.ceil(t.project([0,r.wrapLng[1]],l).x/s.y)],this._wrapY=r.wrapLat&&!this.options.noWrap&&[Math.floor(t.project([r.wrapLat[0],0],l).y/s.x),Math.ceil(t.project([r.wrapLat[1],0],l).y/s.y)]},_onMoveEnd:function(){!this._map||this._map._animatingZoom||this._update()},_getTiledPixelBounds:function(t){var r=this._map,s=r._animatingZoom?Math.max(r._animateToZoom,r.getZoom()):r.getZoom(),l=r.getZoomScale(s,this._tileZoom),c=r.project(t,this._tileZoom).floor(),h=r.getSize().divideBy(l*2);return new U(c.subtract(h),c.add(h))},_update:function(t){var r=this._map;if(r){var s=this._clampZoom(r.getZoom());if(t===void 0&&(t=r.getCenter()),this._tileZoom!==void 0){var l=this._getTiledPixelBounds(t),c=this._pxBoundsToTileRange(l),h=c.getCenter(),v=[],w=this.options.keepBuffer,C=new U(c.getBottomLeft().subtract([w,-w]),c.getTopRight().add([w,-w]));if(!(isFinite(c.min.x)&&isFinite(c.min.y)&&isFinite(c.max.x)&&isFinite(c.max.y)))throw new Error("Attempted to load an infinite number of tiles");for(var M in this._tiles){var A=this._tiles[M].coords;(A.z!==this._tileZoom||!C.contains(new z(A.x,A.y)))&&(this._tiles[M].current=!1)}if(Math.abs(s-this._tileZoom)>1){this._setView(t,s);return}for(var W=c.min.y;W<=c.max.y;W++)for(var X=c.min.x;X<=c.max.x;X++){var De=new z(X,W);if(De.z=this._tileZoom,!!this._isValidTile(De)){var Ee=this._tiles[this._tileCoordsToKey(De)];Ee?Ee.current=!0:v.push(De)}}if(v.sort(function(Ve,Un){return Ve.distanceTo(h)-Un.distanceTo(h)}),v.length!==0){this._loading||(this._loading=!0,this.fire("loading"));var st=document.createDocumentFragment();for(X=0;X<v.length;X++)this._addTile(v[X],st);this._level.el.appendChild(st)}}}},_isValidTile:function(t){var r=this._map.options.crs;if(!r.infinite){var s=this._globalTileRange;if(!r.wrapLng&&(t.x<s.min.x||t.x>s.max.x)||!r.wrapLat&&(t.y<s.min.y||t.y>s.max.y))return!1}if(!this.options.bounds)return!0;var l=this._tileCoordsToBounds(t);return oe(this.options.bounds).overlaps(l)},_keyToBounds:function(t){return this._tileCoordsToBounds(this._keyToTileCoords(t))},_tileCoordsToNwSe:function(t){var r=this._map,s=this.getTileSize(),l=t.scaleBy(s),c=l.add(s),h=r.unproject(l,t.z),v=r.unproject(c,t.z);return[h,v]},_tileCoordsToBounds:function(t){var r=this._tileCoordsToNwSe(t),s=new Pe(r[0],r[1]);return this.options.noWrap||(s=this._map.wrapLatLngBounds(s)),s},_tileCoordsToKey:function(t){return t.x+":"+t.y+":"+t.z},_keyToTileCoords:function(t){var r=t.split(":"),s=new z(+r[0],+r[1]);return s.z=+r[2],s},_removeTile:function(t){var r=this._tiles[t];r&&(de(r.el),delete this._tiles[t],this.fire("tileunload",{tile:r.el,coords:this._keyToTileCoords(t)}))},_initTile:function(t){Q(t,"leaflet-tile");var r=this.getTileSize();t.style.width=r.x+"px",t.style.height=r.y+"px",t.onselectstart=P,t.onmousemove=P,F.ielt9&&this.options.opacity<1&&rt(t,this.options.opacity)},_addTile:function(t,r){var s=this._getTilePos(t),l=this._tileCoordsToKey(t),c=this.createTile(this._wrapCoords(t),f(this._tileReady,this,t));this._initTile(c),this.createTile.length<2&&se(f(this._tileReady,this,t,null,c)),xe(c,s),this._tiles[l]={el:c,coords:t,current:!0},r.appendChild(c),this.fire("tileloadstart",{tile:c,coords:t})},_tileReady:function(t,r,s){r&&this.fire("tileerror",{error:r,tile:s,coords:t});var l=this._tileCoordsToKey(t);s=this._tiles[l],s&&(s.loaded=+new Date,this._map._fadeAnimated?(rt(s.el,0),Ce(this._fadeFrame),this._fadeFrame=se(this._updateOpacity,this)):(s.active=!0,this._pruneTiles()),r||(Q(s.el,"leaflet-tile-loaded"),this.fire("tileload",{tile:s.el,coords:t})),this._noTilesToLoad()&&(this._loading=!1,this.fire("load"),F.ielt9||!this._map._fadeAnimated?se(this._pruneTiles,this):setTimeout(f(this._pruneTiles,this),250)))},_getTilePos:function(t){return t.scaleBy(this.getTileSize()).subtract(this._level.origin)},_wrapCoords:function(t){var r=new z(this._wrapX?k(t.x,this._wrapX):t.x,this._wrapY?k(t.y,this._wrapY):t.y);return r.z=t.z,r},_pxBoundsToTileRange:function(t){var r=this.getTileSize();return new U(t.min.unscaleBy(r).floor(),t.max.unscaleBy(r).ceil().subtract([1,1]))},_noTilesToLoad:function(){for(var t in this._tiles)if(!this._tiles[t].loaded)return!1;return!0}});function pm(t){return new Oi(t)}var Wn=Oi.extend({options:{minZoom:0,maxZoom:18,subdomains:"abc",errorTileUrl:"",zoomOffset:0,tms:!1,zoomReverse:!1,detectRetina:!1,crossOrigin:!1,referrerPolicy:!1},initialize:function(t,r){this._url=t,r=T(this,r),r.detectRetina&&F.retina&&r.maxZoom>0?(r.tileSize=Math.floor(r.tileSize/2),r.zoomReverse?(r.zoomOffset--,r.minZoom=Math.min(r.maxZoom,r.minZoom+1)):(r.zoomOffset++,r.maxZoom=Math.max(r.minZoom,r.maxZoom-1)),r.minZoom=Math.max(0,r.minZoom)):r.zoomReverse?r.minZoom=Math.min(r.maxZoom,r.minZoom):r.maxZoom=Math.max(r.minZoom,r.maxZoom),typeof r.subdomains=="string"&&(r.subdomains=r.subdomains.split("")),this.on("tileunload",this._onTileRemove)},setUrl:function(t,r){return this._url===t&&r===void 0&&(r=!0),this._url=t,r||this.redraw(),this},createTile:function(t,r){var s=document.createElement("img");return K(s,"load",f(this._tileOnLoad,this,r,s)),K(s,"error",f(this._tileOnError,this,r,s)),(this.options.crossOrigin||this.options.crossOrigin==="")&&(s.crossOrigin=this.options.crossOrigin===!0?"":this.options.crossOrigin),typeof this.options.referrerPolicy=="string"&&(s.referrerPolicy=this.options.referrerPolicy),s.alt="",s.src=this.getTileUrl(t),s},getTileUrl:function(t){var r={r:F.retina?"@2x":"",s:this._getSubdomain(t),x:t.x,y:t.y,z:this._getZoomForUrl()};if(this._map&&!this._map.options.crs.infinite){var s=this._globalTileRange.max.y-t.y;this.options.tms&&(r.y=s),r["-y"]=s}return _(this._url,a(r,this.options))},_tileOnLoad:function(t,r){F.ielt9?setTimeout(f(t,this,null,r),0):t(null,r)},_tileOnError:function(t,r,s){var l=this.options.errorTileUrl;l&&r.getAttribute("src")!==l&&(r.src=l),t(s,r)},_onTileRemove:function(t){t.tile.onload=null},_getZoomForUrl:function(){var t=this._tileZoom,r=this.options.maxZoom,s=this.options.zoomReverse,l=this.options.zoomOffset;return s&&(t=r-t),t+l},_getSubdomain:function(t){var r=Math.abs(t.x+t.y)%this.options.subdomains.length;return this.options.subdomains[r]},_abortLoading:function(){var t,r;for(t in this._tiles)if(this._tiles[t].coords.z!==this._tileZoom&&(r=this._tiles[t].el,r.onload=P,r.onerror=P,!r.complete)){r.src=R;var s=this._tiles[t].coords;de(r),delete this._tiles[t],this.fire("tileabort",{tile:r,coords:s})}},_removeTile:function(t){var r=this._tiles[t];if(r)return r.el.setAttribute("src",R),Oi.prototype._removeTile.call(this,t)},_tileReady:function(t,r,s){if(!(!this._map||s&&s.getAttribute("src")===R))return Oi.prototype._tileReady.call(this,t,r,s)}});function oc(t,r){return new Wn(t,r)}var sc=Wn.extend({defaultWmsParams:{service:"WMS",request:"GetMap",layers:"",styles:"",format:"image/jpeg",transparent:!1,version:"1.1.1"},options:{crs:null,uppercase:!1},initialize:function(t,r){this._url=t;var s=a({},this.defaultWmsParams);for(var l in r)l in this.options||(s[l]=r[l]);r=T(this,r);var c=r.detectRetina&&F.retina?2:1,h=this.getTileSize();s.width=h.x*c,s.height=h.y*c,this.wmsParams=s},onAdd:function(t){this._crs=this.options.crs||t.options.crs,this._wmsVersion=parseFloat(this.wmsParams.version);var r=this._wmsVersion>=1.3?"crs":"srs";this.wmsParams[r]=this._crs.code,Wn.prototype.onAdd.call(this,t)},getTileUrl:function(t){var r=this._tileCoordsToNwSe(t),s=this._crs,l=ee(s.project(r[0]),s.project(r[1])),c=l.min,h=l.max,v=(this._wmsVersion>=1.3&&this._crs===qu?[c.y,c.x,h.y,h.x]:[c.x,c.y,h.x,h.y]).join(","),w=Wn.prototype.getTileUrl.call(this,t);return w+q(this.wmsParams,w,this.options.uppercase)+(this.options.uppercase?"&BBOX=":"&bbox=")+v},setParams:function(t,r){return a(this.wmsParams,t),r||this.redraw(),this}});function mm(t,r){return new sc(t,r)}Wn.WMS=sc,oc.wms=mm;var Rt=pt.extend({options:{padding:.1},initialize:function(t){T(this,t),p(this),this._layers=this._layers||{}},onAdd:function(){this._container||(this._initContainer(),Q(this._container,"leaflet-zoom-animated")),this.getPane().appendChild(this._container),this._update(),this.on("update",this._updatePaths,this)},onRemove:function(){this.off("update",this._updatePaths,this),this._destroyContainer()},getEvents:function(){var t={viewreset:this._reset,zoom:this._onZoom,moveend:this._update,zoomend:this._onZoomEnd};return this._zoomAnimated&&(t.zoomanim=this._onAnimZoom),t},_onAnimZoom:function(t){this._updateTransform(t.center,t.zoom)},_onZoom:function(){this._updateTransform(this._map.getCenter(),this._map.getZoom())},_updateTransform:function(t,r){var s=this._map.getZoomScale(r,this._zoom),l=this._map.getSize().multiplyBy(.5+this.options.padding),c=this._map.project(this._center,r),h=l.multiplyBy(-s).add(c).subtract(this._map._getNewPixelOrigin(t,r));F.any3d?vn(this._container,h,s):xe(this._container,h)},_reset:function(){this._update(),this._updateTransform(this._center,this._zoom);for(var t in this._layers)this._layers[t]._reset()},_onZoomEnd:function(){for(var t in this._layers)this._layers[t]._project()},_updatePaths:function(){for(var t in this._layers)this._layers[t]._update()},_update:function(){var t=this.options.padding,r=this._map.getSize(),s=this._map.containerPointToLayerPoint(r.multiplyBy(-t)).round();this._bounds=new U(s,s.add(r.multiplyBy(1+t*2)).round()),this._center=this._map.getCenter(),this._zoom=this._map.getZoom()}}),ac=Rt.extend({options:{tolerance:0},getEvents:function(){var t=Rt.prototype.getEvents.call(this);return t.viewprereset=this._onViewPreReset,t},_onViewPreReset:function(){this._postponeUpdatePaths=!0},onAdd:function(){Rt.prototype.onAdd.call(this),this._draw()},_initContainer:function(){var t=this._container=document.createElement("canvas");K(t,"mousemove",this._onMouseMove,this),K(t,"click dblclick mousedown mouseup contextmenu",this._onClick,this),K(t,"mouseout",this._handleMouseOut,this),t._leaflet_disable_events=!0,this._ctx=t.getContext("2d")},_destroyContainer:function(){Ce(this._redrawRequest),delete this._ctx,de(this._container),ae(this._container),delete this._container},_updatePaths:function(){if(!this._postponeUpdatePaths){var t;this._redrawBounds=null;for(var r in this._layers)t=this._layers[r],t._update();this._redraw()}},_update:function(){if(!(this._map._animatingZoom&&this._bounds)){Rt.prototype._update.call(this);var t=this._bounds,r=this._container,s=t.getSize(),l=F.retina?2:1;xe(r,t.min),r.width=l*s.x,r.height=l*s.y,r.style.width=s.x+"px",r.style.height=s.y+"px",F.retina&&this._ctx.scale(2,2),this._ctx.translate(-t.min.x,-t.min.y),this.fire("update")}},_reset:function(){Rt.prototype._reset.call(this),this._postponeUpdatePaths&&(this._postponeUpdatePaths=!1,this._updatePaths())},_initPath:function(t){this._updateDashArray(t),this._layers[p(t)]=t;var r=t._order={layer:t,prev:this._drawLast,next:null};this._drawLast&&(this._drawLast.next=r),this._drawLast=r,this._drawFirst=this._drawFirst||this._drawLast},_addPath:function(t){this._requestRedraw(t)},_removePath:function(t){var r=t._order,s=r.next,l=r.prev;s?s.prev=l:this._drawLast=l,l?l.next=s:this._drawFirst=s,delete t._order,delete this._layers[p(t)],this._requestRedraw(t)},_updatePath:function(t){this._extendRedrawBounds(t),t._project(),t._update(),this._requestRedraw(t)},_updateStyle:function(t){this._updateDashArray(t),this._requestRedraw(t)},_updateDashArray:function(t){if(typeof t.options.dashArray=="string"){var r=t.options.dashArray.split(/[, ]+/),s=[],l,c;for(c=0;c<r.length;c++){if(l=Number(r[c]),isNaN(l))return;s.push(l)}t.options._dashArray=s}else t.options._dashArray=t.options.dashArray},_requestRedraw:function(t){this._map&&(this._extendRedrawBounds(t),this._redrawRequest=this._redrawRequest||se(this._redraw,this))},_extendRedrawBounds:function(t){if(t._pxBounds){var r=(t.options.weight||0)+1;this._redrawBounds=this._redrawBounds||new U,this._redrawBounds.extend(t._pxBounds.min.subtract([r,r])),this._redrawBounds.extend(t._pxBounds.max.add([r,r]))}},_redraw:function(){this._redrawRequest=null,this._redrawBounds&&(this._redrawBounds.min._floor(),this._redrawBounds.max._ceil()),this._clear(),this._draw(),this._redrawBounds=null},_clear:function(){var t=this._redrawBounds;if(t){var r=t.getSize();this._ctx.clearRect(t.min.x,t.min.y,r.x,r.y)}else this._ctx.save(),this._ctx.setTransform(1,0,0,1,0,0),this._ctx.clearRect(0,0,this._container.width,this._container.height),this._ctx.restore()},_draw:function(){var t,r=this._redrawBounds;if(this._ctx.save(),r){var s=r.getSize();this._ctx.beginPath(),this._ctx.rect(r.min.x,r.min.y,s.x,s.y),this._ctx.clip()}this._drawing=!0;for(var l=this._drawFirst;l;l=l.next)t=l.layer,(!r||t._pxBounds&&t._pxBounds.intersects(r))&&t._updatePath();this._drawing=!1,this._ctx.restore()},_updatePoly:function(t,r){if(this._drawing){var s,l,c,h,v=t._parts,w=v.length,C=this._ctx;if(w){for(C.beginPath(),s=0;s<w;s++){for(l=0,c=v[s].length;l<c;l++)h=v[s][l],C[l?"lineTo":"moveTo"](h.x,h.y);r&&C.closePath()}this._fillStroke(C,t)}}},_updateCircle:function(t){if(!(!this._drawing||t._empty())){var r=t._point,s=this._ctx,l=Math.max(Math.round(t._radius),1),c=(Math.max(Math.round(t._radiusY),1)||l)/l;c!==1&&(s.save(),s.scale(1,c)),s.beginPath(),s.arc(r.x,r.y/c,l,0,Math.PI*2,!1),c!==1&&s.restore(),this._fillStroke(s,t)}},_fillStroke:function(t,r){var s=r.options;s.fill&&(t.globalAlpha=s.fillOpacity,t.fillStyle=s.fillColor||s.color,t.fill(s.fillRule||"evenodd")),s.stroke&&s.weight!==0&&(t.setLineDash&&t.setLineDash(r.options&&r.options._dashArray||[]),t.globalAlpha=s.opacity,t.lineWidth=s.weight,t.strokeStyle=s.color,t.lineCap=s.lineCap,t.lineJoin=s.lineJoin,t.stroke())},_onClick:function(t){for(var r=this._map.mouseEventToLayerPoint(t),s,l,c=this._drawFirst;c;c=c.next)s=c.layer,s.options.interactive&&s._containsPoint(r)&&(!(t.type==="click"||t.type==="preclick")||!this._map._draggableMoved(s))&&(l=s);this._fireEvent(l?[l]:!1,t)},_onMouseMove:function(t){if(!(!this._map||this._map.dragging.moving()||this._map._animatingZoom)){var r=this._map.mouseEventToLayerPoint(t);this._handleMouseHover(t,r)}},_handleMouseOut:function(t){var r=this._hoveredLayer;r&&(ge(this._container,"leaflet-interactive"),this._fireEvent([r],t,"mouseout"),this._hoveredLayer=null,this._mouseHoverThrottled=!1)},_handleMouseHover:function(t,r){if(!this._mouseHoverThrottled){for(var s,l,c=this._drawFirst;c;c=c.next)s=c.layer,s.options.interactive&&s._containsPoint(r)&&(l=s);l!==this._hoveredLayer&&(this._handleMouseOut(t),l&&(Q(this._container,"leaflet-interactive"),this._fireEvent([l],t,"mouseover"),this._hoveredLayer=l)),this._fireEvent(this._hoveredLayer?[this._hoveredLayer]:!1,t),this._mouseHoverThrottled=!0,setTimeout(f(function(){this._mouseHoverThrottled=!1},this),32)}},_fireEvent:function(t,r,s){this._map._fireDOMEvent(r,s||r.type,t)},_bringToFront:function(t){var r=t._order;if(r){var s=r.next,l=r.prev;if(s)s.prev=l;else return;l?l.next=s:s&&(this._drawFirst=s),r.prev=this._drawLast,this._drawLast.next=r,r.next=null,this._drawLast=r,this._requestRedraw(t)}},_bringToBack:function(t){var r=t._order;if(r){var s=r.next,l=r.prev;if(l)l.next=s;else return;s?s.prev=l:l&&(this._drawLast=l),r.prev=null,r.next=this._drawFirst,this._drawFirst.prev=r,this._drawFirst=r,this._requestRedraw(t)}}});function lc(t){return F.canvas?new ac(t):null}var Ii=function(){try{return document.namespaces.add("lvml","urn:schemas-microsoft-com:vml"),function(t){return document.createElement("<lvml:"+t+' class="lvml">')}}catch{}return function(t){return document.createElement("<"+t+' xmlns="urn:schemas-microsoft.com:vml" class="lvml">')}}(),_m={_initContainer:function(){this._container=ie("div","leaflet-vml-container")},_update:function(){this._map._animatingZoom||(Rt.prototype._update.call(this),this.fire("update"))},_initPath:function(t){var r=t._container=Ii("shape");Q(r,"leaflet-vml-shape "+(this.options.className||"")),r.coordsize="1 1",t._path=Ii("path"),r.appendChild(t._path),this._updateStyle(t),this._layers[p(t)]=t},_addPath:function(t){var r=t._container;this._container.appendChild(r),t.options.interactive&&t.addInteractiveTarget(r)},_removePath:function(t){var r=t._container;de(r),t.removeInteractiveTarget(r),delete this._layers[p(t)]},_updateStyle:function(t){var r=t._stroke,s=t._fill,l=t.options,c=t._container;c.stroked=!!l.stroke,c.filled=!!l.fill,l.stroke?(r||(r=t._stroke=Ii("stroke")),c.appendChild(r),r.weight=l.weight+"px",r.color=l.color,r.opacity=l.opacity,l.dashArray?r.dashStyle=y(l.dashArray)?l.dashArray.join(" "):l.dashArray.replace(/( *, *)/g," "):r.dashStyle="",r.endcap=l.lineCap.replace("butt","flat"),r.joinstyle=l.lineJoin):r&&(c.removeChild(r),t._stroke=null),l.fill?(s||(s=t._fill=Ii("fill")),c.appendChild(s),s.color=l.fillColor||l.color,s.opacity=l.fillOpacity):s&&(c.removeChild(s),t._fill=null)},_updateCircle:function(t){var r=t._point.round(),s=Math.round(t._radius),l=Math.round(t._radiusY||s);this._setPath(t,t._empty()?"M0 0":"AL "+r.x+","+r.y+" "+s+","+l+" 0,"+65535*360)},_setPath:function(t,r){t._path.v=r},_bringToFront:function(t){bn(t._container)},_bringToBack:function(t){Bn(t._container)}},Hr=F.vml?Ii:hu,ji=Rt.extend({_initContainer:function(){this._container=Hr("svg"),this._container.setAttribute("pointer-events","none"),this._rootGroup=Hr("g"),this._container.appendChild(this._rootGroup)},_destroyContainer:function(){de(this._container),ae(this._container),delete this._container,delete this._rootGroup,delete this._svgSize},_update:function(){if(!(this._map._animatingZoom&&this._bounds)){Rt.prototype._update.call(this);var t=this._bounds,r=t.getSize(),s=this._container;(!this._svgSize||!this._svgSize.equals(r))&&(this._svgSize=r,s.setAttribute("width",r.x),s.setAttribute("height",r.y)),xe(s,t.min),s.setAttribute("viewBox",[t.min.x,t.min.y,r.x,r.y].join(" ")),this.fire("update")}},_initPath:function(t){var r=t._path=Hr("path");t.options.className&&Q(r,t.options.className),t.options.interactive&&Q(r,"leaflet-interactive"),this._updateStyle(t),this._layers[p(t)]=t},_addPath:function(t){this._rootGroup||this._initContainer(),this._rootGroup.appendChild(t._path),t.addInteractiveTarget(t._path)},_removePath:function(t){de(t._path),t.removeInteractiveTarget(t._path),delete this._layers[p(t)]},_updatePath:function(t){t._project(),t._update()},_updateStyle:function(t){var r=t._path,s=t.options;r&&(s.stroke?(r.setAttribute("stroke",s.color),r.setAttribute("stroke-opacity",s.opacity),r.setAttribute("stroke-width",s.weight),r.setAttribute("stroke-linecap",s.lineCap),r.setAttribute("stroke-linejoin",s.lineJoin),s.dashArray?r.setAttribute("stroke-dasharray",s.dashArray):r.removeAttribute("stroke-dasharray"),s.dashOffset?r.setAttribute("stroke-dashoffset",s.dashOffset):r.removeAttribute("stroke-dashoffset")):r.setAttribute("stroke","none"),s.fill?(r.setAttribute("fill",s.fillColor||s.color),r.setAttribute("fill-opacity",s.fillOpacity),r.setAttribute("fill-rule",s.fillRule||"evenodd")):r.setAttribute("fill","none"))},_updatePoly:function(t,r){this._setPath(t,du(t._parts,r))},_updateCircle:function(t){var r=t._point,s=Math.max(Math.round(t._radius),1),l=Math.max(Math.round(t._radiusY),1)||s,c="a"+s+","+l+" 0 1,0 ",h=t._empty()?"M0 0":"M"+(r.x-s)+","+r.y+c+s*2+",0 "+c+-s*2+",0 ";this._setPath(t,h)},_setPath:function(t,r){t._path.setAttribute("d",r)},_bringToFront:function(t){bn(t._path)},_bringToBack:function(t){Bn(t._path)}});F.vml&&ji.include(_m);function uc(t){return F.svg||F.vml?new ji(t):null}J.include({getRenderer:function(t){var r=t.options.renderer||this._getPaneRenderer(t.options.pane)||this.options.renderer||this._renderer;return r||(r=this._renderer=this._createRenderer()),this.hasLayer(r)||this.addLayer(r),r},_getPaneRenderer:function(t){if(t==="overlayPane"||t===void 0)return!1;var r=this._paneRenderers[t];return r===void 0&&(r=this._createRenderer({pane:t}),this._paneRenderers[t]=r),r},_createRenderer:function(t){return this.options.preferCanvas&&lc(t)||uc(t)}});var cc=Fn.extend({initialize:function(t,r){Fn.prototype.initialize.call(this,this._boundsToLatLngs(t),r)},setBounds:function(t){return this.setLatLngs(this._boundsToLatLngs(t))},_boundsToLatLngs:function(t){return t=oe(t),[t.getSouthWest(),t.getNorthWest(),t.getNorthEast(),t.getSouthEast()]}});function vm(t,r){return new cc(t,r)}ji.create=Hr,ji.pointsToPath=du,jt.geometryToLayer=Rr,jt.coordsToLatLng=Ws,jt.coordsToLatLngs=Ar,jt.latLngToCoords=Us,jt.latLngsToCoords=br,jt.getFeature=Hn,jt.asFeature=Br,J.mergeOptions({boxZoom:!0});var fc=St.extend({initialize:function(t){this._map=t,this._container=t._container,this._pane=t._panes.overlayPane,this._resetStateTimeout=0,t.on("unload",this._destroy,this)},addHooks:function(){K(this._container,"mousedown",this._onMouseDown,this)},removeHooks:function(){ae(this._container,"mousedown",this._onMouseDown,this)},moved:function(){return this._moved},_destroy:function(){de(this._pane),delete this._pane},_resetState:function(){this._resetStateTimeout=0,this._moved=!1},_clearDeferredResetState:function(){this._resetStateTimeout!==0&&(clearTimeout(this._resetStateTimeout),this._resetStateTimeout=0)},_onMouseDown:function(t){if(!t.shiftKey||t.which!==1&&t.button!==1)return!1;this._clearDeferredResetState(),this._resetState(),Li(),Cs(),this._startPoint=this._map.mouseEventToContainerPoint(t),K(document,{contextmenu:xn,mousemove:this._onMouseMove,mouseup:this._onMouseUp,keydown:this._onKeyDown},this)},_onMouseMove:function(t){this._moved||(this._moved=!0,this._box=ie("div","leaflet-zoom-box",this._container),Q(this._container,"leaflet-crosshair"),this._map.fire("boxzoomstart")),this._point=this._map.mouseEventToContainerPoint(t);var r=new U(this._point,this._startPoint),s=r.getSize();xe(this._box,r.min),this._box.style.width=s.x+"px",this._box.style.height=s.y+"px"},_finish:function(){this._moved&&(de(this._box),ge(this._container,"leaflet-crosshair")),Ci(),Es(),ae(document,{contextmenu:xn,mousemove:this._onMouseMove,mouseup:this._onMouseUp,keydown:this._onKeyDown},this)},_onMouseUp:function(t){if(!(t.which!==1&&t.button!==1)&&(this._finish(),!!this._moved)){this._clearDeferredResetState(),this._resetStateTimeout=setTimeout(f(this._resetState,this),0);var r=new Pe(this._map.containerPointToLatLng(this._startPoint),this._map.containerPointToLatLng(this._point));this._map.fitBounds(r).fire("boxzoomend",{boxZoomBounds:r})}},_onKeyDown:function(t){t.keyCode===27&&(this._finish(),this._clearDeferredResetState(),this._resetState())}});J.addInitHook("addHandler","boxZoom",fc),J.mergeOptions({doubleClickZoom:!0});var hc=St.extend({addHooks:function(){this._map.on("dblclick",this._onDoubleClick,this)},removeHooks:function(){this._map.off("dblclick",this._onDoubleClick,this)},_onDoubleClick:function(t){var r=this._map,s=r.getZoom(),l=r.options.zoomDelta,c=t.originalEvent.shiftKey?s-l:s+l;r.options.doubleClickZoom==="center"?r.setZoom(c):r.setZoomAround(t.containerPoint,c)}});J.addInitHook("addHandler","doubleClickZoom",hc),J.mergeOptions({dragging:!0,inertia:!0,inertiaDeceleration:3400,inertiaMaxSpeed:1/0,easeLinearity:.2,worldCopyJump:!1,maxBoundsViscosity:0});var dc=St.extend({addHooks:function(){if(!this._draggable){var t=this._map;this._draggable=new Kt(t._mapPane,t._container),this._draggable.on({dragstart:this._onDragStart,drag:this._onDrag,dragend:this._onDragEnd},this),this._draggable.on("predrag",this._onPreDragLimit,this),t.options.worldCopyJump&&(this._draggable.on("predrag",this._onPreDragWrap,this),t.on("zoomend",this._onZoomEnd,this),t.whenReady(this._onZoomEnd,this))}Q(this._map._container,"leaflet-grab leaflet-touch-drag"),this._draggable.enable(),this._positions=[],this._times=[]},removeHooks:function(){ge(this._map._container,"leaflet-grab"),ge(this._map._container,"leaflet-touch-drag"),this._draggable.disable()},moved:function(){return this._draggable&&this._draggable._moved},moving:function(){return this._draggable&&this._draggable._moving},_onDragStart:function(){var t=this._map;if(t._stop(),this._map.options.maxBounds&&this._map.options.maxBoundsViscosity){var r=oe(this._map.options.maxBounds);this._offsetLimit=ee(this._map.latLngToContainerPoint(r.getNorthWest()).multiplyBy(-1),this._map.latLngToContainerPoint(r.getSouthEast()).multiplyBy(-1).add(this._map.getSize())),this._viscosity=Math.min(1,Math.max(0,this._map.options.maxBoundsViscosity))}else this._offsetLimit=null;t.fire("movestart").fire("dragstart"),t.options.inertia&&(this._positions=[],this._times=[])},_onDrag:function(t){if(this._map.options.inertia){var r=this._lastTime=+new Date,s=this._lastPos=this._draggable._absPos||this._draggable._newPos;this._positions.push(s),this._times.push(r),this._prunePositions(r)}this._map.fire("move",t).fire("drag",t)},_prunePositions:function(t){for(;this._positions.length>1&&t-this._times[0]>50;)this._positions.shift(),this._times.shift()},_onZoomEnd:function(){var t=this._map.getSize().divideBy(2),r=this._map.latLngToLayerPoint([0,0]);this._initialWorldOffset=r.subtract(t).x,this._worldWidth=this._map.getPixelWorldBounds().getSize().x},_viscousLimit:function(t,r){return t-(t-r)*this._viscosity},_onPreDragLimit:function(){if(!(!this._viscosity||!this._offsetLimit)){var t=this._draggable._newPos.subtract(this._draggable._startPos),r=this._offsetLimit;t.x<r.min.x&&(t.x=this._viscousLimit(t.x,r.min.x)),t.y<r.min.y&&(t.y=this._viscousLimit(t.y,r.min.y)),t.x>r.max.x&&(t.x=this._viscousLimit(t.x,r.max.x)),t.y>r.max.y&&(t.y=this._viscousLimit(t.y,r.max.y)),this._draggable._newPos=this._draggable._startPos.add(t)}},_onPreDragWrap:function(){var t=this._worldWidth,r=Math.round(t/2),s=this._initialWorldOffset,l=this._draggable._newPos.x,c=(l-r+s)%t+r-s,h=(l+r+s)%t-r-s,v=Math.abs(c+s)<Math.abs(h+s)?c:h;this._draggable._absPos=this._draggable._newPos.clone(),this._draggable._newPos.x=v},_onDragEnd:function(t){var r=this._map,s=r.options,l=!s.inertia||t.noInertia||this._times.length<2;if(r.fire("dragend",t),l)r.fire("moveend");else{this._prunePositions(+new Date);var c=this._lastPos.subtract(this._positions[0]),h=(this._lastTime-this._times[0])/1e3,v=s.easeLinearity,w=c.multiplyBy(v/h),C=w.distanceTo([0,0]),M=Math.min(s.inertiaMaxSpeed,C),A=w.multiplyBy(M/C),W=M/(s.inertiaDeceleration*v),X=A.multiplyBy(-W/2).round();!X.x&&!X.y?r.fire("moveend"):(X=r._limitOffset(X,r.options.maxBounds),se(function(){r.panBy(X,{duration:W,easeLinearity:v,noMoveStart:!0,animate:!0})}))}}});J.addInitHook("addHandler","dragging",dc),J.mergeOptions({keyboard:!0,keyboardPanDelta:80});var pc=St.extend({keyCodes:{left:[37],right:[39],down:[40],up:[38],zoomIn:[187,107,61,171],zoomOut:[189,109,54,173]},initialize:function(t){this._map=t,this._setPanDelta(t.options.keyboardPanDelta),this._setZoomDelta(t.options.zoomDelta)},addHooks:function(){var t=this._map._container;t.tabIndex<=0&&(t.tabIndex="0"),K(t,{focus:this._onFocus,blur:this._onBlur,mousedown:this._onMouseDown},this),this._map.on({focus:this._addHooks,blur:this._removeHooks},this)},removeHooks:function(){this._removeHooks(),ae(this._map._container,{focus:this._onFocus,blur:this._onBlur,mousedown:this._onMouseDown},this),this._map.off({focus:this._addHooks,blur:this._removeHooks},this)},_onMouseDown:function(){if(!this._focused){var t=document.body,r=document.documentElement,s=t.scrollTop||r.scrollTop,l=t.scrollLeft||r.scrollLeft;this._map._container.focus(),window.scrollTo(l,s)}},_onFocus:function(){this._focused=!0,this._map.fire("focus")},_onBlur:function(){this._focused=!1,this._map.fire("blur")},_setPanDelta:function(t){var r=this._panKeys={},s=this.keyCodes,l,c;for(l=0,c=s.left.length;l<c;l++)r[s.left[l]]=[-1*t,0];for(l=0,c=s.right.length;l<c;l++)r[s.right[l]]=[t,0];for(l=0,c=s.down.length;l<c;l++)r[s.down[l]]=[0,t];for(l=0,c=s.up.length;l<c;l++)r[s.up[l]]=[0,-1*t]},_setZoomDelta:function(t){var r=this._zoomKeys={},s=this.keyCodes,l,c;for(l=0,c=s.zoomIn.length;l<c;l++)r[s.zoomIn[l]]=t;for(l=0,c=s.zoomOut.length;l<c;l++)r[s.zoomOut[l]]=-t},_addHooks:function(){K(document,"keydown",this._onKeyDown,this)},_removeHooks:function(){ae(document,"keydown",this._onKeyDown,this)},_onKeyDown:function(t){if(!(t.altKey||t.ctrlKey||t.metaKey)){var r=t.keyCode,s=this._map,l;if(r in this._panKeys){if(!s._panAnim||!s._panAnim._inProgress)if(l=this._panKeys[r],t.shiftKey&&(l=j(l).multiplyBy(3)),s.options.maxBounds&&(l=s._limitOffset(j(l),s.options.maxBounds)),s.options.worldCopyJump){var c=s.wrapLatLng(s.unproject(s.project(s.getCenter()).add(l)));s.panTo(c)}else s.panBy(l)}else if(r in this._zoomKeys)s.setZoom(s.getZoom()+(t.shiftKey?3:1)*this._zoomKeys[r]);else if(r===27&&s._popup&&s._popup.options.closeOnEscapeKey)s.closePopup();else return;xn(t)}}});J.addInitHook("addHandler","keyboard",pc),J.mergeOptions({scrollWheelZoom:!0,wheelDebounceTime:40,wheelPxPerZoomLevel:60});var mc=St.extend({addHooks:function(){K(this._map._container,"wheel",this._onWheelScroll,this),this._delta=0},removeHooks:function(){ae(this._map._container,"wheel",this._onWheelScroll,this)},_onWheelScroll:function(t){var r=Du(t),s=this._map.options.wheelDebounceTime;this._delta+=r,this._lastMousePos=this._map.mouseEventToContainerPoint(t),this._startTime||(this._startTime=+new Date);var l=Math.max(s-(+new Date-this._startTime),0);clearTimeout(this._timer),this._timer=setTimeout(f(this._performZoom,this),l),xn(t)},_performZoom:function(){var t=this._map,r=t.getZoom(),s=this._map.options.zoomSnap||0;t._stop();var l=this._delta/(this._map.options.wheelPxPerZoomLevel*4),c=4*Math.log(2/(1+Math.exp(-Math.abs(l))))/Math.LN2,h=s?Math.ceil(c/s)*s:c,v=t._limitZoom(r+(this._delta>0?h:-h))-r;this._delta=0,this._startTime=null,v&&(t.options.scrollWheelZoom==="center"?t.setZoom(r+v):t.setZoomAround(this._lastMousePos,r+v))}});J.addInitHook("addHandler","scrollWheelZoom",mc);var gm=600;J.mergeOptions({tapHold:F.touchNative&&F.safari&&F.mobile,tapTolerance:15});var _c=St.extend({addHooks:function(){K(this._map._container,"touchstart",this._onDown,this)},removeHooks:function(){ae(this._map._container,"touchstart",this._onDown,this)},_onDown:function(t){if(clearTimeout(this._holdTimeout),t.touches.length===1){var r=t.touches[0];this._startPos=this._newPos=new z(r.clientX,r.clientY),this._holdTimeout=setTimeout(f(function(){this._cancel(),this._isTapValid()&&(K(document,"touchend",Me),K(document,"touchend touchcancel",this._cancelClickPrevent),this._simulateEvent("contextmenu",r))},this),gm),K(document,"touchend touchcancel contextmenu",this._cancel,this),K(document,"touchmove",this._onMove,this)}},_cancelClickPrevent:function t(){ae(document,"touchend",Me),ae(document,"touchend touchcancel",t)},_cancel:function(){clearTimeout(this._holdTimeout),ae(document,"touchend touchcancel contextmenu",this._cancel,this),ae(document,"touchmove",this._onMove,this)},_onMove:function(t){var r=t.touches[0];this._newPos=new z(r.clientX,r.clientY)},_isTapValid:function(){return this._newPos.distanceTo(this._startPos)<=this._map.options.tapTolerance},_simulateEvent:function(t,r){var s=new MouseEvent(t,{bubbles:!0,cancelable:!0,view:window,screenX:r.screenX,screenY:r.screenY,clientX:r.clientX,clientY:r.clientY});s._simulated=!0,r.target.dispatchEvent(s)}});J.addInitHook("addHandler","tapHold",_c),J.mergeOptions({touchZoom:F.touch,bounceAtZoomLimits:!0});var vc=St.extend({addHooks:function(){Q(this._map._container,"leaflet-touch-zoom"),K(this._map._container,"touchstart",this._onTouchStart,this)},removeHooks:function(){ge(this._map._container,"leaflet-touch-zoom"),ae(this._map._container,"touchstart",this._onTouchStart,this)},_onTouchStart:function(t){var r=this._map;if(!(!t.touches||t.touches.length!==2||r._animatingZoom||this._zooming)){var s=r.mouseEventToContainerPoint(t.touches[0]),l=r.mouseEventToContainerPoint(t.touches[1]);this._centerPoint=r.getSize()._divideBy(2),this._startLatLng=r.containerPointToLatLng(this._centerPoint),r.options.touchZoom!=="center"&&(this._pinchStartLatLng=r.containerPointToLatLng(s.add(l)._divideBy(2))),this._startDist=s.distanceTo(l),this._startZoom=r.getZoom(),this._moved=!1,this._zooming=!0,r._stop(),K(document,"touchmove",this._onTouchMove,this),K(document,"touchend touchcancel",this._onTouchEnd,this),Me(t)}},_onTouchMove:function(t){if(!(!t.touches||t.touches.length!==2||!this._zooming)){var r=this._map,s=r.mouseEventToContainerPoint(t.touches[0]),l=r.mouseEventToContainerPoint(t.touches[1]),c=s.distanceTo(l)/this._startDist;if(this._zoom=r.getScaleZoom(c,this._startZoom),!r.options.bounceAtZoomLimits&&(this._zoom<r.getMinZoom()&&c<1||this._zoom>r.getMaxZoom()&&c>1)&&(this._zoom=r._limitZoom(this._zoom)),r.options.touchZoom==="center"){if(this._center=this._startLatLng,c===1)return}else{var h=s._add(l)._divideBy(2)._subtract(this._centerPoint);if(c===1&&h.x===0&&h.y===0)return;this._center=r.unproject(r.project(this._pinchStartLatLng,this._zoom).subtract(h),this._zoom)}this._moved||(r._moveStart(!0,!1),this._moved=!0),Ce(this._animRequest);var v=f(r._move,r,this._center,this._zoom,{pinch:!0,round:!1},void 0);this._animRequest=se(v,this,!0),Me(t)}},_onTouchEnd:function(){if(!this._moved||!this._zooming){this._zooming=!1;return}this._zooming=!1,Ce(this._animRequest),ae(document,"touchmove",this._onTouchMove,this),ae(document,"touchend touchcancel",this._onTouchEnd,this),this._map.options.zoomAnimation?this._map._animateZoom(this._center,this._map._limitZoom(this._zoom),!0,this._map.options.zoomSnap):this._map._resetView(this._center,this._map._limitZoom(this._zoom))}});J.addInitHook("addHandler","touchZoom",vc),J.BoxZoom=fc,J.DoubleClickZoom=hc,J.Drag=dc,J.Keyboard=pc,J.ScrollWheelZoom=mc,J.TapHold=_c,J.TouchZoom=vc,i.Bounds=U,i.Browser=F,i.CRS=Ue,i.Canvas=ac,i.Circle=Hs,i.CircleMarker=jr,i.Class=it,i.Control=dt,i.DivIcon=rc,i.DivOverlay=Lt,i.DomEvent=Ap,i.DomUtil=jp,i.Draggable=Kt,i.Evented=Mt,i.FeatureGroup=Ot,i.GeoJSON=jt,i.GridLayer=Oi,i.Handler=St,i.Icon=Zn,i.ImageOverlay=Dr,i.LatLng=ne,i.LatLngBounds=Pe,i.Layer=pt,i.LayerGroup=Dn,i.LineUtil=Yp,i.Map=J,i.Marker=Ir,i.Mixin=Wp,i.Path=Qt,i.Point=z,i.PolyUtil=Up,i.Polygon=Fn,i.Polyline=It,i.Popup=Zr,i.PosAnimation=Zu,i.Projection=Xp,i.Rectangle=cc,i.Renderer=Rt,i.SVG=ji,i.SVGOverlay=ic,i.TileLayer=Wn,i.Tooltip=Fr,i.Transformation=ps,i.Util=_n,i.VideoOverlay=nc,i.bind=f,i.bounds=ee,i.canvas=lc,i.circle=rm,i.circleMarker=im,i.control=zi,i.divIcon=dm,i.extend=a,i.featureGroup=em,i.geoJSON=tc,i.geoJson=am,i.gridLayer=pm,i.icon=tm,i.imageOverlay=lm,i.latLng=G,i.latLngBounds=oe,i.layerGroup=Jp,i.map=bp,i.marker=nm,i.point=j,i.polygon=sm,i.polyline=om,i.popup=fm,i.rectangle=vm,i.setOptions=T,i.stamp=p,i.svg=uc,i.svgOverlay=cm,i.tileLayer=oc,i.tooltip=hm,i.transformation=wi,i.version=o,i.videoOverlay=um;var ym=window.L;i.noConflict=function(){return window.L=ym,this},window.L=i})})(pl,pl.exports);var xi=pl.exports;const ep=Rf(xi);function us(e,n,i){return Object.freeze({instance:e,context:n,container:i})}function cs(e,n){return n==null?function(o,a){const u=H.useRef();return u.current||(u.current=e(o,a)),u}:function(o,a){const u=H.useRef();u.current||(u.current=e(o,a));const f=H.useRef(o),{instance:d}=u.current;return H.useEffect(function(){f.current!==o&&(n(d,o,f.current),f.current=o)},[d,o,a]),u}}function tp(e,n){H.useEffect(function(){return(n.layerContainer??n.map).addLayer(e.instance),function(){var u;(u=n.layerContainer)==null||u.removeLayer(e.instance),n.map.removeLayer(e.instance)}},[n,e])}function np(e){return function(i){const o=as(),a=e(ls(i,o),o);return Yd(o.map,i.attribution),cu(a.current,i.eventHandlers),tp(a.current,o),a}}function lg(e,n){const i=H.useRef();H.useEffect(function(){if(n.pathOptions!==i.current){const a=n.pathOptions??{};e.instance.setStyle(a),i.current=a}},[e,n])}function ug(e){return function(i){const o=as(),a=e(ls(i,o),o);return cu(a.current,i.eventHandlers),tp(a.current,o),lg(a.current,i),a}}function cg(e,n){const i=cs(e,n),o=np(i);return Jd(o)}function fg(e,n){const i=cs(e),o=ag(i,n);return og(o)}function hg(e,n){const i=cs(e,n),o=ug(i);return Jd(o)}function dg(e,n){const i=cs(e,n),o=np(i);return sg(o)}function pg(e,n,i){const{opacity:o,zIndex:a}=n;o!=null&&o!==i.opacity&&e.setOpacity(o),a!=null&&a!==i.zIndex&&e.setZIndex(a)}function ip(){return as().map}function mg(e){const n=ip();return H.useEffect(function(){return n.on(e),function(){n.off(e)}},[n,e]),n}function ml(){return ml=Object.assign||function(e){for(var n=1;n<arguments.length;n++){var i=arguments[n];for(var o in i)Object.prototype.hasOwnProperty.call(i,o)&&(e[o]=i[o])}return e},ml.apply(this,arguments)}function _g({bounds:e,boundsOptions:n,center:i,children:o,className:a,id:u,placeholder:f,style:d,whenReady:p,zoom:g,...k},P){const[S]=H.useState({className:a,id:u,style:d}),[E,O]=H.useState(null);H.useImperativeHandle(P,()=>(E==null?void 0:E.map)??null,[E]);const T=H.useCallback(x=>{if(x!==null&&E===null){const _=new xi.Map(x,k);i!=null&&g!=null?_.setView(i,g):e!=null&&_.fitBounds(e,n),p!=null&&_.whenReady(p),O(rg(_))}},[]);H.useEffect(()=>()=>{E==null||E.map.remove()},[E]);const q=E?nr.createElement(qd,{value:E},o):f??null;return nr.createElement("div",ml({},S,{ref:T}),q)}const vg=H.forwardRef(_g),Mf=cg(function({position:n,...i},o){const a=new xi.Marker(n,i);return us(a,Xd(o,{overlayContainer:a}))},function(n,i,o){i.position!==o.position&&n.setLatLng(i.position),i.icon!=null&&i.icon!==o.icon&&n.setIcon(i.icon),i.zIndexOffset!=null&&i.zIndexOffset!==o.zIndexOffset&&n.setZIndexOffset(i.zIndexOffset),i.opacity!=null&&i.opacity!==o.opacity&&n.setOpacity(i.opacity),n.dragging!=null&&i.draggable!==o.draggable&&(i.draggable===!0?n.dragging.enable():n.dragging.disable())}),Of=hg(function({positions:n,...i},o){const a=new xi.Polyline(n,i);return us(a,Xd(o,{overlayContainer:a}))},function(n,i,o){i.positions!==o.positions&&n.setLatLngs(i.positions)}),xa=fg(function(n,i){const o=new xi.Popup(n,i.overlayContainer);return us(o,i)},function(n,i,{position:o},a){H.useEffect(function(){const{instance:f}=n;function d(g){g.popup===f&&(f.update(),a(!0))}function p(g){g.popup===f&&a(!1)}return i.map.on({popupopen:d,popupclose:p}),i.overlayContainer==null?(o!=null&&f.setLatLng(o),f.openOn(i.map)):i.overlayContainer.bindPopup(f),function(){var k;i.map.off({popupopen:d,popupclose:p}),(k=i.overlayContainer)==null||k.unbindPopup(),i.map.removeLayer(f)}},[n,i,a,o])}),gg=dg(function({url:n,...i},o){const a=new xi.TileLayer(n,ls(i,o));return us(a,o)},function(n,i,o){pg(n,i,o);const{url:a}=i;a!=null&&a!==o.url&&n.setUrl(a)});ep.Icon.Default.imagePath="https://unpkg.com/leaflet@1.9.4/dist/images/";const yg=["#1A56DB","#27272A","#9333EA"],If=e=>ep.divIcon({className:"custom-div-icon",html:`<div class="rounded-full flex items-center justify-center relative ${e==="#1A56DB"?"custom-src-marker":"custom-dst-marker"}" style="background-color: ${e}; width:20px; height:20px;">
            <div class="marker-inner-dot"></div>
-         </div>`,iconSize:[20,20],iconAnchor:[10,10]});function xg({source:e,dest:n,onChangeSource:i,onChangeDest:o}){return mg({async click(a){if(e&&n)return;const u=e?"dst":"src",f=a.latlng.lat,d=a.latlng.lng;let p="Map Point";try{const k=await(await fetch(`https://nominatim.openstreetmap.org/reverse?lat=${f}&lon=${d}&format=json`)).json();p=k.address?k.address.suburb||k.address.neighbourhood||k.address.road||k.display_name.split(",")[0]:"Map Point"}catch{}u==="src"?i({lat:f,lon:d,label:p}):o({lat:f,lon:d,label:p})}}),null}function wg({routes:e,source:n,dest:i}){const o=ip();return H.useEffect(()=>{if(e.length>0){const a=[];e.forEach(u=>{u.meta.route_geometry.forEach(f=>a.push([f.lat,f.lon]))}),a.length&&o.fitBounds(a,{padding:[40,40]})}else n&&i?o.fitBounds([[n.lat,n.lon],[i.lat,i.lon]],{padding:[60,60]}):n?o.setView([n.lat,n.lon],13):i&&o.setView([i.lat,i.lon],13)},[e,n,i,o]),null}function kg({source:e,dest:n,routes:i,activeRouteIdx:o,onChangeSource:a,onChangeDest:u,onRouteSelect:f}){const[d,p]=H.useState("Click map to set start point");return H.useEffect(()=>{p(!e&&!n?"Click map to set start point":e&&!n?"Click map to set destination":null)},[e,n]),m.jsxs("div",{className:"w-full h-full relative",children:[d&&m.jsx("div",{className:"absolute bottom-8 left-1/2 -translate-x-1/2 bg-white px-6 py-3 rounded-full shadow-[var(--shadow-lg)] font-bold text-[14px] text-[var(--text-primary)] z-[1000] anim-fadeUp pointer-events-none",children:d}),m.jsxs(vg,{center:[12.9716,77.5946],zoom:12,style:{width:"100%",height:"100%"},zoomControl:!1,children:[m.jsx(gg,{attribution:"© OpenStreetMap",url:"https://{s}.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}{r}.png"}),m.jsx(xg,{source:e,dest:n,onChangeSource:a,onChangeDest:u}),m.jsx(wg,{routes:i,source:e,dest:n}),e&&m.jsx(Mf,{position:[e.lat,e.lon],icon:If("#1A56DB"),zIndexOffset:100,children:m.jsxs(xa,{children:[m.jsx("span",{className:"font-bold",children:"Start:"})," ",e.label]})}),n&&m.jsx(Mf,{position:[n.lat,n.lon],icon:If("#059669"),zIndexOffset:100,children:m.jsxs(xa,{children:[m.jsx("span",{className:"font-bold",children:"End:"})," ",n.label]})}),i.map((g,k)=>{const P=yg[k]||"#0F172A",S=g.meta.route_geometry.map(T=>[T.lat,T.lon]),E=k===o,O=g.meta.incident?`<span style="color:#DC2626;font-weight:700">⚠ ${g.meta.incident_segments} incidents</span>`:'<span style="color:#059669;font-weight:700">✓ Clear</span>';return m.jsxs(nr.Fragment,{children:[m.jsx(Of,{positions:S,pathOptions:{color:P,weight:14,opacity:E?.3:0,lineCap:"round",className:E?"animate-[routeGlow_2s_infinite]":""},zIndexOffset:E?50:10}),m.jsx(Of,{positions:S,pathOptions:{color:P,weight:E?5:3,opacity:E?1:.4,lineCap:"round"},eventHandlers:{click:()=>f(k)},zIndexOffset:E?60:20,children:m.jsx(xa,{children:m.jsxs("div",{className:"min-w-[160px] p-2",children:[m.jsxs("div",{className:"font-[800] text-[14px] uppercase flex items-center gap-1.5 mb-2",style:{color:P},children:[m.jsx("div",{className:"w-2 h-2 rounded-full bg-current"}),g.label]}),m.jsxs("div",{className:"text-[24px] font-[800] text-[var(--text-primary)] leading-none mb-2",children:[Math.round(g.eta_minutes["1_hour"].estimate)," ",m.jsx("span",{className:"text-[14px] font-bold text-[var(--text-muted)]",children:"min"})]}),m.jsxs("div",{className:"text-[13px] font-bold text-[var(--text-secondary)] flex justify-between items-center mt-2 border-t pt-2 border-[var(--border)]",children:[m.jsxs("span",{children:[g.meta.distance_km," km"]}),m.jsx("div",{dangerouslySetInnerHTML:{__html:O}})]})]})})})]},g.route_id)})]})]})}const jf="cgee_session_id";function fs(){let e=localStorage.getItem(jf);return e||(e=crypto.randomUUID(),localStorage.setItem(jf,e)),e}async function Pg(){const e=await fetch(`/trips/history?session_id=${fs()}`);return e.ok?(await e.json()).trips||[]:[]}async function Sg(){const e=await fetch(`/trips/favourites?session_id=${fs()}`);return e.ok?(await e.json()).favourites||[]:[]}async function Lg(e){await fetch(`/trips/favourites/${e}?session_id=${fs()}`,{method:"DELETE"})}const Cg=async()=>{const e=await fetch("/health");if(!e.ok)throw new Error("Offline");return await e.json()},Eg=async e=>{const n=await fetch("/predict-route-eta",{method:"POST",headers:{"Content-Type":"application/json","X-Session-ID":fs()},body:JSON.stringify(e)});if(!n.ok){const i=await n.json();throw new Error(i.detail||"Prediction failed")}return await n.json()};function Tg({pendingTrip:e}){const[n,i]=H.useState(null),[o,a]=H.useState(null),[u,f]=H.useState(new Date),[d,p]=H.useState([]),[g,k]=H.useState(0),[P,S]=H.useState(!1),[E,O]=H.useState(null);H.useEffect(()=>{e&&(i(e.source),a(e.dest),e.autoPredict&&setTimeout(()=>T(e.source,e.dest),300))},[e]);const T=async(x=n,_=o)=>{if(!(!x||!_)){S(!0),O(null);try{const y=await Eg({source:x,destination:_,departure_time:u.toISOString()});y.routes&&y.routes.length>0?(p(y.routes),k(0)):O("No routes calculated")}catch(y){O(y.message||"Failed to load routes")}finally{S(!1)}}},q=()=>{const x=n;i(o),a(x)};return d[g],m.jsxs("div",{className:"flex flex-col md:flex-row w-full h-full relative",children:[m.jsx("aside",{className:"w-full md:w-[420px] bg-[var(--bg-base)] flex flex-col z-10 border-r border-[var(--border)] anim-slideInLeft md:shadow-[2px_0_12px_rgba(0,0,0,0.02)]",children:m.jsxs("div",{className:"flex-1 overflow-y-auto p-6",children:[m.jsxs("div",{className:"flex justify-between items-center mb-4",children:[m.jsxs("h2",{className:"text-[20px] font-bold text-[var(--text-primary)] flex items-center gap-2",children:[m.jsxs("svg",{width:"22",height:"22",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2.5",children:[m.jsx("circle",{cx:"12",cy:"12",r:"10"}),m.jsx("polygon",{points:"16.24 7.76 14.12 14.12 7.76 16.24 9.88 9.88 16.24 7.76"})]}),"Plan Your Trip"]}),m.jsx("button",{className:"flex items-center gap-1.5 px-3 py-1 bg-white border border-[var(--border)] rounded-md text-[13px] font-semibold text-[var(--text-secondary)] hover:text-[var(--primary)] hover:border-[var(--primary)] transition-all",onClick:()=>{i(null),a(null),p([]),O(null),f(new Date)},children:"Reset"})]}),m.jsx("hr",{className:"border-[var(--border)] mb-6"}),m.jsx(eg,{source:n,dest:o,onChangeSource:i,onChangeDest:a,onSwap:q}),m.jsx(tg,{date:u,onChange:f,routes:d,onPredict:T}),m.jsx("button",{className:"w-full h-[52px] bg-gradient-to-br from-[var(--primary)] to-[var(--accent)] text-white font-bold rounded-lg flex items-center justify-center gap-2 mt-2 shadow-[0_4px_20px_rgba(26,86,219,0.3)] hover:-translate-y-0.5 hover:shadow-[0_6px_24px_rgba(26,86,219,0.4)] transition-all disabled:opacity-70 disabled:hover:translate-y-0",disabled:!n||!o||P,onClick:()=>T(),children:P?m.jsx("div",{className:"w-4 h-4 border-2 border-white/30 border-t-white rounded-full animate-spin"}):"Compute Intelligence"}),E&&m.jsx("div",{className:"text-[var(--danger)] text-sm font-semibold mt-4 bg-[#FEE2E2] p-3 rounded-md",children:E}),m.jsx(ng,{isLoading:P,routes:d,activeIndex:g,onChangeActive:k,source:n,dest:o})]})}),m.jsx("main",{className:"flex-1 relative z-0 h-[50vh] md:h-auto",children:m.jsx(kg,{source:n,dest:o,routes:d,activeRouteIdx:g,onChangeSource:i,onChangeDest:a,onRouteSelect:k})})]})}const zg=({onNavigateToTrip:e})=>{const[n,i]=H.useState("recent"),[o,a]=H.useState([]),[u,f]=H.useState([]),[d,p]=H.useState(!0),[g,k]=H.useState("");H.useEffect(()=>{P()},[]);const P=async()=>{p(!0);try{const[_,y]=await Promise.all([Pg(),Sg()]);a(_),f(y)}catch{console.error("Failed to load history data")}finally{p(!1)}},S=async(_,y)=>{y.stopPropagation();try{await Lg(_),f(u.filter(N=>N.id!==_))}catch{console.error("Failed to delete fav")}},E=(_,y)=>{e({lat:_.source_lat,lon:_.source_lon,label:_.source_label},{lat:_.dest_lat,lon:_.dest_lon,label:_.dest_label},y)},O=_=>{const y=new Date(_),R=new Date().getTime()-y.getTime(),B=Math.floor(R/6e4);if(B<60)return`${B||1} mins ago`;const D=Math.floor(B/60);if(D<24)return`${D} hours ago`;const Z=Math.floor(D/24);return Z===1?"Yesterday":`${Z} days ago`},T=_=>{if(!g)return _;const y=g.toLowerCase();return _.filter(N=>N.source_label&&N.source_label.toLowerCase().includes(y)||N.dest_label&&N.dest_label.toLowerCase().includes(y))},q=T(o),x=T(u);return m.jsxs("div",{className:"max-w-4xl mx-auto p-6 h-full flex flex-col",children:[m.jsxs("div",{className:"flex justify-between items-center mb-6",children:[m.jsx("h1",{className:"text-2xl font-bold text-slate-800 dark:text-white",children:"Journey History"}),m.jsx("input",{type:"text",placeholder:"Search locations...",className:"px-4 py-2 rounded-lg border border-slate-200 dark:border-slate-700 bg-white dark:bg-slate-800 text-sm focus:outline-none focus:ring-2 focus:ring-blue-500 w-64",value:g,onChange:_=>k(_.target.value)})]}),m.jsxs("div",{className:"flex space-x-4 border-b border-slate-200 dark:border-slate-700 mb-6",children:[m.jsx("button",{className:`pb-3 px-2 font-medium text-sm transition-colors ${n==="recent"?"border-b-2 border-blue-600 text-blue-600 dark:text-blue-400":"text-slate-500 hover:text-slate-700 dark:hover:text-slate-300"}`,onClick:()=>i("recent"),children:"Recent Trips"}),m.jsx("button",{className:`pb-3 px-2 font-medium text-sm transition-colors ${n==="favourites"?"border-b-2 border-blue-600 text-blue-600 dark:text-blue-400":"text-slate-500 hover:text-slate-700 dark:hover:text-slate-300"}`,onClick:()=>i("favourites"),children:"Favourites"})]}),m.jsx("div",{className:"flex-1 overflow-y-auto pr-2 space-y-4",children:d?Array.from({length:3}).map((_,y)=>m.jsx("div",{className:"animate-pulse bg-white dark:bg-slate-800 border border-slate-200 dark:border-slate-700 rounded-xl p-5 h-32"},y)):n==="recent"?q.length>0?q.map(_=>{var y;return m.jsxs("div",{className:"bg-white dark:bg-slate-800 border border-slate-200 dark:border-slate-700 rounded-xl p-5 shadow-sm hover:shadow-md transition-shadow",children:[m.jsxs("div",{className:"flex justify-between items-start mb-3",children:[m.jsxs("div",{className:"flex items-center space-x-3 text-slate-800 dark:text-white font-medium",children:[m.jsx("span",{className:"max-w-[200px] truncate",children:_.source_label||"Selected Pin"}),m.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",className:"text-slate-400",children:[m.jsx("path",{d:"M5 12h14"}),m.jsx("path",{d:"M12 5l7 7-7 7"})]}),m.jsx("span",{className:"max-w-[200px] truncate",children:_.dest_label||"Selected Pin"})]}),m.jsx("span",{className:"text-xs text-slate-500 bg-slate-100 dark:bg-slate-700 px-2 py-1 rounded-full",children:O(_.created_at)})]}),m.jsxs("div",{className:"flex space-x-6 text-sm text-slate-600 dark:text-slate-300 mb-4",children:[m.jsxs("div",{className:"flex items-center space-x-1",children:[m.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"var(--primary)",strokeWidth:"2",children:[m.jsx("circle",{cx:"12",cy:"12",r:"10"}),m.jsx("polyline",{points:"12 6 12 12 16 14"})]}),m.jsxs("span",{children:[Math.round(_.fastest_eta_minutes)," mins"]})]}),m.jsxs("div",{className:"flex items-center space-x-1",children:[m.jsx("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:m.jsx("path",{d:"M22 12h-4l-3 9L9 3l-3 9H2"})}),m.jsxs("span",{children:[(y=_.distance_km)==null?void 0:y.toFixed(1)," km"]})]}),_.incident&&m.jsxs("div",{className:"flex items-center space-x-1 text-amber-600 dark:text-amber-400",children:[m.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:[m.jsx("path",{d:"M10.29 3.86L1.82 18a2 2 0 0 0 1.71 3h16.94a2 2 0 0 0 1.71-3L13.71 3.86a2 2 0 0 0-3.42 0z"}),m.jsx("line",{x1:"12",y1:"9",x2:"12",y2:"13"}),m.jsx("line",{x1:"12",y1:"17",x2:"12.01",y2:"17"})]}),m.jsxs("span",{children:[_.incident_segments," incidents"]})]})]}),m.jsxs("div",{className:"flex space-x-3",children:[m.jsx("button",{onClick:()=>E(_,!1),className:"text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 hover:bg-slate-200 dark:hover:bg-slate-600 px-4 py-2 rounded-lg transition-colors",children:"View on Map"}),m.jsx("button",{onClick:()=>E(_,!0),className:"text-sm font-medium text-white bg-blue-600 hover:bg-blue-700 px-4 py-2 rounded-lg shadow-sm transition-colors",children:"Predict ETA"})]})]},_.id)}):m.jsx("div",{className:"text-center py-12 text-slate-500",children:"No recent trips found for this session."}):x.length>0?x.map(_=>m.jsxs("div",{className:"bg-white dark:bg-slate-800 border border-slate-200 dark:border-slate-700 rounded-xl p-5 shadow-sm hover:shadow-md transition-shadow relative",children:[m.jsxs("div",{className:"absolute top-4 right-4 flex space-x-2",children:[m.jsxs("span",{className:"text-xs font-bold text-blue-600 dark:text-blue-400 bg-blue-50 dark:bg-blue-900/30 border border-blue-200 dark:border-blue-800 px-2 py-1 rounded-full",children:[_.trip_count," trips"]}),m.jsx("button",{onClick:y=>S(_.id,y),className:"text-slate-400 hover:text-red-500 transition-colors p-1",title:"Remove from favourites",children:m.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:[m.jsx("polyline",{points:"3 6 5 6 21 6"}),m.jsx("path",{d:"M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"})]})})]}),m.jsxs("div",{className:"flex items-center space-x-3 text-slate-800 dark:text-white font-medium mb-3 pr-24",children:[m.jsx("span",{className:"max-w-[200px] truncate",children:_.source_label||"Selected Pin"}),m.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",className:"text-slate-400",children:[m.jsx("path",{d:"M5 12h14"}),m.jsx("path",{d:"M12 5l7 7-7 7"})]}),m.jsx("span",{className:"max-w-[200px] truncate",children:_.dest_label||"Selected Pin"})]}),m.jsxs("div",{className:"text-sm text-slate-600 dark:text-slate-300 mb-4",children:["Last fastest ETA: ",m.jsxs("span",{className:"font-semibold",children:[Math.round(_.last_fastest_eta)," mins"]}),m.jsx("span",{className:"mx-2 text-slate-300 dark:text-slate-600",children:"|"}),"Added ",O(_.created_at)]}),m.jsxs("div",{className:"flex space-x-3",children:[m.jsx("button",{onClick:()=>E(_,!1),className:"text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 hover:bg-slate-200 dark:hover:bg-slate-600 px-4 py-2 rounded-lg transition-colors",children:"View on Map"}),m.jsx("button",{onClick:()=>E(_,!0),className:"text-sm font-medium text-white bg-blue-600 hover:bg-blue-700 px-4 py-2 rounded-lg shadow-sm transition-colors",children:"Predict ETA"})]})]},_.id)):m.jsx("div",{className:"text-center py-12 text-slate-500",children:"No frequently travelled routes recorded yet."})})]})};function Ng(){const[e,n]=H.useState(!1),[i,o]=H.useState("dashboard"),[a,u]=H.useState(null);return H.useEffect(()=>{const f=async()=>{try{(await Cg()).engine_ready&&n(!0)}catch{console.error("Engine offline")}};f();const d=setInterval(f,3e3);return()=>clearInterval(d)},[]),m.jsxs("div",{className:"flex flex-col h-screen overflow-hidden",children:[m.jsxs("header",{className:"flex justify-between items-center px-6 py-3 bg-white/85 backdrop-blur-md border-b border-[var(--border)] z-50 shrink-0",children:[m.jsxs("div",{className:"flex items-center gap-8",children:[m.jsx("a",{href:"/",className:"text-[20px] font-[800] text-[var(--primary)] shrink-0",children:"CGEE"}),m.jsxs("nav",{className:"flex gap-4 text-sm font-semibold text-slate-600 dark:text-slate-300",children:[m.jsx("button",{onClick:()=>o("dashboard"),className:`hover:text-[var(--primary)] transition-colors ${i==="dashboard"?"text-[var(--primary)]":""}`,children:"Trip Explorer"}),m.jsx("button",{onClick:()=>o("history"),className:`hover:text-[var(--primary)] transition-colors ${i==="history"?"text-[var(--primary)]":""}`,children:"Journey History"})]})]}),m.jsxs("div",{className:"flex items-center gap-3 text-[13px] font-semibold text-[var(--text-secondary)]",children:[m.jsx("div",{className:`w-2 h-2 rounded-full ${e?"bg-[var(--success)] animate-[pulseRings_2s_infinite]":"bg-[var(--text-muted)]"}`}),e?"Engine ready":"Initializing..."]})]}),m.jsx("main",{className:"flex-1 flex overflow-hidden relative",children:i==="dashboard"?m.jsx(Tg,{pendingTrip:a}):m.jsx("div",{className:"flex-1 overflow-y-auto bg-slate-50 dark:bg-slate-900 w-full",children:m.jsx(zg,{onNavigateToTrip:(f,d,p)=>{u({source:f,dest:d,autoPredict:p}),o("dashboard")}})})})]})}wa.createRoot(document.getElementById("root")).render(m.jsx(nr.StrictMode,{children:m.jsx(Ng,{})}));
+         </div>`,iconSize:[20,20],iconAnchor:[10,10]});function xg({source:e,dest:n,onChangeSource:i,onChangeDest:o}){return mg({async click(a){if(e&&n)return;const u=e?"dst":"src",f=a.latlng.lat,d=a.latlng.lng;let p="Map Point";try{const k=await(await fetch(`https://nominatim.openstreetmap.org/reverse?lat=${f}&lon=${d}&format=json`)).json();p=k.address?k.address.suburb||k.address.neighbourhood||k.address.road||k.display_name.split(",")[0]:"Map Point"}catch{}u==="src"?i({lat:f,lon:d,label:p}):o({lat:f,lon:d,label:p})}}),null}function wg({routes:e,source:n,dest:i}){const o=ip();return H.useEffect(()=>{if(e.length>0){const a=[];e.forEach(u=>{u.meta.route_geometry.forEach(f=>a.push([f.lat,f.lon]))}),a.length&&o.fitBounds(a,{padding:[40,40]})}else n&&i?o.fitBounds([[n.lat,n.lon],[i.lat,i.lon]],{padding:[60,60]}):n?o.setView([n.lat,n.lon],13):i&&o.setView([i.lat,i.lon],13)},[e,n,i,o]),null}function kg({source:e,dest:n,routes:i,activeRouteIdx:o,onChangeSource:a,onChangeDest:u,onRouteSelect:f}){const[d,p]=H.useState("Click map to set start point");return H.useEffect(()=>{p(!e&&!n?"Click map to set start point":e&&!n?"Click map to set destination":null)},[e,n]),m.jsxs("div",{className:"w-full h-full relative",children:[d&&m.jsx("div",{className:"absolute bottom-8 left-1/2 -translate-x-1/2 bg-white px-6 py-3 rounded-full shadow-[var(--shadow-lg)] font-bold text-[14px] text-[var(--text-primary)] z-[1000] anim-fadeUp pointer-events-none",children:d}),m.jsxs(vg,{center:[12.9716,77.5946],zoom:12,style:{width:"100%",height:"100%"},zoomControl:!1,children:[m.jsx(gg,{attribution:"© OpenStreetMap",url:"https://{s}.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}{r}.png"}),m.jsx(xg,{source:e,dest:n,onChangeSource:a,onChangeDest:u}),m.jsx(wg,{routes:i,source:e,dest:n}),e&&m.jsx(Mf,{position:[e.lat,e.lon],icon:If("#1A56DB"),zIndexOffset:100,children:m.jsxs(xa,{children:[m.jsx("span",{className:"font-bold",children:"Start:"})," ",e.label]})}),n&&m.jsx(Mf,{position:[n.lat,n.lon],icon:If("#059669"),zIndexOffset:100,children:m.jsxs(xa,{children:[m.jsx("span",{className:"font-bold",children:"End:"})," ",n.label]})}),i.map((g,k)=>{const P=yg[k]||"#0F172A",S=g.meta.route_geometry.map(T=>[T.lat,T.lon]),E=k===o,O=g.meta.incident?`<span style="color:#DC2626;font-weight:700">⚠ ${g.meta.incident_segments} incidents</span>`:'<span style="color:#059669;font-weight:700">✓ Clear</span>';return m.jsxs(nr.Fragment,{children:[m.jsx(Of,{positions:S,pathOptions:{color:P,weight:14,opacity:E?.3:0,lineCap:"round",className:E?"animate-[routeGlow_2s_infinite]":""},zIndexOffset:E?50:10}),m.jsx(Of,{positions:S,pathOptions:{color:P,weight:E?5:3,opacity:E?1:.4,lineCap:"round"},eventHandlers:{click:()=>f(k)},zIndexOffset:E?60:20,children:m.jsx(xa,{children:m.jsxs("div",{className:"min-w-[160px] p-2",children:[m.jsxs("div",{className:"font-[800] text-[14px] uppercase flex items-center gap-1.5 mb-2",style:{color:P},children:[m.jsx("div",{className:"w-2 h-2 rounded-full bg-current"}),g.label]}),m.jsxs("div",{className:"text-[24px] font-[800] text-[var(--text-primary)] leading-none mb-2",children:[Math.round(g.eta_minutes["1_hour"].estimate)," ",m.jsx("span",{className:"text-[14px] font-bold text-[var(--text-muted)]",children:"min"})]}),m.jsxs("div",{className:"text-[13px] font-bold text-[var(--text-secondary)] flex justify-between items-center mt-2 border-t pt-2 border-[var(--border)]",children:[m.jsxs("span",{children:[g.meta.distance_km," km"]}),m.jsx("div",{dangerouslySetInnerHTML:{__html:O}})]})]})})})]},g.route_id)})]})]})}const jf="cgee_session_id";function fs(){let e=localStorage.getItem(jf);return e||(e=crypto.randomUUID(),localStorage.setItem(jf,e)),e}async function Pg(){const e=await fetch(`/trips/history?session_id=${fs()}`);return e.ok?(await e.json()).trips||[]:[]}async function Sg(){const e=await fetch(`/trips/favourites?session_id=${fs()}`);return e.ok?(await e.json()).favourites||[]:[]}async function Lg(e){await fetch(`/trips/favourites/${e}?session_id=${fs()}`,{method:"DELETE"})}const Cg=async()=>{const e=await fetch("/health");if(!e.ok&&e.status!==503)throw new Error("Offline");return await e.json()},Eg=async e=>{const n=await fetch("/predict-route-eta",{method:"POST",headers:{"Content-Type":"application/json","X-Session-ID":fs()},body:JSON.stringify(e)});if(!n.ok){const i=await n.json();throw new Error(i.detail||"Prediction failed")}return await n.json()};function Tg({pendingTrip:e}){const[n,i]=H.useState(null),[o,a]=H.useState(null),[u,f]=H.useState(new Date),[d,p]=H.useState([]),[g,k]=H.useState(0),[P,S]=H.useState(!1),[E,O]=H.useState(null);H.useEffect(()=>{e&&(i(e.source),a(e.dest),e.autoPredict&&setTimeout(()=>T(e.source,e.dest),300))},[e]);const T=async(x=n,_=o)=>{if(!(!x||!_)){S(!0),O(null);try{const y=await Eg({source:x,destination:_,departure_time:u.toISOString()});y.routes&&y.routes.length>0?(p(y.routes),k(0)):O("No routes calculated")}catch(y){O(y.message||"Failed to load routes")}finally{S(!1)}}},q=()=>{const x=n;i(o),a(x)};return d[g],m.jsxs("div",{className:"flex flex-col md:flex-row w-full h-full relative",children:[m.jsx("aside",{className:"w-full md:w-[420px] bg-[var(--bg-base)] flex flex-col z-10 border-r border-[var(--border)] anim-slideInLeft md:shadow-[2px_0_12px_rgba(0,0,0,0.02)]",children:m.jsxs("div",{className:"flex-1 overflow-y-auto p-6",children:[m.jsxs("div",{className:"flex justify-between items-center mb-4",children:[m.jsxs("h2",{className:"text-[20px] font-bold text-[var(--text-primary)] flex items-center gap-2",children:[m.jsxs("svg",{width:"22",height:"22",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2.5",children:[m.jsx("circle",{cx:"12",cy:"12",r:"10"}),m.jsx("polygon",{points:"16.24 7.76 14.12 14.12 7.76 16.24 9.88 9.88 16.24 7.76"})]}),"Plan Your Trip"]}),m.jsx("button",{className:"flex items-center gap-1.5 px-3 py-1 bg-white border border-[var(--border)] rounded-md text-[13px] font-semibold text-[var(--text-secondary)] hover:text-[var(--primary)] hover:border-[var(--primary)] transition-all",onClick:()=>{i(null),a(null),p([]),O(null),f(new Date)},children:"Reset"})]}),m.jsx("hr",{className:"border-[var(--border)] mb-6"}),m.jsx(eg,{source:n,dest:o,onChangeSource:i,onChangeDest:a,onSwap:q}),m.jsx(tg,{date:u,onChange:f,routes:d,onPredict:T}),m.jsx("button",{className:"w-full h-[52px] bg-gradient-to-br from-[var(--primary)] to-[var(--accent)] text-white font-bold rounded-lg flex items-center justify-center gap-2 mt-2 shadow-[0_4px_20px_rgba(26,86,219,0.3)] hover:-translate-y-0.5 hover:shadow-[0_6px_24px_rgba(26,86,219,0.4)] transition-all disabled:opacity-70 disabled:hover:translate-y-0",disabled:!n||!o||P,onClick:()=>T(),children:P?m.jsx("div",{className:"w-4 h-4 border-2 border-white/30 border-t-white rounded-full animate-spin"}):"Compute Intelligence"}),E&&m.jsx("div",{className:"text-[var(--danger)] text-sm font-semibold mt-4 bg-[#FEE2E2] p-3 rounded-md",children:E}),m.jsx(ng,{isLoading:P,routes:d,activeIndex:g,onChangeActive:k,source:n,dest:o})]})}),m.jsx("main",{className:"flex-1 relative z-0 h-[50vh] md:h-auto",children:m.jsx(kg,{source:n,dest:o,routes:d,activeRouteIdx:g,onChangeSource:i,onChangeDest:a,onRouteSelect:k})})]})}const zg=({onNavigateToTrip:e})=>{const[n,i]=H.useState("recent"),[o,a]=H.useState([]),[u,f]=H.useState([]),[d,p]=H.useState(!0),[g,k]=H.useState("");H.useEffect(()=>{P()},[]);const P=async()=>{p(!0);try{const[_,y]=await Promise.all([Pg(),Sg()]);a(_),f(y)}catch{console.error("Failed to load history data")}finally{p(!1)}},S=async(_,y)=>{y.stopPropagation();try{await Lg(_),f(u.filter(N=>N.id!==_))}catch{console.error("Failed to delete fav")}},E=(_,y)=>{e({lat:_.source_lat,lon:_.source_lon,label:_.source_label},{lat:_.dest_lat,lon:_.dest_lon,label:_.dest_label},y)},O=_=>{const y=new Date(_),R=new Date().getTime()-y.getTime(),B=Math.floor(R/6e4);if(B<60)return`${B||1} mins ago`;const D=Math.floor(B/60);if(D<24)return`${D} hours ago`;const Z=Math.floor(D/24);return Z===1?"Yesterday":`${Z} days ago`},T=_=>{if(!g)return _;const y=g.toLowerCase();return _.filter(N=>N.source_label&&N.source_label.toLowerCase().includes(y)||N.dest_label&&N.dest_label.toLowerCase().includes(y))},q=T(o),x=T(u);return m.jsxs("div",{className:"max-w-4xl mx-auto p-6 h-full flex flex-col",children:[m.jsxs("div",{className:"flex justify-between items-center mb-6",children:[m.jsx("h1",{className:"text-2xl font-bold text-slate-800 dark:text-white",children:"Journey History"}),m.jsx("input",{type:"text",placeholder:"Search locations...",className:"px-4 py-2 rounded-lg border border-slate-200 dark:border-slate-700 bg-white dark:bg-slate-800 text-sm focus:outline-none focus:ring-2 focus:ring-blue-500 w-64",value:g,onChange:_=>k(_.target.value)})]}),m.jsxs("div",{className:"flex space-x-4 border-b border-slate-200 dark:border-slate-700 mb-6",children:[m.jsx("button",{className:`pb-3 px-2 font-medium text-sm transition-colors ${n==="recent"?"border-b-2 border-blue-600 text-blue-600 dark:text-blue-400":"text-slate-500 hover:text-slate-700 dark:hover:text-slate-300"}`,onClick:()=>i("recent"),children:"Recent Trips"}),m.jsx("button",{className:`pb-3 px-2 font-medium text-sm transition-colors ${n==="favourites"?"border-b-2 border-blue-600 text-blue-600 dark:text-blue-400":"text-slate-500 hover:text-slate-700 dark:hover:text-slate-300"}`,onClick:()=>i("favourites"),children:"Favourites"})]}),m.jsx("div",{className:"flex-1 overflow-y-auto pr-2 space-y-4",children:d?Array.from({length:3}).map((_,y)=>m.jsx("div",{className:"animate-pulse bg-white dark:bg-slate-800 border border-slate-200 dark:border-slate-700 rounded-xl p-5 h-32"},y)):n==="recent"?q.length>0?q.map(_=>{var y;return m.jsxs("div",{className:"bg-white dark:bg-slate-800 border border-slate-200 dark:border-slate-700 rounded-xl p-5 shadow-sm hover:shadow-md transition-shadow",children:[m.jsxs("div",{className:"flex justify-between items-start mb-3",children:[m.jsxs("div",{className:"flex items-center space-x-3 text-slate-800 dark:text-white font-medium",children:[m.jsx("span",{className:"max-w-[200px] truncate",children:_.source_label||"Selected Pin"}),m.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",className:"text-slate-400",children:[m.jsx("path",{d:"M5 12h14"}),m.jsx("path",{d:"M12 5l7 7-7 7"})]}),m.jsx("span",{className:"max-w-[200px] truncate",children:_.dest_label||"Selected Pin"})]}),m.jsx("span",{className:"text-xs text-slate-500 bg-slate-100 dark:bg-slate-700 px-2 py-1 rounded-full",children:O(_.created_at)})]}),m.jsxs("div",{className:"flex space-x-6 text-sm text-slate-600 dark:text-slate-300 mb-4",children:[m.jsxs("div",{className:"flex items-center space-x-1",children:[m.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"var(--primary)",strokeWidth:"2",children:[m.jsx("circle",{cx:"12",cy:"12",r:"10"}),m.jsx("polyline",{points:"12 6 12 12 16 14"})]}),m.jsxs("span",{children:[Math.round(_.fastest_eta_minutes)," mins"]})]}),m.jsxs("div",{className:"flex items-center space-x-1",children:[m.jsx("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:m.jsx("path",{d:"M22 12h-4l-3 9L9 3l-3 9H2"})}),m.jsxs("span",{children:[(y=_.distance_km)==null?void 0:y.toFixed(1)," km"]})]}),_.incident&&m.jsxs("div",{className:"flex items-center space-x-1 text-amber-600 dark:text-amber-400",children:[m.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:[m.jsx("path",{d:"M10.29 3.86L1.82 18a2 2 0 0 0 1.71 3h16.94a2 2 0 0 0 1.71-3L13.71 3.86a2 2 0 0 0-3.42 0z"}),m.jsx("line",{x1:"12",y1:"9",x2:"12",y2:"13"}),m.jsx("line",{x1:"12",y1:"17",x2:"12.01",y2:"17"})]}),m.jsxs("span",{children:[_.incident_segments," incidents"]})]})]}),m.jsxs("div",{className:"flex space-x-3",children:[m.jsx("button",{onClick:()=>E(_,!1),className:"text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 hover:bg-slate-200 dark:hover:bg-slate-600 px-4 py-2 rounded-lg transition-colors",children:"View on Map"}),m.jsx("button",{onClick:()=>E(_,!0),className:"text-sm font-medium text-white bg-blue-600 hover:bg-blue-700 px-4 py-2 rounded-lg shadow-sm transition-colors",children:"Predict ETA"})]})]},_.id)}):m.jsx("div",{className:"text-center py-12 text-slate-500",children:"No recent trips found for this session."}):x.length>0?x.map(_=>m.jsxs("div",{className:"bg-white dark:bg-slate-800 border border-slate-200 dark:border-slate-700 rounded-xl p-5 shadow-sm hover:shadow-md transition-shadow relative",children:[m.jsxs("div",{className:"absolute top-4 right-4 flex space-x-2",children:[m.jsxs("span",{className:"text-xs font-bold text-blue-600 dark:text-blue-400 bg-blue-50 dark:bg-blue-900/30 border border-blue-200 dark:border-blue-800 px-2 py-1 rounded-full",children:[_.trip_count," trips"]}),m.jsx("button",{onClick:y=>S(_.id,y),className:"text-slate-400 hover:text-red-500 transition-colors p-1",title:"Remove from favourites",children:m.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:[m.jsx("polyline",{points:"3 6 5 6 21 6"}),m.jsx("path",{d:"M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"})]})})]}),m.jsxs("div",{className:"flex items-center space-x-3 text-slate-800 dark:text-white font-medium mb-3 pr-24",children:[m.jsx("span",{className:"max-w-[200px] truncate",children:_.source_label||"Selected Pin"}),m.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",className:"text-slate-400",children:[m.jsx("path",{d:"M5 12h14"}),m.jsx("path",{d:"M12 5l7 7-7 7"})]}),m.jsx("span",{className:"max-w-[200px] truncate",children:_.dest_label||"Selected Pin"})]}),m.jsxs("div",{className:"text-sm text-slate-600 dark:text-slate-300 mb-4",children:["Last fastest ETA: ",m.jsxs("span",{className:"font-semibold",children:[Math.round(_.last_fastest_eta)," mins"]}),m.jsx("span",{className:"mx-2 text-slate-300 dark:text-slate-600",children:"|"}),"Added ",O(_.created_at)]}),m.jsxs("div",{className:"flex space-x-3",children:[m.jsx("button",{onClick:()=>E(_,!1),className:"text-sm font-medium text-slate-600 dark:text-slate-300 bg-slate-100 dark:bg-slate-700 hover:bg-slate-200 dark:hover:bg-slate-600 px-4 py-2 rounded-lg transition-colors",children:"View on Map"}),m.jsx("button",{onClick:()=>E(_,!0),className:"text-sm font-medium text-white bg-blue-600 hover:bg-blue-700 px-4 py-2 rounded-lg shadow-sm transition-colors",children:"Predict ETA"})]})]},_.id)):m.jsx("div",{className:"text-center py-12 text-slate-500",children:"No frequently travelled routes recorded yet."})})]})};function Ng(){const[e,n]=H.useState(!1),[i,o]=H.useState("dashboard"),[a,u]=H.useState(null);return H.useEffect(()=>{const f=async()=>{try{(await Cg()).engine_ready&&n(!0)}catch{console.error("Engine offline")}};f();const d=setInterval(f,3e3);return()=>clearInterval(d)},[]),m.jsxs("div",{className:"flex flex-col h-screen overflow-hidden",children:[m.jsxs("header",{className:"flex justify-between items-center px-6 py-3 bg-white/85 backdrop-blur-md border-b border-[var(--border)] z-50 shrink-0",children:[m.jsxs("div",{className:"flex items-center gap-8",children:[m.jsx("a",{href:"/",className:"text-[20px] font-[800] text-[var(--primary)] shrink-0",children:"CGEE"}),m.jsxs("nav",{className:"flex gap-4 text-sm font-semibold text-slate-600 dark:text-slate-300",children:[m.jsx("button",{onClick:()=>o("dashboard"),className:`hover:text-[var(--primary)] transition-colors ${i==="dashboard"?"text-[var(--primary)]":""}`,children:"Trip Explorer"}),m.jsx("button",{onClick:()=>o("history"),className:`hover:text-[var(--primary)] transition-colors ${i==="history"?"text-[var(--primary)]":""}`,children:"Journey History"})]})]}),m.jsxs("div",{className:"flex items-center gap-3 text-[13px] font-semibold text-[var(--text-secondary)]",children:[m.jsx("div",{className:`w-2 h-2 rounded-full ${e?"bg-[var(--success)] animate-[pulseRings_2s_infinite]":"bg-[var(--text-muted)]"}`}),e?"Engine ready":"Initializing..."]})]}),m.jsx("main",{className:"flex-1 flex overflow-hidden relative",children:i==="dashboard"?m.jsx(Tg,{pendingTrip:a}):m.jsx("div",{className:"flex-1 overflow-y-auto bg-slate-50 dark:bg-slate-900 w-full",children:m.jsx(zg,{onNavigateToTrip:(f,d,p)=>{u({source:f,dest:d,autoPredict:p}),o("dashboard")}})})})]})}wa.createRoot(document.getElementById("root")).render(m.jsx(nr.StrictMode,{children:m.jsx(Ng,{})}));
@@ -0,0 +1,66 @@
+# tests/conftest.py
+"""
+Engine-level fixtures: the routing engine initialised on the synthetic
+road grid from src/routing/conftest.py, with small XGBoost horizon models
+trained on synthetic speeds, so no graph, snapshot or model files are read.
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.common.features import build_features_batch  # noqa: E402
+from src.routing.compiled_graph import compile_graph  # noqa: E402
+from src.routing.conftest import make_road_graph  # noqa: E402
+
+GRID_CENTRE = (12.99, 77.61)   # inside make_road_graph()'s grid
+
+
+def feature_rows(n, seed):
+    """Random model inputs and a speed target that depends on all of them."""
+    rng = np.random.default_rng(seed)
+    hour = rng.integers(0, 24, size=n)
+    severity = np.where(rng.random(n) < 0.3, rng.uniform(0.1, 0.9, size=n), 0.0)
+    X = build_features_batch(
+        speed_lag_1=rng.uniform(5.0, 90.0, size=n),
+        hour=hour,
+        is_peak=(7 <= hour) & (hour <= 10) | (17 <= hour) & (hour <= 21),
+        incident_flag=severity > 0,
+        incident_severity=severity,
+    )
+    y = X[:, 0] * (1.0 - 0.5 * X[:, 6]) + 3.0 * X[:, 2] + rng.normal(0, 2.0, size=n)
+    return X, y
+
+
+@pytest.fixture(scope="session")
+def speed_models():
+    """{horizon: XGBRegressor} for every horizon the engine serves."""
+    xgb = pytest.importorskip("xgboost")
+    from src.routing.route_eta import HORIZON_CONFIG
+
+    models = {}
+    for i, horizon in enumerate(HORIZON_CONFIG):
+        X, y = feature_rows(2000, seed=i)
+        models[horizon] = xgb.XGBRegressor(n_estimators=40, max_depth=4, learning_rate=0.15,
+                                           n_jobs=1).fit(X, y)
+    return models
+
+
+@pytest.fixture(scope="session")
+def engine(speed_models):
+    """src.routing.route_eta, initialised and warm."""
+    import src.routing.route_eta as eng
+
+    cg = compile_graph(make_road_graph())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(eng, "load_compiled_graph", lambda require_networkx=False: (None, cg))
+        mp.setattr(eng, "load_active_models", lambda: (dict(speed_models), {"version": "test"}))
+        mp.setattr(eng, "WARMUP_OD_PAIRS", [("grid", GRID_CENTRE, (12.975, 77.595))])
+        eng.initialize_engine()
+        assert eng.is_engine_ready(), eng.get_init_error()
+        yield eng
+        eng._reset_engine()
+        eng.ROUTE_CACHE.clear()
@@ -0,0 +1,47 @@
+# tests/test_batch.py
+"""compute_route_eta_batch(): request order kept, repeated node pairs routed once."""
+A, B = {"lat": 12.972, "lon": 77.592}, {"lat": 13.004, "lon": 77.626}
+C, D = {"lat": 12.985, "lon": 77.620}, {"lat": 12.975, "lon": 77.600}
+A_NEAR = {"lat": A["lat"] + 0.00002, "lon": A["lon"] - 0.00002}   # snaps to A's node
+
+
+def eta(result):
+    return [route["eta_minutes"] for route in result["routes"]]
+
+
+def test_order_and_dedupe(engine, monkeypatch):
+    calls = []
+    extract_routes = engine._extract_routes
+
+    def counting(orig, dest, *args, **kwargs):
+        calls.append((orig, dest))
+        return extract_routes(orig, dest, *args, **kwargs)
+
+    monkeypatch.setattr(engine, "_extract_routes", counting)
+    pairs = [(A, B), (C, D), (A, B), (B, A), (A_NEAR, B)]
+    results = engine.compute_route_eta_batch(pairs, seed=1)
+
+    assert len(results) == len(pairs)
+    for (source, destination), result in zip(pairs, results):
+        geometry = result["routes"][0]["meta"]["route_geometry"]
+        assert geometry[0] == source and geometry[-1] == destination
+    # three distinct snapped pairs: (A, B) and its repeats share one search and result
+    assert len(calls) == len(set(calls)) == 3
+    assert eta(results[0]) == eta(results[2]) == eta(results[4])
+    assert results[4]["routes"][0]["meta"]["route_geometry"][0] == A_NEAR
+
+
+def test_unroutable_item_keeps_its_slot(engine, monkeypatch):
+    extract_routes = engine._extract_routes
+    unroutable = tuple(engine.SPATIAL_INDEX.snap([C["lat"], D["lat"]], [C["lon"], D["lon"]]).tolist())
+
+    def failing(orig, dest, *args, **kwargs):
+        if (orig, dest) == unroutable:
+            raise ValueError("No path found between selected locations.")
+        return extract_routes(orig, dest, *args, **kwargs)
+
+    monkeypatch.setattr(engine, "_extract_routes", failing)
+    results = engine.compute_route_eta_batch([(A, B), (C, D), (B, A)], seed=1, k=1)
+    assert [("error" in r) for r in results] == [False, True, False]
+    assert results[1] == {"error": "No path found between selected locations."}
+    assert all(len(r["routes"]) == 1 for r in (results[0], results[2]))
@@ -0,0 +1,46 @@
+# tests/test_features.py
+"""build_features_batch() builds, row for row, what build_features() builds."""
+import numpy as np
+import pandas as pd
+
+from src.common.features import FEATURE_COLS, build_features, build_features_batch
+
+
+def reference_row(speed_lag_1, hour, is_peak, incident_flag, incident_severity):
+    """The original one-row DataFrame construction."""
+    return pd.DataFrame([{
+        "speed_lag_1": speed_lag_1,
+        "hour": hour,
+        "hour_sin": np.sin(2 * np.pi * hour / 24),
+        "hour_cos": np.cos(2 * np.pi * hour / 24),
+        "is_peak": is_peak,
+        "incident_flag": incident_flag,
+        "incident_severity": incident_severity,
+    }])
+
+
+def test_batch_matches_per_row_features():
+    rng = np.random.default_rng(0)
+    n = 500
+    speed = rng.uniform(0.0, 120.0, n)
+    hour = rng.integers(0, 24, n)
+    is_peak = rng.integers(0, 2, n)
+    severity = np.where(rng.random(n) < 0.4, rng.uniform(0.05, 0.9, n), 0.0)
+    flag = (severity > 0).astype(int)
+
+    X = build_features_batch(speed, hour, is_peak, flag, severity)
+    assert X.shape == (n, len(FEATURE_COLS)) and X.dtype == np.float32
+    assert X.flags.c_contiguous
+    for i in range(n):
+        args = (float(speed[i]), int(hour[i]), int(is_peak[i]), int(flag[i]), float(severity[i]))
+        row = build_features(*args)
+        assert list(row.columns) == FEATURE_COLS
+        np.testing.assert_array_equal(X[i], row.to_numpy()[0])
+        # float32 is what XGBoost scores, so the original float64 row agrees once cast
+        np.testing.assert_array_equal(X[i], reference_row(*args)[FEATURE_COLS].to_numpy(np.float32)[0])
+
+
+def test_scalars_broadcast():
+    X = build_features_batch(np.array([30.0, 40.0, 50.0]), 8, 1, False, 0.0)
+    np.testing.assert_array_equal(X[:, FEATURE_COLS.index("hour")], [8, 8, 8])
+    np.testing.assert_array_equal(X[:, FEATURE_COLS.index("speed_lag_1")], [30, 40, 50])
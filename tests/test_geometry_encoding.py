@@ -0,0 +1,51 @@
+# tests/test_geometry_encoding.py
+"""Encoded route geometry decodes back to the points, to 1e-5 degrees."""
+import numpy as np
+import pytest
+
+from src.common.geometry import (
+    GEOMETRY_PRECISION, decode_delta, decode_polyline, encode_delta, encode_geometry, encode_polyline,
+)
+
+
+def random_route(n, seed):
+    rng = np.random.default_rng(seed)
+    lat = 12.97 + np.cumsum(rng.normal(0, 0.0008, n))
+    lon = 77.59 + np.cumsum(rng.normal(0, 0.0008, n))
+    return [{"lat": a, "lon": b} for a, b in zip(lat.tolist(), lon.tolist())]
+
+
+def assert_close(decoded, points):
+    assert len(decoded) == len(points)
+    got = np.array([(p["lat"], p["lon"]) for p in decoded])
+    want = np.array([(p["lat"], p["lon"]) for p in points])
+    np.testing.assert_allclose(got, want, rtol=0, atol=0.5 * 10 ** -GEOMETRY_PRECISION + 1e-12)
+
+
+@pytest.mark.parametrize("encode,decode", [(encode_polyline, decode_polyline),
+                                           (encode_delta, decode_delta)])
+def test_roundtrip(encode, decode):
+    for seed in range(5):
+        points = random_route(300, seed)
+        assert_close(decode(encode(points)), points)
+        # decoding is exact on already-rounded coordinates
+        rounded = decode(encode(points))
+        assert decode(encode(rounded)) == rounded
+
+
+def test_polyline_reference_encoding():
+    # the worked example from Google's polyline algorithm documentation
+    points = [{"lat": 38.5, "lon": -120.2}, {"lat": 40.7, "lon": -120.95},
+              {"lat": 43.252, "lon": -126.453}]
+    assert encode_polyline(points) == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+    assert_close(decode_polyline("_p~iF~ps|U_ulLnnqC_mqNvxq`@"), points)
+
+
+def test_edge_cases():
+    assert encode_polyline([]) == "" and decode_polyline("") == []
+    assert encode_delta([]) == [] and decode_delta([]) == []
+    point = [{"lat": -0.000004, "lon": 179.999996}]
+    assert_close(decode_polyline(encode_polyline(point)), point)
+    assert encode_geometry(point, "json") is point
+    with pytest.raises(ValueError):
+        encode_geometry(point, "wkt")
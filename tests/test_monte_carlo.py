@@ -0,0 +1,53 @@
+# tests/test_monte_carlo.py
+"""Monte Carlo ETAs: the median and bands are fixed by the seed."""
+import numpy as np
+
+SOURCE, DESTINATION = {"lat": 12.972, "lon": 77.592}, {"lat": 13.004, "lon": 77.626}
+
+
+def sample_route(engine):
+    orig, dest = engine.SPATIAL_INDEX.snap([SOURCE["lat"], DESTINATION["lat"]],
+                                           [SOURCE["lon"], DESTINATION["lon"]]).tolist()
+    route = engine.find_k_routes(orig, dest, k=1)[0]
+    geometry, segments, road_types, edges = engine.extract_route_info(route, with_edges=True)
+    incidents = engine.simulate_incidents(len(segments), road_types, 18, geometry, seed=0)
+    return segments, road_types, incidents, edges
+
+
+def test_bands_deterministic_under_seed(engine):
+    segments, road_types, incidents, edges = sample_route(engine)
+    runs = [
+        engine.predict_route_etas(segments, road_types, 18, 1, incidents, edges, samples=300, seed=seed)
+        for seed in (4, 4, 5)
+    ]
+    assert runs[0] == runs[1]
+    assert runs[0][0] != runs[2][0]
+
+
+def test_estimate_is_median_of_draws(engine):
+    segments, road_types, incidents, edges = sample_route(engine)
+    etas, _ = engine.predict_route_etas(segments, road_types, 18, 1, incidents, edges,
+                                        samples=400, seed=9)
+    # the point pass draws its noise first, then monte_carlo_etas() continues the stream
+    rng = np.random.default_rng(9)
+    for _ in engine.MODELS:
+        rng.normal(0, 2.5, size=len(segments))
+    nominal = np.array([
+        engine.FREE_FLOW.get(rt, 40) * (1.0 - engine.LOAD_FACTORS.get(rt, (0.45, 0.68))[1])
+        for rt in road_types
+    ])
+    draws = engine.monte_carlo_etas(segments, road_types, 18, nominal, 400, rng)
+    for horizon, eta in etas.items():
+        median, lower, upper = np.percentile(draws[horizon], (50.0, *engine.MC_PERCENTILES))
+        assert eta["estimate"] == round(median, 2)
+        assert eta["lower_bound"] <= eta["estimate"] <= eta["upper_bound"]
+        assert (eta["lower_bound"], eta["upper_bound"]) == (round(lower, 2), round(upper, 2))
+
+
+def test_request_payload_deterministic(engine):
+    first, second = (engine.compute_route_eta(SOURCE, DESTINATION, seed=3, samples=150)
+                     for _ in range(2))
+    assert first == second
+    meta = first["routes"][0]["meta"]["uncertainty"]
+    assert meta == {"method": "montecarlo", "samples": 150, "estimate": "median",
+                    "percentiles": list(engine.MC_PERCENTILES)}
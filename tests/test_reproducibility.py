@@ -0,0 +1,15 @@
+# tests/test_reproducibility.py
+"""A request seed fixes the whole ETA: incidents and per-segment speed noise."""
+
+
+def route_request(engine, seed):
+    return engine.compute_route_eta({"lat": 12.972, "lon": 77.592}, {"lat": 13.004, "lon": 77.626},
+                                    seed=seed)
+
+
+def test_same_seed_same_payload(engine):
+    engine.ROUTE_CACHE.clear()
+    first = route_request(engine, seed=7)
+    second = route_request(engine, seed=7)   # routes now come from the route cache
+    assert first == second
+    assert route_request(engine, seed=8)["routes"] != first["routes"]
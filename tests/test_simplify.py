@@ -0,0 +1,75 @@
+# tests/test_simplify.py
+"""Douglas-Peucker simplification keeps the endpoints and forced vertices."""
+import numpy as np
+import pytest
+
+from src.common.geometry import _M_PER_DEG, simplify_indices, zoom_tolerance_m
+
+
+def wiggly_route(n, seed):
+    rng = np.random.default_rng(seed)
+    lat = 12.97 + np.cumsum(rng.normal(0, 0.0005, n))
+    lon = 77.59 + np.cumsum(rng.normal(0.0002, 0.0005, n))
+    return [{"lat": a, "lon": b} for a, b in zip(lat.tolist(), lon.tolist())]
+
+
+def chord_distance_m(points, i, j, k):
+    """Distance of point k from segment i-j, in the projection simplify_indices() uses."""
+    lat0 = np.mean([p["lat"] for p in points])
+    xy = np.array([(p["lon"] * _M_PER_DEG * np.cos(np.radians(lat0)), p["lat"] * _M_PER_DEG)
+                   for p in (points[i], points[j], points[k])])
+    a, b, p = xy
+    ab = b - a
+    t = np.clip(np.dot(p - a, ab) / max(np.dot(ab, ab), 1e-18), 0.0, 1.0)
+    return float(np.hypot(*(a + t * ab - p)))
+
+
+@pytest.mark.parametrize("tolerance_m", [5.0, 40.0, 200.0])
+def test_keeps_endpoints_and_forced_vertices(tolerance_m):
+    points = wiggly_route(400, seed=1)
+    keep = [17, 18, 250, 399]
+    kept = simplify_indices(points, tolerance_m, keep=keep)
+    assert kept[0] == 0 and kept[-1] == len(points) - 1
+    assert set(keep) <= set(kept.tolist())
+    assert np.all(np.diff(kept) > 0)
+    assert len(kept) < len(points)
+
+
+def test_dropped_points_within_tolerance():
+    points = wiggly_route(300, seed=2)
+    tolerance_m = 25.0
+    kept = simplify_indices(points, tolerance_m, keep=[120]).tolist()
+    for i, j in zip(kept, kept[1:]):
+        for k in range(i + 1, j):
+            assert chord_distance_m(points, i, j, k) <= tolerance_m + 1e-6
+
+
+def test_trivial_inputs():
+    points = wiggly_route(5, seed=3)
+    assert simplify_indices(points, 0).tolist() == list(range(5))
+    assert simplify_indices(points[:2], 1e6).tolist() == [0, 1]
+    assert simplify_indices(points, 1e6).tolist() == [0, 4]
+    # keep indices out of range are ignored
+    assert simplify_indices(points, 1e6, keep=[-1, 2, 9]).tolist() == [0, 2, 4]
+
+
+def test_zoom_tolerance():
+    assert zoom_tolerance_m(12, 12.97) == pytest.approx(37.2, abs=0.1)
+    assert zoom_tolerance_m(13, 12.97) == pytest.approx(zoom_tolerance_m(12, 12.97) / 2)
+
+
+def test_route_response_keeps_pins_and_incidents(engine):
+    source, destination = {"lat": 12.972, "lon": 77.592}, {"lat": 13.004, "lon": 77.626}
+    incidents_seen = 0
+    for seed in range(20):
+        result = engine.compute_route_eta(source, destination, seed=seed, simplify_tolerance_m=150.0)
+        for route in result["routes"]:
+            meta = route["meta"]
+            geometry = meta["route_geometry"]
+            assert geometry[0] == source and geometry[-1] == destination
+            assert len(geometry) == meta["geometry_simplification"]["points"]
+            assert len(geometry) < meta["geometry_simplification"]["full_points"]
+            for point in meta["incident_coordinates"]:
+                assert point in geometry
+            incidents_seen += len(meta["incident_coordinates"])
+    assert incidents_seen > 0
@@ -0,0 +1,27 @@
+# tests/test_speed_field.py
+"""Published speed fields are never rewritten; other hours are cached per hour."""
+import numpy as np
+
+
+def test_refresh_leaves_held_field_intact(engine):
+    held = engine.SPEED_FIELD
+    speeds = {h: a.copy() for h, a in held.speeds.items()}
+    try:
+        engine.refresh_speed_field((held.hour + 12) % 24)
+        assert engine.SPEED_FIELD is not held
+        for horizon, before in speeds.items():
+            np.testing.assert_array_equal(held.speeds[horizon], before)
+    finally:
+        engine.refresh_speed_field(held.hour)
+
+
+def test_other_hours_cached_per_hour(engine):
+    current = engine.SPEED_FIELD.hour
+    hours = [(current + d) % 24 for d in range(1, engine.OTHER_HOUR_FIELDS + 2)]
+    fields = [engine.get_speed_field(hour) for hour in hours]
+    assert [f.hour for f in fields] == hours
+    # the oldest was evicted, the newest are served from the cache
+    assert engine.get_speed_field(hours[-1]) is fields[-1]
+    assert engine.get_speed_field(hours[1]) is fields[1]
+    assert engine.get_speed_field(hours[0]) is not fields[0]
+    assert engine.get_speed_field(current) is engine.SPEED_FIELD
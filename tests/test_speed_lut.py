@@ -0,0 +1,68 @@
+# tests/test_speed_lut.py
+"""SpeedLUT against direct model inference: exact on the grid, bounded between."""
+import numpy as np
+import pytest
+
+from src.models.speed_lut import (
+    PEAK_HOURS, SEVERITY_RANGE, SPEED_RANGE, _predict_chunked, build_speed_lut,
+)
+
+
+@pytest.fixture(scope="module")
+def model_and_lut(speed_models):
+    model = speed_models["1_hour"]
+    return model, build_speed_lut(model)
+
+
+def random_inputs(n_per_hour, seed):
+    rng = np.random.default_rng(seed)
+    n = 24 * n_per_hour
+    hour = np.repeat(np.arange(24), n_per_hour)
+    speed = rng.uniform(*SPEED_RANGE, n)
+    severity = np.where(rng.random(n) < 0.5, 0.0, rng.uniform(*SEVERITY_RANGE, n))
+    return hour, speed, severity
+
+
+def test_exact_on_grid_points(model_and_lut):
+    model, lut = model_and_lut
+    hour = np.repeat(np.arange(24), len(lut.speeds))
+    speed = np.tile(lut.speeds, 24)
+    np.testing.assert_array_equal(lut.predict(hour, speed, 0.0),
+                                  _predict_chunked(model, hour, speed, np.zeros(len(hour))))
+    severity = np.full(len(hour), lut.severities[7])
+    np.testing.assert_allclose(lut.predict(hour, speed, severity),
+                               _predict_chunked(model, hour, speed, severity), rtol=1e-6)
+
+
+def test_interpolates_between_cell_corners(model_and_lut):
+    _, lut = model_and_lut
+    hour, speed, _ = random_inputs(200, seed=5)
+    i = np.minimum(((speed - lut.speeds[0]) // (lut.speeds[1] - lut.speeds[0])).astype(np.intp),
+                   len(lut.speeds) - 2)
+    lo, hi = lut.table_clear[hour, i], lut.table_clear[hour, i + 1]
+    pred = lut.predict(hour, speed, 0.0)
+    assert np.all(pred >= np.minimum(lo, hi) - 1e-4)
+    assert np.all(pred <= np.maximum(lo, hi) + 1e-4)
+
+
+def test_error_matches_reported_bound(model_and_lut):
+    """Fresh points stay within the error build_speed_lut() reported."""
+    model, lut = model_and_lut
+    hour, speed, severity = random_inputs(3000, seed=11)
+    err = np.abs(lut.predict(hour, speed, severity) - _predict_chunked(model, hour, speed, severity))
+    # the reported max is itself a sample maximum; nearly every point is far inside it
+    assert np.percentile(err, 99) <= lut.max_abs_error
+    assert err.mean() == pytest.approx(lut.mean_abs_error, rel=0.25)
+
+
+def test_engine_lut_scoring_within_bound(engine):
+    luts, stats = engine._build_speed_luts(engine.MODELS)
+    assert stats["mode"] == "lut"
+    hour, speed, severity = random_inputs(100, seed=13)
+    speed = np.clip(speed, 5.0, None)
+    peak = np.isin(hour, PEAK_HOURS)
+    for horizon, model in engine.MODELS.items():
+        exact = engine._score_speeds(horizon, model, hour, peak, speed, severity)
+        approx = engine._score_speeds(horizon, model, hour, peak, speed, severity, luts)
+        err = np.abs(approx - exact)
+        assert np.percentile(err, 99) <= stats["horizons"][horizon]["max_abs_error_kmh"] + 1e-3
@@ -0,0 +1,59 @@
+# tests/test_warmup.py
+"""The API keeps traffic off the engine until every warm-up stage has run."""
+import threading
+import time
+
+import pytest
+
+ROUTE = {"source": {"lat": 12.972, "lon": 77.592}, "destination": {"lat": 13.004, "lon": 77.626},
+         "seed": 1}
+
+
+@pytest.fixture
+def api(monkeypatch):
+    pytest.importorskip("slowapi")
+    import src.api.main as api
+
+    monkeypatch.setattr(api.limiter, "enabled", False)
+    return api
+
+
+def test_gated_until_warm_up_completes(engine, api, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    probing, release = threading.Event(), threading.Event()
+    run_probes = engine._run_warmup_probes
+
+    def held_probes():
+        probing.set()
+        release.wait(30)
+        return run_probes()
+
+    monkeypatch.setattr(engine, "_run_warmup_probes", held_probes)
+    engine._reset_engine()
+    try:
+        with TestClient(api.app) as client:   # lifespan starts the engine in the background
+            assert probing.wait(30)
+            health = client.get("/health")
+            assert health.status_code == 503
+            body = health.json()
+            assert body["status"] == "initializing" and not body["engine_ready"]
+            assert body["warmup"]["stage"] == "probe"
+            assert body["warmup"]["completed"] == len(engine.WARMUP_STAGES) - 1
+            assert client.post("/predict-route-eta", json=ROUTE).status_code == 503
+            batch = {"items": [{"source": ROUTE["source"], "destination": ROUTE["destination"]}]}
+            assert client.post("/predict-route-eta/batch", json=batch).status_code == 503
+
+            release.set()
+            deadline = time.monotonic() + 30
+            while (health := client.get("/health")).status_code != 200:
+                assert time.monotonic() < deadline, health.json()["warmup"]
+                time.sleep(0.05)
+            assert health.json()["warmup"]["state"] == "ready"
+            assert health.json()["warmup"]["progress"] == 1.0
+            response = client.post("/predict-route-eta", json=ROUTE)
+            assert response.status_code == 200 and response.json()["routes"]
+    finally:
+        release.set()
+        engine.initialize_engine()
+    assert engine.is_engine_ready()